@@ -288,35 +288,423 @@ def run():
             """)
 
 
+    module.addPyCode("""\
+        import threading as _threading
+        import collections as _collections
+        import time as _time
+
+        class _CallAfterQueue(object):
+            \"\"\"
+            The queue of calls made with :func:`wx.CallAfter` and
+            :func:`wx.CallAfterCoalesced`. Calls can be added from any thread.
+            Only one event is posted to the application to wake up the GUI
+            thread, which then runs the queued calls in one go, up to a time
+            budget, before letting other events be processed.
+            \"\"\"
+            budget = 0.02
+
+            def __init__(self, app):
+                self.lock = _threading.Lock()
+                self.calls = _collections.deque()
+                self.coalesced = {}
+                self.pending = False
+                self.posted = self.executed = self.replaced = self.wakeups = 0
+                self.maxDepth = 0
+                self.totalLatency = self.maxLatency = 0.0
+                self.app = app
+                self.eventType = wx.NewEventType()
+                app.Connect(-1, -1, self.eventType, self.Drain)
+
+            def Put(self, key, callableObj, args, kw):
+                entry = (_time.perf_counter(), callableObj, args, kw)
+                with self.lock:
+                    self.posted += 1
+                    if key is None:
+                        self.calls.append((entry, None))
+                    elif key in self.coalesced:
+                        # replace the pending call, keeping its place in line
+                        self.replaced += 1
+                        self.coalesced[key] = entry
+                        return
+                    else:
+                        self.coalesced[key] = entry
+                        self.calls.append((None, key))
+                    self.maxDepth = max(self.maxDepth, len(self.calls))
+                    if self.pending:
+                        return
+                    self.pending = True
+                self.Wakeup()
+
+            def Wakeup(self):
+                evt = wx.PyEvent()
+                evt.SetEventType(self.eventType)
+                wx.PostEvent(self.app, evt)
+
+            def Drain(self, event):
+                self.wakeups += 1
+                start = _time.perf_counter()
+                # Calls added while draining wait for the next wakeup, so a
+                # busy producer can not keep the GUI thread in here.
+                count = len(self.calls)
+                try:
+                    while count:
+                        count -= 1
+                        with self.lock:
+                            if not self.calls:
+                                # emptied by a nested Drain
+                                break
+                            entry, key = self.calls.popleft()
+                            if key is not None:
+                                entry = self.coalesced.pop(key)
+                            # Calls made by this one, also from a nested event
+                            # loop (ShowModal, Yield), post their own wakeup.
+                            self.pending = False
+                        queued, callableObj, args, kw = entry
+                        now = _time.perf_counter()
+                        self.executed += 1
+                        self.totalLatency += now - queued
+                        self.maxLatency = max(self.maxLatency, now - queued)
+                        callableObj(*args, **kw)
+                        if _time.perf_counter() - start > self.budget:
+                            break
+                finally:
+                    with self.lock:
+                        wakeup = bool(self.calls) and not self.pending
+                        if wakeup:
+                            self.pending = True
+                    if wakeup:
+                        self.Wakeup()
+
+            def GetStats(self):
+                with self.lock:
+                    depth = len(self.calls)
+                return dict(depth=depth,
+                            maxDepth=self.maxDepth,
+                            posted=self.posted,
+                            executed=self.executed,
+                            coalesced=self.replaced,
+                            wakeups=self.wakeups,
+                            avgLatency=self.totalLatency / max(1, self.executed),
+                            maxLatency=self.maxLatency)
+
+        _callAfterLock = _threading.Lock()
+
+        def _getCallAfterQueue():
+            app = wx.GetApp()
+            assert app is not None, 'No wx.App created yet'
+            queue = getattr(app, '_callAfterQueue', None)
+            if queue is None:
+                with _callAfterLock:
+                    queue = getattr(app, '_callAfterQueue', None)
+                    if queue is None:
+                        queue = app._callAfterQueue = _CallAfterQueue(app)
+            return queue
+        """)
+
+
     module.addPyFunction('CallAfter', '(callableObj, *args, **kw)', doc="""\
             Call the specified function after the current and pending event
             handlers have been completed.  This is also good for making GUI
             method calls from non-GUI threads.  Any extra positional or
             keyword args are passed on to the callable when it is called.
 
+            The calls are queued and run in the order they were made, many
+            of them for each wakeup of the GUI thread.  If running them takes
+            longer than the time budget set with
+            :func:`wx.SetCallAfterTimeBudget` the rest are run after other
+            pending events have been processed.
+
             :param PyObject callableObj: the callable object
             :param args: arguments to be passed to the callable object
             :param kw: keywords to be passed to the callable object
 
             .. seealso::
-                :ref:`wx.CallLater`
+                :ref:`wx.CallLater`, :func:`wx.CallAfterCoalesced`
 
             """,
         body="""\
             assert callable(callableObj), "callableObj is not callable"
+            _getCallAfterQueue().Put(None, callableObj, args, kw)""")
+
+
+    module.addPyFunction('CallAfterCoalesced', '(key, callableObj, *args, **kw)', doc="""\
+            Like :func:`wx.CallAfter`, but if a call made with the same key
+            is still waiting to be run, it is replaced by this one.  Only the
+            latest call for a key is run, in the place of the first one.
+            This is useful for posting frequent updates from a worker thread,
+            like progress values, of which only the most recent one matters.
+
+            :param key: any hashable object identifying the call
+            :param PyObject callableObj: the callable object
+            :param args: arguments to be passed to the callable object
+            :param kw: keywords to be passed to the callable object
+
+            """,
+        body="""\
+            assert callable(callableObj), "callableObj is not callable"
+            _getCallAfterQueue().Put(key, callableObj, args, kw)""")
+
+
+    module.addPyFunction('SetCallAfterTimeBudget', '(millis)', doc="""\
+            Sets how long, in milliseconds, the calls queued by
+            :func:`wx.CallAfter` may run before pending events are processed
+            again.  The default is 20 milliseconds.
+
+            :param int millis: the time budget
+            """,
+        body="""\
+            _CallAfterQueue.budget = millis / 1000.0""")
+
+
+    module.addPyFunction('GetCallAfterStats', '()', doc="""\
+            Returns a dictionary of counters about the :func:`wx.CallAfter`
+            queue of the current application: the current and maximum queue
+            ``depth`` and ``maxDepth``, the number of calls ``posted``,
+            ``executed`` and ``coalesced`` (replaced by a later call with
+            the same key), the number of ``wakeups`` of the GUI thread, and
+            the ``avgLatency`` and ``maxLatency`` in seconds between queuing
+            a call and running it.
+            """,
+        body="""\
+            return _getCallAfterQueue().GetStats()""")
+
+
+    module.addPyCode("""\
+        class _TimerHandle(object):
+            \"\"\"
+            A timer of the :class:`_TimerWheel`, which calls ``callback``
+            when it expires.
+            \"\"\"
+            def __init__(self, wheel, callback):
+                self.wheel = wheel
+                self.callback = callback
+                self.millis = 0
+                self.expires = 0
+                self.slot = None
+                self.active = False
+
+            def Start(self, millis):
+                self.wheel.Remove(self)
+                self.millis = millis
+                self.wheel.Add(self, millis)
+
+            def Stop(self):
+                self.wheel.Remove(self)
+
+            def IsRunning(self):
+                return self.active
+
+            def GetInterval(self):
+                return self.millis
+
+
+        class _TimerWheel(object):
+            \"\"\"
+            Runs the timers of :class:`wx.CallLater`, :class:`wx.Debounce` and
+            :class:`wx.Throttle` from one native timer, which is only set for
+            the nearest deadline.
+
+            This is a hierarchical timer wheel with a resolution of one
+            millisecond. Each level has 64 slots, each of which covers 64
+            slots of the level below, and timers are moved down a level when
+            the wheel reaches their slot. Starting and stopping a timer is
+            done in constant time.
+            \"\"\"
+            bits = 6
+            levels = 4
+
+            def __init__(self):
+                size = 1 << self.bits
+                self.slots = [[{} for i in range(size)] for level in range(self.levels)]
+                self.occupied = [0] * self.levels
+                self.origin = _time.perf_counter()
+                self.current = 0
+                self.count = 0
+                self.due = _collections.deque()
+                self.armed = None
+                self.scheduled = self.fired = self.cancelled = self.wakeups = 0
+                self.timer = wx.PyTimer(self.Notify)
+
+            def Now(self):
+                return int((_time.perf_counter() - self.origin) * 1000)
+
+            def CreateTimer(self, callback):
+                return _TimerHandle(self, callback)
+
+            def Add(self, handle, millis):
+                if not self.count:
+                    # the wheel is not advanced while it is empty
+                    self.current = max(self.current, self.Now())
+                handle.expires = max(self.Now() + int(millis), self.current + 1)
+                handle.active = True
+                self._Insert(handle)
+                self.count += 1
+                self.scheduled += 1
+                if self.armed is None or handle.expires < self.armed:
+                    self._Arm(handle.expires)
+
+            def Remove(self, handle):
+                if not handle.active:
+                    return
+                handle.active = False
+                self.cancelled += 1
+                if handle.slot is not None:
+                    level, index = handle.slot
+                    slot = self.slots[level][index]
+                    del slot[handle]
+                    if not slot:
+                        self.occupied[level] &= ~(1 << index)
+                    handle.slot = None
+                    self.count -= 1
+
+            def _Insert(self, handle):
+                bits = self.bits
+                mask = (1 << bits) - 1
+                delta = handle.expires - self.current
+                for level in range(self.levels):
+                    if delta < 1 << (bits * (level + 1)):
+                        index = (handle.expires >> (bits * level)) & mask
+                        break
+                else:
+                    # too far away, look again after a turn of the top level
+                    index = (self.current >> (bits * level)) & mask
+                self.slots[level][index][handle] = None
+                self.occupied[level] |= 1 << index
+                handle.slot = (level, index)
+
+            def _Cascade(self, level, index):
+                slot = self.slots[level][index]
+                self.slots[level][index] = {}
+                self.occupied[level] &= ~(1 << index)
+                for handle in slot:
+                    self._Insert(handle)
+
+            def _NextTick(self):
+                # the first millisecond at which the wheel reaches an
+                # occupied slot, at any level
+                bits = self.bits
+                size = 1 << bits
+                mask = size - 1
+                nearest = None
+                for level in range(self.levels):
+                    occupied = self.occupied[level]
+                    if not occupied:
+                        continue
+                    shift = bits * level
+                    position = self.current >> shift
+                    start = (position + 1) & mask
+                    rotated = ((occupied >> start) | (occupied << (size - start))) & ((1 << size) - 1)
+                    tick = (position + (rotated & -rotated).bit_length()) << shift
+                    if nearest is None or tick < nearest:
+                        nearest = tick
+                return nearest
+
+            def Advance(self, now):
+                bits = self.bits
+                mask = (1 << bits) - 1
+                while self.current < now:
+                    tick = self._NextTick() if self.count else None
+                    if tick is None or tick > now:
+                        # nothing to expire or cascade before now
+                        self.current = now
+                        break
+                    self.current = tick
+                    if not tick & mask:
+                        for level in range(1, self.levels):
+                            index = (tick >> (bits * level)) & mask
+                            self._Cascade(level, index)
+                            if index:
+                                break
+                    index = tick & mask
+                    slot = self.slots[0][index]
+                    if slot:
+                        self.slots[0][index] = {}
+                        self.occupied[0] &= ~(1 << index)
+                        self.count -= len(slot)
+                        for handle in slot:
+                            handle.slot = None
+                            self.due.append(handle)
+
+            def NextExpiry(self):
+                if not self.count:
+                    return None
+                bits = self.bits
+                size = 1 << bits
+                mask = size - 1
+                nearest = None
+                for level in range(self.levels):
+                    occupied = self.occupied[level]
+                    if not occupied:
+                        continue
+                    # find the first slot the wheel will reach
+                    shift = bits * level
+                    position = self.current >> shift
+                    start = (position + 1) & mask
+                    rotated = ((occupied >> start) | (occupied << (size - start))) & ((1 << size) - 1)
+                    position += (rotated & -rotated).bit_length()
+                    if level == self.levels - 1:
+                        # Timers too far away for the wheel are parked in the
+                        # top level out of order, so wake up to cascade the
+                        # slot instead; no timer in it expires before that.
+                        expires = position << shift
+                    else:
+                        index = position & mask
+                        expires = min(handle.expires for handle in self.slots[level][index])
+                    if nearest is None or expires < nearest:
+                        nearest = expires
+                return nearest
+
+            def _Arm(self, expires):
+                self.armed = expires
+                self.timer.StartOnce(max(0, expires - self.Now()))
+
+            def Notify(self):
+                self.wakeups += 1
+                self.armed = None
+                self.Advance(self.Now())
+                try:
+                    while self.due:
+                        handle = self.due.popleft()
+                        # skip timers stopped or restarted by an earlier one
+                        if not handle.active or handle.slot is not None:
+                            continue
+                        handle.active = False
+                        self.fired += 1
+                        handle.callback()
+                finally:
+                    if self.due:
+                        self._Arm(self.current)
+                    else:
+                        expires = self.NextExpiry()
+                        if expires is not None and (self.armed is None or expires < self.armed):
+                            self._Arm(expires)
+
+            def GetStats(self):
+                return dict(pending=self.count + len(self.due),
+                            scheduled=self.scheduled,
+                            fired=self.fired,
+                            cancelled=self.cancelled,
+                            wakeups=self.wakeups)
+
+        def _getTimerWheel():
             app = wx.GetApp()
             assert app is not None, 'No wx.App created yet'
+            wheel = getattr(app, '_timerWheel', None)
+            if wheel is None:
+                wheel = app._timerWheel = _TimerWheel()
+            return wheel
+        """)
 
-            if not hasattr(app, "_CallAfterId"):
-                app._CallAfterId = wx.NewEventType()
-                app.Connect(-1, -1, app._CallAfterId,
-                            lambda event: event.callable(*event.args, **event.kw) )
-            evt = wx.PyEvent()
-            evt.SetEventType(app._CallAfterId)
-            evt.callable = callableObj
-            evt.args = args
-            evt.kw = kw
-            wx.PostEvent(app, evt)""")
+
+    module.addPyFunction('GetTimerStats', '()', doc="""\
+            Returns a dictionary of counters about the timers used by
+            :class:`wx.CallLater`, :class:`wx.Debounce` and :class:`wx.Throttle`
+            in the current application: the number of timers ``pending``, the
+            number of timers ``scheduled``, ``fired`` and ``cancelled``, and
+            the number of ``wakeups`` of the native timer.
+            """,
+        body="""\
+            return _getTimerWheel().GetStats()""")
 
 
     module.addPyClass('CallLater', ['object'],
@@ -333,12 +721,14 @@ def run():
             finish, the internal reference is deleted and the GC is free to collect
             naturally.
 
+            All the CallLater timers of the application share one native timer,
+            so it is cheap to create many of them, or to restart them often.
+
             .. seealso::
                 :func:`wx.CallAfter`
 
             """,
         items = [
-            PyCodeDef('__instances = {}'),
             PyFunctionDef('__init__', '(self, millis, callableObj, *args, **kwargs)',
                 doc="""\
                     Constructs a new :class:`wx.CallLater` object.
@@ -379,17 +769,15 @@ def run():
                     if args or kwargs:
                         self.SetArgs(*args, **kwargs)
                     self.Stop()
-                    CallLater.__instances[self] = "value irrelevant"  # Maintain a reference to avoid GC
-                    self.timer = wx.PyTimer(self.Notify)
-                    self.timer.Start(self.millis, wx.TIMER_ONE_SHOT)
+                    # the running timer keeps a reference to self
+                    self.timer = _getTimerWheel().CreateTimer(self.Notify)
+                    self.timer.Start(self.millis)
                     self.running = True"""),
             PyCodeDef('Restart = Start'),
 
             PyFunctionDef('Stop', '(self)',
                 doc="Stop and destroy the timer.",
                 body="""\
-                    if self in CallLater.__instances:
-                        del CallLater.__instances[self]
                     if self.timer is not None:
                         self.timer.Stop()
                         self.timer = None"""),
@@ -444,7 +832,7 @@ def run():
                     self.hasRun = True
                     if not self.running:
                         # if it wasn't restarted, then cleanup
-                        wx.CallAfter(self.Stop)"""),
+                        self.Stop()"""),
 
             PyPropertyDef('Interval', 'GetInterval'),
             PyPropertyDef('Result', 'GetResult'),
@@ -452,6 +840,148 @@ def run():
 
     module.addPyCode("FutureCall = deprecated(CallLater, 'Use CallLater instead.')")
 
+
+    module.addPyClass('Debounce', ['object'],
+        doc="""\
+            Wraps a callable object so that it is only called once calls to the
+            wrapper have stopped for the given amount of milliseconds.  The
+            arguments of the last call are passed on.  This is useful for
+            reacting to a burst of events, like typing or resizing, only once::
+
+                self.search = wx.Debounce(300, self.DoSearch)
+                self.text.Bind(wx.EVT_TEXT, lambda evt: self.search(evt.GetString()))
+
+            .. seealso::
+                :class:`wx.Throttle`, :class:`wx.CallLater`
+
+            """,
+        items = [
+            PyFunctionDef('__init__', '(self, millis, callableObj)',
+                doc="""\
+                    Constructs a new :class:`wx.Debounce` object.
+
+                    :param int millis: number of milliseconds without calls to wait for
+                    :param PyObject callableObj: the callable object
+                """,
+                body="""\
+                    assert callable(callableObj), "callableObj is not callable"
+                    self.millis = millis
+                    self.callable = callableObj
+                    self.args = ()
+                    self.kwargs = {}
+                    self.timer = None"""),
+
+            PyFunctionDef('__call__', '(self, *args, **kwargs)',
+                doc="(Re)start the delay, remembering the args for the call.",
+                body="""\
+                    self.args = args
+                    self.kwargs = kwargs
+                    if self.timer is None:
+                        self.timer = _getTimerWheel().CreateTimer(self.Notify)
+                    self.timer.Start(self.millis)"""),
+
+            PyFunctionDef('Notify', '(self)',
+                doc="The delay has expired so call the callable.",
+                body="""\
+                    args, kwargs = self.args, self.kwargs
+                    self.args = ()
+                    self.kwargs = {}
+                    self.callable(*args, **kwargs)"""),
+
+            PyFunctionDef('Cancel', '(self)',
+                doc="Drop the pending call, if any.",
+                body="""\
+                    if self.timer is not None:
+                        self.timer.Stop()
+                    self.args = ()
+                    self.kwargs = {}"""),
+
+            PyFunctionDef('Flush', '(self)',
+                doc="Make the pending call now, if there is one.",
+                body="""\
+                    if self.IsPending():
+                        self.timer.Stop()
+                        self.Notify()"""),
+
+            PyFunctionDef('IsPending', '(self)',
+                doc="Returns whether a call is waiting for the delay to expire.",
+                body="""\
+                    return self.timer is not None and self.timer.IsRunning()"""),
+            ])
+
+
+    module.addPyClass('Throttle', ['object'],
+        doc="""\
+            Wraps a callable object so that it is called at most once every
+            given amount of milliseconds.  The first call is made immediately.
+            Calls made during the following interval are combined into one
+            call at its end, with the arguments of the last of them.  This is
+            useful for updating a display from frequent events without doing
+            it for every one of them.
+
+            .. seealso::
+                :class:`wx.Debounce`, :class:`wx.CallLater`
+
+            """,
+        items = [
+            PyFunctionDef('__init__', '(self, millis, callableObj)',
+                doc="""\
+                    Constructs a new :class:`wx.Throttle` object.
+
+                    :param int millis: the minimum number of milliseconds between calls
+                    :param PyObject callableObj: the callable object
+                """,
+                body="""\
+                    assert callable(callableObj), "callableObj is not callable"
+                    self.millis = millis
+                    self.callable = callableObj
+                    self.args = ()
+                    self.kwargs = {}
+                    self.pending = False
+                    self.timer = None"""),
+
+            PyFunctionDef('__call__', '(self, *args, **kwargs)',
+                doc="Call the callable now, or at the end of the current interval.",
+                body="""\
+                    self.args = args
+                    self.kwargs = kwargs
+                    if self.timer is None:
+                        self.timer = _getTimerWheel().CreateTimer(self.Notify)
+                    if self.timer.IsRunning():
+                        self.pending = True
+                    else:
+                        self._Call()"""),
+
+            PyFunctionDef('_Call', '(self)', """\
+                args, kwargs = self.args, self.kwargs
+                self.args = ()
+                self.kwargs = {}
+                self.pending = False
+                self.timer.Start(self.millis)
+                self.callable(*args, **kwargs)"""),
+
+            PyFunctionDef('Notify', '(self)',
+                doc="The interval has ended, make the combined call if there is one.",
+                body="""\
+                    if self.pending:
+                        self._Call()"""),
+
+            PyFunctionDef('Cancel', '(self)',
+                doc="Drop the pending call, if any, and end the current interval.",
+                body="""\
+                    if self.timer is not None:
+                        self.timer.Stop()
+                    self.pending = False
+                    self.args = ()
+                    self.kwargs = {}"""),
+
+            PyFunctionDef('IsPending', '(self)',
+                doc="Returns whether a call is waiting for the end of the interval.",
+                body="""\
+                    return self.pending"""),
+            ])
+
+
     module.addPyCode("""\
         def GetDefaultPyEncoding():
             return "utf-8"
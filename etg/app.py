@@ -263,6 +263,13 @@ def run():
             stderr streams.  It will do nothing until something is wrriten to
             the stream at which point it will create a Frame with a text area
             and write the text there.
+
+            Writes from any thread are collected in a buffer which is written
+            to the text area at most ``flushRate`` times per second, so chatty
+            threads don't flood the GUI with events.  Only the last
+            ``maxLength`` characters are kept in the text area.  If
+            ``spillFile`` is set to a file name then the older text that is
+            removed is appended to that file.
             """,
         items=[
             PyFunctionDef('__init__', '(self, title="wxPython: stdout/stderr")',
@@ -272,6 +279,13 @@ def run():
                     self.pos    = wx.DefaultPosition
                     self.size   = (450, 300)
                     self.parent = None
+                    self.flushRate = 10
+                    self.maxLength = 1000000
+                    self.spillFile = None
+                    self._pending = []
+                    self._lock = _threading.Lock()
+                    self._flushScheduled = False
+                    self._lastFlush = 0
                     """),
 
             PyFunctionDef('SetParent', '(self, parent)',
@@ -300,34 +314,82 @@ def run():
                     self.parent = None
                     """),
 
+            PyFunctionDef('_ScheduleFlush', '(self)', """\
+                delay = self._lastFlush + 1.0 / self.flushRate - _time.time()
+                if delay <= 0:
+                    self._Flush()
+                else:
+                    wx.CallLater(int(delay * 1000) + 1, self._Flush)
+                """),
+
+            PyFunctionDef('_Flush', '(self)', """\
+                with self._lock:
+                    text = ''.join(self._pending)
+                    self._pending = []
+                    self._flushScheduled = False
+                self._lastFlush = _time.time()
+                if not text:
+                    return
+                if self.frame is None:
+                    self.CreateOutputWindow(text)
+                else:
+                    self.text.AppendText(text)
+                self._Trim()
+                """),
+
+            PyFunctionDef('_Trim', '(self)', """\
+                # Remove the oldest text, plus a bit more so this isn't needed
+                # again on every flush.
+                length = self.text.GetLastPosition()
+                if not self.maxLength or length <= self.maxLength:
+                    return
+                end = length - self.maxLength + self.maxLength // 10
+                if self.spillFile:
+                    import io
+                    with io.open(self.spillFile, 'a', encoding='utf-8') as f:
+                        f.write(self.text.GetRange(0, end))
+                self.text.Remove(0, end)
+                """),
+
             # These methods provide the file-like output behaviour.
             PyFunctionDef('write', '(self, text)',
                 doc="""\
-                    Create the output window if needed and write the string to it.
-                    If not called in the context of the gui thread then CallAfter is
-                    used to do the work there.
+                    Add the string to the output buffer, and make sure that it
+                    will be written to the output window, creating the window if
+                    needed.  If not called in the context of the gui thread then
+                    CallAfter is used to do the work there.
                     """,
                 body="""\
-                    if self.frame is None:
-                        if not wx.IsMainThread():
-                            wx.CallAfter(self.CreateOutputWindow, text)
-                        else:
-                            self.CreateOutputWindow(text)
+                    with self._lock:
+                        self._pending.append(text)
+                        if self._flushScheduled:
+                            return
+                        self._flushScheduled = True
+                    if not wx.IsMainThread():
+                        wx.CallAfter(self._ScheduleFlush)
                     else:
-                        if not wx.IsMainThread():
-                            wx.CallAfter(self.text.AppendText, text)
-                        else:
-                            self.text.AppendText(text)
+                        self._ScheduleFlush()
                      """),
 
             PyFunctionDef('close', '(self)',
                 doc="",
                 body="""\
+                    self.flush()
                     if self.frame is not None:
                         wx.CallAfter(self.frame.Close)
                     """),
 
-            PyFunctionDef('flush', '(self)', 'pass'),
+            PyFunctionDef('flush', '(self)',
+                doc="""\
+                    Write any buffered text to the output window now, or as soon
+                    as the gui thread gets to it if not called from there.
+                    """,
+                body="""\
+                    if not wx.IsMainThread():
+                        wx.CallAfter(self._Flush)
+                    else:
+                        self._Flush()
+                    """),
             ])
 
 
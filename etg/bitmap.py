@@ -166,7 +166,7 @@ def run():
 
 
     c.addCppMethod('void', 'CopyFromBuffer',
-        '(wxPyBuffer* data, wxBitmapBufferFormat format=wxBitmapBufferFormat_RGB, int stride=-1)',
+        '(wxPyBuffer* data, wxBitmapBufferFormat format=wxBitmapBufferFormat_RGB, int stride=-1, const wxRect& rect=wxRect())',
         doc=dedent("""\
             Copy data from a buffer object to replace the bitmap pixel data.
             Default format is plain RGB, but other formats are now supported as
@@ -178,19 +178,40 @@ def run():
                 wx.BitmapBufferFormat_RGBA     A simple sequence of RGBA bytes
                 wx.BitmapBufferFormat_ARGB32   A sequence of 32-bit values in native endian order, with alpha in the upper 8 bits, followed by red, green, and blue.
                 wx.BitmapBufferFormat_RGB32    Same as above but the alpha byte is ignored.
-                =============================  ================================"""),
+                =============================  ================================
+
+            If ``rect`` is given then only that part of the bitmap is replaced,
+            and the buffer holds just the pixels of the rectangle.  The
+            ``stride`` is the number of bytes from the start of one row in the
+            buffer to the start of the next, so a region of a larger frame can
+            be copied without repacking it.  The default of -1 means rows of
+            exactly the rectangle's width.  When the format of the buffer
+            matches the layout of the bitmap's pixels whole rows are copied at
+            once."""),
         body="""\
-            wxPyCopyBitmapFromBuffer(self, (byte*)data->m_ptr, data->m_len, format, stride);
+            wxPyCopyBitmapFromBuffer(self, (byte*)data->m_ptr, data->m_len, format, stride, *rect);
         """)
 
 
     c.addCppMethod('void', 'CopyToBuffer',
-        '(wxPyBuffer* data, wxBitmapBufferFormat format=wxBitmapBufferFormat_RGB, int stride=-1)',
+        '(wxPyBuffer* data, wxBitmapBufferFormat format=wxBitmapBufferFormat_RGB, int stride=-1, const wxRect& rect=wxRect())',
         doc=dedent("""\
             Copy pixel data to a buffer object.  See :meth:`CopyFromBuffer` for buffer
-            format details."""),
+            format details, and for copying just a rectangle of the bitmap."""),
+        body="""\
+            wxPyCopyBitmapToBuffer(self, (byte*)data->m_ptr, data->m_len, format, stride, *rect);
+            """)
+
+
+    c.addCppMethod('void', 'CopyFromImage', '(const wxImage& image, const wxRect& rect=wxRect())',
+        doc=dedent("""\
+            Copy the pixels of the ``rect`` area of the image to the same area
+            of the bitmap, or all of them if no rectangle is given.  This is
+            faster than converting the image to a new bitmap when only a part
+            of it has changed, for example when showing video frames.  The
+            image's alpha channel is used if the bitmap has a depth of 32."""),
         body="""\
-            wxPyCopyBitmapToBuffer(self, (byte*)data->m_ptr, data->m_len, format, stride);
+            wxPyCopyBitmapFromImage(self, *image, *rect);
             """)
 
 
@@ -32,7 +32,8 @@ ITEMS  = [ 'wxFontMetrics',
            'wxDCTextBgModeChanger',
            ]
 
-OTHERDEPS = [ 'src/dc_ex.cpp', ]
+OTHERDEPS = [ 'src/dc_ex.cpp',
+              'src/coordbuffer.h', ]
 
 #---------------------------------------------------------------------------
 
@@ -65,6 +66,9 @@ def run():
 
     # remove wxPoint* overloads, we use the wxPointList ones
     c.find('DrawLines').findOverload('wxPoint points').ignore()
+    # and the wxPointList one too, it is reimplemented below so it can use
+    # arrays of coordinates directly
+    c.find('DrawLines').findOverload('wxPointList').ignore()
     c.find('DrawPolygon').findOverload('wxPoint points').ignore()
     c.find('DrawSpline').findOverload('wxPoint points').ignore()
 
@@ -289,22 +293,44 @@ def run():
     # This file contains implementations of functions for quickly drawing
     # lists of items on the DC. They are called from the CppMethods defined
     # below, which in turn are called from the PyMethods below that.
+    module.addHeaderCode('#include "coordbuffer.h"')
     c.includeCppCode('src/dc_ex.cpp')
 
     c.addCppMethod('PyObject*', '_DrawPointList', '(PyObject* pyCoords, PyObject* pyPens, PyObject* pyBrushes)',
-        body="return wxPyDrawXXXList(*self, wxPyDrawXXXPoint, pyCoords, pyPens, pyBrushes);")
+        body="return wxPyDrawXXXList(*self, wxPyDrawXXXPoint, wxPyDrawBufferPoint, 2, pyCoords, pyPens, pyBrushes);")
 
     c.addCppMethod('PyObject*', '_DrawLineList', '(PyObject* pyCoords, PyObject* pyPens, PyObject* pyBrushes)',
-        body="return wxPyDrawXXXList(*self, wxPyDrawXXXLine, pyCoords, pyPens, pyBrushes);")
+        body="return wxPyDrawXXXList(*self, wxPyDrawXXXLine, wxPyDrawBufferLine, 4, pyCoords, pyPens, pyBrushes);")
 
     c.addCppMethod('PyObject*', '_DrawRectangleList', '(PyObject* pyCoords, PyObject* pyPens, PyObject* pyBrushes)',
-        body="return wxPyDrawXXXList(*self, wxPyDrawXXXRectangle, pyCoords, pyPens, pyBrushes);")
+        body="return wxPyDrawXXXList(*self, wxPyDrawXXXRectangle, wxPyDrawBufferRectangle, 4, pyCoords, pyPens, pyBrushes);")
 
     c.addCppMethod('PyObject*', '_DrawEllipseList', '(PyObject* pyCoords, PyObject* pyPens, PyObject* pyBrushes)',
-        body="return wxPyDrawXXXList(*self, wxPyDrawXXXEllipse, pyCoords, pyPens, pyBrushes);")
+        body="return wxPyDrawXXXList(*self, wxPyDrawXXXEllipse, wxPyDrawBufferEllipse, 4, pyCoords, pyPens, pyBrushes);")
 
     c.addCppMethod('PyObject*', '_DrawPolygonList', '(PyObject* pyCoords, PyObject* pyPens, PyObject* pyBrushes)',
-        body="return wxPyDrawXXXList(*self, wxPyDrawXXXPolygon, pyCoords, pyPens, pyBrushes);")
+        body="return wxPyDrawXXXList(*self, wxPyDrawXXXPolygon, wxPyDrawBufferPolygon, 0, pyCoords, pyPens, pyBrushes);")
+
+    c.addCppMethod('PyObject*', 'DrawLines', '(PyObject* points, wxCoord xoffset=0, wxCoord yoffset=0)',
+        pyArgsString="(points, xoffset=0, yoffset=0)",
+        doc="""\
+            Draws lines using a sequence of points, or an Nx2 array of int32
+            or float64 values, adding the optional offset coordinate.  The
+            current pen is used for drawing the lines.
+            """,
+        body="""\
+            wxPyThreadBlocker blocker;
+            int count;
+            wxPoint* ptsArray = wxPoint_LIST_helper(points, &count);
+            if (! ptsArray)
+                return NULL;
+            PyThreadState* saved = wxPyBeginAllowThreads();
+            self->DrawLines(count, ptsArray, xoffset, yoffset);
+            wxPyEndAllowThreads(saved);
+            delete [] ptsArray;
+            Py_INCREF(Py_None);
+            return Py_None;
+            """)
 
     c.addCppMethod('PyObject*', '_DrawTextList',
         '(PyObject* textList, PyObject* pyPoints, PyObject* foregroundList, PyObject* backgroundList)',
@@ -315,8 +341,14 @@ def run():
         doc="""\
             Draw a list of points as quickly as possible.
 
+            The coordinates of this and the other ``Draw*List`` methods can
+            also be given as a C-contiguous array of int32 or float64 values,
+            like a numpy array, or any other object supporting the buffer
+            protocol.  The array is used in place, and the GIL is released
+            while the items using the same pen and brush are drawn.
+
             :param points: A sequence of 2-element sequences representing
-                           each point to draw, (x,y).
+                           each point to draw, (x,y), or an Nx2 array.
             :param pens:   If None, then the current pen is used.  If a single
                            pen then it will be used for all points.  If a list of
                            pens then there should be one for each point in points.
@@ -336,7 +368,7 @@ def run():
             Draw a list of lines as quickly as possible.
 
             :param lines: A sequence of 4-element sequences representing
-                          each line to draw, (x1,y1, x2,y2).
+                          each line to draw, (x1,y1, x2,y2), or an Nx4 array.
             :param pens:  If None, then the current pen is used.  If a
                           single pen then it will be used for all lines.  If
                           a list of pens then there should be one for each line
@@ -357,7 +389,8 @@ def run():
             Draw a list of rectangles as quickly as possible.
 
             :param rectangles: A sequence of 4-element sequences representing
-                               each rectangle to draw, (x,y, w,h).
+                               each rectangle to draw, (x,y, w,h), or an Nx4
+                               array.
             :param pens:       If None, then the current pen is used.  If a
                                single pen then it will be used for all rectangles.
                                If a list of pens then there should be one for each
@@ -386,7 +419,7 @@ def run():
             Draw a list of ellipses as quickly as possible.
 
             :param ellipses: A sequence of 4-element sequences representing
-                             each ellipse to draw, (x,y, w,h).
+                             each ellipse to draw, (x,y, w,h), or an Nx4 array.
             :param pens:     If None, then the current pen is used.  If a
                              single pen then it will be used for all ellipses.
                              If a list of pens then there should be one for each
@@ -416,6 +449,7 @@ def run():
 
             :param polygons: A sequence of sequences of sequences.
                              [[(x1,y1),(x2,y2),(x3,y3)...], [(x1,y1),(x2,y2),(x3,y3)...]]
+                             or an NxMx2 array of N polygons of M points.
 
             :param pens:     If None, then the current pen is used.  If a
                              single pen then it will be used for all polygons.
@@ -256,6 +256,30 @@ def run():
         """)
 
 
+    c.addCppMethod('void', 'SetHandlerMonitor', '(PyObject* monitor)', isStatic=True,
+        doc="""\
+            Set a callable to be called after each Python event handler is
+            run, with the event, the handler and the time in seconds that the
+            handler took.  This is meant for profiling tools such as
+            :mod:`wx.lib.inspection`.  Pass ``None`` to remove the monitor.
+            """,
+        body="""\
+            wxPyThreadBlocker blocker;
+            if (monitor != Py_None && !PyCallable_Check(monitor)) {
+                PyErr_SetString(PyExc_TypeError, "Expected callable object or None.");
+                return;
+            }
+            wxPyCallback::SetMonitor(monitor);
+            """)
+
+    c.addCppMethod('PyObject*', 'GetHandlerMonitor', '()', isStatic=True,
+        doc="Returns the callable set with :meth:`SetHandlerMonitor`, or ``None``.",
+        body="""\
+            wxPyThreadBlocker blocker;
+            return wxPyCallback::GetMonitor();
+            """)
+
+
     # Ignore the C++ version of CallAfter. We have our own.
     # TODO: If we want to support this we'll need concrete implementations of
     # the template, probably using PyObject* args.
@@ -142,6 +142,25 @@ def run():
     c.addCppCode(tools.ObjArrayHelperTemplate('wxPoint2D', 'sipType_wxPoint2DDouble',
                     "Expected a sequence of length-2 sequences or wx.Point2D objects."))
 
+    # Nx2 arrays of int32 or float64 values are converted without looking at
+    # each item from Python.
+    module.addHeaderCode('#include "coordbuffer.h"')
+    c.addCppCode("""\
+        static
+        wxPoint2D* wxPoint2D_coords_helper(PyObject* source, size_t *count)
+        {
+            wxPyThreadBlocker blocker;
+            wxPyCoordBuffer buffer;
+            if (! buffer.Create(source, 2))
+                return wxPoint2D_array_helper(source, count);
+            *count = buffer.GetCount();
+            wxPoint2D* array = new wxPoint2D[*count];
+            for (size_t idx=0; idx<*count; idx++)
+                array[idx] = wxPoint2D(buffer.GetDouble(idx, 0), buffer.GetDouble(idx, 1));
+            return array;
+        }
+        """)
+
     # we'll reimplement this overload as StrokeLineSegments
     c.find('StrokeLines').findOverload('beginPoints').ignore()
     c.addCppMethod('void', 'StrokeLineSegments', '(PyObject* beginPoints, PyObject* endPoints)',
@@ -149,8 +168,8 @@ def run():
         doc="Stroke disconnected lines from begin to end points.",
         body="""\
         size_t c1, c2, count;
-        wxPoint2D* beginP = wxPoint2D_array_helper(beginPoints, &c1);
-        wxPoint2D* endP =   wxPoint2D_array_helper(endPoints, &c2);
+        wxPoint2D* beginP = wxPoint2D_coords_helper(beginPoints, &c1);
+        wxPoint2D* endP =   wxPoint2D_coords_helper(endPoints, &c2);
 
         if ( beginP != NULL && endP != NULL ) {
             count = wxMin(c1, c2);
@@ -165,10 +184,10 @@ def run():
     m = c.find('StrokeLines').findOverload('points').ignore()
     c.addCppMethod('void', 'StrokeLines', '(PyObject* points)',
         pyArgsString="(point2Ds)",
-        doc="Stroke lines connecting all the points.",
+        doc="Stroke lines connecting all the points, given as a sequence or an Nx2 array.",
         body="""\
         size_t count;
-        wxPoint2D* ptsArray = wxPoint2D_array_helper(points, &count);
+        wxPoint2D* ptsArray = wxPoint2D_coords_helper(points, &count);
 
         if ( ptsArray != NULL ) {
             self->StrokeLines(count, ptsArray);
@@ -183,7 +202,7 @@ def run():
         doc="Draws a polygon.",
         body="""\
         size_t count;
-        wxPoint2D* ptsArray = wxPoint2D_array_helper(points, &count);
+        wxPoint2D* ptsArray = wxPoint2D_coords_helper(points, &count);
 
         if ( ptsArray != NULL ) {
             self->DrawLines(count, ptsArray, fillStyle);
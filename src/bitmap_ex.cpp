@@ -16,22 +16,91 @@
 
 // TODO: Switch these APIs to use the new wxPyBuffer class
 
+
+// When the rows of the buffer have the same layout as the rows of the
+// bitmap's pixel data they are copied with memcpy instead of pixel by pixel.
+static const bool wxPy_RGBIsNative =
+    wxNativePixelFormat::SizePixel == 3 &&
+    wxNativePixelFormat::RED == 0 &&
+    wxNativePixelFormat::GREEN == 1 &&
+    wxNativePixelFormat::BLUE == 2;
+
+#if defined(__WXMSW__) || defined(__WXMAC__)
+// the bitmap holds premultiplied values
+static const bool wxPy_RGBAIsNative = false;
+#else
+static const bool wxPy_RGBAIsNative =
+    wxAlphaPixelFormat::RED == 0 &&
+    wxAlphaPixelFormat::GREEN == 1 &&
+    wxAlphaPixelFormat::BLUE == 2 &&
+    wxAlphaPixelFormat::ALPHA == 3;
+#endif
+
+// The ARGB32 values are not premultiplied when copied, so only the byte
+// order matters.
+#if wxBYTE_ORDER == wxLITTLE_ENDIAN
+static const bool wxPy_ARGB32IsNative =
+    wxAlphaPixelFormat::BLUE == 0 &&
+    wxAlphaPixelFormat::GREEN == 1 &&
+    wxAlphaPixelFormat::RED == 2 &&
+    wxAlphaPixelFormat::ALPHA == 3;
+#else
+static const bool wxPy_ARGB32IsNative =
+    wxAlphaPixelFormat::ALPHA == 0 &&
+    wxAlphaPixelFormat::RED == 1 &&
+    wxAlphaPixelFormat::GREEN == 2 &&
+    wxAlphaPixelFormat::BLUE == 3;
+#endif
+
+
+// Check the rectangle and the size of the buffer holding its pixels. An
+// empty rectangle means the whole bitmap, and a stride of -1 means that the
+// rows are not padded.
+static bool wxPyCheckBufferRect(wxBitmap* bmp, wxRect& rect, int& stride,
+                                Py_ssize_t DATASIZE, int pixelSize)
+{
+    wxRect bmpRect(0, 0, bmp->GetWidth(), bmp->GetHeight());
+    if (rect.IsEmpty())
+        rect = bmpRect;
+    else if (! bmpRect.Contains(rect)) {
+        wxPyErr_SetString(PyExc_ValueError, "The rectangle must be inside the bitmap.");
+        return false;
+    }
+
+    if (stride == -1)
+        stride = rect.width * pixelSize;
+    else if (stride < rect.width * pixelSize) {
+        wxPyErr_SetString(PyExc_ValueError, "The stride is smaller than a row of pixels.");
+        return false;
+    }
+
+    if (DATASIZE < (Py_ssize_t)stride * (rect.height - 1) + rect.width * pixelSize) {
+        wxPyErr_SetString(PyExc_ValueError, "Invalid data buffer size.");
+        return false;
+    }
+    return true;
+}
+
+
 void wxPyCopyBitmapFromBuffer(wxBitmap* bmp,
                               buffer data, Py_ssize_t DATASIZE,
-                              wxBitmapBufferFormat format, int stride)
+                              wxBitmapBufferFormat format, int stride,
+                              const wxRect& area)
 {
-    int height = bmp->GetHeight();
-    int width = bmp->GetWidth();
+    wxRect rect(area);
+    int pixelSize = (format == wxBitmapBufferFormat_RGB) ? 3 : 4;
+    if (! wxPyCheckBufferRect(bmp, rect, stride, DATASIZE, pixelSize))
+        return;
+
+    int height = rect.height;
+    int width = rect.width;
+    byte* rowStart = data;
 
     switch (format) {
         // A simple sequence of RGB bytes
         case wxBitmapBufferFormat_RGB:
         {
-            if (DATASIZE < width * height * 3) {
-                wxPyErr_SetString(PyExc_ValueError, "Invalid data buffer size.");
-                return;
-            }
-            wxNativePixelData pixData(*bmp, wxPoint(0,0), wxSize(width, height));
+            wxNativePixelData pixData(*bmp, rect.GetTopLeft(), rect.GetSize());
             if (! pixData) {
                 wxPyErr_SetString(PyExc_RuntimeError,
                                   "Failed to gain raw access to bitmap data.");
@@ -40,15 +109,19 @@ void wxPyCopyBitmapFromBuffer(wxBitmap* bmp,
 
             wxNativePixelData::Iterator p(pixData);
             for (int y=0; y<height; y++) {
-                wxNativePixelData::Iterator rowStart = p;
+                p.MoveTo(pixData, 0, y);
+                data = rowStart;
+                rowStart += stride;
+                if (wxPy_RGBIsNative) {
+                    memcpy(&p.Data(), data, width * 3);
+                    continue;
+                }
                 for (int x=0; x<width; x++) {
                     p.Red()   = *(data++);
                     p.Green() = *(data++);
                     p.Blue()  = *(data++);
                     ++p;
                 }
-                p = rowStart;
-                p.OffsetY(pixData, 1);
             }
             break;
         }
@@ -56,11 +129,7 @@ void wxPyCopyBitmapFromBuffer(wxBitmap* bmp,
         // A simple sequence of RGBA bytes
         case wxBitmapBufferFormat_RGBA:
         {
-            if (DATASIZE < width * height * 4) {
-                wxPyErr_SetString(PyExc_ValueError, "Invalid data buffer size.");
-                return;
-            }
-            wxAlphaPixelData pixData(*bmp, wxPoint(0,0), wxSize(width, height));
+            wxAlphaPixelData pixData(*bmp, rect.GetTopLeft(), rect.GetSize());
             if (! pixData) {
                 wxPyErr_SetString(PyExc_RuntimeError,
                                   "Failed to gain raw access to bitmap data.");
@@ -68,7 +137,13 @@ void wxPyCopyBitmapFromBuffer(wxBitmap* bmp,
             }
             wxAlphaPixelData::Iterator p(pixData);
             for (int y=0; y<height; y++) {
-                wxAlphaPixelData::Iterator rowStart = p;
+                p.MoveTo(pixData, 0, y);
+                data = rowStart;
+                rowStart += stride;
+                if (wxPy_RGBAIsNative) {
+                    memcpy(&p.Data(), data, width * 4);
+                    continue;
+                }
                 for (int x=0; x<width; x++) {
                     byte a = data[3];
                     p.Red()   = wxPy_premultiply(*(data++), a);
@@ -77,8 +152,6 @@ void wxPyCopyBitmapFromBuffer(wxBitmap* bmp,
                     p.Alpha() = a; data++;
                     ++p;
                 }
-                p = rowStart;
-                p.OffsetY(pixData, 1);
             }
             break;
         }
@@ -99,19 +172,10 @@ void wxPyCopyBitmapFromBuffer(wxBitmap* bmp,
         case wxBitmapBufferFormat_ARGB32:
         {
             bool useAlpha = (format == wxBitmapBufferFormat_ARGB32);
-            byte* rowStart = data;
             wxUint32* bufptr;
             wxUint32  value;
 
-            if (stride == -1)
-                stride = width * 4;
-
-            if (DATASIZE < stride * height) {
-                wxPyErr_SetString(PyExc_ValueError, "Invalid data buffer size.");
-                return;
-            }
-
-            wxAlphaPixelData pixData(*bmp, wxPoint(0,0), wxSize(width,height));
+            wxAlphaPixelData pixData(*bmp, rect.GetTopLeft(), rect.GetSize());
             if (! pixData) {
                 wxPyErr_SetString(PyExc_RuntimeError,
                                   "Failed to gain raw access to bitmap data.");
@@ -122,6 +186,11 @@ void wxPyCopyBitmapFromBuffer(wxBitmap* bmp,
             for (int y=0; y<height; y++) {
                 pix.MoveTo(pixData, 0, y);
                 bufptr = (wxUint32*)rowStart;
+                rowStart += stride;
+                if (useAlpha && wxPy_ARGB32IsNative) {
+                    memcpy(&pix.Data(), bufptr, width * 4);
+                    continue;
+                }
                 for (int x=0; x<width; x++) {
                     value = *bufptr;
                     pix.Alpha() = useAlpha ? (value >> 24) & 0xFF : 255;
@@ -131,7 +200,6 @@ void wxPyCopyBitmapFromBuffer(wxBitmap* bmp,
                     ++pix;
                     ++bufptr;
                 }
-                rowStart += stride;
             }
             break;
         }
@@ -141,28 +209,33 @@ void wxPyCopyBitmapFromBuffer(wxBitmap* bmp,
 
 // Some helper macros used below to help declutter the code
 #define MAKE_PIXDATA(type) \
-    type pixData(*bmp, wxPoint(0,0), wxSize(width, height)); \
+    type pixData(*bmp, rect.GetTopLeft(), rect.GetSize()); \
     if (! pixData) { \
         wxPyErr_SetString(PyExc_RuntimeError, "Failed to gain raw access to bitmap data."); \
         return; \
     } \
-    type::Iterator p(pixData); \
-    type::Iterator rowStart
+    type::Iterator p(pixData)
 
-#define CHECK_BUFFERSIZE(size_needed) \
-    if (DATASIZE < size_needed) { \
-        wxPyErr_SetString(PyExc_ValueError, "Invalid data buffer size."); \
-        return; \
-    }
+#define NEXT_ROW(y) \
+    p.MoveTo(pixData, 0, y); \
+    data = dataRow; \
+    dataRow += stride
 
 
 void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
                             buffer data, Py_ssize_t DATASIZE,
-                            wxBitmapBufferFormat format, int stride)
+                            wxBitmapBufferFormat format, int stride,
+                            const wxRect& area)
 {
-    int height = bmp->GetHeight();
-    int width = bmp->GetWidth();
+    wxRect rect(area);
+    int pixelSize = (format == wxBitmapBufferFormat_RGB) ? 3 : 4;
+    if (! wxPyCheckBufferRect(bmp, rect, stride, DATASIZE, pixelSize))
+        return;
+
+    int height = rect.height;
+    int width = rect.width;
     int depth = bmp->GetDepth();
+    byte* dataRow = data;
 
     // images loaded from a file may not have set the depth, at least on Mac...
     if (depth == -1) {
@@ -176,20 +249,21 @@ void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
         // A simple sequence of RGB bytes
         case wxBitmapBufferFormat_RGB:
         {
-            CHECK_BUFFERSIZE(width * height * 3);
             if (depth == 24) {
                 MAKE_PIXDATA(wxNativePixelData);
 
                 for (int y=0; y<height; y++) {
-                    rowStart = p;
+                    NEXT_ROW(y);
+                    if (wxPy_RGBIsNative) {
+                        memcpy(data, &p.Data(), width * 3);
+                        continue;
+                    }
                     for (int x=0; x<width; x++) {
                         *(data++) = p.Red();
                         *(data++) = p.Green();
                         *(data++) = p.Blue();
                         ++p;
                     }
-                    p = rowStart;
-                    p.OffsetY(pixData, 1);
                 }
             }
             if (depth == 32) {
@@ -198,15 +272,13 @@ void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
                 MAKE_PIXDATA(wxAlphaPixelData);
 
                 for (int y=0; y<height; y++) {
-                    rowStart = p;
+                    NEXT_ROW(y);
                     for (int x=0; x<width; x++) {
                         *(data++) = p.Red();
                         *(data++) = p.Green();
                         *(data++) = p.Blue();
                         ++p;
                     }
-                    p = rowStart;
-                    p.OffsetY(pixData, 1);
                 }
             }
             break;
@@ -215,11 +287,10 @@ void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
         // A simple sequence of RGBA bytes
         case wxBitmapBufferFormat_RGBA:
         {
-            CHECK_BUFFERSIZE(width * height * 4);
             if (depth == 24) {
                 MAKE_PIXDATA(wxNativePixelData);
                 for (int y=0; y<height; y++) {
-                    rowStart = p;
+                    NEXT_ROW(y);
                     for (int x=0; x<width; x++) {
                         byte a = wxALPHA_OPAQUE;
                         *(data++) = wxPy_unpremultiply(p.Red(), a);
@@ -228,14 +299,16 @@ void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
                         *(data++) = a;
                         ++p;
                     }
-                    p = rowStart;
-                    p.OffsetY(pixData, 1);
                 }
             }
             if (depth == 32) {
                 MAKE_PIXDATA(wxAlphaPixelData);
                 for (int y=0; y<height; y++) {
-                    rowStart = p;
+                    NEXT_ROW(y);
+                    if (wxPy_RGBAIsNative) {
+                        memcpy(data, &p.Data(), width * 4);
+                        continue;
+                    }
                     for (int x=0; x<width; x++) {
                         byte a = p.Alpha();
                         *(data++) = wxPy_unpremultiply(p.Red(), a);
@@ -244,8 +317,6 @@ void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
                         *(data++) = a;
                         ++p;
                     }
-                    p = rowStart;
-                    p.OffsetY(pixData, 1);
                 }
             }
             break;
@@ -267,20 +338,18 @@ void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
         case wxBitmapBufferFormat_ARGB32:
         {
             bool useAlpha = (format == wxBitmapBufferFormat_ARGB32);
-            byte* dataRow = data;
             wxUint32* bufptr;
             wxUint32  value;
 
-            if (stride == -1)
-                stride = width * 4;
-
-            CHECK_BUFFERSIZE(stride * height);
-
             if (useAlpha && depth == 32) {
                 MAKE_PIXDATA(wxAlphaPixelData);
                 for (int y=0; y<height; y++) {
-                    p.MoveTo(pixData, 0, y);
-                    bufptr = (wxUint32*)dataRow;
+                    NEXT_ROW(y);
+                    bufptr = (wxUint32*)data;
+                    if (wxPy_ARGB32IsNative) {
+                        memcpy(bufptr, &p.Data(), width * 4);
+                        continue;
+                    }
                     for (int x=0; x<width; x++) {
                         value =
                             (p.Alpha() << 24) |
@@ -291,15 +360,14 @@ void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
                         ++p;
                         ++bufptr;
                     }
-                    dataRow += stride;
                 }
             }
             else // if (!useAlpha /*depth == 24*/)
             {
                 MAKE_PIXDATA(wxNativePixelData);
                 for (int y=0; y<height; y++) {
-                    p.MoveTo(pixData, 0, y);
-                    bufptr = (wxUint32*)dataRow;
+                    NEXT_ROW(y);
+                    bufptr = (wxUint32*)data;
                     for (int x=0; x<width; x++) {
                         value =
                             (wxALPHA_OPAQUE << 24) |
@@ -310,7 +378,6 @@ void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
                         ++p;
                         ++bufptr;
                     }
-                    dataRow += stride;
                 }
             }
             break;
@@ -318,4 +385,51 @@ void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
     }
 }
 
+
+// Copy the pixels in a rectangle of an image to the same place in the
+// bitmap, which saves converting the whole image to a new bitmap when only
+// a part of it has changed.
+void wxPyCopyBitmapFromImage(wxBitmap* bmp, const wxImage& image, const wxRect& area)
+{
+    wxRect rect(area);
+    if (rect.IsEmpty())
+        rect = wxRect(0, 0, image.GetWidth(), image.GetHeight());
+    if (! wxRect(0, 0, image.GetWidth(), image.GetHeight()).Contains(rect)) {
+        wxPyErr_SetString(PyExc_ValueError, "The rectangle must be inside the image.");
+        return;
+    }
+
+    int stride = image.GetWidth() * 3;
+    byte* data = image.GetData() + rect.y * stride + rect.x * 3;
+    Py_ssize_t DATASIZE = (Py_ssize_t)stride * (rect.height - 1) + rect.width * 3;
+
+    if (! image.HasAlpha() || bmp->GetDepth() != 32) {
+        wxPyCopyBitmapFromBuffer(bmp, data, DATASIZE, wxBitmapBufferFormat_RGB, stride, rect);
+        return;
+    }
+
+    // The alpha is held separately in the image, so merge them as we go
+    wxRect bmpRect(0, 0, bmp->GetWidth(), bmp->GetHeight());
+    if (! bmpRect.Contains(rect)) {
+        wxPyErr_SetString(PyExc_ValueError, "The rectangle must be inside the bitmap.");
+        return;
+    }
+    int width = rect.width;
+    int height = rect.height;
+    MAKE_PIXDATA(wxAlphaPixelData);
+    for (int y=0; y<height; y++) {
+        p.MoveTo(pixData, 0, y);
+        byte* rgb = data + y * stride;
+        byte* alpha = image.GetAlpha() + (rect.y + y) * image.GetWidth() + rect.x;
+        for (int x=0; x<width; x++) {
+            byte a = *(alpha++);
+            p.Red()   = wxPy_premultiply(*(rgb++), a);
+            p.Green() = wxPy_premultiply(*(rgb++), a);
+            p.Blue()  = wxPy_premultiply(*(rgb++), a);
+            p.Alpha() = a;
+            ++p;
+        }
+    }
+}
+
 //--------------------------------------------------------------------------
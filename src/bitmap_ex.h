@@ -35,12 +35,18 @@ enum wxBitmapBufferFormat {
 #endif
 
 
+// An empty rect means the whole bitmap.
 void wxPyCopyBitmapFromBuffer(wxBitmap* bmp,
                               buffer data, Py_ssize_t DATASIZE,
-                              wxBitmapBufferFormat format, int stride=-1);
+                              wxBitmapBufferFormat format, int stride=-1,
+                              const wxRect& rect=wxRect());
 
 void wxPyCopyBitmapToBuffer(wxBitmap* bmp,
                             buffer data, Py_ssize_t DATASIZE,
-                            wxBitmapBufferFormat format, int stride=-1);
+                            wxBitmapBufferFormat format, int stride=-1,
+                            const wxRect& rect=wxRect());
+
+void wxPyCopyBitmapFromImage(wxBitmap* bmp, const wxImage& image,
+                             const wxRect& rect=wxRect());
 
 #endif
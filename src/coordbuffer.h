@@ -0,0 +1,143 @@
+//--------------------------------------------------------------------------
+// Name:        src/coordbuffer.h
+// Purpose:     A view of coordinates held in a Python buffer object, such
+//              as a numpy array, for the functions that draw lists of
+//              items.
+//
+// Created:     19-Oct-2026
+// Licence:     wxWindows license
+//--------------------------------------------------------------------------
+
+#ifndef COORDBUFFER_H
+#define COORDBUFFER_H
+
+#include <climits>
+#include <cmath>
+
+
+// Gives direct access to a C-contiguous buffer of int32 or float64 values
+// with one row of coordinates per item, so they can be used without making a
+// Python object for each value. The GIL must be held when creating and
+// releasing the view, but not when reading the values.
+
+class wxPyCoordBuffer
+{
+public:
+    wxPyCoordBuffer() : m_ok(false), m_isDouble(false), m_rows(0), m_cols(0) {}
+    ~wxPyCoordBuffer() { Release(); }
+
+    // Get the buffer of obj if it is a 2-D buffer with rows of cols values,
+    // or a 1-D buffer whose length is a multiple of cols. When cols is 0 a
+    // 3-D buffer of (x,y) pairs is expected, with each row holding any number
+    // of points. Returns false without setting a Python error if the object
+    // can not be used like this, so the caller can fall back to the sequence
+    // protocol.
+    bool Create(PyObject* obj, int cols) {
+        if (!PyObject_CheckBuffer(obj))
+            return false;
+        if (PyObject_GetBuffer(obj, &m_view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0) {
+            PyErr_Clear();
+            return false;
+        }
+        m_ok = true;
+        if (!CheckFormat() || !CheckShape(cols)) {
+            Release();
+            return false;
+        }
+        return true;
+    }
+
+    void Release() {
+        if (m_ok) {
+            PyBuffer_Release(&m_view);
+            m_ok = false;
+        }
+    }
+
+    // The number of items, and of values per item.
+    Py_ssize_t GetCount() const { return m_rows; }
+    Py_ssize_t GetColumns() const { return m_cols; }
+
+    // Doubles are truncated like int() does, and clamped to the range of an
+    // int since converting values outside of it is undefined. NaN gives 0.
+    int GetInt(Py_ssize_t row, Py_ssize_t col) const {
+        Py_ssize_t idx = row * m_cols + col;
+        if (m_isDouble) {
+            double value = ((const double*)m_view.buf)[idx];
+            if (std::isnan(value))
+                return 0;
+            if (value <= (double)INT_MIN)
+                return INT_MIN;
+            if (value >= (double)INT_MAX)
+                return INT_MAX;
+            return (int)value;
+        }
+        return ((const wxInt32*)m_view.buf)[idx];
+    }
+
+    double GetDouble(Py_ssize_t row, Py_ssize_t col) const {
+        Py_ssize_t idx = row * m_cols + col;
+        if (m_isDouble)
+            return ((const double*)m_view.buf)[idx];
+        return ((const wxInt32*)m_view.buf)[idx];
+    }
+
+    // Copy the (x,y) pairs of a row to an array of GetColumns()/2 points.
+    void GetPoints(Py_ssize_t row, wxPoint* points) const {
+        for (Py_ssize_t idx=0; idx < m_cols / 2; idx++)
+            points[idx] = wxPoint(GetInt(row, idx*2), GetInt(row, idx*2+1));
+    }
+
+private:
+    bool CheckFormat() {
+        const char* fmt = m_view.format;
+        if (fmt == NULL)
+            return false;
+        // only the native byte order can be used directly
+        const int one = 1;
+        char native = *(const char*)&one ? '<' : '>';
+        if (*fmt == '@' || *fmt == '=' || *fmt == native)
+            fmt++;
+        if (fmt[0] == '\0' || fmt[1] != '\0')
+            return false;
+        if (fmt[0] == 'd' && m_view.itemsize == 8) {
+            m_isDouble = true;
+            return true;
+        }
+        if ((fmt[0] == 'i' || fmt[0] == 'l') && m_view.itemsize == 4) {
+            m_isDouble = false;
+            return true;
+        }
+        return false;
+    }
+
+    bool CheckShape(int cols) {
+        if (cols == 0) {
+            if (m_view.ndim != 3 || m_view.shape[2] != 2)
+                return false;
+            m_rows = m_view.shape[0];
+            m_cols = m_view.shape[1] * 2;
+            return true;
+        }
+        if (m_view.ndim == 2 && m_view.shape[1] == cols) {
+            m_rows = m_view.shape[0];
+            m_cols = cols;
+            return true;
+        }
+        if (m_view.ndim == 1 && m_view.shape[0] % cols == 0) {
+            m_rows = m_view.shape[0] / cols;
+            m_cols = cols;
+            return true;
+        }
+        return false;
+    }
+
+    Py_buffer   m_view;
+    bool        m_ok;
+    bool        m_isDouble;
+    Py_ssize_t  m_rows;
+    Py_ssize_t  m_cols;
+};
+
+#endif
+//--------------------------------------------------------------------------
@@ -12,7 +12,13 @@
 
 typedef bool (*wxPyDrawListOp_t)(wxDC& dc, PyObject* coords);
 
+// Draws the items first to last-1 from a buffer of coordinates. Called
+// without holding the GIL.
+typedef void (*wxPyDrawBufferOp_t)(wxDC& dc, const wxPyCoordBuffer& coords,
+                                   Py_ssize_t first, Py_ssize_t last);
+
 PyObject* wxPyDrawXXXList(wxDC& dc, wxPyDrawListOp_t doDraw,
+                          wxPyDrawBufferOp_t doDrawBuffer, int bufferCols,
                           PyObject* pyCoords, PyObject* pyPens, PyObject* pyBrushes);
 
 bool wxPyDrawXXXPoint(wxDC& dc, PyObject* coords);
@@ -21,6 +27,12 @@ bool wxPyDrawXXXRectangle(wxDC& dc, PyObject* coords);
 bool wxPyDrawXXXEllipse(wxDC& dc, PyObject* coords);
 bool wxPyDrawXXXPolygon(wxDC& dc, PyObject* coords);
 
+void wxPyDrawBufferPoint(wxDC& dc, const wxPyCoordBuffer& coords, Py_ssize_t first, Py_ssize_t last);
+void wxPyDrawBufferLine(wxDC& dc, const wxPyCoordBuffer& coords, Py_ssize_t first, Py_ssize_t last);
+void wxPyDrawBufferRectangle(wxDC& dc, const wxPyCoordBuffer& coords, Py_ssize_t first, Py_ssize_t last);
+void wxPyDrawBufferEllipse(wxDC& dc, const wxPyCoordBuffer& coords, Py_ssize_t first, Py_ssize_t last);
+void wxPyDrawBufferPolygon(wxDC& dc, const wxPyCoordBuffer& coords, Py_ssize_t first, Py_ssize_t last);
+
 PyObject* wxPyDrawTextList(wxDC& dc, PyObject* textList, PyObject* pyPoints,
                            PyObject* foregroundList, PyObject* backgroundList);
 
@@ -28,9 +40,11 @@ PyObject* wxPyDrawTextList(wxDC& dc, PyObject* textList, PyObject* pyPoints,
 
 
 PyObject* wxPyDrawXXXList(wxDC& dc, wxPyDrawListOp_t doDraw,
+                          wxPyDrawBufferOp_t doDrawBuffer, int bufferCols,
                           PyObject* pyCoords, PyObject* pyPens, PyObject* pyBrushes)
 {
     wxPyBlock_t blocked = wxPyBeginBlockThreads();
+    wxPyCoordBuffer buffer;
 
     bool      isFastSeq  = PyList_Check(pyCoords) || PyTuple_Check(pyCoords);
     bool      isFastPens = PyList_Check(pyPens) || PyTuple_Check(pyPens);
@@ -44,6 +58,7 @@ PyObject* wxPyDrawXXXList(wxDC& dc, wxPyDrawListOp_t doDraw,
     PyObject* coords;
     int       i = 0;
     PyObject* retval;
+    bool      useBuffer = false;
 
     if (!PySequence_Check(pyCoords)) {
         goto err0;
@@ -54,7 +69,10 @@ PyObject* wxPyDrawXXXList(wxDC& dc, wxPyDrawListOp_t doDraw,
     if (!PySequence_Check(pyBrushes)) {
         goto err2;
     }
-    numObjs = PySequence_Length(pyCoords);
+    // Coordinates in a buffer, like a numpy array, are used in place
+    useBuffer = doDrawBuffer != NULL && buffer.Create(pyCoords, bufferCols);
+
+    numObjs = useBuffer ? buffer.GetCount() : PySequence_Length(pyCoords);
     numPens = PySequence_Length(pyPens);
     numBrushes = PySequence_Length(pyBrushes);
     for (i = 0; i < numObjs; i++) {
@@ -95,6 +113,19 @@ PyObject* wxPyDrawXXXList(wxDC& dc, wxPyDrawListOp_t doDraw,
                 Py_DECREF(obj);
         }
 
+        if (useBuffer) {
+            if (i >= numPens && i >= numBrushes) {
+                // The rest use the same pen and brush, so draw them all
+                // without the GIL.
+                PyThreadState* saved = wxPyBeginAllowThreads();
+                doDrawBuffer(dc, buffer, i, numObjs);
+                wxPyEndAllowThreads(saved);
+                break;
+            }
+            doDrawBuffer(dc, buffer, i, i+1);
+            continue;
+        }
+
         // Get the Coordinates
         if (isFastSeq) {
             coords = PySequence_Fast_GET_ITEM(pyCoords, i);
@@ -138,6 +169,7 @@ PyObject* wxPyDrawXXXList(wxDC& dc, wxPyDrawListOp_t doDraw,
 
 
  exit:
+    buffer.Release();
     wxPyEndBlockThreads(blocked);
     return retval;
 }
@@ -211,6 +243,45 @@ bool wxPyDrawXXXPolygon(wxDC& dc, PyObject* coords)
 }
 
 
+void wxPyDrawBufferPoint(wxDC& dc, const wxPyCoordBuffer& coords, Py_ssize_t first, Py_ssize_t last)
+{
+    for (Py_ssize_t i = first; i < last; i++)
+        dc.DrawPoint(coords.GetInt(i, 0), coords.GetInt(i, 1));
+}
+
+void wxPyDrawBufferLine(wxDC& dc, const wxPyCoordBuffer& coords, Py_ssize_t first, Py_ssize_t last)
+{
+    for (Py_ssize_t i = first; i < last; i++)
+        dc.DrawLine(coords.GetInt(i, 0), coords.GetInt(i, 1),
+                    coords.GetInt(i, 2), coords.GetInt(i, 3));
+}
+
+void wxPyDrawBufferRectangle(wxDC& dc, const wxPyCoordBuffer& coords, Py_ssize_t first, Py_ssize_t last)
+{
+    for (Py_ssize_t i = first; i < last; i++)
+        dc.DrawRectangle(coords.GetInt(i, 0), coords.GetInt(i, 1),
+                         coords.GetInt(i, 2), coords.GetInt(i, 3));
+}
+
+void wxPyDrawBufferEllipse(wxDC& dc, const wxPyCoordBuffer& coords, Py_ssize_t first, Py_ssize_t last)
+{
+    for (Py_ssize_t i = first; i < last; i++)
+        dc.DrawEllipse(coords.GetInt(i, 0), coords.GetInt(i, 1),
+                       coords.GetInt(i, 2), coords.GetInt(i, 3));
+}
+
+void wxPyDrawBufferPolygon(wxDC& dc, const wxPyCoordBuffer& coords, Py_ssize_t first, Py_ssize_t last)
+{
+    int numPoints = (int)(coords.GetColumns() / 2);
+    wxPoint* points = new wxPoint[numPoints];
+    for (Py_ssize_t i = first; i < last; i++) {
+        coords.GetPoints(i, points);
+        dc.DrawPolygon(numPoints, points);
+    }
+    delete [] points;
+}
+
+
 //---------------------------------------------------------------------------
 
 
@@ -392,6 +463,17 @@ wxPoint* wxPoint_LIST_helper(PyObject* source, int *count)
     wxPoint* temp;
     PyObject *o, *o1, *o2;
     bool isFast = PyList_Check(source) || PyTuple_Check(source);
+    wxPyCoordBuffer buffer;
+
+    // An Nx2 buffer of int32 or float64 values can be copied directly
+    if (!isFast && buffer.Create(source, 2)) {
+        *count = (int)buffer.GetCount();
+        temp = new wxPoint[*count];
+        for (idx=0; idx<*count; idx++)
+            temp[idx] = wxPoint(buffer.GetInt(idx, 0), buffer.GetInt(idx, 1));
+        buffer.Release();
+        return temp;
+    }
 
     if (!PySequence_Check(source)) {
         goto error0;
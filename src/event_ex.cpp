@@ -8,11 +8,21 @@ public:
 
     void EventThunker(wxEvent& event);
 
+    static void SetMonitor(PyObject* monitor);
+    static PyObject* GetMonitor();
+
     PyObject*   m_func;
+
+    // Called after each handler when set, for profiling the handlers
+    static PyObject*    ms_monitor;
+    static wxStopWatch* ms_clock;
 };
 
 IMPLEMENT_ABSTRACT_CLASS(wxPyCallback, wxEvtHandler);
 
+PyObject*    wxPyCallback::ms_monitor = NULL;
+wxStopWatch* wxPyCallback::ms_clock = NULL;
+
 wxPyCallback::wxPyCallback(PyObject* func) {
     m_func = func;
     wxPyBLOCK_THREADS( Py_INCREF(m_func) );
@@ -27,6 +37,24 @@ wxPyCallback::~wxPyCallback() {
     wxPyBLOCK_THREADS( Py_DECREF(m_func) );
 }
 
+// The GIL must be held when calling these
+void wxPyCallback::SetMonitor(PyObject* monitor) {
+    Py_XDECREF(ms_monitor);
+    ms_monitor = NULL;
+    if (monitor != Py_None) {
+        ms_monitor = monitor;
+        Py_INCREF(ms_monitor);
+        if (!ms_clock)
+            ms_clock = new wxStopWatch;
+    }
+}
+
+PyObject* wxPyCallback::GetMonitor() {
+    PyObject* monitor = ms_monitor ? ms_monitor : Py_None;
+    Py_INCREF(monitor);
+    return monitor;
+}
+
 
 // #define wxPy_PRECALLINIT     "_preCallInit"
 // #define wxPy_POSTCALLCLEANUP "_postCallCleanup"
@@ -50,6 +78,12 @@ void wxPyCallback::EventThunker(wxEvent& event) {
         // Call the event handler, passing the event object
         tuple = PyTuple_New(1);
         PyTuple_SET_ITEM(tuple, 0, arg);  // steals ref to arg
+        PyObject* monitor = ms_monitor;
+        wxLongLong start;
+        if ( monitor ) {
+            Py_INCREF(monitor);
+            start = ms_clock->TimeInMicro();
+        }
         result = PyEval_CallObject(func, tuple);
         if ( result ) {
             Py_DECREF(result);   // result is ignored, but we still need to decref it
@@ -57,6 +91,16 @@ void wxPyCallback::EventThunker(wxEvent& event) {
         } else {
             PyErr_Print();
         }
+        if ( monitor ) {
+            // Tell the monitor the event, handler and duration in seconds
+            double duration = (ms_clock->TimeInMicro() - start).ToDouble() / 1e6;
+            result = PyObject_CallFunction(monitor, "OOd", arg, func, duration);
+            if ( result )
+                Py_DECREF(result);
+            else
+                PyErr_Print();
+            Py_DECREF(monitor);
+        }
         Py_DECREF(tuple);
     }
 }
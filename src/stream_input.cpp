@@ -17,10 +17,19 @@ static PyObject* wxPyGetMethod(PyObject* py, char* name)
 
 // This class can wrap a Python file-like object and allow it to be used
 // as a wxInputStream.
+//
+// Objects holding all of their data in memory, like mmap and io.BytesIO, are
+// read straight from their buffer without calling back into Python. Other
+// objects are read with their readinto method when they have one, so the
+// data is written directly into wx's buffer, and small reads from seekable
+// objects are served from a read-ahead buffer that is filled a large chunk at
+// a time. What is left of it is given back when the stream is destroyed.
 class wxPyInputStream : public wxInputStream
 {
 public:
 
+    enum { READAHEAD_SIZE = 64 * 1024 };
+
     // Make sure there is at least a read method
     static bool Check(PyObject* fileObj)
     {
@@ -36,36 +45,161 @@ public:
         wxPyThreadBlocker blocker(m_block);
 
         m_read = wxPyGetMethod(fileObj, "read");
+        m_readinto = wxPyGetMethod(fileObj, "readinto");
         m_seek = wxPyGetMethod(fileObj, "seek");
         m_tell = wxPyGetMethod(fileObj, "tell");
+        Init();
+        InitDirect(fileObj);
+        m_readAhead = !m_source && CheckSeekable(fileObj);
     }
 
     virtual ~wxPyInputStream()
     {
         wxPyThreadBlocker blocker(m_block);
+        if (m_source) {
+            // leave the file object positioned after what has been read
+            PyObject* result = PyObject_CallFunction(m_seek, "(L)", (long long)m_pos);
+            if (result == NULL)
+                PyErr_Clear();
+            Py_XDECREF(result);
+            PyBuffer_Release(&m_view);
+            Py_DECREF(m_source);
+        }
+        else if (m_bufPos < m_bufLen) {
+            // seek back over what was read ahead but not used
+            PyObject* result = PyObject_CallFunction(m_seek, "(Li)",
+                                                     -(long long)(m_bufLen - m_bufPos), 1);
+            if (result == NULL)
+                PyErr_Clear();
+            Py_XDECREF(result);
+        }
         Py_XDECREF(m_read);
+        Py_XDECREF(m_readinto);
         Py_XDECREF(m_seek);
         Py_XDECREF(m_tell);
+        delete [] m_buffer;
     }
 
     wxPyInputStream(const wxPyInputStream& other)
     {
         wxPyThreadBlocker blocker;
         m_read  = other.m_read;
+        m_readinto = other.m_readinto;
         m_seek  = other.m_seek;
         m_tell  = other.m_tell;
         m_block = other.m_block;
+        m_readAhead = other.m_readAhead;
         Py_INCREF(m_read);
+        Py_XINCREF(m_readinto);
         Py_INCREF(m_seek);
         Py_INCREF(m_tell);
+        Init();
+        if (other.m_source) {
+            if (PyObject_GetBuffer(other.m_source, &m_view, PyBUF_SIMPLE) == 0) {
+                m_source = other.m_source;
+                Py_INCREF(m_source);
+                m_pos = other.m_pos;
+            }
+            else
+                PyErr_Clear();
+        }
+        if (other.m_bufPos < other.m_bufLen) {
+            // the copy takes over the data read ahead, so that only one of
+            // the streams seeks back over it
+            wxPyInputStream* from = (wxPyInputStream*)&other; // cast off const
+            m_buffer = new char[READAHEAD_SIZE];
+            m_bufLen = from->m_bufLen - from->m_bufPos;
+            memcpy(m_buffer, from->m_buffer + from->m_bufPos, m_bufLen);
+            from->m_bufPos = from->m_bufLen = 0;
+        }
     }
 
 protected:
 
+    void Init()
+    {
+        m_source = NULL;
+        m_pos = 0;
+        m_buffer = NULL;
+        m_bufPos = m_bufLen = 0;
+    }
+
+    // Use the memory of mmap and BytesIO objects directly. The buffer is held
+    // until the stream is destroyed, so the object can not be resized
+    // meanwhile.
+    void InitDirect(PyObject* fileObj)
+    {
+        if (!m_seek || !m_tell)
+            return;
+
+        PyObject* source = NULL;
+        if (PyObject_CheckBuffer(fileObj)) {
+            // mmap
+            source = fileObj;
+            Py_INCREF(source);
+        }
+        else {
+            PyObject* getbuffer = wxPyGetMethod(fileObj, "getbuffer");
+            if (getbuffer) {
+                // io.BytesIO
+                source = PyObject_CallObject(getbuffer, NULL);
+                Py_DECREF(getbuffer);
+                if (source == NULL) {
+                    PyErr_Clear();
+                    return;
+                }
+            }
+        }
+        if (source == NULL)
+            return;
+
+        if (PyObject_GetBuffer(source, &m_view, PyBUF_SIMPLE) != 0) {
+            PyErr_Clear();
+            Py_DECREF(source);
+            return;
+        }
+        PyObject* result = PyObject_CallObject(m_tell, NULL);
+        if (result == NULL) {
+            PyErr_Clear();
+            PyBuffer_Release(&m_view);
+            Py_DECREF(source);
+            return;
+        }
+        m_pos = PyLong_AsLongLong(result);
+        Py_DECREF(result);
+        m_source = source;
+    }
+
+    // Only objects that can seek back over the data read ahead get a
+    // read-ahead buffer.
+    bool CheckSeekable(PyObject* fileObj)
+    {
+        if (!m_seek || !m_tell)
+            return false;
+
+        PyObject* seekable = wxPyGetMethod(fileObj, "seekable");
+        if (!seekable)
+            return true;
+        PyObject* result = PyObject_CallObject(seekable, NULL);
+        Py_DECREF(seekable);
+        if (result == NULL) {
+            PyErr_Clear();
+            return false;
+        }
+        int rval = PyObject_IsTrue(result);
+        Py_DECREF(result);
+        if (rval < 0)
+            PyErr_Clear();
+        return rval == 1;
+    }
+
     // implement base class virtuals
 
     wxFileOffset GetLength() const
     {
+        if (m_source)
+            return m_view.len;
+
         wxPyInputStream* self = (wxPyInputStream*)this; // cast off const
         if (m_seek && m_tell) {
             wxFileOffset temp = self->OnSysTell();
@@ -82,8 +216,81 @@ protected:
         if (bufsize == 0)
             return 0;
 
+        // Read from the object's memory, the GIL is not needed for that
+        if (m_source) {
+            size_t o = 0;
+            if (m_pos < m_view.len)
+                o = wxMin(bufsize, (size_t)(m_view.len - m_pos));
+            if (o == 0)
+                m_lasterror = wxSTREAM_EOF;
+            memcpy(buffer, (char*)m_view.buf + m_pos, o);
+            m_pos += o;
+            return o;
+        }
+
+        // Anything left from the last read-ahead?
+        if (m_bufPos < m_bufLen) {
+            size_t o = wxMin(bufsize, m_bufLen - m_bufPos);
+            memcpy(buffer, m_buffer + m_bufPos, o);
+            m_bufPos += o;
+            return o;
+        }
+
         wxPyThreadBlocker blocker;
-        PyObject* arglist = Py_BuildValue("(i)", bufsize);
+        if (!m_readinto)
+            return ReadObject(buffer, bufsize);
+
+        // Large reads go straight to the caller's buffer, small ones are
+        // served from the read-ahead buffer
+        if (bufsize >= READAHEAD_SIZE || !m_readAhead)
+            return ReadInto(buffer, bufsize);
+
+        if (!m_buffer)
+            m_buffer = new char[READAHEAD_SIZE];
+        m_bufPos = 0;
+        m_bufLen = ReadInto(m_buffer, READAHEAD_SIZE);
+        size_t o = wxMin(bufsize, m_bufLen);
+        memcpy(buffer, m_buffer, o);
+        m_bufPos = o;
+        return o;
+    }
+
+    // Call readinto with a memoryview of the buffer. The GIL must be held.
+    size_t ReadInto(void *buffer, size_t bufsize)
+    {
+        PyObject* view = PyMemoryView_FromMemory((char*)buffer, bufsize, PyBUF_WRITE);
+        if (view == NULL) {
+            m_lasterror = wxSTREAM_READ_ERROR;
+            return 0;
+        }
+        PyObject* result = PyObject_CallFunctionObjArgs(m_readinto, view, NULL);
+
+        // Make sure the Python code can't use the memory after this
+        PyObject* released = PyObject_CallMethod(view, "release", NULL);
+        Py_XDECREF(released);
+        Py_DECREF(view);
+
+        size_t o = 0;
+        if (result == NULL) {
+            m_lasterror = wxSTREAM_READ_ERROR;
+            return 0;
+        }
+        if (result != Py_None)
+            o = PyLong_AsSize_t(result);
+        Py_DECREF(result);
+        if (PyErr_Occurred() || o > bufsize) {
+            m_lasterror = wxSTREAM_READ_ERROR;
+            return 0;
+        }
+        if (o == 0)
+            m_lasterror = wxSTREAM_EOF;
+        return o;
+    }
+
+    // Call read and copy the bytes it returns. The GIL must be held.
+    size_t ReadObject(void *buffer, size_t bufsize)
+    {
+        PyObject* arglist = Py_BuildValue("(n)", (Py_ssize_t)bufsize);
         PyObject* result = PyEval_CallObject(m_read, arglist);
         Py_DECREF(arglist);
 
@@ -110,6 +317,24 @@ protected:
 
     wxFileOffset OnSysSeek(wxFileOffset off, wxSeekMode mode)
     {
+        if (m_source) {
+            wxFileOffset pos = off;
+            if (mode == wxFromCurrent)
+                pos += m_pos;
+            else if (mode == wxFromEnd)
+                pos += m_view.len;
+            if (pos < 0)
+                return wxInvalidOffset;
+            m_pos = pos;
+            return m_pos;
+        }
+
+        // The file object is ahead of us by what is left in the read-ahead
+        // buffer, which is dropped
+        if (mode == wxFromCurrent)
+            off -= (wxFileOffset)(m_bufLen - m_bufPos);
+        m_bufPos = m_bufLen = 0;
+
         wxPyThreadBlocker blocker;
         PyObject* arglist = PyTuple_New(2);
 
@@ -130,6 +355,9 @@ protected:
 
     wxFileOffset OnSysTell() const
     {
+        if (m_source)
+            return m_pos;
+
         wxPyThreadBlocker blocker;
         PyObject* arglist = Py_BuildValue("()");
         PyObject* result = PyEval_CallObject(m_tell, arglist);
@@ -142,7 +370,7 @@ protected:
                 o = wxPyInt_AsLong(result);
             Py_DECREF(result);
         };
-        return o;
+        return o - (wxFileOffset)(m_bufLen - m_bufPos);
     }
 
     bool IsSeekable() const
@@ -152,10 +380,22 @@ protected:
 
 
 private:
-    PyObject* m_read;
-    PyObject* m_seek;
-    PyObject* m_tell;
-    bool      m_block;
+    PyObject*    m_read;
+    PyObject*    m_readinto;
+    PyObject*    m_seek;
+    PyObject*    m_tell;
+    bool         m_block;
+    bool         m_readAhead;
+
+    // the object whose memory is read directly, and the position in it
+    PyObject*    m_source;
+    Py_buffer    m_view;
+    wxFileOffset m_pos;
+
+    // the read-ahead buffer
+    char*        m_buffer;
+    size_t       m_bufPos;
+    size_t       m_bufLen;
 };
 
 //--------------------------------------------------------------------------
@@ -16,7 +16,12 @@ static PyObject* wxPyGetMethod(PyObject* py, char* name)
 
 
 // This class can wrap a Python file-like object and allow it to be used
-// as a wxInputStream.
+// as a wxOutputStream.
+//
+// Objects derived from io.IOBase are passed a memoryview of wx's buffer, so
+// the data is not first copied to a bytes object. Those objects are not
+// supposed to keep a reference to the data past the write call, others may
+// do so and are passed bytes as before.
 class wxPyOutputStream : public wxOutputStream
 {
 public:
@@ -38,6 +43,7 @@ public:
         m_write = wxPyGetMethod(fileObj, "write");
         m_seek = wxPyGetMethod(fileObj, "seek");
         m_tell = wxPyGetMethod(fileObj, "tell");
+        m_useView = IsIOBase(fileObj);
     }
 
     virtual ~wxPyOutputStream()
@@ -55,6 +61,7 @@ public:
         m_seek  = other.m_seek;
         m_tell  = other.m_tell;
         m_block = other.m_block;
+        m_useView = other.m_useView;
         Py_INCREF(m_write);
         Py_INCREF(m_seek);
         Py_INCREF(m_tell);
@@ -62,6 +69,22 @@ public:
 
 protected:
 
+    static bool IsIOBase(PyObject* fileObj)
+    {
+        bool rval = false;
+        PyObject* io = PyImport_ImportModule("io");
+        if (io) {
+            PyObject* iobase = PyObject_GetAttrString(io, "IOBase");
+            if (iobase) {
+                rval = PyObject_IsInstance(fileObj, iobase) == 1;
+                Py_DECREF(iobase);
+            }
+            Py_DECREF(io);
+        }
+        PyErr_Clear();
+        return rval;
+    }
+
     // implement base class virtuals
 
     wxFileOffset GetLength() const
@@ -89,17 +112,39 @@ protected:
             return 0;
 
         wxPyThreadBlocker blocker;
-        PyObject* arglist = PyTuple_New(1);
-        PyTuple_SET_ITEM(arglist, 0, PyBytes_FromStringAndSize((char*)buffer, bufsize));
-
-        PyObject* result = PyEval_CallObject(m_write, arglist);
-        Py_DECREF(arglist);
+        PyObject* data;
+        if (m_useView)
+            data = PyMemoryView_FromMemory((char*)buffer, bufsize, PyBUF_READ);
+        else
+            data = PyBytes_FromStringAndSize((const char*)buffer, bufsize);
+        if (data == NULL) {
+            m_lasterror = wxSTREAM_WRITE_ERROR;
+            return 0;
+        }
+        PyObject* result = PyObject_CallFunctionObjArgs(m_write, data, NULL);
+        if (m_useView) {
+            PyObject* released = PyObject_CallMethod(data, "release", NULL);
+            if (released == NULL)
+                PyErr_Clear();
+            Py_XDECREF(released);
+        }
+        Py_DECREF(data);
 
-        if (result != NULL)
+        size_t o = bufsize;
+        if (result != NULL) {
+            // raw files may write less than they were given
+            if (PyLong_Check(result)) {
+                o = PyLong_AsSize_t(result);
+                if (PyErr_Occurred() || o > bufsize) {
+                    PyErr_Clear();
+                    o = bufsize;
+                }
+            }
             Py_DECREF(result);
+        }
         else
             m_lasterror = wxSTREAM_WRITE_ERROR;
-        return bufsize;
+        return o;
     }
 
     wxFileOffset OnSysSeek(wxFileOffset off, wxSeekMode mode)
@@ -149,6 +194,7 @@ private:
     PyObject* m_seek;
     PyObject* m_tell;
     bool      m_block;
+    bool      m_useView;
 };
 
 //--------------------------------------------------------------------------
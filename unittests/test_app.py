@@ -67,6 +67,71 @@ class App(unittest.TestCase):
         app.MainLoop()
         self.assertTrue(app.callAfter_called)
 
+    def test_CallAfterCoalesced(self):
+        class MyApp(wx.App):
+            def OnInit(self):
+                self.values = []
+                self.frame = wx.Frame(None, title="testing CallAfterCoalesced")
+                self.frame.Show()
+                for i in range(10):
+                    wx.CallAfterCoalesced('progress', self.values.append, i)
+                wx.CallAfter(self.frame.Close)
+                return True
+
+        app = MyApp()
+        app.MainLoop()
+        self.assertEqual(app.values, [9])
+        stats = wx.GetCallAfterStats()
+        self.assertEqual(stats['posted'], 11)
+        self.assertEqual(stats['coalesced'], 9)
+        self.assertEqual(stats['depth'], 0)
+
+    def test_CallAfterNestedLoop(self):
+        class MyApp(wx.App):
+            def OnInit(self):
+                self.values = []
+                self.frame = wx.Frame(None, title="testing nested CallAfter")
+                self.frame.Show()
+                wx.CallAfter(self.nested)
+                return True
+
+            def nested(self):
+                # a call made from a queued call runs in a nested event loop
+                wx.CallAfter(self.values.append, 'inner')
+                self.Yield()
+                self.values.append('outer')
+                self.frame.Close()
+
+        app = MyApp()
+        app.MainLoop()
+        self.assertEqual(app.values, ['inner', 'outer'])
+
+    def test_OutputWindowBatched(self):
+        import threading
+        class MyApp(wx.App):
+            def OnInit(self):
+                self.frame = wx.Frame(None, title="testing PyOnDemandOutputWindow")
+                self.frame.Show()
+                self.out = wx.PyOnDemandOutputWindow()
+                self.out.maxLength = 1000
+                def worker():
+                    for i in range(1000):
+                        self.out.write('line %03d\n' % i)
+                t = threading.Thread(target=worker)
+                t.start()
+                t.join()
+                wx.CallLater(300, self.doCheck)
+                return True
+            def doCheck(self):
+                self.value = self.out.text.GetValue()
+                self.out.frame.Close()
+                self.frame.Close()
+
+        app = MyApp()
+        app.MainLoop()
+        self.assertTrue(len(app.value) <= 1000)
+        self.assertTrue(app.value.endswith('line 999\n'))
+
 #---------------------------------------------------------------------------
 
 
@@ -165,6 +165,34 @@ class BitmapTests(wtc.WidgetTestCase):
         bmp.CopyToBuffer(buf, wx.BitmapBufferFormat_ARGB32)
 
 
+    def test_bitmapCopyBufferRect(self):
+        w = h = 10
+        bmp = wx.Bitmap(w,h,24)
+        bmp.CopyFromBuffer(makeBuf(w,h,3), wx.BitmapBufferFormat_RGB)
+
+        # copy a 4x3 area out of a buffer with 5 pixel wide rows
+        buf = bytearray(range(5*3*3))
+        bmp.CopyFromBuffer(buf, wx.BitmapBufferFormat_RGB, 5*3, (2,2,4,3))
+        out = makeBuf(4,3,3)
+        bmp.CopyToBuffer(out, wx.BitmapBufferFormat_RGB, rect=wx.Rect(2,2,4,3))
+        for y in range(3):
+            self.assertEqual(bytes(out[y*12:y*12+12]), bytes(buf[y*15:y*15+12]))
+
+        with self.assertRaises(ValueError):
+            bmp.CopyFromBuffer(buf, wx.BitmapBufferFormat_RGB, rect=(8,8,4,3))
+        with self.assertRaises(ValueError):
+            bmp.CopyFromBuffer(buf, wx.BitmapBufferFormat_RGB, 5*3, (0,0,6,3))
+
+    def test_bitmapCopyFromImage(self):
+        img = wx.Image(10, 10)
+        img.SetRGB(wx.Rect(2,2,3,3), 1, 2, 3)
+        bmp = wx.Bitmap(10,10,24)
+        bmp.CopyFromImage(img, (2,2,3,3))
+        out = makeBuf(3,3,3)
+        bmp.CopyToBuffer(out, wx.BitmapBufferFormat_RGB, rect=(2,2,3,3))
+        self.assertEqual(bytes(out), b'\x01\x02\x03' * 9)
+
+
     def test_bitmapBufferFactory1(self):
         w = h = 10
         buf = makeBuf(w,h,3, 111)
@@ -256,6 +256,47 @@ class dcDrawLists_Tests(wtc.WidgetTestCase):
         del dc
 
 
+    @unittest.skipIf(not haveNumpy, "Numpy required for this test")
+    def test_dcDrawBufferArrays(self):
+        # int32 and float64 arrays are drawn straight from their buffers
+        pnl = wx.Panel(self.frame)
+        self.frame.SetSize((w,h))
+        dc = wx.ClientDC(pnl)
+        dc.SetPen(wx.Pen("BLACK", 1))
+        dc.SetBrush( wx.Brush("RED") )
+
+        pens = makeRandomPens()
+        for dtype in (np.int32, np.float64):
+            dc.DrawPointList(np.array(makeRandomPoints(), dtype=dtype))
+            dc.DrawPointList(np.array(makeRandomPoints(), dtype=dtype), pens)
+            dc.DrawLineList(np.array(makeRandomLines(), dtype=dtype))
+            dc.DrawEllipseList(np.array(makeRandomRectangles(), dtype=dtype))
+            dc.DrawPolygonList(np.random.randint(0, w, (num, 3, 2)).astype(dtype))
+            dc.DrawLines(np.array(makeRandomPoints(), dtype=dtype))
+            # flat arrays work too
+            dc.DrawLineList(np.array(makeRandomLines(), dtype=dtype).ravel())
+        # a non-contiguous array falls back to the sequence protocol
+        dc.DrawPointList(np.array(makeRandomPoints(), dtype=np.int32)[::2])
+        del dc
+
+
+    @unittest.skipIf(not haveNumpy, "Numpy required for this test")
+    def test_dcDrawBufferNonFinite(self):
+        # NaN, infinite and out of range values are clamped, not converted
+        pnl = wx.Panel(self.frame)
+        self.frame.SetSize((w,h))
+        dc = wx.ClientDC(pnl)
+        dc.SetPen(wx.Pen("BLACK", 1))
+        dc.SetBrush( wx.Brush("RED") )
+
+        lines = np.array(makeRandomLines(), dtype=np.float64)
+        lines[0] = np.nan
+        lines[1] = [np.inf, -np.inf, 1e300, -1e300]
+        dc.DrawLineList(lines)
+        dc.DrawPointList(np.ascontiguousarray(lines[:, :2]))
+        del dc
+
+
     def test_dcDrawTextLists(self):
         pnl = wx.Panel(self.frame)
         self.frame.SetSize((w,h))
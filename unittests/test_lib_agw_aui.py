@@ -61,6 +61,40 @@ class lib_agw_aui_additional_Tests(wtc.WidgetTestCase):
         tb.Realize()
 
 
+    def test_lib_agw_aui_NotebookPageIndex(self):
+        nb = aui.AuiNotebook(self.frame)
+        pages = [wx.Panel(nb) for i in range(5)]
+        for i, page in enumerate(pages):
+            nb.AddPage(page, "Page %d" % i)
+
+        nb.InsertPage(1, wx.Panel(nb), "Inserted")
+        nb.DeletePage(3)
+        for page in [nb.GetPage(i) for i in range(nb.GetPageCount())]:
+            tabs, idx = nb.FindTab(page)
+            self.assertTrue(tabs.GetPage(idx).window is page)
+            self.assertEqual(nb.GetPageIndex(page), idx)
+
+        self.assertEqual(nb.GetPageIndex(wx.Panel(self.frame)), wx.NOT_FOUND)
+
+
+    def test_lib_agw_aui_NotebookTabSizeCache(self):
+        nb = aui.AuiNotebook(self.frame)
+        nb.AddPage(wx.Panel(nb), "Page")
+        tabs = nb.GetActiveTabCtrl()
+        page = tabs.GetPage(0)
+
+        dc = wx.ClientDC(tabs)
+        size = tabs.GetPageTabSize(dc, tabs, page, aui.AUI_BUTTON_STATE_HIDDEN)
+        self.assertTrue(tabs.GetPageTabSize(dc, tabs, page, aui.AUI_BUTTON_STATE_HIDDEN) is size)
+
+        nb.SetPageText(0, "A much longer caption")
+        longer = tabs.GetPageTabSize(dc, tabs, page, aui.AUI_BUTTON_STATE_HIDDEN)
+        self.assertTrue(longer[0].width > size[0].width)
+
+        tabs.InvalidateTabSizes()
+        self.assertTrue(tabs.GetPageTabSize(dc, tabs, page, aui.AUI_BUTTON_STATE_HIDDEN) is not longer)
+
+
     def test_lib_agw_auiEvents(self):
         aui.EVT_AUI_PANE_BUTTON
         """ Fires an event when the user left-clicks on a pane button. """
@@ -61,6 +61,33 @@ class lib_agw_flatnotebook_Tests(wtc.WidgetTestCase):
 
         self.assertEqual(nb.GetPageCount(), 0)
 
+    def test_lib_agw_flatnotebookCaptionWidth(self):
+        nb = FNB.FlatNotebook(self.frame)
+        nb.AddPage(wx.Panel(nb), "Page1")
+        renderer = nb._pages._mgr.GetRenderer(nb.GetAGWWindowStyleFlag())
+
+        width = renderer.GetCaptionWidth("Page1")
+        self.assertEqual(renderer.GetCaptionWidth("Page1"), width)
+        self.assertTrue(renderer.GetCaptionWidth("Page1 and more") > width)
+        self.assertTrue(renderer.GetCaptionWidth("Page1", bold=False) <= width)
+        tabWidth = renderer.CalcTabWidth(nb._pages, 0, 20)
+
+        nb.SetPageText(0, "Renamed")
+        nb.Refresh()
+        nb.Update()
+        self.assertEqual(nb.GetPageText(0), "Renamed")
+
+        dc = wx.MemoryDC(wx.Bitmap(1, 1))
+        font = wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT)
+        font.SetWeight(wx.FONTWEIGHT_BOLD)
+        dc.SetFont(font)
+        newWidth = dc.GetTextExtent("Renamed")[0]
+        self.assertEqual(renderer.GetCaptionWidth("Renamed"), newWidth)
+
+        # the tab is laid out with the width of the new caption
+        self.assertEqual(renderer.CalcTabWidth(nb._pages, 0, 20) - tabWidth,
+                         max(newWidth, 20) - max(width, 20))
+
     def test_lib_agw_flatnotebookMethods(self):
         nb = FNB.FlatNotebook(self.frame)
         p1 = wx.Panel(nb)
@@ -4,6 +4,9 @@ import wx
 import random
 
 import os
+import sys
+import datetime
+import subprocess
 import wx.lib.agw.persist as PM
 
 #---------------------------------------------------------------------------
@@ -63,6 +66,69 @@ class lib_agw_persist_persistencemanager_Tests(wtc.WidgetTestCase):
         self.assertEqual(cb.GetValue(), False, "Should be False as set in CTOR test")
 
 
+    def test_persistencemanagerEncodeValue(self):
+        values = [3, True, 1.5, u'text', (10, 20), [1, 2, 3], [('a', 1)],
+                  datetime.date(2020, 3, 4), {'key': (1, 2)}]
+        for value in values:
+            result = PM.DecodeValue(PM.EncodeValue(value))
+            self.assertEqual(result, value)
+            self.assertEqual(type(result), type(value))
+
+        # the format used by older versions is still read, without eval
+        self.assertEqual(PM.DecodeValue(repr(('int', '5'))), 5)
+        self.assertEqual(PM.DecodeValue(repr(('tuple', "(1, 'x')"))), (1, 'x'))
+        self.assertEqual(PM.DecodeValue(repr(('datetime.date', '2020-03-04'))),
+                         datetime.date(2020, 3, 4))
+        self.assertEqual(PM.DecodeValue(repr(('int', '__import__("os")'))), None)
+
+
+    def test_persistencemanagerJsonBackend(self):
+        fileName = self._configFile1 + '.json'
+        self._persistMgr = PM.PersistenceManager.Get()
+        self._persistMgr.SetConfigurationHandler(PM.JsonPersistenceBackend(fileName))
+        try:
+            self.frame.SetName('PersistTestFrame')
+            self.frame.SetPosition((23, 24))
+            self._persistMgr.Register(self.frame)
+            self._persistMgr.SaveAndUnregister()
+            self.assertTrue(os.path.exists(fileName))
+
+            # a new handler reads the values back from the file
+            self._persistMgr.SetConfigurationHandler(PM.JsonPersistenceBackend(fileName))
+            obj = PM.PersistentObject(self.frame)
+            self.assertEqual(obj.RestoreValue(PM.PERSIST_TLW_X), 23)
+        finally:
+            self._persistMgr.SetConfigurationHandler(None)
+            if os.path.exists(fileName):
+                os.unlink(fileName)
+
+
+    def test_persistencemanagerImportCost(self):
+        # Importing the package should not drag in the widget modules that
+        # the handlers support, they are only looked up once already loaded
+        code = ("import sys, wx; import wx.lib.agw.persist; "
+                "print(' '.join(sorted(sys.modules)))")
+        output = subprocess.check_output([sys.executable, '-c', code])
+        modules = output.decode('utf-8').strip().splitlines()[-1].split()
+
+        for name in ['wx.html', 'wx.dataview', 'wx.lib.masked', 'wx.lib.agw.aui',
+                     'wx.lib.agw.customtreectrl', 'wx.lib.agw.hypertreelist',
+                     'wx.lib.agw.flatmenu', 'wx.lib.agw.ultimatelistctrl']:
+            self.assertTrue(name not in modules, name)
+
+
+    def test_persistencemanagerHandlerLookup(self):
+        import wx.lib.agw.persist.persist_handlers as handlers
+        import wx.lib.agw.aui as aui
+
+        tb = wx.Treebook(self.frame)
+        nb = aui.AuiNotebook(self.frame)
+        self.assertTrue(handlers.FindHandlerClass(tb.__class__) is handlers.TreebookHandler)
+        self.assertTrue(handlers.FindHandlerClass(nb.__class__) is handlers.BookHandler)
+        self.assertTrue(handlers.FindHandlerClass(wx.Timer) is None)
+        self.assertTrue(PM.HasCtrlHandler(wx.TextCtrl(self.frame)))
+
+
     def test_persistencemanagerZZZZCleanup(self):
         # Just clean up the test file used by the other tests...
         # TODO: Fix these tests to be self-contained and to clean up after themselves
@@ -0,0 +1,69 @@
+import unittest
+from unittests import wtc
+import wx
+import asyncio
+import socket
+import threading
+from wx.lib import asyncloop
+
+#---------------------------------------------------------------------------
+
+class lib_asyncloop_Tests(wtc.WidgetTestCase):
+
+    def setUp(self):
+        super(lib_asyncloop_Tests, self).setUp()
+        self.loop = asyncloop.WxEventLoop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+        super(lib_asyncloop_Tests, self).tearDown()
+
+
+    def test_lib_asyncloop_CallLater(self):
+        future = asyncloop.CallLaterAsync(10, lambda a, b: a + b, 40, 2)
+        self.assertEqual(self.loop.run_until_complete(future), 42)
+
+
+    def test_lib_asyncloop_WaitEvent(self):
+        btn = wx.Button(self.frame, label='button')
+
+        def sendButtonEvent():
+            evt = wx.CommandEvent(wx.wxEVT_BUTTON, btn.GetId())
+            evt.SetEventObject(btn)
+            btn.GetEventHandler().ProcessEvent(evt)
+
+        future = asyncloop.WaitEvent(btn, wx.EVT_BUTTON)
+        wx.CallAfter(sendButtonEvent)
+        evt = self.loop.run_until_complete(asyncio.wait_for(future, 5))
+        self.assertEqual(evt.GetId(), btn.GetId())
+
+
+    def test_lib_asyncloop_Socket(self):
+        # data arriving from another thread wakes up the loop
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        timer = threading.Timer(0.05, wsock.send, (b'data',))
+        timer.start()
+        try:
+            data = self.loop.run_until_complete(
+                asyncio.wait_for(self.loop.sock_recv(rsock, 10), 5))
+            self.assertEqual(data, b'data')
+        finally:
+            timer.join()
+            rsock.close()
+            wsock.close()
+
+
+    def test_lib_asyncloop_Policy(self):
+        policy = asyncloop.WxEventLoopPolicy()
+        loop = policy.new_event_loop()
+        self.assertTrue(isinstance(loop, asyncloop.WxEventLoop))
+        loop.close()
+
+
+#---------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
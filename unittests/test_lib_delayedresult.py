@@ -0,0 +1,89 @@
+import unittest
+from unittests import wtc
+import threading
+import wx.lib.delayedresult as dr
+
+#---------------------------------------------------------------------------
+
+def _double(value):
+    return value * 2
+
+
+class lib_delayedresult_Tests(wtc.WidgetTestCase):
+
+    def test_lib_delayedresult_startWorker(self):
+        results = []
+        dr.startWorker(lambda r: results.append(r.get()), _double, wargs=(21,))
+        self.waitFor(500)
+        self.assertEqual(results, [42])
+
+
+    def test_lib_delayedresult_Executor(self):
+        order = []
+        gate = threading.Event()
+        executor = dr.Executor(maxWorkers=1)
+        # keep the only worker busy while the other jobs are queued
+        executor.submit(lambda r: None, gate.wait)
+        jobs = [executor.submit(lambda r: order.append(r.get()), _double,
+                                wargs=(i,), priority=i % 3, jobID=i)
+                for i in range(6)]
+        self.assertTrue(jobs[4].cancel())
+        self.assertTrue(jobs[4].isCancelled())
+        gate.set()
+        self.waitFor(1000)
+        executor.shutdown()
+        self.assertEqual(order, [4, 10, 2, 0, 6])
+
+
+    def test_lib_delayedresult_ExecutorShutdownNoWait(self):
+        results = []
+        gate = threading.Event()
+        executor = dr.Executor(maxWorkers=1)
+        executor.submit(lambda r: None, gate.wait)
+        for i in range(3):
+            executor.submit(lambda r: results.append(r.get()), _double, wargs=(i,))
+        # the queued jobs are still run after the call returns
+        executor.shutdown(wait=False, cancelPending=False)
+        gate.set()
+        self.waitFor(1000)
+        self.assertEqual(results, [0, 2, 4])
+        self.assertEqual(executor.getPendingCount(), 0)
+        with self.assertRaises(RuntimeError):
+            executor.submit(lambda r: None, _double, wargs=(1,))
+
+
+    def test_lib_delayedresult_ExecutorProgress(self):
+        chunks = []
+        results = []
+        def worker(progress):
+            for i in range(100):
+                progress(i)
+            return 'done'
+        with dr.Executor() as executor:
+            executor.submit(lambda r: results.append(r.get()), worker,
+                            progressArg='progress',
+                            progress=lambda jobID, values: chunks.append(values))
+        self.waitFor(500)
+        self.assertEqual(results, ['done'])
+        self.assertEqual(sum(chunks, []), list(range(100)))
+        self.assertTrue(len(chunks) < 100)
+
+
+    def test_lib_delayedresult_ExecutorException(self):
+        errors = []
+        def consumer(result):
+            try:
+                result.get()
+            except Exception as exc:
+                errors.append(type(exc))
+        with dr.Executor() as executor:
+            executor.submit(consumer, _double, wargs=(None,))
+            executor.submit(consumer, lambda: 1/0)
+        self.waitFor(500)
+        self.assertEqual(sorted(errors, key=str), [TypeError, ZeroDivisionError])
+
+
+#---------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+import unittest
+import os
+import shutil
+import tempfile
+import threading
+from unittests import wtc
+import wx.lib.docview as docview
+
+#---------------------------------------------------------------------------
+
+class AppendCommand(docview.Command):
+
+    def __init__(self, target, text, merge=False):
+        docview.Command.__init__(self, canUndo=True, name='Append')
+        self.target = target
+        self.text = text
+        self.merge = merge
+
+    def Do(self):
+        self.target.append(self.text)
+        return True
+
+    def Undo(self):
+        self.target.pop()
+        return True
+
+    def MergeWith(self, command):
+        if not (self.merge and command.merge):
+            return False
+        self.target.pop()
+        self.target[-1] = self.text = self.text + command.text
+        return True
+
+
+class JournaledAppendCommand(AppendCommand):
+
+    def Serialize(self):
+        text, self.text = self.text, None
+        return text
+
+    def Restore(self, state):
+        self.text = state
+
+
+class TextDocument(docview.Document):
+
+    def __init__(self):
+        docview.Document.__init__(self)
+        self.text = ''
+        self.started = None
+        self.resume = None
+
+    def SaveObject(self, file):
+        if self.started is not None:
+            self.started.set()
+            self.resume.wait()
+        file.write(self.text)
+        return True
+
+    def LoadObject(self, file):
+        if self.GetMemoryMappedLoad():
+            self.text = file[:].decode()
+        else:
+            self.text = ''.join(file.ReadChunks(4))
+        return True
+
+
+class lib_docview_CommandProcessor_Tests(wtc.WidgetTestCase):
+
+    def test_lib_docview_CommandProcessorUndoRedo(self):
+        target = []
+        cp = docview.CommandProcessor()
+        for text in 'abc':
+            cp.Submit(AppendCommand(target, text))
+        self.assertEqual(len(cp.GetCommands()), 3)
+        self.assertTrue(cp.Undo())
+        self.assertEqual(target, ['a', 'b'])
+        self.assertTrue(cp.Redo())
+        self.assertEqual(target, ['a', 'b', 'c'])
+
+    def test_lib_docview_CommandProcessorMerge(self):
+        target = []
+        cp = docview.CommandProcessor()
+        for text in 'abc':
+            cp.Submit(AppendCommand(target, text, merge=True))
+        self.assertEqual(target, ['abc'])
+        self.assertEqual(len(cp.GetCommands()), 1)
+        cp.Undo()
+        self.assertEqual(target, [])
+
+    def test_lib_docview_CommandProcessorMaxCommands(self):
+        target = []
+        cp = docview.CommandProcessor(maxCommands=2)
+        for text in 'abcd':
+            cp.Submit(AppendCommand(target, text))
+        self.assertEqual(len(cp.GetCommands()), 2)
+        self.assertTrue(cp.Undo())
+        self.assertTrue(cp.Undo())
+        self.assertFalse(cp.Undo())
+
+    def test_lib_docview_CommandProcessorJournal(self):
+        target = []
+        cp = docview.CommandProcessor(maxMemory=1, journal=True)
+        for text in 'abcd':
+            cp.Submit(JournaledAppendCommand(target, text))
+        self.assertEqual(len(cp.GetCommands()), 4)
+        self.assertEqual([c.text for c in cp.GetCommands()], [None, None, None, 'd'])
+        usage = cp.GetMemoryUsage()
+        self.assertTrue(cp.CanUndo())
+        self.assertFalse(cp.CanRedo())
+        self.assertEqual(cp.GetMemoryUsage(), usage)
+
+        # the spilled commands are restored into the command objects, which
+        # still act on the live target
+        for expected in ['abc', 'ab', 'a', '']:
+            self.assertTrue(cp.Undo())
+            self.assertEqual(''.join(target), expected)
+        self.assertFalse(cp.Undo())
+        for expected in ['a', 'ab', 'abc', 'abcd']:
+            self.assertTrue(cp.Redo())
+            self.assertEqual(''.join(target), expected)
+        self.assertFalse(cp.Redo())
+        self.assertTrue(cp.Undo())
+        self.assertEqual(target, ['a', 'b', 'c'])
+
+    def test_lib_docview_CommandProcessorJournalClose(self):
+        target = []
+        cp = docview.CommandProcessor(maxMemory=1, journal=True)
+        for text in 'abc':
+            cp.Submit(JournaledAppendCommand(target, text))
+        journal = cp._journal
+        self.assertEqual(len(journal), 2)
+        cp.ClearCommands()
+        self.assertTrue(journal._file.closed)
+        self.assertEqual(cp.GetCommands(), [])
+
+        # a new journal is made when commands need to be spilled again
+        for text in 'de':
+            cp.Submit(JournaledAppendCommand(target, text))
+        self.assertTrue(cp.Undo())
+        self.assertTrue(cp.Undo())
+        self.assertEqual(target, ['a', 'b', 'c'])
+        journal = cp._journal
+        del cp
+        self.assertTrue(journal._file.closed)
+
+    def test_lib_docview_CommandProcessorJournalUnsupported(self):
+        # commands without Serialize stay in memory instead of being dropped
+        target = []
+        cp = docview.CommandProcessor(maxMemory=1, journal=True)
+        for text in 'abc':
+            cp.Submit(AppendCommand(target, text))
+        self.assertEqual([c.text for c in cp.GetCommands()], ['a', 'b', 'c'])
+        for expected in [['a', 'b'], ['a'], []]:
+            self.assertTrue(cp.Undo())
+            self.assertEqual(target, expected)
+        self.assertFalse(cp.Undo())
+
+
+class lib_docview_Document_Tests(wtc.WidgetTestCase):
+
+    def setUp(self):
+        super(lib_docview_Document_Tests, self).setUp()
+        self.dirname = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dirname, 'doc.txt')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+        super(lib_docview_Document_Tests, self).tearDown()
+
+    def test_lib_docview_AtomicSave(self):
+        docview.AtomicSave(self.filename, lambda f: f.write('first'))
+
+        def failingSave(f):
+            f.write('second')
+            raise IOError('disk full')
+        with self.assertRaises(IOError):
+            docview.AtomicSave(self.filename, failingSave)
+        with open(self.filename) as f:
+            self.assertEqual(f.read(), 'first')
+        self.assertEqual(os.listdir(self.dirname), ['doc.txt'])
+
+    def test_lib_docview_DocumentSaveOpen(self):
+        doc = TextDocument()
+        doc.text = 'hello world'
+        self.assertTrue(doc.OnSaveDocument(self.filename))
+        self.assertEqual(doc.GetFilename(), self.filename)
+        self.assertTrue(doc.GetDocumentSaved())
+
+        for memoryMapped in (False, True):
+            other = TextDocument()
+            other.SetMemoryMappedLoad(memoryMapped)
+            self.assertTrue(other.OnOpenDocument(self.filename))
+            self.assertEqual(other.text, 'hello world')
+
+    def test_lib_docview_DocumentBackgroundSave(self):
+        doc = TextDocument()
+        doc.SetSaveInBackground()
+        doc.text = 'background'
+        doc.Modify(True)
+        self.assertTrue(doc.OnSaveDocument(self.filename))
+        doc.WaitForSave()
+        self.assertFalse(doc.IsSaving())
+        self.assertFalse(doc.IsModified())
+        with open(self.filename) as f:
+            self.assertEqual(f.read(), 'background')
+
+    def test_lib_docview_DocumentCancelSave(self):
+        with open(self.filename, 'w') as f:
+            f.write('original')
+        doc = TextDocument()
+        doc.SetSaveInBackground()
+        doc.Modify(True)
+        doc.started = threading.Event()
+        doc.resume = threading.Event()
+        self.assertTrue(doc.OnSaveDocument(self.filename))
+        doc.started.wait()
+        self.assertTrue(doc.IsSaving())
+        doc.CancelSave()
+        doc.resume.set()
+        doc.WaitForSave()
+        self.assertTrue(doc.IsModified())
+        with open(self.filename) as f:
+            self.assertEqual(f.read(), 'original')
+        self.assertEqual(os.listdir(self.dirname), ['doc.txt'])
+
+
+#---------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from unittests import wtc
+import wx
+from wx.lib.evtmgr import EventManager
+
+#---------------------------------------------------------------------------
+
+class lib_evtmgr_Tests(wtc.WidgetTestCase):
+
+    def sendButtonEvent(self, btn):
+        evt = wx.CommandEvent(wx.wxEVT_BUTTON, btn.GetId())
+        evt.SetEventObject(btn)
+        btn.GetEventHandler().ProcessEvent(evt)
+
+    def test_lib_evtmgr1(self):
+        em = EventManager()
+        btn = wx.Button(self.frame, label='button')
+        received = []
+        handler1 = lambda evt: received.append(1)
+        handler2 = lambda evt: received.append(2)
+        em.Register(handler1, wx.EVT_BUTTON, btn)
+        em.Register(handler2, wx.EVT_BUTTON, btn)
+
+        self.sendButtonEvent(btn)
+        self.assertEqual(received, [1, 2])
+
+        stats = em.GetStats()
+        self.assertEqual(stats['Adapters: Message'], 2)
+        self.assertEqual(stats['Adapters: Event'], 1)
+        deliveries = list(stats['Topics: Deliveries'].values())
+        self.assertEqual(deliveries[0][0], 1)
+
+        em.DeregisterListener(handler1)
+        self.sendButtonEvent(btn)
+        self.assertEqual(received, [1, 2, 2])
+
+    def test_lib_evtmgr2(self):
+        em = EventManager()
+        btn = wx.Button(self.frame, label='button')
+        em.Register(lambda evt: None, wx.EVT_BUTTON, btn)
+        em.Register(lambda evt: None, wx.EVT_LEFT_DOWN, btn)
+        self.assertEqual(em.GetStats()['Topics: Total'], 2)
+
+        btn.Destroy()
+        self.assertEqual(em.GetStats()['Topics: Total'], 0)
+        self.assertEqual(em.listenerTopicLookup, {})
+
+
+#---------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -167,6 +167,82 @@ class lib_floatcanvas_floatcanvas_Tests(wtc.WidgetTestCase):
         fccanvas.AddObject(obj)
         fccanvas.Destroy()
 
+    def test_lib_floatcanvas_fc_polygonset(self):
+        fccanvas = fc.FloatCanvas(self.frame)
+
+        obj = fc.PolygonSet([[(0, 0), (10, 0), (10, 10)], [(20, 0), (30, 0), (30, 10)]],
+                            Styles=[{}, {'FillColor': 'Red'}], StyleIndex=[1, 0])
+
+        fccanvas.AddObject(obj)
+        fccanvas.Draw(Force=True)
+        self.assertEqual(obj.GetFeatureCount(), 2)
+        self.assertEqual(obj.FindFeature((8, 2)), 0)
+        self.assertEqual(obj.FindFeature((28, 2)), 1)
+        self.assertEqual(obj.FindFeature((2, 8)), None)
+        fccanvas.Destroy()
+
+    def test_lib_floatcanvas_fc_lineset(self):
+        fccanvas = fc.FloatCanvas(self.frame)
+
+        obj = fccanvas.AddLineSet([(0, 0), (10, 0), (10, 10), (50, 50), (60, 50)],
+                                  Offsets=[0, 3])
+
+        fccanvas.Draw(Force=True)
+        self.assertEqual(obj.GetFeature(1).tolist(), [[50, 50], [60, 50]])
+        self.assertEqual(obj.FindFeature((5, 1)), 0)
+        self.assertEqual(obj.FindFeature((55, 49)), 1)
+        self.assertEqual(obj.FindFeature((5, 5)), None)
+        fccanvas.Destroy()
+
+    def test_lib_floatcanvas_fc_markerset(self):
+        fccanvas = fc.FloatCanvas(self.frame)
+
+        obj = fc.MarkerSet([(0, 0), (20, 20), (21, 20)], Diameter=6,
+                           Styles=[{}, {'Shape': 'Square'}], StyleIndex=[0, 1, 1])
+
+        fccanvas.AddObject(obj)
+        fccanvas.Draw(Force=True)
+        self.assertEqual(obj.FindFeature((1, 1)), 0)
+        self.assertEqual(obj.FindFeature((21, 21)), 2)
+        self.assertEqual(obj.FindFeature((10, 10)), None)
+        fccanvas.Destroy()
+
+    def test_lib_floatcanvas_fc_tiledraster(self):
+        import shutil, tempfile
+        from wx.lib.floatcanvas.Utilities import TilePyramid
+
+        tempdir = tempfile.mkdtemp()
+        try:
+            TilePyramid.BuildTilePyramid(wx.Image(pngFile), tempdir, TileSize=64)
+            fccanvas = fc.FloatCanvas(self.frame, size=(100, 100))
+            obj = fccanvas.AddTiledRaster(tempdir, (0, 0), 100)
+            fccanvas.ZoomToBB()
+            fccanvas.Draw(Force=True)
+            self.assertTrue(len(obj._TileCache) > 0)
+            obj.Close()
+            fccanvas.Destroy()
+        finally:
+            shutil.rmtree(tempdir)
+
+    def test_lib_floatcanvas_floatcanvasScroll(self):
+        fccanvas = fc.FloatCanvas(self.frame, size=(100, 100))
+        fccanvas.InitializePanel()
+        fccanvas.MakeNewBuffers()
+        fccanvas.AddRectangle((-20, -20), (20, 20), FillColor='Red')
+        fccanvas.AddRectangle((60, -10), (10, 20), FillColor='Blue')
+        fccanvas.Draw()
+
+        # a pan by whole pixels shifts the buffer and draws the exposed strip
+        fccanvas.MoveImage((30, 0), 'Pixel')
+        self.assertFalse(fccanvas._BackgroundDirty)
+        scrolled = fccanvas._Buffer.ConvertToImage().GetData()
+        fccanvas.Draw(Force=True)
+        self.assertEqual(scrolled, fccanvas._Buffer.ConvertToImage().GetData())
+
+        fccanvas.MoveImage((0.5, 0), 'Pixel', ReDraw=False)
+        self.assertTrue(fccanvas._BackgroundDirty)
+        fccanvas.Destroy()
+
     def test_lib_floatcanvas_floatcanvasEvents(self):
 
         fc.EVT_FC_ENTER_WINDOW
@@ -0,0 +1,57 @@
+import unittest
+from unittests import wtc
+import wx
+import shutil
+import tempfile
+
+import numpy as N
+from wx.lib.floatcanvas.Utilities import TilePyramid
+
+#---------------------------------------------------------------------------
+
+class lib_floatcanvas_tilepyramid_Tests(wtc.WidgetTestCase):
+
+    def setUp(self):
+        super(lib_floatcanvas_tilepyramid_Tests, self).setUp()
+        self.tempdir = tempfile.mkdtemp()
+        self.image = N.zeros((100, 150, 3), N.uint8)
+        self.image[..., 0] = N.arange(150)[None, :]
+        self.image[..., 1] = N.arange(100)[:, None]
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+        super(lib_floatcanvas_tilepyramid_Tests, self).tearDown()
+
+
+    def test_lib_floatcanvas_tilepyramidLevels(self):
+        pyramid = TilePyramid.BuildTilePyramid(self.image, self.tempdir, TileSize=32)
+        self.assertEqual(pyramid.Levels, [(150, 100), (75, 50), (38, 25), (19, 13)])
+        self.assertEqual(pyramid.GetTileCount(0), (5, 4))
+        self.assertEqual(pyramid.GetTileCount(3), (1, 1))
+        self.assertEqual(pyramid.GetTileExtent(0, 3, 4), (22, 4))
+
+        # reopening the directory gives the same pyramid
+        pyramid = TilePyramid.TilePyramid(self.tempdir)
+        self.assertEqual(pyramid.TileSize, 32)
+        self.assertEqual(pyramid.Levels[0], (150, 100))
+
+    def test_lib_floatcanvas_tilepyramidTiles(self):
+        pyramid = TilePyramid.BuildTilePyramid(self.image, self.tempdir, TileSize=32)
+        tile = pyramid.ReadTile(0, 3, 4)
+        self.assertEqual(tile.shape, (32, 32, 3))
+        self.assertTrue((tile[:4, :22] == self.image[96:, 128:]).all())
+        # the part outside the image repeats its edges
+        self.assertTrue((tile[:4, 22:] == tile[:4, 21:22]).all())
+
+        tile = pyramid.ReadTile(1, 0, 0)
+        self.assertEqual(tuple(tile[0, 1]), (3, 1, 0))
+
+    def test_lib_floatcanvas_tilepyramidImage(self):
+        img = wx.Image(40, 20)
+        pyramid = TilePyramid.BuildTilePyramid(img, self.tempdir, TileSize=16)
+        self.assertEqual(pyramid.Levels, [(40, 20), (20, 10), (10, 5)])
+
+#---------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
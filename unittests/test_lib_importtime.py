@@ -0,0 +1,86 @@
+import unittest
+import sys
+import subprocess
+
+#---------------------------------------------------------------------------
+
+def importTimes(code):
+    """
+    Runs `code` in a new Python with ``-X importtime`` and returns a dictionary
+    mapping the names of the imported modules to their cumulative import time,
+    in microseconds.
+    """
+    sp = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', code],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = sp.communicate()
+    if sp.returncode != 0:
+        raise AssertionError(stderr.decode('utf-8', 'replace'))
+
+    times = {}
+    for line in stderr.decode('utf-8', 'replace').splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            times[fields[2].strip()] = int(fields[1])
+        except (IndexError, ValueError):
+            pass    # the header line
+    return times
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'Needs module __getattr__ and -X importtime')
+class lib_importtime_Tests(unittest.TestCase):
+
+    def assertNotImported(self, times, names):
+        for name in names:
+            self.assertTrue(name not in times,
+                            '%s should not be imported (%d us)' % (name, times.get(name, 0)))
+
+    def test_lib_importtime_aui(self):
+        times = importTimes('import wx.lib.agw.aui')
+        self.assertTrue('wx.lib.agw.aui.aui_constants' in times)
+        self.assertNotImported(times, ['wx.lib.agw.aui.framemanager', 'wx.lib.agw.aui.auibook',
+                                       'wx.lib.agw.aui.auibar', 'wx.lib.agw.aui.tabmdi'])
+
+    def test_lib_importtime_auiManager(self):
+        times = importTimes('import wx.lib.agw.aui as aui; aui.AuiManager')
+        self.assertTrue('wx.lib.agw.aui.framemanager' in times)
+        self.assertNotImported(times, ['wx.lib.agw.aui.auibar', 'wx.lib.agw.aui.tabmdi'])
+
+        # the other modules are loaded on demand
+        times = importTimes('import wx.lib.agw.aui as aui; aui.AuiToolBar; aui.AuiMDIParentFrame')
+        self.assertTrue('wx.lib.agw.aui.auibar' in times)
+        self.assertTrue('wx.lib.agw.aui.tabmdi' in times)
+
+    def test_lib_importtime_masked(self):
+        times = importTimes('import wx.lib.masked as masked; masked.TextCtrl')
+        self.assertTrue('wx.lib.masked.textctrl' in times)
+        self.assertNotImported(times, ['wx.lib.masked.numctrl', 'wx.lib.masked.timectrl',
+                                       'wx.lib.masked.ipaddrctrl', 'wx.lib.masked.ctrl'])
+
+    def test_lib_importtime_sameNames(self):
+        # Every class and function of the submodules must still be available
+        # from the package without having to import everything
+        code = '\n'.join([
+            'import inspect, importlib',
+            'import wx.lib.agw.aui as aui',
+            'lazy = set(dir(aui))',
+            'for name in ("framemanager", "auibar", "auibook", "tabart", "dockart", "tabmdi"):',
+            '    module = importlib.import_module("wx.lib.agw.aui." + name)',
+            '    for attr, value in vars(module).items():',
+            '        if (inspect.isclass(value) or inspect.isfunction(value)) and \\',
+            '                value.__module__ == module.__name__ and not attr.startswith("_"):',
+            '            assert attr in lazy, attr',
+            '            assert getattr(aui, attr) is value, attr',
+            'import wx.lib.masked as masked',
+            'assert masked.NumCtrl is importlib.import_module("wx.lib.masked.numctrl").NumCtrl',
+            'ns = {}',
+            'exec("from wx.lib.masked import *", ns)',
+            'assert "IpAddrCtrl" in ns and "TIME" in ns and "Field" in ns',
+            ])
+        importTimes(code)
+
+#---------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
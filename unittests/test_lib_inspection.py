@@ -0,0 +1,70 @@
+import unittest
+from unittests import wtc
+import wx
+import wx.lib.inspection as insp
+import six
+import json
+
+#---------------------------------------------------------------------------
+
+class lib_inspection_Tests(wtc.WidgetTestCase):
+
+    def test_lib_inspection_HandlerMonitor(self):
+        calls = []
+        def monitor(evt, handler, duration):
+            calls.append((evt.GetEventType(), handler, duration))
+        def handler(evt):
+            pass
+
+        self.frame.Bind(wx.EVT_BUTTON, handler)
+        wx.EvtHandler.SetHandlerMonitor(monitor)
+        try:
+            self.assertTrue(wx.EvtHandler.GetHandlerMonitor() is monitor)
+            self.frame.ProcessEvent(wx.CommandEvent(wx.wxEVT_BUTTON))
+        finally:
+            wx.EvtHandler.SetHandlerMonitor(None)
+        self.assertTrue(wx.EvtHandler.GetHandlerMonitor() is None)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][0], wx.wxEVT_BUTTON)
+        self.assertTrue(calls[0][1] is handler)
+        self.assertTrue(calls[0][2] >= 0)
+
+
+    def test_lib_inspection_EventMonitor(self):
+        def handler(evt):
+            pass
+        self.frame.Bind(wx.EVT_BUTTON, handler)
+
+        monitor = insp.EventMonitor(latencyInterval=10)
+        monitor.Start()
+        self.assertTrue(monitor.IsRunning())
+        with self.assertRaises(RuntimeError):
+            insp.EventMonitor().Start()
+        for i in range(3):
+            self.frame.ProcessEvent(wx.CommandEvent(wx.wxEVT_BUTTON))
+        self.waitFor(100)
+        monitor.Stop()
+        self.assertFalse(monitor.IsRunning())
+
+        self.assertEqual(monitor.GetEventCount(wx.EVT_BUTTON), 3)
+        calls, total, maximum = monitor.GetHandlerStats(wx.EVT_BUTTON)
+        self.assertEqual(calls, 3)
+        self.assertTrue(total >= maximum >= 0)
+        self.assertEqual(monitor.GetTypeStats()[0][0], 'EVT_BUTTON')
+        self.assertTrue(monitor.GetWindowStats()[0][0].startswith('Frame'))
+        self.assertTrue(monitor.GetLatencyPercentiles())
+
+        f = six.StringIO()
+        monitor.ExportChromeTrace(f)
+        trace = json.loads(f.getvalue())
+        names = [e['name'] for e in trace['traceEvents']]
+        self.assertEqual(names.count('EVT_BUTTON'), 3)
+
+        monitor.Reset()
+        self.assertEqual(monitor.GetEventCount(wx.EVT_BUTTON), 0)
+
+
+#---------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -147,6 +147,62 @@ class MaskedIpAddrCtrlTests(wtc.WidgetTestCase):
         t.Value
 
 
+#---------------------------------------------------------------------------
+
+class MaskEngineTests(wtc.WidgetTestCase):
+
+    def test_maskengineNormalize(self):
+        e = m.MaskEngine(autoformat='USPHONEFULL')
+        self.assertEqual(e.Normalize('5551234567'), '(555) 123-4567')
+        self.assertTrue(e.Validate('(555) 123-4567'))
+        self.assertFalse(e.Validate('(555) 123-45'))
+        with self.assertRaises(ValueError):
+            e.Normalize('abc')
+
+
+    def test_maskengineBulk(self):
+        e = m.MaskEngine(autoformat='USPHONEFULL')
+        self.assertEqual(e.NormalizeMany(['5551234567', 'abc']),
+                         ['(555) 123-4567', None])
+        self.assertEqual(e.ValidateMany(['5551234567', 'abc']), [True, False])
+
+
+    def test_maskengineControl(self):
+        t = m.TextCtrl(self.frame, autoformat='USPHONEFULL')
+        e = t.GetMaskEngine()
+        self.assertEqual(e.Normalize('5551234567'), '(555) 123-4567')
+        t.SetCtrlParameters(autoformat='USZIP')
+        self.assertTrue(e is t.GetMaskEngine())
+        self.assertEqual(e.Normalize('98765'), '98765')
+        t.SetValue('12345')
+        self.assertEqual(t.GetValue(), '12345')
+
+
+    def test_maskengineNoColours(self):
+        e = m.MaskEngine(mask='###', validBackgroundColour='Yellow')
+        self.assertFalse(isinstance(e._validBackgroundColour, wx.Colour))
+        t = m.TextCtrl(self.frame, mask='###', validBackgroundColour='Yellow')
+        self.assertTrue(isinstance(t.GetCtrlParameter('validBackgroundColour'), wx.Colour))
+        self.assertFalse(isinstance(t.GetMaskEngine()._validBackgroundColour, wx.Colour))
+
+
+    def test_maskengineNumCtrl(self):
+        t = m.NumCtrl(self.frame, integerWidth=4, fractionWidth=2)
+        t.SetValue(12.5)
+        e = t.GetMaskEngine()
+        self.assertEqual(e.Normalize(t.GetValue()), t.GetValue())
+        self.assertTrue(e.Validate(t.GetValue()))
+
+
+    def test_maskengineIpAddrCtrl(self):
+        t = m.IpAddrCtrl(self.frame)
+        t.SetValue('10.0.0.1')
+        self.assertEqual(t.GetValue(), ' 10.  0.  0.  1')
+        e = t.GetMaskEngine()
+        self.assertTrue(e.Validate(t.GetValue()))
+        self.assertFalse(e.Validate(' 10.  0.  0.300'))
+
+
 #---------------------------------------------------------------------------
 
 
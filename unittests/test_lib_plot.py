@@ -2,6 +2,10 @@
 import unittest
 from unittests import wtc
 import wx
+import os
+import shutil
+import tempfile
+import numpy as np
 
 import wx.lib.plot as wxplot
 
@@ -13,6 +17,163 @@ class lib_plot_PlotCanvas_Tests(wtc.WidgetTestCase):
         """ Ctor? """
         p = wxplot.PlotCanvas(self.frame)
 
+    def test_lib_plot_plotcanvasAppend(self):
+        p = wxplot.PlotCanvas(self.frame, size=(300, 200))
+        stream = wxplot.PolyStream(100)
+        p.Draw(wxplot.PlotGraphics([stream]))
+        p.followWidth = 10
+        for i in range(50):
+            p.Append(stream, [i], [np.sin(i)])
+        self.assertEqual(len(stream), 50)
+        xAxis = p.last_draw[1]
+        self.assertAlmostEqual(xAxis[1] - xAxis[0], 10)
+        self.assertGreaterEqual(xAxis[1], 49)
+
+
+class lib_plot_PolyStream_Tests(wtc.WidgetTestCase):
+
+    def test_lib_plot_polystreamAppend(self):
+        stream = wxplot.PolyStream(5, [(0, 0), (1, 1)])
+        self.assertEqual(len(stream), 2)
+        stream.append([2, 3, 4, 5], [-2, 3, 4, 9])
+        self.assertEqual(len(stream), 5)
+        self.assertEqual(list(stream.points[:, 0]), [1, 2, 3, 4, 5])
+        for i in range(6, 20):
+            stream.append([i], [i % 3])
+        self.assertEqual(list(stream.points[:, 0]), [15, 16, 17, 18, 19])
+
+    def test_lib_plot_polystreamBoundingBox(self):
+        stream = wxplot.PolyStream(100)
+        data = np.random.RandomState(0).randn(1000)
+        for i in range(0, 1000, 7):
+            stream.append(np.arange(i, i + 7)[:len(data[i:i + 7])],
+                          data[i:i + 7])
+            minXY, maxXY = stream.boundingBox()
+            points = stream.points
+            self.assertTrue(np.allclose(minXY, points.min(axis=0)))
+            self.assertTrue(np.allclose(maxXY, points.max(axis=0)))
+
+    def test_lib_plot_polystreamScaleAndShift(self):
+        stream = wxplot.PolyStream(10, [(0, 0), (1, 1)])
+        stream.scaleAndShift((2, 2), (1, 1))
+        stream.append(range(2, 12), range(2, 12))
+        stream.scaleAndShift((2, 2), (1, 1))
+        self.assertTrue(np.allclose(stream.scaled, stream.points * 2 + 1))
+
+
+class lib_plot_NearestPointIndex_Tests(wtc.WidgetTestCase):
+
+    def bruteForce(self, points, xy, weights):
+        d = np.hypot(*((points - xy) * weights).T)
+        return d.min()
+
+    def checkIndex(self, points, sorted_):
+        index = wxplot.utils.NearestPointIndex(points, leafsize=8)
+        self.assertEqual(index.sorted, sorted_)
+        rs = np.random.RandomState(1)
+        for weights in [(1, 1), (100, 0.5)]:
+            for xy in rs.uniform(-3, 3, (50, 2)):
+                i, dist = index.nearest(xy, weights)
+                self.assertAlmostEqual(dist, self.bruteForce(points, xy, weights))
+                self.assertAlmostEqual(
+                    dist, np.hypot(*((points[i] - xy) * weights)))
+
+    def test_lib_plot_nearestpointindexSorted(self):
+        x = np.linspace(-2, 2, 500)
+        self.checkIndex(np.column_stack((x, np.sin(5 * x))), True)
+        self.checkIndex(np.column_stack((x[::-1], np.cos(5 * x))), True)
+
+    def test_lib_plot_nearestpointindexTree(self):
+        points = np.random.RandomState(0).randn(500, 2)
+        self.checkIndex(points, False)
+
+    def test_lib_plot_nearestpointindexEmpty(self):
+        index = wxplot.utils.NearestPointIndex(np.zeros((0, 2)))
+        self.assertEqual(len(index), 0)
+        with self.assertRaises(ValueError):
+            index.nearest((0, 0))
+
+    def test_lib_plot_getClosestPoint(self):
+        line = wxplot.PolyMarker(np.random.RandomState(2).randn(200, 2))
+        line.scaleAndShift((10, 300), (5, 5))
+        points = line.points
+        for pointScaled, weights in [(True, (10, 300)), (False, (1, 1))]:
+            i, pointXY, scaledXY, dist = line.getClosestPoint((0.1, 0.2),
+                                                              pointScaled)
+            d = np.hypot(*((points - (0.1, 0.2)) * weights).T)
+            self.assertEqual(i, np.argmin(d))
+            self.assertAlmostEqual(dist, d.min())
+            self.assertTrue(np.allclose(pointXY, points[i]))
+
+        # the index is rebuilt when the points change
+        line.points = np.array([[5.0, 5.0]])
+        line.scaleAndShift((1, 1), (0, 0))
+        self.assertEqual(line.getClosestPoint((0, 0))[0], 0)
+        self.assertEqual(len(line.getPointIndex()), 1)
+
+    def test_lib_plot_getClosestPointStream(self):
+        stream = wxplot.PolyStream(10, [(0, 0), (1, 1)])
+        self.assertEqual(stream.getClosestPoint((5, 5), False)[0], 1)
+        stream.append([2, 3, 4, 5], [2, 3, 4, 5])
+        stream.scaleAndShift()
+        self.assertEqual(stream.getClosestPoint((5, 5), False)[0], 5)
+
+
+class lib_plot_PlotRenderer_Tests(wtc.WidgetTestCase):
+
+    def setUp(self):
+        super(lib_plot_PlotRenderer_Tests, self).setUp()
+        self.tempdir = tempfile.mkdtemp()
+        x = np.linspace(0, 10, 100)
+        self.graphics = wxplot.PlotGraphics(
+            [wxplot.PolyLine(np.column_stack((x, np.sin(x))),
+                             colour='red', legend='sin')],
+            'Title', 'X', 'Y')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+        super(lib_plot_PlotRenderer_Tests, self).tearDown()
+
+
+    def test_lib_plot_plotrendererBitmap(self):
+        r = wxplot.PlotRenderer((300, 200), enableLegend=True)
+        self.assertTrue(r.enableLegend)
+        r.Draw(self.graphics)
+        bmp = r.GetBitmap()
+        self.assertEqual(tuple(bmp.GetSize()), (300, 200))
+        img = bmp.ConvertToImage()
+        self.assertEqual((img.GetRed(0, 0), img.GetGreen(0, 0)), (255, 255))
+        self.assertNotEqual(len(set(bytes(img.GetData()))), 1)
+
+        with self.assertRaises(AttributeError):
+            wxplot.PlotRenderer(noSuchOption=True)
+
+    def test_lib_plot_plotrendererSaveFile(self):
+        r = wxplot.PlotRenderer((300, 200), dpi=192)
+        self.assertEqual(r.dpi, 192)
+        r.Draw(self.graphics)
+        png = os.path.join(self.tempdir, 'plot.png')
+        svg = os.path.join(self.tempdir, 'plot.svg')
+        self.assertTrue(r.SaveFile(png))
+        self.assertTrue(r.SaveFile(svg))
+        self.assertEqual(tuple(wx.Image(png).GetSize()), (300, 200))
+        with open(svg) as f:
+            self.assertIn('<svg', f.read())
+        with self.assertRaises(ValueError):
+            r.SaveFile(os.path.join(self.tempdir, 'plot.xyz'))
+
+    def test_lib_plot_renderbatch(self):
+        names = [os.path.join(self.tempdir, 'plot%d.png' % i) for i in range(3)]
+        jobs = [(self.graphics, names[0]),
+                (self.graphics, names[1], {'size': (100, 80)}),
+                (self.graphics, names[2], {'xAxis': (0, 5), 'enableGrid': False})]
+        self.assertEqual(wxplot.RenderBatch(jobs, processes=0), [True] * 3)
+        self.assertEqual(tuple(wx.Image(names[1]).GetSize()), (100, 80))
+
+        os.remove(names[0])
+        self.assertEqual(wxplot.RenderBatch(jobs[:2], processes=2), [True] * 2)
+        self.assertTrue(os.path.exists(names[0]))
+
 
 class lib_plot_Tests(wtc.WidgetTestCase):
     def test_lib_plot_tempstyle_contextmanager(self):
@@ -13,6 +13,34 @@ class py_introspect_Tests(unittest.TestCase):
         attributes = inrspct.getAutoCompleteList("wx.")
         self.assertTrue(len(attributes) > 100)
 
+    def test_getAutoCompleteListPrefix(self):
+        sys.ps2 = '... '
+        attributes = inrspct.getAutoCompleteList("wx.", prefix='fra')
+        self.assertTrue('Frame' in attributes)
+        self.assertTrue(all(a.upper().startswith('FRA') for a in attributes))
+
+    def test_getAttributeNamesCache(self):
+        class Foo(object):
+            pass
+        foo = Foo()
+        inrspct.clearCaches()
+        self.assertFalse('bar' in inrspct.getAttributeNames(foo))
+        self.assertTrue(inrspct._attributeNamesCache.get(foo, 1) is not None)
+        # adding an attribute invalidates the cached names
+        foo.bar = 1
+        self.assertTrue('bar' in inrspct.getAttributeNames(foo))
+        del foo.bar
+        self.assertFalse('bar' in inrspct.getAttributeNames(foo))
+
+    def test_getAutoCompleteListAsync(self):
+        sys.ps2 = '... '
+        result = []
+        # not a module so this is done right away
+        called = inrspct.getAutoCompleteListAsync("x.", result.append,
+                                                  {'x': self})
+        self.assertTrue(called)
+        self.assertTrue('assertTrue' in result[0])
+
 
 #---------------------------------------------------------------------------
 
@@ -39,6 +39,46 @@ class stream_Tests(wtc.WidgetTestCase):
         self.assertTrue(image.IsOk())
 
 
+    def test_inputStreamMmap(self):
+        # mmap and BytesIO objects are read from their memory directly, and
+        # are left positioned after the data that was read.
+        import mmap
+        with open(pngFile, 'rb') as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            img = wx.Image(m)
+            self.assertTrue(img.IsOk())
+            self.assertTrue(m.tell() > 0)
+            m.close()
+
+        with open(pngFile, 'rb') as f:
+            stream = FileLikeObject(f.read())
+        img = wx.Image(stream)
+        self.assertTrue(img.IsOk())
+        self.assertTrue(stream.tell() > 0)
+        # the buffer is not held after the stream is done with it
+        stream.write(b'more')
+
+
+    def test_inputStreamReadinto(self):
+        # buffered files are read with readinto
+        with open(pngFile, 'rb') as f:
+            img = wx.Image(f)
+            self.assertTrue(img.IsOk())
+
+
+    def test_inputStreamReadAhead(self):
+        # data read ahead but not used is given back to seekable files
+        import tempfile
+        with open(pngFile, 'rb') as f:
+            data = f.read()
+        with tempfile.TemporaryFile() as f:
+            f.write(data + b'trailer')
+            f.seek(0)
+            img = wx.Image(f)
+            self.assertTrue(img.IsOk())
+            self.assertTrue(f.tell() <= len(data))
+
+
 
 #---------------------------------------------------------------------------
 
@@ -75,6 +75,68 @@ class timer_Tests(wtc.WidgetTestCase):
         self.assertTrue(self.flag)
 
 
+    def test_timerCallLaterMany(self):
+        # many timers share one native timer
+        results = []
+        for i in range(200):
+            wx.CallLater(50 + i % 10, results.append, i)
+        stopped = wx.CallLater(50, results.append, -1)
+        stopped.Stop()
+        self.waitFor(300)
+        self.assertEqual(sorted(results), list(range(200)))
+        stats = wx.GetTimerStats()
+        self.assertEqual(stats['pending'], 0)
+        self.assertTrue(stats['wakeups'] < 200)
+
+
+    def test_timerDebounce(self):
+        calls = []
+        d = wx.Debounce(100, lambda *args: calls.append(args))
+        for i in range(5):
+            d(i)
+        self.assertTrue(d.IsPending())
+        self.waitFor(300)
+        self.assertEqual(calls, [(4,)])
+        d('x')
+        d.Flush()
+        self.assertEqual(calls, [(4,), ('x',)])
+        self.assertFalse(d.IsPending())
+
+
+    def test_timerThrottle(self):
+        calls = []
+        t = wx.Throttle(100, lambda *args: calls.append(args))
+        for i in range(5):
+            t(i)
+        self.assertEqual(calls, [(0,)])
+        self.assertTrue(t.IsPending())
+        self.waitFor(300)
+        self.assertEqual(calls, [(0,), (4,)])
+
+
+    def test_timerWheelFarTimers(self):
+        # Drive a private wheel with a fixed clock so timers parked past the
+        # end of the wheel can be checked without waiting for hours.
+        wheel = wx.core._TimerWheel()
+        now = [0]
+        wheel.Now = lambda: now[0]
+        fired = {}
+        def make(name):
+            return wheel.CreateTimer(lambda: fired.setdefault(name, now[0]))
+        x, y, z, v = [make(name) for name in 'xyzv']
+        x.Start(20000000)
+        y.Start(300000)
+        now[0] = 300000
+        wheel.Notify()
+        z.Start(17000000)
+        v.Start(10)
+        while wheel.armed is not None:
+            now[0] = wheel.armed
+            wheel.Notify()
+        wheel.timer.Stop()
+        self.assertEqual(fired, dict(x=20000000, y=300000, z=17300000, v=300010))
+
+
 
 #---------------------------------------------------------------------------
 
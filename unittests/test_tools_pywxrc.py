@@ -0,0 +1,68 @@
+import unittest
+from unittests import wtc
+import wx
+import wx.xrc as xrc
+import os
+import sys
+import shutil
+import tempfile
+import importlib
+
+from wx.tools import pywxrc
+
+xrcFile = os.path.join(os.path.dirname(__file__), 'xrctest.xrc')
+
+#---------------------------------------------------------------------------
+
+class tools_pywxrc_Tests(wtc.WidgetTestCase):
+
+    def setUp(self):
+        super(tools_pywxrc_Tests, self).setUp()
+        self.tempdir = tempfile.mkdtemp()
+        sys.path.insert(0, self.tempdir)
+
+    def tearDown(self):
+        sys.path.remove(self.tempdir)
+        shutil.rmtree(self.tempdir)
+        super(tools_pywxrc_Tests, self).tearDown()
+
+
+    def makeModule(self, name, **kw):
+        outputFilename = os.path.join(self.tempdir, name + '.py')
+        comp = pywxrc.XmlResourceCompiler()
+        comp.MakePythonModule([xrcFile], outputFilename, **kw)
+        return importlib.import_module(name)
+
+
+    def test_tools_pywxrcPython(self):
+        module = self.makeModule('xrctest_xrc', embedResources=True)
+        f = module.xrcMainFrame(self.frame)
+        self.assertTrue(isinstance(f.TitleText, wx.StaticText))
+        f.Destroy()
+
+    def test_tools_pywxrcCompile(self):
+        module = self.makeModule('xrctest_compiled', compileResources=True)
+        self.assertFalse(hasattr(module, 'get_resources'))
+
+        f = module.xrcMainFrame(self.frame)
+        f.Show()
+        self.myYield()
+
+        self.assertTrue(isinstance(f.MainPanel, wx.Panel))
+        self.assertTrue(isinstance(f.TitleText, wx.StaticText))
+        self.assertEqual(f.TitleText.GetLabel(), 'Hello World')
+        self.assertEqual(f.wxID_OK.GetId(), wx.ID_OK)
+        self.assertTrue(f.FindWindow('TitleText') is f.TitleText)
+        self.assertTrue(f.FindWindow(xrc.XRCID('MainPanel')) is f.MainPanel)
+        f.Destroy()
+
+    def test_tools_pywxrcConvertXrcText(self):
+        comp = pywxrc.XmlResourceCompiler()
+        self.assertEqual(comp.ConvertXrcText('_File'), '&File')
+        self.assertEqual(comp.ConvertXrcText('snake__case'), 'snake_case')
+        self.assertEqual(comp.ConvertXrcText('one\\ntwo'), 'one\ntwo')
+
+#---------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
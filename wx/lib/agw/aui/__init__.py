@@ -287,9 +287,101 @@ __date__ = "31 March 2009"
 
 from .aui_constants import *
 from .aui_utilities import *
-from .framemanager import *
-from .auibar import *
-from .auibook import *
-from .tabart import *
-from .dockart import *
-from .tabmdi import *
+
+# The other modules are only imported when one of their names is used, so that
+# e.g. an application using just AuiManager doesn't load the toolbar and MDI code
+from wx.lib.lazyimport import InstallLazyLoader
+
+InstallLazyLoader(globals(), {
+    'framemanager': (
+        'wxEVT_AUI_PANE_BUTTON', 'wxEVT_AUI_PANE_CLOSE', 'wxEVT_AUI_PANE_CLOSED',
+        'wxEVT_AUI_PANE_MAXIMIZE', 'wxEVT_AUI_PANE_RESTORE', 'wxEVT_AUI_RENDER',
+        'wxEVT_AUI_FIND_MANAGER', 'wxEVT_AUI_PANE_MINIMIZE',
+        'wxEVT_AUI_PANE_MIN_RESTORE', 'wxEVT_AUI_PANE_FLOATING',
+        'wxEVT_AUI_PANE_FLOATED', 'wxEVT_AUI_PANE_DOCKING', 'wxEVT_AUI_PANE_DOCKED',
+        'wxEVT_AUI_PANE_ACTIVATED', 'wxEVT_AUI_PERSPECTIVE_CHANGED',
+        'EVT_AUI_PANE_BUTTON', 'EVT_AUI_PANE_CLOSE', 'EVT_AUI_PANE_CLOSED',
+        'EVT_AUI_PANE_MAXIMIZE', 'EVT_AUI_PANE_RESTORE', 'EVT_AUI_RENDER',
+        'EVT_AUI_FIND_MANAGER', 'EVT_AUI_PANE_MINIMIZE', 'EVT_AUI_PANE_MIN_RESTORE',
+        'EVT_AUI_PANE_FLOATING', 'EVT_AUI_PANE_FLOATED', 'EVT_AUI_PANE_DOCKING',
+        'EVT_AUI_PANE_DOCKED', 'EVT_AUI_PANE_ACTIVATED',
+        'EVT_AUI_PERSPECTIVE_CHANGED', 'AuiDockInfo', 'AuiDockingGuideInfo',
+        'AuiDockUIPart', 'AuiPaneButton', 'AuiManagerEvent', 'AuiPaneInfo',
+        'NonePaneInfo', 'AuiDockingGuide', 'AuiDockingGuideWindow',
+        'AuiSingleDockingGuide', 'AuiCenterDockingGuide', 'AuiDockingHintWindow',
+        'AuiFloatingFrame', 'DrawResizeHint', 'CopyDocksAndPanes',
+        'CopyDocksAndPanes2', 'GetMaxLayer', 'GetMaxRow', 'DoInsertDockLayer',
+        'DoInsertDockRow', 'DoInsertPane', 'FindDocks', 'FindOppositeDocks',
+        'FindPaneInDock', 'GetToolBarDockOffsets', 'GetInternalFrameRect',
+        'CheckOutOfWindow', 'CheckEdgeDrop', 'RemovePaneFromDocks',
+        'RenumberDockRows', 'SetActivePane', 'ShowDockingGuides',
+        'RefreshDockingGuides', 'PaneSortFunc', 'GetNotebookRoot', 'EscapeDelimiters',
+        'IsDifferentDockingPosition', 'AuiManager_HasLiveResize',
+        'AuiManager_UseNativeMiniframes', 'GetManager', 'AuiManager', 'AuiManager_DCP',
+        ),
+    'auibar': (
+        'wxEVT_COMMAND_AUITOOLBAR_TOOL_DROPDOWN',
+        'wxEVT_COMMAND_AUITOOLBAR_OVERFLOW_CLICK',
+        'wxEVT_COMMAND_AUITOOLBAR_RIGHT_CLICK',
+        'wxEVT_COMMAND_AUITOOLBAR_MIDDLE_CLICK',
+        'wxEVT_COMMAND_AUITOOLBAR_BEGIN_DRAG', 'EVT_AUITOOLBAR_TOOL_DROPDOWN',
+        'EVT_AUITOOLBAR_OVERFLOW_CLICK', 'EVT_AUITOOLBAR_RIGHT_CLICK',
+        'EVT_AUITOOLBAR_MIDDLE_CLICK', 'EVT_AUITOOLBAR_BEGIN_DRAG',
+        'CommandToolBarEvent', 'AuiToolBarEvent', 'ToolbarCommandCapture',
+        'AuiToolBarItem', 'AuiDefaultToolBarArt', 'AuiToolBar',
+        ),
+    'auibook': (
+        'wxEVT_COMMAND_AUINOTEBOOK_PAGE_CLOSE',
+        'wxEVT_COMMAND_AUINOTEBOOK_PAGE_CLOSED',
+        'wxEVT_COMMAND_AUINOTEBOOK_PAGE_CHANGED',
+        'wxEVT_COMMAND_AUINOTEBOOK_PAGE_CHANGING', 'wxEVT_COMMAND_AUINOTEBOOK_BUTTON',
+        'wxEVT_COMMAND_AUINOTEBOOK_BEGIN_DRAG', 'wxEVT_COMMAND_AUINOTEBOOK_END_DRAG',
+        'wxEVT_COMMAND_AUINOTEBOOK_DRAG_MOTION',
+        'wxEVT_COMMAND_AUINOTEBOOK_ALLOW_DND', 'wxEVT_COMMAND_AUINOTEBOOK_DRAG_DONE',
+        'wxEVT_COMMAND_AUINOTEBOOK_TAB_LEFT_UP',
+        'wxEVT_COMMAND_AUINOTEBOOK_TAB_MIDDLE_DOWN',
+        'wxEVT_COMMAND_AUINOTEBOOK_TAB_MIDDLE_UP',
+        'wxEVT_COMMAND_AUINOTEBOOK_TAB_RIGHT_DOWN',
+        'wxEVT_COMMAND_AUINOTEBOOK_TAB_RIGHT_UP',
+        'wxEVT_COMMAND_AUINOTEBOOK_TAB_DCLICK',
+        'wxEVT_COMMAND_AUINOTEBOOK_BG_LEFT_UP',
+        'wxEVT_COMMAND_AUINOTEBOOK_BG_MIDDLE_DOWN',
+        'wxEVT_COMMAND_AUINOTEBOOK_BG_MIDDLE_UP',
+        'wxEVT_COMMAND_AUINOTEBOOK_BG_RIGHT_DOWN',
+        'wxEVT_COMMAND_AUINOTEBOOK_BG_RIGHT_UP',
+        'wxEVT_COMMAND_AUINOTEBOOK_BG_DCLICK',
+        'wxEVT_COMMAND_AUINOTEBOOK_CANCEL_DRAG',
+        'wxEVT_COMMAND_AUINOTEBOOK_BEGIN_LABEL_EDIT',
+        'wxEVT_COMMAND_AUINOTEBOOK_END_LABEL_EDIT', 'EVT_AUINOTEBOOK_PAGE_CLOSE',
+        'EVT_AUINOTEBOOK_PAGE_CLOSED', 'EVT_AUINOTEBOOK_PAGE_CHANGED',
+        'EVT_AUINOTEBOOK_PAGE_CHANGING', 'EVT_AUINOTEBOOK_BUTTON',
+        'EVT_AUINOTEBOOK_BEGIN_DRAG', 'EVT_AUINOTEBOOK_END_DRAG',
+        'EVT_AUINOTEBOOK_DRAG_MOTION', 'EVT_AUINOTEBOOK_ALLOW_DND',
+        'EVT_AUINOTEBOOK_DRAG_DONE', 'EVT_AUINOTEBOOK_TAB_LEFT_UP',
+        'EVT_AUINOTEBOOK_TAB_MIDDLE_DOWN', 'EVT_AUINOTEBOOK_TAB_MIDDLE_UP',
+        'EVT_AUINOTEBOOK_TAB_RIGHT_DOWN', 'EVT_AUINOTEBOOK_TAB_RIGHT_UP',
+        'EVT_AUINOTEBOOK_BG_LEFT_UP', 'EVT_AUINOTEBOOK_BG_MIDDLE_DOWN',
+        'EVT_AUINOTEBOOK_BG_MIDDLE_UP', 'EVT_AUINOTEBOOK_BG_RIGHT_DOWN',
+        'EVT_AUINOTEBOOK_BG_RIGHT_UP', 'EVT_AUINOTEBOOK_BG_DCLICK',
+        'EVT_AUINOTEBOOK_CANCEL_DRAG', 'EVT_AUINOTEBOOK_TAB_DCLICK',
+        'EVT_AUINOTEBOOK_BEGIN_LABEL_EDIT', 'EVT_AUINOTEBOOK_END_LABEL_EDIT',
+        'TabTextCtrl', 'AuiNotebookPage', 'AuiTabContainerButton',
+        'CommandNotebookEvent', 'AuiNotebookEvent', 'TabNavigatorProps',
+        'TabNavigatorWindow', 'AuiTabContainer', 'AuiTabCtrl', 'TabFrame',
+        'AuiNotebook',
+        ),
+    'tabart': (
+        'AuiCommandCapture', 'AuiDefaultTabArt', 'AuiSimpleTabArt', 'VC71TabArt',
+        'FF2TabArt', 'VC8TabArt', 'ChromeTabArt',
+        ),
+    'dockart': (
+        'optionActive', 'AuiDefaultDockArt', 'RECT', 'SIZE', 'ModernDockArt',
+        ),
+    'tabmdi': (
+        'AuiMDIParentFrame', 'AuiMDIChildFrame', 'AuiMDIClientWindow',
+        ),
+
+    }, starImports=('aui_constants', 'aui_utilities', 'framemanager', 'auibar',
+                    'auibook', 'tabart', 'dockart', 'tabmdi'))
+
+del InstallLazyLoader
@@ -350,6 +350,9 @@ class AuiNotebookPage(object):
 
         self.access_time = datetime.datetime.now() # Last time this page was selected
 
+        self.tab_size = None            # cached result of the art provider GetTabSize
+        self.tab_size_key = None        # what the tab looked like when it was measured
+
 
     def IsMultiline(self):
         """ Returns whether the tab contains multiline text. """
@@ -930,6 +933,13 @@ class AuiTabContainer(object):
         self._rect = wx.Rect()
         self._auiNotebook = auiNotebook
 
+        # Bumped whenever the cached tab sizes of the pages become invalid
+        self._tab_size_generation = 0
+        # Maps the page windows to their index, rebuilt when pages are added or removed
+        self._page_index = None
+        # The off-screen bitmap Render draws into, reused while the size stays the same
+        self._buffer = None
+
         self.AddButton(AUI_BUTTON_LEFT, wx.LEFT, name="Scroll Left")
         self.AddButton(AUI_BUTTON_RIGHT, wx.RIGHT, name="Scroll Right")
         self.AddButton(AUI_BUTTON_WINDOWLIST, wx.RIGHT, name="Window List")
@@ -952,6 +962,8 @@ class AuiTabContainer(object):
         if self._art:
             self._art.SetAGWFlags(self._agwFlags)
 
+        self.InvalidateTabSizes()
+
 
     def GetArtProvider(self):
         """ Returns the current art provider being used. """
@@ -1019,6 +1031,8 @@ class AuiTabContainer(object):
         if self._art:
             self._art.SetAGWFlags(self._agwFlags)
 
+        self.InvalidateTabSizes()
+
 
     def GetAGWFlags(self):
         """
@@ -1038,6 +1052,7 @@ class AuiTabContainer(object):
         """
 
         self._art.SetNormalFont(font)
+        self.InvalidateTabSizes()
 
 
     def SetSelectedFont(self, font):
@@ -1048,6 +1063,7 @@ class AuiTabContainer(object):
         """
 
         self._art.SetSelectedFont(font)
+        self.InvalidateTabSizes()
 
 
     def SetMeasuringFont(self, font):
@@ -1058,6 +1074,7 @@ class AuiTabContainer(object):
         """
 
         self._art.SetMeasuringFont(font)
+        self.InvalidateTabSizes()
 
 
     def SetTabRect(self, rect):
@@ -1068,10 +1085,66 @@ class AuiTabContainer(object):
         """
 
         self._rect = rect
+        self.UpdateSizingInfo()
 
-        if self._art:
-            minMaxTabWidth = self._auiNotebook.GetMinMaxTabWidth()
-            self._art.SetSizingInfo(rect.GetSize(), len(self._pages), minMaxTabWidth)
+
+    def UpdateSizingInfo(self):
+        """
+        Lets the art provider know the size of the tab area and the number of pages,
+        invalidating the cached tab sizes if the fixed tab width changes.
+        """
+
+        if not self._art:
+            return
+
+        minMaxTabWidth = self._auiNotebook.GetMinMaxTabWidth()
+        fixedWidth = getattr(self._art, "_fixed_tab_width", self)
+        self._art.SetSizingInfo(self._rect.GetSize(), len(self._pages), minMaxTabWidth)
+
+        # Art providers without a fixed width attribute may size the tabs on anything
+        if fixedWidth is self or fixedWidth != getattr(self._art, "_fixed_tab_width", None):
+            self.InvalidateTabSizes()
+
+
+    def InvalidateTabSizes(self):
+        """
+        Discards the tab sizes cached by :meth:`GetPageTabSize`, so that the tabs
+        are measured again the next time they are rendered.
+
+        This is done automatically when the art provider, its fonts or the flags are
+        changed through :class:`AuiTabContainer`; call it after changing the
+        settings of the art provider directly.
+        """
+
+        self._tab_size_generation += 1
+
+
+    def GetPageTabSize(self, dc, wnd, page, close_button_state):
+        """
+        Returns the size of the tab of `page`, as calculated by the art provider
+        `GetTabSize` method.
+
+        The result is cached in the page and only computed again when the caption,
+        bitmap, active state, close button or control of the page change, or after
+        :meth:`InvalidateTabSizes` has been called.
+
+        :param `dc`: a :class:`wx.DC` device context;
+        :param `wnd`: an instance of :class:`wx.Window`;
+        :param `page`: an instance of :class:`AuiNotebookPage`;
+        :param integer `close_button_state`: the state of the close button on the tab.
+        """
+
+        control = page.control
+        # the pages may be shared with the notebook's own container, hence the self
+        key = (self, self._tab_size_generation, page.caption, id(page.bitmap), page.active,
+               close_button_state, control and control.GetSize().GetWidth())
+
+        if page.tab_size_key != key:
+            page.tab_size = self._art.GetTabSize(dc, wnd, page.caption, page.bitmap, page.active,
+                                                 close_button_state, control)
+            page.tab_size_key = key
+
+        return page.tab_size
 
 
     def AddPage(self, page, info):
@@ -1086,11 +1159,11 @@ class AuiTabContainer(object):
         page_info.window = page
 
         self._pages.append(page_info)
+        if self._page_index is not None:
+            self._page_index.setdefault(page, len(self._pages) - 1)
 
         # let the art provider know how many pages we have
-        if self._art:
-            minMaxTabWidth = self._auiNotebook.GetMinMaxTabWidth()
-            self._art.SetSizingInfo(self._rect.GetSize(), len(self._pages), minMaxTabWidth)
+        self.UpdateSizingInfo()
 
         return True
 
@@ -1112,10 +1185,10 @@ class AuiTabContainer(object):
         else:
             self._pages.insert(idx, page_info)
 
+        self._page_index = None
+
         # let the art provider know how many pages we have
-        if self._art:
-            minMaxTabWidth = self._auiNotebook.GetMinMaxTabWidth()
-            self._art.SetSizingInfo(self._rect.GetSize(), len(self._pages), minMaxTabWidth)
+        self.UpdateSizingInfo()
 
         return True
 
@@ -1151,20 +1224,18 @@ class AuiTabContainer(object):
         :param `wnd`: an instance of :class:`wx.Window`, a window associated with this tab.
         """
 
-        minMaxTabWidth = self._auiNotebook.GetMinMaxTabWidth()
-
-        for page in self._pages:
-            if page.window == wnd:
-                self._pages.remove(page)
-                self._tab_offset = min(self._tab_offset, len(self._pages) - 1)
+        idx = self.GetIdxFromWindow(wnd)
+        if idx == wx.NOT_FOUND:
+            return False
 
-                # let the art provider know how many pages we have
-                if self._art:
-                    self._art.SetSizingInfo(self._rect.GetSize(), len(self._pages), minMaxTabWidth)
+        del self._pages[idx]
+        self._page_index = None
+        self._tab_offset = min(self._tab_offset, len(self._pages) - 1)
 
-                return True
+        # let the art provider know how many pages we have
+        self.UpdateSizingInfo()
 
-        return False
+        return True
 
 
     def SetActivePage(self, wndOrInt):
@@ -1236,11 +1307,27 @@ class AuiTabContainer(object):
         :param `wnd`: an instance of :class:`wx.Window`.
         """
 
+        index = self._page_index
+        if index is None or len(index) != len(self._pages):
+            index = self.BuildPageIndex()
+
+        idx = index.get(wnd, wx.NOT_FOUND)
+        if idx != wx.NOT_FOUND and (idx >= len(self._pages) or self._pages[idx].window != wnd):
+            # the pages were changed without going through AuiTabContainer
+            idx = self.BuildPageIndex().get(wnd, wx.NOT_FOUND)
+
+        return idx
+
+
+    def BuildPageIndex(self):
+        """ Rebuilds and returns the dictionary mapping the page windows to their index. """
+
+        index = {}
         for indx, page in enumerate(self._pages):
-            if page.window == wnd:
-                return indx
+            index.setdefault(page.window, indx)
 
-        return wx.NOT_FOUND
+        self._page_index = index
+        return index
 
 
     def GetPage(self, idx):
@@ -1461,9 +1548,11 @@ class AuiTabContainer(object):
         page_count = len(self._pages)
         button_count = len(self._buttons)
 
-        # create off-screen bitmap
-        bmp = wx.Bitmap(self._rect.GetWidth(), self._rect.GetHeight())
-        dc.SelectObject(bmp)
+        # create off-screen bitmap, or reuse the one from the last time
+        if self._buffer is None or self._buffer.GetSize() != self._rect.GetSize():
+            self._buffer = wx.Bitmap(self._rect.GetWidth(), self._rect.GetHeight())
+
+        dc.SelectObject(self._buffer)
 
         if not dc.IsOk():
             return
@@ -1506,9 +1595,8 @@ class AuiTabContainer(object):
                 except RuntimeError:
                     page.control = None
 
-            size, x_extent = self._art.GetTabSize(dc, wnd, page.caption, page.bitmap, page.active,
-                                                  (close_button and [AUI_BUTTON_STATE_NORMAL] or \
-                                                   [AUI_BUTTON_STATE_HIDDEN])[0], page.control)
+            size, x_extent = self.GetPageTabSize(dc, wnd, page, (close_button and [AUI_BUTTON_STATE_NORMAL] or \
+                                                                 [AUI_BUTTON_STATE_HIDDEN])[0])
 
             if i+1 < page_count:
                 total_width += x_extent
@@ -1637,7 +1725,7 @@ class AuiTabContainer(object):
         if self._tab_offset > 0:
             page = self._pages[self._tab_offset - 1]
             tab_button = self._tab_close_buttons[self._tab_offset - 1]
-            size, x_extent = self._art.GetTabSize(dc, wnd, page.caption, page.bitmap, page.active, tab_button.cur_state, page.control)
+            size, x_extent = self.GetPageTabSize(dc, wnd, page, tab_button.cur_state)
 
             rect = wx.Rect(offset - x_extent, 0, self._rect.width - right_buttons_width - offset - x_extent - 2, self._rect.height)
             clip_rect = wx.Rect(*self._rect)
@@ -1712,6 +1800,7 @@ class AuiTabContainer(object):
             dummy = self._art.DrawTab(dc, wnd, page, active_rect, tab_button.cur_state)
 
         raw_dc.Blit(self._rect.x, self._rect.y, self._rect.GetWidth(), self._rect.GetHeight(), dc, 0, 0)
+        dc.SelectObject(wx.NullBitmap)
 
 
     def IsTabVisible(self, tabPage, tabOffset, dc, wnd):
@@ -1810,7 +1899,7 @@ class AuiTabContainer(object):
             if rect.width <= 0:
                 return False # haven't found the tab, and we've run out of space, so return False
 
-            size, x_extent = self._art.GetTabSize(dc, wnd, page.caption, page.bitmap, page.active, tab_button.cur_state, page.control)
+            size, x_extent = self.GetPageTabSize(dc, wnd, page, tab_button.cur_state)
             offset += x_extent
 
             if i == tabPage:
@@ -96,6 +96,7 @@ __author__ = "Andrea Gavana <andrea.gavana@gmail.com>"
 __date__ = "31 March 2009"
 
 import wx
+import sys
 # just for isinstance
 from time import time
 
@@ -107,10 +108,9 @@ import warnings
 
 import six
 
-from . import auibar
+# auibar and tabmdi are imported only when a toolbar or MDI frame is used
 from . import auibook
 
-from . import tabmdi
 from . import dockart
 from . import tabart
 
@@ -121,6 +121,20 @@ from .aui_constants import *
 # Define this as a translation function
 _ = wx.GetTranslation
 
+
+def _IsInstanceOf(obj, moduleName, className):
+    """
+    Returns whether `obj` is an instance of the class `className` defined in the
+    AUI module `moduleName`.
+
+    The module is not imported if it hasn't been already: nothing can be an
+    instance of its classes then.
+    """
+
+    module = sys.modules.get(__name__.rpartition(".")[0] + "." + moduleName)
+    return module is not None and isinstance(obj, getattr(module, className))
+
+
 _winxptheme = False
 if wx.Platform == "__WXMSW__":
     try:
@@ -2823,7 +2837,7 @@ class AuiFloatingFrame(wx.MiniFrame):
         self._is_toolbar = pane.IsToolbar()
         self._pane_window = pane.window
 
-        if isinstance(pane.window, auibar.AuiToolBar):
+        if _IsInstanceOf(pane.window, "auibar", "AuiToolBar"):
             pane.window.SetAuiManager(self._mgr)
 
         self._pane_window.Reparent(self)
@@ -2949,7 +2963,7 @@ class AuiFloatingFrame(wx.MiniFrame):
         if not event.GetVeto():
             self._mgr.DetachPane(self._pane_window)
 
-            if isinstance(self._pane_window, auibar.AuiToolBar):
+            if _IsInstanceOf(self._pane_window, "auibar", "AuiToolBar"):
                 self._pane_window.SetAuiManager(self._owner_mgr)
 
             # if we do not do this, then we can crash...
@@ -3849,7 +3863,7 @@ def GetManager(window):
     """
 
     if not isinstance(wx.GetTopLevelParent(window), AuiFloatingFrame):
-        if isinstance(window, auibar.AuiToolBar):
+        if _IsInstanceOf(window, "auibar", "AuiToolBar"):
             return window.GetAuiManager()
 
     evt = AuiManagerEvent(wxEVT_AUI_FIND_MANAGER)
@@ -4299,7 +4313,7 @@ class AuiManager(wx.EvtHandler):
             self.AddPane(client_window, AuiPaneInfo().Name("mdiclient").
                          CenterPane().PaneBorder(False))
 
-        elif isinstance(self._frame, tabmdi.AuiMDIParentFrame):
+        elif _IsInstanceOf(self._frame, "tabmdi", "AuiMDIParentFrame"):
 
             mdi_frame = self._frame
             client_window = mdi_frame.GetClientWindow()
@@ -4586,7 +4600,7 @@ class AuiManager(wx.EvtHandler):
             pinfo.buttons.append(button)
 
         if pinfo.HasGripper():
-            if isinstance(pinfo.window, auibar.AuiToolBar):
+            if _IsInstanceOf(pinfo.window, "auibar", "AuiToolBar"):
                 # prevent duplicate gripper -- both AuiManager and AuiToolBar
                 # have a gripper control.  The toolbar's built-in gripper
                 # meshes better with the look and feel of the control than ours,
@@ -4618,7 +4632,7 @@ class AuiManager(wx.EvtHandler):
                     pinfo.best_size.y = pinfo.min_size.y
 
         self._panes[-1] = pinfo
-        if isinstance(window, auibar.AuiToolBar):
+        if _IsInstanceOf(window, "auibar", "AuiToolBar"):
             window.SetAuiManager(self)
 
         return True
@@ -4853,7 +4867,7 @@ class AuiManager(wx.EvtHandler):
             to_destroy = pane_info.window
             self.DetachPane(to_destroy)
         else:
-            if isinstance(pane_info.window, auibar.AuiToolBar) and pane_info.IsFloating():
+            if _IsInstanceOf(pane_info.window, "auibar", "AuiToolBar") and pane_info.IsFloating():
                 tb = pane_info.window
                 if pane_info.dock_direction in [AUI_DOCK_LEFT, AUI_DOCK_RIGHT]:
                     tb.SetAGWWindowStyleFlag(tb.GetAGWWindowStyleFlag() | AUI_TB_VERTICAL)
@@ -5312,7 +5326,7 @@ class AuiManager(wx.EvtHandler):
             pane.buttons = p.buttons
             self._panes[indx] = pane
 
-            if isinstance(pane.window, auibar.AuiToolBar) and (pane.IsFloatable() or pane.IsDockable()):
+            if _IsInstanceOf(pane.window, "auibar", "AuiToolBar") and (pane.IsFloatable() or pane.IsDockable()):
                 pane.window.SetGripperVisible(True)
 
         for p in self._panes:
@@ -6200,7 +6214,7 @@ class AuiManager(wx.EvtHandler):
 
             # reparent to self._frame and destroy the pane
             p.window.Reparent(self._frame)
-            if isinstance(p.window, auibar.AuiToolBar):
+            if _IsInstanceOf(p.window, "auibar", "AuiToolBar"):
                 p.window.SetAuiManager(self)
 
             if p.frame:
@@ -6232,7 +6246,7 @@ class AuiManager(wx.EvtHandler):
             if p.IsFloating():
                 if p.IsToolbar():
                     bar = p.window
-                    if isinstance(bar, auibar.AuiToolBar):
+                    if _IsInstanceOf(bar, "auibar", "AuiToolBar"):
                         bar.SetGripperVisible(False)
                         agwStyle = bar.GetAGWWindowStyleFlag()
                         bar.SetAGWWindowStyleFlag(agwStyle & ~AUI_TB_VERTICAL)
@@ -7296,7 +7310,7 @@ class AuiManager(wx.EvtHandler):
          window associated with it.
         """
 
-        if not isinstance(pane.window, auibar.AuiToolBar):
+        if not _IsInstanceOf(pane.window, "auibar", "AuiToolBar"):
             return pane
 
         if pane.IsFloating():
@@ -8610,8 +8624,8 @@ class AuiManager(wx.EvtHandler):
             else:
                 self.Repaint()
 
-            if isinstance(self._frame, wx.MDIParentFrame) or isinstance(self._frame, tabmdi.AuiMDIClientWindow) \
-                    or isinstance(self._frame, tabmdi.AuiMDIParentFrame):
+            if isinstance(self._frame, wx.MDIParentFrame) or _IsInstanceOf(self._frame, "tabmdi", "AuiMDIClientWindow") \
+                    or _IsInstanceOf(self._frame, "tabmdi", "AuiMDIParentFrame"):
                 # for MDI parent frames, this event must not
                 # be "skipped".  In other words, the parent frame
                 # must not be allowed to resize the client window
@@ -9839,6 +9853,7 @@ class AuiManager(wx.EvtHandler):
             win_rect = paneInfo.window.GetScreenRect()
 
             if posMask != AUI_MINIMIZE_POS_TOOLBAR:
+                from . import auibar
                 minimize_toolbar = auibar.AuiToolBar(self.GetManagedWindow(), agwStyle=tbStyle)
                 minimize_toolbar.Hide()
                 minimize_toolbar.SetToolBitmapSize(wx.Size(16, 16))
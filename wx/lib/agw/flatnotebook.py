@@ -1715,6 +1715,10 @@ class FNBRenderer(object):
 
         self._tabHeight = None
 
+        # Caches the width of the tab captions, see GetCaptionWidth
+        self._captionWidths = {}
+        self._measuringDC = None
+
         if wx.Platform == "__WXMAC__":
             k = Carbon.Appearance.kThemeBrushFocusHighlight if CARBON else 19
             # Get proper highlight colour for focus rectangle from the
@@ -2126,6 +2130,41 @@ class FNBRenderer(object):
                 dc.DrawLine(clientRect.width - 1, 0, clientRect.width - 1, clientRect.height+1)
 
 
+    def GetCaptionWidth(self, caption, bold=True):
+        """
+        Returns the width of a tab caption drawn with the default GUI font.
+
+        The widths are cached, so that the tabs don't need to be measured again
+        every time the :class:`PageContainer` is painted or resized.
+
+        :param string `caption`: the tab caption;
+        :param bool `bold`: whether to measure the caption with the bold font.
+        """
+
+        key = (caption, bold)
+        width = self._captionWidths.get(key)
+
+        if width is None:
+            if self._measuringDC is None:
+                self._measuringDC = wx.MemoryDC()
+                self._measuringDC.SelectObject(wx.Bitmap(1,1))
+                self._normalFont = wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT)
+                self._boldFont = wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT)
+                self._boldFont.SetWeight(wx.FONTWEIGHT_BOLD)
+
+            dc = self._measuringDC
+            dc.SetFont(bold and self._boldFont or self._normalFont)
+            width, pom = dc.GetTextExtent(caption)
+
+            # Don't let the cache grow without limit when the captions keep changing
+            if len(self._captionWidths) >= 2000:
+                self._captionWidths.clear()
+
+            self._captionWidths[key] = width
+
+        return width
+
+
     def CalcTabWidth(self, pageContainer, tabIdx, tabHeight):
         """
         Calculates the width of the input tab.
@@ -2136,19 +2175,13 @@ class FNBRenderer(object):
         """
 
         pc = pageContainer
-        dc = wx.MemoryDC()
-        dc.SelectObject(wx.Bitmap(1,1))
-
-        boldFont = wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT)
-        boldFont.SetWeight(wx.FONTWEIGHT_BOLD)
 
         if pc.IsDefaultTabs():
             shapePoints = int(tabHeight*math.tan(float(pc._pagesInfoVec[tabIdx].GetTabAngle())/180.0*math.pi))
 
         # Calculate the text length using the bold font, so when selecting a tab
         # its width will not change
-        dc.SetFont(boldFont)
-        width, pom = dc.GetTextExtent(pc.GetPageText(tabIdx))
+        width = self.GetCaptionWidth(pc.GetPageText(tabIdx))
 
         # Set a minimum size to a tab
         if width < 20:
@@ -3627,16 +3660,11 @@ class FNBRendererRibbonTabs(FNBRenderer):
         """
 
         pc = pageContainer
-        dc = wx.MemoryDC()
-        dc.SelectObject(wx.Bitmap(1,1))
-
-        font = wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT)
 
         if pc.IsDefaultTabs():
             shapePoints = int(tabHeight*math.tan(float(pc._pagesInfoVec[tabIdx].GetTabAngle())/180.0*math.pi))
 
-        dc.SetFont(font)
-        width, pom = dc.GetTextExtent(pc.GetPageText(tabIdx))
+        width = self.GetCaptionWidth(pc.GetPageText(tabIdx), bold=False)
 
         # Set a minimum size to a tab
         if width < 20:
@@ -5126,6 +5154,9 @@ class PageContainer(wx.Panel):
         self._nFrom = 0
         self._isdragging = False
 
+        # The bitmap OnPaint draws into, kept while the size stays the same
+        self._paintBuffer = None
+
         # Set default page height, this is done according to the system font
         memDc = wx.MemoryDC()
         memDc.SelectObject(wx.Bitmap(1,1))
@@ -5195,7 +5226,11 @@ class PageContainer(wx.Panel):
         :param `event`: a :class:`PaintEvent` event to be processed.
         """
 
-        dc = wx.BufferedPaintDC(self)
+        size = self.GetClientSize()
+        if self._paintBuffer is None or self._paintBuffer.GetSize() != size:
+            self._paintBuffer = wx.Bitmap(max(size.x, 1), max(size.y, 1))
+
+        dc = wx.BufferedPaintDC(self, self._paintBuffer)
         parent = self.GetParent()
 
         renderer = self._mgr.GetRenderer(parent.GetAGWWindowStyleFlag())
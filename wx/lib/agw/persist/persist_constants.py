@@ -11,7 +11,6 @@ This module contains all the constants used by the persistent objects.
 """
 
 import wx
-import wx.dataview as dv
 import six
 
 # ----------------------------------------------------------------------------------- #
@@ -37,12 +36,9 @@ for name in dir(wx):
             val = val.decode('utf-8')
         BAD_DEFAULT_NAMES.append(val)
 
-for name in dir(dv):
-    if "NameStr" in name:
-        val = getattr(dv, name)
-        if six.PY3 and isinstance(val, bytes):
-            val = val.decode('utf-8')
-        BAD_DEFAULT_NAMES.append(val)
+# wx.dataview.DataViewCtrlNameStr and wx.dataview.TreeListCtrlNameStr, spelled
+# out to avoid importing wx.dataview just for them
+BAD_DEFAULT_NAMES.extend(["dataviewCtrl", "wxTreeListCtrl"])
 
 # ----------------------------------------------------------------------------------- #
 # String constants used by BookHandler
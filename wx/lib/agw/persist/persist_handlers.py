@@ -11,51 +11,56 @@ actions depending on the widget kind.
 """
 
 import wx
+import sys
 import datetime
 
-import wx.adv
-import wx.html
+# The widget modules (wx.html, wx.dataview, masked, AUI and the other AGW
+# widgets) are not imported here: handlers are looked up by class names in the
+# HANDLERS tables below, which are resolved only against modules that the
+# application itself has already imported.
 
-# use this instead of wx.gizmos.TreeListCtrl
-import wx.dataview as dv
+from .persist_constants import *
 
-# Will likely not be wrapped
-# import wx.aui
 
-# Not wrapped, unmaintained
-# import wx.gizmos
+def GetClass(path):
+    """
+    Returns the class named by `path` if its module has already been imported,
+    ``None`` otherwise.
 
-# Not wrapped yet, coming soon
-# import wx.media
+    :param `path`: the full dotted name of a class, i.e. "wx.lib.agw.aui.auibook.AuiNotebook".
+    """
 
-import wx.lib.scrolledpanel as scrolled
-import wx.lib.expando as expando
-import wx.lib.buttons as buttons
-import wx.lib.masked as masked
-import wx.lib.colourselect as csel
+    klass = _classCache.get(path)
+    if klass is None:
+        moduleName, className = path.rsplit(".", 1)
+        module = sys.modules.get(moduleName)
+        if module is None:
+            # If the module isn't loaded yet no window can be an instance of it
+            return None
 
-import wx.lib.agw.aui as AUI
-import wx.lib.agw.cubecolourdialog as CCD
-import wx.lib.agw.customtreectrl as CT
-import wx.lib.agw.flatmenu as FM
-import wx.lib.agw.flatnotebook as FNB
-import wx.lib.agw.floatspin as FS
-import wx.lib.agw.foldpanelbar as FPB
-import wx.lib.agw.hypertreelist as HTL
-import wx.lib.agw.knobctrl as KC
-import wx.lib.agw.labelbook as LBK
-import wx.lib.agw.pycollapsiblepane as PCP
+        klass = getattr(module, className, None)
+        if klass is not None:
+            _classCache[path] = klass
 
-try:
-    import wx.lib.agw.shapedbutton as SB
-    hasSB = True
-except:
-    hasSB = False
-    pass
+    return klass
 
-import wx.lib.agw.ultimatelistctrl as ULC
+_classCache = {}
 
-from .persist_constants import *
+
+def IsKindOf(klass, *paths):
+    """
+    Returns ``True`` if `klass` is a subclass of any of the classes named in `paths`.
+
+    :param `klass`: the class to check;
+    :param `paths`: full dotted class names, see :func:`GetClass`.
+    """
+
+    for path in paths:
+        subclass = GetClass(path)
+        if subclass is not None and issubclass(klass, subclass):
+            return True
+
+    return False
 
 
 def PyDate2wxDate(date):
@@ -194,7 +199,7 @@ class BookHandler(AbstractHandler):
         book, obj = self._window, self._pObject
         obj.SaveValue(PERSIST_BOOK_SELECTION, book.GetSelection())
 
-        if issubclass(book.__class__, AUI.AuiNotebook):
+        if IsKindOf(book.__class__, "wx.lib.agw.aui.auibook.AuiNotebook"):
             if self._manager.GetManagerStyle() & PM_SAVE_RESTORE_AUI_PERSPECTIVES:
                 # Allowed to save and restore perspectives
                 perspective = book.SavePerspective()
@@ -207,7 +212,7 @@ class BookHandler(AbstractHandler):
         sel = obj.RestoreValue(PERSIST_BOOK_SELECTION)
 
         retVal = True
-        if issubclass(book.__class__, AUI.AuiNotebook):
+        if IsKindOf(book.__class__, "wx.lib.agw.aui.auibook.AuiNotebook"):
             if self._manager.GetManagerStyle() & PM_SAVE_RESTORE_AUI_PERSPECTIVES:
                 retVal = False
                 # Allowed to save and restore perspectives
@@ -303,7 +308,7 @@ class AUIHandler(AbstractHandler):
         # Save the AUI perspectives if PersistenceManager allows it
         eventHandler = self._window.GetEventHandler()
 
-        isAGWAui = isinstance(eventHandler, AUI.AuiManager)
+        isAGWAui = IsKindOf(eventHandler.__class__, "wx.lib.agw.aui.framemanager.AuiManager")
         if not isAGWAui:
             return True
 
@@ -326,7 +331,7 @@ class AUIHandler(AbstractHandler):
         eventHandler = self._window.GetEventHandler()
         restoreCodeCaption = False
 
-        isAGWAui = isinstance(eventHandler, AUI.AuiManager)
+        isAGWAui = IsKindOf(eventHandler.__class__, "wx.lib.agw.aui.framemanager.AuiManager")
         if not isAGWAui:
             return True
 
@@ -542,7 +547,7 @@ class ListBoxHandler(AbstractHandler):
 
         indices = []
 
-        if isinstance(listBox, (wx.html.HtmlListBox, wx.html.SimpleHtmlListBox)):
+        if IsKindOf(listBox.__class__, "wx.html.HtmlListBox", "wx.html.SimpleHtmlListBox"):
             if listBox.GetSelectedCount() == 0:
                 return indices
         else:
@@ -612,7 +617,7 @@ class ListBoxHandler(AbstractHandler):
 
         isVirtual = issubclass(listBox.__class__, wx.VListBox) or isinstance(listBox, wx.CheckListBox)
 
-        isHtml = isinstance(listBox, wx.html.HtmlListBox)
+        isHtml = IsKindOf(listBox.__class__, "wx.html.HtmlListBox")
         if isVirtual and not isHtml:
             count = listBox.GetCount()
         else:
@@ -1579,7 +1584,7 @@ class TreeCtrlHandler(AbstractHandler):
 
         obj.SaveCtrlValue(PERSIST_TREECTRL_EXPANSION, self.GetExpansionState())
 
-        if issubclass(tree.__class__, (HTL.HyperTreeList, CT.CustomTreeCtrl)):
+        if IsKindOf(tree.__class__, "wx.lib.agw.hypertreelist.HyperTreeList", "wx.lib.agw.customtreectrl.CustomTreeCtrl"):
             obj.SaveCtrlValue(PERSIST_TREECTRL_CHECKED_ITEMS, self.GetCheckedState())
 
         if self._manager.GetManagerStyle() & PM_SAVE_RESTORE_TREE_LIST_SELECTIONS == 0:
@@ -1604,7 +1609,7 @@ class TreeCtrlHandler(AbstractHandler):
             if selections is not None:
                 self.SetSelectionState(selections)
 
-        if not issubclass(tree.__class__, (HTL.HyperTreeList, CT.CustomTreeCtrl)):
+        if not IsKindOf(tree.__class__, "wx.lib.agw.hypertreelist.HyperTreeList", "wx.lib.agw.customtreectrl.CustomTreeCtrl"):
             return (expansion is not None and selections is not None)
 
         checked = obj.RestoreCtrlValue(PERSIST_TREECTRL_CHECKED_ITEMS)
@@ -2133,6 +2138,9 @@ class ToolBarHandler(AbstractHandler):
 
     def Save(self):
 
+        # Only used for AuiToolBar, so AUI is already loaded
+        import wx.lib.agw.aui as AUI
+
         bar, obj = self._window, self._pObject
         toolCount = bar.GetToolCount()
 
@@ -2153,6 +2161,9 @@ class ToolBarHandler(AbstractHandler):
 
     def Restore(self):
 
+        # Only used for AuiToolBar, so AUI is already loaded
+        import wx.lib.agw.aui as AUI
+
         bar, obj = self._window, self._pObject
         toolCount = bar.GetToolCount()
 
@@ -2505,60 +2516,92 @@ class TextEntryHandler(TLWHandler, TextCtrlHandler):
 # ----------------------------------------------------------------------------------- #
 
 
+# The classes handled by each handler, as full dotted names. A class is only
+# resolved once its module has been imported by the application (see GetClass).
+
 HANDLERS = [
-    ("BookHandler", (wx.BookCtrlBase, AUI.AuiNotebook, FNB.FlatNotebook,
-                    LBK.LabelBook, LBK.FlatImageBook)),
-    ("TLWHandler", (wx.TopLevelWindow, )),
-    ("CheckBoxHandler", (wx.CheckBox, )),
-    ("TreeCtrlHandler", (wx.TreeCtrl, wx.GenericDirCtrl, CT.CustomTreeCtrl, dv.TreeListCtrl)),
-    ("MenuBarHandler", (wx.MenuBar, FM.FlatMenuBar)),
-    ("ToolBarHandler", (AUI.AuiToolBar, )),
-    ("ListBoxHandler", (wx.ListBox, wx.VListBox, wx.html.HtmlListBox, wx.html.SimpleHtmlListBox,
-                        wx.adv.EditableListBox)),
-    ("ListCtrlHandler", (wx.ListCtrl, wx.ListView)),  #ULC.UltimateListCtrl (later)
-    ("ChoiceComboHandler", (wx.Choice, wx.ComboBox, wx.adv.OwnerDrawnComboBox)),
-    ("RadioBoxHandler", (wx.RadioBox, )),
-    ("RadioButtonHandler", (wx.RadioButton, )),
-    ("ScrolledWindowHandler", (wx.ScrolledWindow, scrolled.ScrolledPanel)),
-    ("SliderHandler", (wx.Slider, KC.KnobCtrl)),
-    ("SpinHandler", (wx.SpinButton, wx.SpinCtrl, FS.FloatSpin)),
-    ("SplitterHandler", (wx.SplitterWindow, )),
-    ("TextCtrlHandler", (wx.TextCtrl, wx.SearchCtrl, expando.ExpandoTextCtrl, masked.TextCtrl,
-                        masked.ComboBox, masked.IpAddrCtrl, masked.TimeCtrl, masked.NumCtrl)),
-    ("TreeListCtrlHandler", (HTL.HyperTreeList, )),
-    ("CalendarCtrlHandler", (wx.adv.CalendarCtrl, )),
-    ("CollapsiblePaneHandler", (wx.CollapsiblePane, PCP.PyCollapsiblePane)),
-    ("AUIHandler", (wx.Panel, )),
-    ("DatePickerHandler", (wx.adv.DatePickerCtrl, )),
-#    ("MediaCtrlHandler", (wx.media.MediaCtrl, )), not wrapped yet
-    ("ColourPickerHandler", (wx.ColourPickerCtrl, csel.ColourSelect)),
-    ("FileDirPickerHandler", (wx.FilePickerCtrl, wx.DirPickerCtrl)),
-    ("FontPickerHandler", (wx.FontPickerCtrl, )),
-    ("FileHistoryHandler", (wx.FileHistory, )),
-    ("ToggleButtonHandler", (wx.ToggleButton, buttons.GenToggleButton,
-                            buttons.GenBitmapToggleButton, buttons.GenBitmapTextToggleButton)),
+    ("BookHandler", ("wx.BookCtrlBase", "wx.lib.agw.aui.auibook.AuiNotebook",
+                     "wx.lib.agw.flatnotebook.FlatNotebook",
+                     "wx.lib.agw.labelbook.LabelBook", "wx.lib.agw.labelbook.FlatImageBook")),
+    ("TLWHandler", ("wx.TopLevelWindow", )),
+    ("CheckBoxHandler", ("wx.CheckBox", )),
+    ("TreeCtrlHandler", ("wx.TreeCtrl", "wx.GenericDirCtrl",
+                         "wx.lib.agw.customtreectrl.CustomTreeCtrl", "wx.dataview.TreeListCtrl")),
+    ("MenuBarHandler", ("wx.MenuBar", "wx.lib.agw.flatmenu.FlatMenuBar")),
+    ("ToolBarHandler", ("wx.lib.agw.aui.auibar.AuiToolBar", )),
+    ("ListBoxHandler", ("wx.ListBox", "wx.VListBox", "wx.html.HtmlListBox",
+                        "wx.html.SimpleHtmlListBox", "wx.adv.EditableListBox")),
+    ("ListCtrlHandler", ("wx.ListCtrl", "wx.ListView")),  #ULC.UltimateListCtrl (later)
+    ("ChoiceComboHandler", ("wx.Choice", "wx.ComboBox", "wx.adv.OwnerDrawnComboBox")),
+    ("RadioBoxHandler", ("wx.RadioBox", )),
+    ("RadioButtonHandler", ("wx.RadioButton", )),
+    ("ScrolledWindowHandler", ("wx.ScrolledWindow", "wx.lib.scrolledpanel.ScrolledPanel")),
+    ("SliderHandler", ("wx.Slider", "wx.lib.agw.knobctrl.KnobCtrl")),
+    ("SpinHandler", ("wx.SpinButton", "wx.SpinCtrl", "wx.lib.agw.floatspin.FloatSpin")),
+    ("SplitterHandler", ("wx.SplitterWindow", )),
+    ("TextCtrlHandler", ("wx.TextCtrl", "wx.SearchCtrl", "wx.lib.expando.ExpandoTextCtrl",
+                         "wx.lib.masked.textctrl.TextCtrl", "wx.lib.masked.combobox.ComboBox",
+                         "wx.lib.masked.ipaddrctrl.IpAddrCtrl", "wx.lib.masked.timectrl.TimeCtrl",
+                         "wx.lib.masked.numctrl.NumCtrl")),
+    ("TreeListCtrlHandler", ("wx.lib.agw.hypertreelist.HyperTreeList", )),
+    ("CalendarCtrlHandler", ("wx.adv.CalendarCtrl", )),
+    ("CollapsiblePaneHandler", ("wx.CollapsiblePane", "wx.lib.agw.pycollapsiblepane.PyCollapsiblePane")),
+    ("AUIHandler", ("wx.Panel", )),
+    ("DatePickerHandler", ("wx.adv.DatePickerCtrl", )),
+#    ("MediaCtrlHandler", ("wx.media.MediaCtrl", )), not wrapped yet
+    ("ColourPickerHandler", ("wx.ColourPickerCtrl", "wx.lib.colourselect.ColourSelect")),
+    ("FileDirPickerHandler", ("wx.FilePickerCtrl", "wx.DirPickerCtrl")),
+    ("FontPickerHandler", ("wx.FontPickerCtrl", )),
+    ("FileHistoryHandler", ("wx.FileHistory", )),
+    ("ToggleButtonHandler", ("wx.ToggleButton", "wx.lib.buttons.GenToggleButton",
+                             "wx.lib.buttons.GenBitmapToggleButton",
+                             "wx.lib.buttons.GenBitmapTextToggleButton",
+                             "wx.lib.agw.shapedbutton.SToggleButton",
+                             "wx.lib.agw.shapedbutton.SBitmapToggleButton",
+                             "wx.lib.agw.shapedbutton.SBitmapTextToggleButton")),
     ]
 
 STANDALONE_HANDLERS = [
-    ("TreebookHandler", (wx.Treebook, )),
-    ("CheckListBoxHandler", (wx.CheckListBox, )),
-    ("FileDirDialogHandler", (wx.DirDialog, wx.FileDialog)),
-    ("FindReplaceHandler", (wx.FindReplaceDialog, )),
-    ("FontDialogHandler", (wx.FontDialog, )),
-    ("ColourDialogHandler", (wx.ColourDialog, CCD.CubeColourDialog)),
-    ("ChoiceDialogHandler", (wx.SingleChoiceDialog, wx.MultiChoiceDialog)),
-    ("TextEntryHandler", (wx.TextEntryDialog, wx.PasswordEntryDialog)),
+    ("TreebookHandler", ("wx.Treebook", )),
+    ("CheckListBoxHandler", ("wx.CheckListBox", )),
+    ("FileDirDialogHandler", ("wx.DirDialog", "wx.FileDialog")),
+    ("FindReplaceHandler", ("wx.FindReplaceDialog", )),
+    ("FontDialogHandler", ("wx.FontDialog", )),
+    ("ColourDialogHandler", ("wx.ColourDialog", "wx.lib.agw.cubecolourdialog.CubeColourDialog")),
+    ("ChoiceDialogHandler", ("wx.SingleChoiceDialog", "wx.MultiChoiceDialog")),
+    ("TextEntryHandler", ("wx.TextEntryDialog", "wx.PasswordEntryDialog")),
     ]
 
-if hasSB:
-    HANDLERS[-1] = ("ToggleButtonHandler", (wx.ToggleButton, buttons.GenToggleButton,
-                                            buttons.GenBitmapToggleButton,
-                                            buttons.GenBitmapTextToggleButton,
-                                            SB.SToggleButton, SB.SBitmapToggleButton,
-                                            SB.SBitmapTextToggleButton))
-
 # ----------------------------------------------------------------------------------- #
 
+def FindHandlerClass(klass):
+    """
+    Returns the handler class to use for windows of class `klass`, or ``None``.
+
+    :param `klass`: the window class.
+    """
+
+    try:
+        return _handlerCache[klass]
+    except KeyError:
+        pass
+
+    handlerClass = None
+    for handlers in (STANDALONE_HANDLERS, HANDLERS):
+        for handler, subclasses in handlers:
+            if IsKindOf(klass, *subclasses):
+                handlerClass = globals()[handler]
+                break
+        if handlerClass is not None:
+            break
+
+    # All the base classes of klass are already loaded, so the result can't change
+    _handlerCache[klass] = handlerClass
+    return handlerClass
+
+_handlerCache = {}
+
+
 def FindHandler(pObject):
     """
     Finds a suitable handler for the input `Persistent Object` depending on the
@@ -2574,15 +2617,9 @@ def FindHandler(pObject):
         # if control has a handler, just return it
         return window._persistentHandler
 
-    for handler, subclasses in STANDALONE_HANDLERS:
-        for subclass in subclasses:
-            if issubclass(klass, subclass):
-                return eval(handler)(pObject)
-
-    for handler, subclasses in HANDLERS:
-        for subclass in subclasses:
-            if issubclass(klass, subclass):
-                return eval(handler)(pObject)
+    handlerClass = FindHandlerClass(klass)
+    if handlerClass is not None:
+        return handlerClass(pObject)
 
     raise Exception("Unsupported persistent handler (class=%s, name=%s)"%(klass, window.GetName()))
 
@@ -2595,20 +2632,8 @@ def HasCtrlHandler(control):
     :param `control`: the control instance to check if a handler for it exists.
     """
 
-    klass = control.__class__
-
     if hasattr(control, "_persistentHandler"):
         # if control has a handler, just return it
         return True
 
-    for handler, subclasses in STANDALONE_HANDLERS:
-        for subclass in subclasses:
-            if issubclass(klass, subclass):
-                return True
-
-    for handler, subclasses in HANDLERS:
-        for subclass in subclasses:
-            if issubclass(klass, subclass):
-                return True
-
-    return False
+    return FindHandlerClass(control.__class__) is not None
@@ -30,18 +30,267 @@ and :class:`~wx.lib.agw.persist.persitencemanager.PersistenceManager` objects.
 """
 
 import os
+import ast
+import json
 import warnings
 import datetime
 
 import wx
-import wx.adv
 import six
 
-from .persist_handlers import FindHandler, HasCtrlHandler
+from .persist_handlers import FindHandler, HasCtrlHandler, IsKindOf
 
 from .persist_constants import BAD_DEFAULT_NAMES, CONFIG_PATH_SEPARATOR
 from .persist_constants import PM_DEFAULT_STYLE, PM_PERSIST_CONTROL_VALUE
 
+# ----------------------------------------------------------------------------------- #
+
+def EncodeValue(value):
+    """
+    Converts a value saved by the persistent objects into the string stored in
+    the configuration file.
+
+    The value is written as JSON, with tuples, dates and dictionaries tagged so
+    that they are restored with their original type by :func:`DecodeValue`.
+
+    :param `value`: the value to convert. Integers (including wx enumerations),
+     floats, booleans, strings, ``None``, :class:`datetime.date` and any list,
+     tuple or dictionary of these are supported.
+    """
+
+    return json.dumps(_ToJson(value), separators=(",", ":"))
+
+
+def DecodeValue(text):
+    """
+    Converts a string returned by :func:`EncodeValue` back into a value.
+
+    Strings written by older versions of this library, which used a ``repr`` of
+    a `(kind, value)` tuple, are also understood. Nothing is evaluated: old
+    values are parsed with :func:`ast.literal_eval`.
+
+    :param `text`: the string read from the configuration file.
+
+    :returns: the decoded value, or ``None`` if `text` can not be decoded.
+    """
+
+    text = text.strip()
+    if not text:
+        return None
+
+    try:
+        if text.startswith("("):
+            return _DecodeLegacyValue(text)
+        return _FromJson(json.loads(text))
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+
+def _ToJson(value):
+    """ Converts `value` into something which can be written with :func:`json.dumps`. """
+
+    if value is None or isinstance(value, (bool, float)):
+        return value
+    elif isinstance(value, six.integer_types):
+        # wx enumerations are int subclasses
+        return int(value)
+    elif isinstance(value, six.string_types):
+        return six.text_type(value)
+    elif isinstance(value, datetime.date):
+        return {"date": value.isoformat()[:10]}
+    elif isinstance(value, list):
+        return [_ToJson(item) for item in value]
+    elif isinstance(value, tuple):
+        return {"tuple": [_ToJson(item) for item in value]}
+    elif isinstance(value, dict):
+        return {"dict": [[_ToJson(k), _ToJson(v)] for k, v in value.items()]}
+
+    raise TypeError("Values of type %s can not be persisted"%value.__class__.__name__)
+
+
+def _FromJson(value):
+    """ The inverse of :func:`_ToJson`. """
+
+    if isinstance(value, list):
+        return [_FromJson(item) for item in value]
+    elif isinstance(value, dict):
+        if "tuple" in value:
+            return tuple([_FromJson(item) for item in value["tuple"]])
+        elif "date" in value:
+            y, m, d = value["date"].split("-")
+            return datetime.date(int(y), int(m), int(d))
+        elif "dict" in value:
+            return dict([(_Hashable(_FromJson(k)), _FromJson(v)) for k, v in value["dict"]])
+        raise ValueError("Unknown persisted value %r"%value)
+
+    return value
+
+
+def _Hashable(value):
+    """ Turns lists back into tuples so that they can be used as dictionary keys. """
+
+    if isinstance(value, list):
+        return tuple([_Hashable(item) for item in value])
+    return value
+
+
+def _DecodeLegacyValue(text):
+    """ Decodes the `repr((kind, value))` strings written by older versions. """
+
+    kind, result = ast.literal_eval(text)
+    if kind in ("unicode", "str"):
+        return result
+    elif kind == "datetime.date":
+        y, m, d = result.split("-")
+        return datetime.date(int(y), int(m), int(d))
+
+    return ast.literal_eval(result)
+
+
+# ----------------------------------------------------------------------------------- #
+
+class JsonPersistenceBackend(object):
+    """
+    A configuration handler which keeps all the settings in memory and writes
+    them to a single JSON file when flushed.
+
+    This is handy for large layouts, as the whole file is written once per
+    :meth:`PersistenceManager.Save() <PersistenceManager.Save>` pass instead of
+    once per value. Use it with :meth:`PersistenceManager.SetConfigurationHandler`.
+    """
+
+    def __init__(self, fileName):
+        """
+        Default class constructor.
+
+        :param `fileName`: the JSON file to read and write. It is created on the
+         first flush if it doesn't exist.
+        """
+
+        self._fileName = fileName
+        self._values = {}
+        self._dirty = False
+
+        if os.path.exists(fileName):
+            with open(fileName, "r") as fid:
+                try:
+                    self._values = json.load(fid)
+                except ValueError:
+                    warnings.warn("Ignoring invalid persistence file %s"%fileName)
+
+
+    def SaveValue(self, key, value):
+        """
+        Stores a value, it is written to the file by :meth:`~JsonPersistenceBackend.Flush`.
+
+        :param `key`: the full key name;
+        :param `value`: the encoded value string.
+        """
+
+        if self._values.get(key) != value:
+            self._values[key] = value
+            self._dirty = True
+
+        return True
+
+
+    def RestoreValue(self, key):
+        """
+        Returns the value stored for `key`, or ``None``.
+
+        :param `key`: the full key name.
+        """
+
+        return self._values.get(key)
+
+
+    def Flush(self):
+        """ Writes the settings to the file, if anything has changed. """
+
+        if not self._dirty:
+            return True
+
+        dirName = os.path.dirname(self._fileName)
+        if dirName and not os.path.exists(dirName):
+            os.makedirs(dirName)
+
+        # Write to a temporary file first so a crash never leaves a truncated file
+        tmpName = self._fileName + ".tmp"
+        with open(tmpName, "w") as fid:
+            json.dump(self._values, fid, indent=1, sort_keys=True)
+
+        if os.path.exists(self._fileName):
+            os.remove(self._fileName)
+        os.rename(tmpName, self._fileName)
+
+        self._dirty = False
+        return True
+
+
+class SqlitePersistenceBackend(object):
+    """
+    A configuration handler which stores the settings in a SQLite database.
+
+    Values are written inside a transaction which is committed when the handler
+    is flushed, so saving a large layout costs a single disk sync. Use it with
+    :meth:`PersistenceManager.SetConfigurationHandler`.
+    """
+
+    def __init__(self, fileName):
+        """
+        Default class constructor.
+
+        :param `fileName`: the database file, it is created if it doesn't exist.
+        """
+
+        import sqlite3
+
+        dirName = os.path.dirname(fileName)
+        if dirName and not os.path.exists(dirName):
+            os.makedirs(dirName)
+
+        self._db = sqlite3.connect(fileName)
+        self._db.execute("CREATE TABLE IF NOT EXISTS persist (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.commit()
+
+
+    def SaveValue(self, key, value):
+        """
+        Stores a value, it is committed by :meth:`~SqlitePersistenceBackend.Flush`.
+
+        :param `key`: the full key name;
+        :param `value`: the encoded value string.
+        """
+
+        self._db.execute("INSERT OR REPLACE INTO persist (key, value) VALUES (?, ?)", (key, value))
+        return True
+
+
+    def RestoreValue(self, key):
+        """
+        Returns the value stored for `key`, or ``None``.
+
+        :param `key`: the full key name.
+        """
+
+        row = self._db.execute("SELECT value FROM persist WHERE key = ?", (key,)).fetchone()
+        return row and row[0]
+
+
+    def Flush(self):
+        """ Commits the pending values to the database. """
+
+        self._db.commit()
+        return True
+
+
+    def Close(self):
+        """ Commits the pending values and closes the database. """
+
+        self._db.commit()
+        self._db.close()
+
+
 # ----------------------------------------------------------------------------------- #
 
 class PersistentObject(object):
@@ -77,7 +326,7 @@ class PersistentObject(object):
         klass = window.__class__
         if issubclass(klass, wx.GenericDirCtrl):
             self._window = window.GetTreeCtrl()
-        elif issubclass(klass, wx.adv.EditableListBox):
+        elif IsKindOf(klass, "wx.adv.EditableListBox"):
             self._window = window.GetListCtrl()
         else:
             self._window = window
@@ -251,9 +500,11 @@ class PersistenceManager(object):
          indicate that its value should be saved/restored even so the style
          `PM_PERSIST_CONTROL_VALUE` is not set.
 
-        :note: UI settings are stored as dictionaries key <=> tuple: the tuple value
-         contains two items. The first is the value *type* (i.e., float, int, bool etc...)
-         while the second is the actual key value.
+        :note: UI settings are stored as strings created by :func:`EncodeValue`, a
+         JSON representation which keeps the value *type* (i.e., float, int, bool,
+         tuple etc...). Values are written through a single cached configuration
+         object and flushed once per :meth:`~PersistenceManager.Save` or
+         :meth:`~PersistenceManager.SaveAndUnregister` call.
 
         """
 
@@ -269,6 +520,15 @@ class PersistenceManager(object):
         # wx.FileConfig (i.e., ConfigObj, ConfigParser etc...)
         self._customConfigHandler = None
 
+        # The wx.FileConfig used when there is no custom config handler, it is
+        # created on first use and kept for the lifetime of the manager
+        self._config = None
+
+        # Nesting level of BeginBatch/EndBatch and whether values have been
+        # written since the last flush
+        self._batchLevel = 0
+        self._dirty = False
+
         # Specifies the PersistenceManager style
         self._style = PM_DEFAULT_STYLE
 
@@ -301,6 +561,7 @@ class PersistenceManager(object):
         """ Destructor for the unique persistence manager object. """
 
         if hasattr(self, "_instance"):
+            self._instance.Flush()
             del self._instance
 
     Free = classmethod(Free)
@@ -345,6 +606,7 @@ class PersistenceManager(object):
          custom configuration handler (i.e., by using ConfigObj/ConfigParser/cPickle etc...).
         """
 
+        self.Flush()
         self._configKey = key
 
 
@@ -369,7 +631,9 @@ class PersistenceManager(object):
          custom configuration handler (i.e., by using ConfigObj/ConfigParser/cPickle etc...).
         """
 
+        self.Flush()
         self._configFile = fileName
+        self._config = None
         self._persistentObjects = {}
 
 
@@ -379,6 +643,9 @@ class PersistenceManager(object):
 
         :note: The return value of this method is not used if you are using your own
          custom configuration handler (i.e., by using ConfigObj/ConfigParser/cPickle etc...).
+
+        :note: This method creates a new :class:`FileConfig` on every call, the manager
+         itself uses the one returned by :meth:`~PersistenceManager.GetConfig`.
         """
 
         if self._configFile is not None:
@@ -398,18 +665,37 @@ class PersistenceManager(object):
         return config
 
 
+    def GetConfig(self):
+        """
+        Returns the :class:`FileConfig` used to store the settings, creating it on
+        the first call.
+
+        :note: The return value of this method is not used if you are using your own
+         custom configuration handler (i.e., by using ConfigObj/ConfigParser/cPickle etc...).
+        """
+
+        if self._config is None:
+            self._config = self.GetPersistenceFile()
+
+        return self._config
+
+
     def SetConfigurationHandler(self, handler):
         """
         Sets the persistent configuration handler for :class:`PersistenceManager`.
 
         :param `handler`: an object capable of saving/restoring UI settings. This
-         can be a cPickle object or a ConfigObj one, for example.
+         can be a cPickle object or a ConfigObj one, for example. It must have
+         `SaveValue(key, value)` and `RestoreValue(key)` methods and, optionally,
+         a `Flush()` method which is called once the values of a save pass have
+         been written. See :class:`JsonPersistenceBackend` and :class:`SqlitePersistenceBackend`.
 
-        :note: UI settings are stored as dictionaries key <=> tuple: the tuple value
-         contains two items. The first is the value *type* (i.e., float, int, bool etc...)
-         while the second is the actual key value.
+        :note: UI settings are stored as strings created by :func:`EncodeValue`, a
+         JSON representation which keeps the value *type* (i.e., float, int, bool,
+         tuple etc...).
         """
 
+        self.Flush()
         self._customConfigHandler = handler
 
 
@@ -520,11 +806,59 @@ class PersistenceManager(object):
             return False
 
         name = window.GetName()
-        self._persistentObjects[name].Save()
+        self.BeginBatch()
+        try:
+            self._persistentObjects[name].Save()
+        finally:
+            self.EndBatch()
 
         return True
 
 
+    def BeginBatch(self):
+        """
+        Starts a batch of saves: the values are written to the configuration but
+        it is not flushed to disk until the matching :meth:`~PersistenceManager.EndBatch`.
+
+        Batches may be nested, :meth:`~PersistenceManager.Save` and
+        :meth:`~PersistenceManager.SaveAndUnregister` use one automatically.
+        """
+
+        self._batchLevel += 1
+
+
+    def EndBatch(self):
+        """
+        Ends a batch started by :meth:`~PersistenceManager.BeginBatch`, flushing the
+        configuration when the outermost batch ends.
+        """
+
+        self._batchLevel -= 1
+        if self._batchLevel <= 0:
+            self._batchLevel = 0
+            self.Flush()
+
+
+    def Flush(self):
+        """
+        Writes any pending values to disk.
+
+        For a custom configuration handler this calls its `Flush()` method, if it
+        has one.
+        """
+
+        if not self._dirty:
+            return
+
+        self._dirty = False
+        if self._customConfigHandler is not None:
+            flush = getattr(self._customConfigHandler, "Flush", None)
+            if flush is not None:
+                flush()
+        elif self._config is not None:
+            self._config.Flush()
+
+
     def Restore(self, window):
         """
         Restores the state of an object.
@@ -604,8 +938,12 @@ class PersistenceManager(object):
         """
 
         if window is None:
-            for name, obj in list(self._persistentObjects.items()):
-                self.SaveAndUnregister(obj.GetWindow())
+            self.BeginBatch()
+            try:
+                for name, obj in list(self._persistentObjects.items()):
+                    self.SaveAndUnregister(obj.GetWindow())
+            finally:
+                self.EndBatch()
 
             return
 
@@ -777,19 +1115,24 @@ class PersistenceManager(object):
         overridden by passing a custom configuration handler in the :class:`PersistenceManager`
         constructor.
 
+        The value is flushed to disk straight away, unless a batch started with
+        :meth:`~PersistenceManager.BeginBatch` is in progress.
+
         :param `obj`: an instance of :class:`PersistentObject`;
         :param `keyName`: a string specifying the key name;
         :param `value`: the value to store in the configuration file.
         """
 
-        kind = repr(value.__class__).split("'")[1]
+        text = EncodeValue(value)
 
         if self._customConfigHandler is not None:
-            result = self._customConfigHandler.SaveValue(self.GetKey(obj, keyName), repr((kind, six.text_type(value))))
+            result = self._customConfigHandler.SaveValue(self.GetKey(obj, keyName), text)
         else:
-            config = self.GetPersistenceFile()
-            result = config.Write(self.GetKey(obj, keyName), repr((kind, six.text_type(value))))
-            config.Flush()
+            result = self.GetConfig().Write(self.GetKey(obj, keyName), text)
+
+        self._dirty = True
+        if self._batchLevel == 0:
+            self.Flush()
 
         return result
 
@@ -838,19 +1181,10 @@ class PersistenceManager(object):
         if self._customConfigHandler is not None:
             result = self._customConfigHandler.RestoreValue(self.GetKey(obj, keyName))
         else:
-            config = self.GetPersistenceFile()
-            result = config.Read(self.GetKey(obj, keyName))
+            result = self.GetConfig().Read(self.GetKey(obj, keyName))
 
         if result:
-            kind, result = eval(result)
-            if kind in ("unicode", "str"):
-                return result
-            elif kind == "datetime.date":
-                y, m, d = result.split("-")
-                result = datetime.date(int(y), int(m), int(d))
-                return result
-
-            return eval(result)
+            return DecodeValue(result)
 
 
     def AddBadDefaultName(self, name):
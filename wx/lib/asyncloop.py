@@ -0,0 +1,395 @@
+#----------------------------------------------------------------------
+# Name:        wx.lib.asyncloop
+# Purpose:     An asyncio event loop that runs the wx event loop on the
+#              same thread.
+#
+# Created:     19-Oct-2026
+# Licence:     wxWindows license
+#----------------------------------------------------------------------
+
+"""
+An :mod:`asyncio` event loop that shares the GUI thread with wxPython.
+
+While asyncio waits for sockets, pipes or timers, the :class:`WxEventLoop`
+dispatches wx events instead of blocking. The wait for I/O itself is
+handed to a helper thread, which wakes up the wx event loop as soon as
+something is ready, so neither side has to poll. Coroutines, callbacks and
+event handlers all run on the GUI thread and can freely use each other's
+objects.
+
+Install the policy, or use :func:`run`, and await :func:`MainLoop` instead
+of calling :meth:`wx.App.MainLoop`::
+
+    import wx
+    from wx.lib import asyncloop
+
+    async def main(frame):
+        while True:
+            await asyncloop.WaitEvent(frame.button, wx.EVT_BUTTON)
+            data = await fetch_something()
+            frame.show(data)
+
+    async def start():
+        frame = MyFrame()
+        frame.Show()
+        task = asyncio.ensure_future(main(frame))
+        await asyncloop.MainLoop()
+        task.cancel()
+
+    app = wx.App()
+    asyncloop.run(start())
+
+The helpers :func:`WaitEvent`, :func:`CallLaterAsync` and
+:func:`ShowModalAsync` return awaitables for wx events, timers and dialogs.
+
+Native modal dialogs, like :func:`wx.MessageBox` or :class:`wx.FileDialog`,
+run their own event loop and asyncio callbacks are paused until they are
+closed.
+"""
+
+import asyncio
+import selectors
+import threading
+
+import wx
+
+#----------------------------------------------------------------------
+
+class _WxSelector(selectors.BaseSelector):
+    """
+    Wraps the selector of a :class:`WxEventLoop`. Waits in :meth:`select`
+    are done on a helper thread while the calling thread dispatches wx
+    events.
+    """
+
+    # how many pending events to dispatch when asyncio does not wait
+    maxDispatch = 100
+
+    def __init__(self, selector):
+        self._selector = selector
+        self._loop = None
+        self._evtLoop = None
+        self._thread = None
+        self._request = threading.Event()
+        self._done = threading.Event()
+        self._done.set()
+        self._timeout = None
+        self._result = None
+        self._closing = False
+
+
+    def register(self, fileobj, events, data=None):
+        self._stopSelect()
+        return self._selector.register(fileobj, events, data)
+
+
+    def unregister(self, fileobj):
+        self._stopSelect()
+        return self._selector.unregister(fileobj)
+
+
+    def modify(self, fileobj, events, data=None):
+        self._stopSelect()
+        return self._selector.modify(fileobj, events, data)
+
+
+    def get_key(self, fileobj):
+        return self._selector.get_key(fileobj)
+
+
+    def get_map(self):
+        return self._selector.get_map()
+
+
+    def close(self):
+        self._closing = True
+        self._stopSelect()
+        self._request.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._selector.close()
+
+
+    def select(self, timeout=None):
+        if wx.GetApp() is None:
+            return self._selector.select(timeout)
+        if self._evtLoop is None:
+            self._evtLoop = wx.GUIEventLoop()
+        evtLoop = self._evtLoop
+
+        with wx.EventLoopActivator(evtLoop):
+            if timeout is not None and timeout <= 0:
+                # asyncio has work to do, only handle what is pending
+                for i in range(self.maxDispatch):
+                    if not evtLoop.Pending():
+                        break
+                    evtLoop.Dispatch()
+                self._processPending()
+                if not evtLoop.Pending():
+                    evtLoop.ProcessIdle()
+                self._loop._checkTopLevelWindows()
+                return self._selector.select(0)
+
+            deadline = None
+            if timeout is not None:
+                deadline = self._loop.time() + timeout
+            self._startSelect(timeout)
+            while not self._done.is_set():
+                while (not self._done.is_set() and not evtLoop.Pending()
+                       and evtLoop.ProcessIdle()):
+                    self._afterEvents(deadline)
+                if self._done.is_set():
+                    break
+                evtLoop.Dispatch()
+                self._processPending()
+                self._afterEvents(deadline)
+
+        result = self._result
+        self._result = None
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+    def _processPending(self):
+        app = wx.GetApp()
+        if app is not None and app.HasPendingEvents():
+            app.ProcessPendingEvents()
+
+
+    def _afterEvents(self, deadline):
+        # The event handlers may have given asyncio something to do sooner
+        # than the helper thread is waiting for.
+        loop = self._loop
+        loop._checkTopLevelWindows()
+        if self._done.is_set():
+            return
+        scheduled = loop._scheduled
+        if (loop._ready or loop._stopping
+                or (scheduled and (deadline is None or scheduled[0].when() < deadline))):
+            loop._write_to_self()
+
+
+    def _startSelect(self, timeout):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='WxSelector')
+            self._thread.daemon = True
+            self._thread.start()
+        self._timeout = timeout
+        self._done.clear()
+        self._request.set()
+
+
+    def _stopSelect(self):
+        # Registrations can not change while the helper thread waits on
+        # them, so wake it up and wait for it first.
+        if not self._done.is_set():
+            self._loop._write_to_self()
+            self._done.wait()
+
+
+    def _run(self):
+        while True:
+            self._request.wait()
+            self._request.clear()
+            if self._closing:
+                return
+            try:
+                self._result = self._selector.select(self._timeout)
+            except BaseException as exc:
+                self._result = exc
+            self._done.set()
+            if wx.GetApp() is not None:
+                wx.CallAfter(self._wakeup)
+
+
+    def _wakeup(self):
+        # Nothing to do, the event only makes Dispatch return.
+        pass
+
+
+class WxEventLoop(asyncio.SelectorEventLoop):
+    """
+    An asyncio event loop that dispatches wx events whenever it would
+    otherwise wait. A :class:`wx.App` must exist before the loop is run.
+    """
+
+    def __init__(self, selector=None):
+        if selector is None:
+            selector = selectors.DefaultSelector()
+        wxSelector = _WxSelector(selector)
+        asyncio.SelectorEventLoop.__init__(self, wxSelector)
+        wxSelector._loop = self
+        self._mainLoopWaiters = []
+
+
+    def _checkTopLevelWindows(self):
+        if self._mainLoopWaiters and not wx.GetTopLevelWindows():
+            waiters = self._mainLoopWaiters
+            self._mainLoopWaiters = []
+            for future in waiters:
+                if not future.done():
+                    future.set_result(None)
+
+
+class WxEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """
+    An event loop policy that creates :class:`WxEventLoop` instances::
+
+        asyncio.set_event_loop_policy(asyncloop.WxEventLoopPolicy())
+    """
+
+    def new_event_loop(self):
+        return WxEventLoop()
+
+
+def run(main):
+    """
+    Runs the ``main`` coroutine in a new :class:`WxEventLoop` until it is
+    done and returns its result, like :func:`asyncio.run` does.
+    """
+    loop = WxEventLoop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            allTasks = getattr(asyncio, 'all_tasks', None) or asyncio.Task.all_tasks
+            tasks = [task for task in allTasks(loop) if not task.done()]
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+#----------------------------------------------------------------------
+
+def MainLoop():
+    """
+    Returns a future that is done once the application has no top-level
+    windows left, which is when :meth:`wx.App.MainLoop` would return.
+    """
+    loop = asyncio.get_event_loop()
+    if not isinstance(loop, WxEventLoop):
+        raise RuntimeError("The current event loop is not a WxEventLoop")
+    future = loop.create_future()
+    loop._mainLoopWaiters.append(future)
+    loop._checkTopLevelWindows()
+    return future
+
+
+def WaitEvent(evtHandler, event, source=None, id=wx.ID_ANY, id2=wx.ID_ANY):
+    """
+    Returns a future for the next event of the given type received by
+    ``evtHandler``. The parameters are the same as for
+    :meth:`wx.EvtHandler.Bind`. The result is a copy of the event, which is
+    skipped so that other handlers still get it::
+
+        evt = await WaitEvent(button, wx.EVT_BUTTON)
+    """
+    future = asyncio.get_event_loop().create_future()
+
+    def handler(evt):
+        evt.Skip()
+        evtHandler.Unbind(event, source, id, id2, handler)
+        if not future.done():
+            future.set_result(evt.Clone())
+
+    def onDone(future):
+        if future.cancelled() and evtHandler:
+            evtHandler.Unbind(event, source, id, id2, handler)
+
+    evtHandler.Bind(event, handler, source, id, id2)
+    future.add_done_callback(onDone)
+    return future
+
+
+def CallLaterAsync(millis, callableObj=None, *args, **kw):
+    """
+    Returns a future for the result of calling ``callableObj`` with the
+    given arguments after ``millis`` milliseconds, using a
+    :class:`wx.CallLater` timer. Without a callable the future just becomes
+    done after the delay. Cancelling the future stops the timer.
+    """
+    future = asyncio.get_event_loop().create_future()
+
+    def notify():
+        if future.done():
+            return
+        try:
+            result = callableObj(*args, **kw) if callableObj is not None else None
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    timer = wx.CallLater(millis, notify)
+
+    def onDone(future):
+        if future.cancelled():
+            timer.Stop()
+
+    future.add_done_callback(onDone)
+    return future
+
+
+_nativeDialogs = (wx.FileDialog, wx.DirDialog, wx.MessageDialog,
+                  wx.ColourDialog, wx.FontDialog)
+
+async def ShowModalAsync(dialog):
+    """
+    Shows ``dialog`` as a modal dialog, disabling the other windows, and
+    returns the ID of the button that closed it, like
+    :meth:`wx.Dialog.ShowModal` does, but lets the asyncio loop keep
+    running meanwhile::
+
+        if await ShowModalAsync(dlg) == wx.ID_OK:
+            ...
+
+    The dialog must close itself with its standard buttons or by being
+    hidden, not with :meth:`wx.Dialog.EndModal`. Native dialogs can only be
+    shown with :meth:`wx.Dialog.ShowModal`, which is called for them.
+    """
+    if isinstance(dialog, _nativeDialogs):
+        return dialog.ShowModal()
+
+    future = asyncio.get_event_loop().create_future()
+    returnCode = [None]
+
+    def onButton(evt):
+        evt.Skip()
+        returnCode[0] = evt.GetId()
+
+    def onClose(evt):
+        evt.Skip()
+        returnCode[0] = dialog.GetEscapeId()
+        if returnCode[0] == wx.ID_ANY:
+            returnCode[0] = wx.ID_CANCEL
+
+    def onShow(evt):
+        evt.Skip()
+        if not evt.IsShown() and not future.done():
+            code = returnCode[0]
+            if code is None:
+                code = dialog.GetReturnCode()
+            future.set_result(code)
+
+    dialog.Bind(wx.EVT_BUTTON, onButton)
+    dialog.Bind(wx.EVT_CLOSE, onClose)
+    dialog.Bind(wx.EVT_SHOW, onShow)
+    disabler = wx.WindowDisabler(dialog)
+    try:
+        dialog.Show()
+        return await future
+    finally:
+        del disabler
+        if dialog:
+            dialog.Unbind(wx.EVT_BUTTON, handler=onButton)
+            dialog.Unbind(wx.EVT_CLOSE, handler=onClose)
+            dialog.Unbind(wx.EVT_SHOW, handler=onShow)
+
+#----------------------------------------------------------------------
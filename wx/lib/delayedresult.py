@@ -26,6 +26,9 @@ More advanced uses:
   (see PreProcessChain)
 - Derive from Sender to use your own way of making result hop over the
   "thread boundary" (from non-main thread to main thread), e.g. using Queue
+- Use an Executor to run many jobs on a pool of threads (or processes)
+  instead of a thread per job, with priorities, cancellation of queued jobs
+  and progress reporting
 
 Thanks to Josiah Carlson for critical feedback/ideas that helped me
 improve this module.
@@ -40,12 +43,19 @@ __author__  = 'Oliver Schoenborn at utoronto dot ca'
 __version__ = '1.0'
 
 __all__ = ('Sender', 'SenderNoWx', 'SenderWxEvent', 'SenderCallAfter',
-    'Handler', 'DelayedResult', 'Producer', 'startWorker', 'PreProcessChain')
+    'Handler', 'DelayedResult', 'Producer', 'startWorker', 'PreProcessChain',
+    'Executor', 'Job')
 
 
 import wx
+import os
+import heapq
 import threading
 import traceback
+try:
+    import concurrent.futures as futures
+except ImportError:
+    futures = None
 
 
 class Struct:
@@ -344,6 +354,253 @@ def startWorker(
     return thread
 
 
+class Job:
+    """
+    A job submitted to an Executor. It is queued until one of the executor's
+    workers is free and there is no queued job with a higher priority.
+    """
+
+    def __init__(self, executor, jobID, priority, workerFn, args, kwargs,
+                 sender, sendReturn, progress):
+        """You should never have to call this yourself. Use
+        Executor.submit() instead."""
+        self.__executor = executor
+        self.__jobID = jobID
+        self.priority = priority
+        self.workerFn = workerFn
+        self.args = args
+        self.kwargs = kwargs
+        self.sender = sender
+        self.sendReturn = sendReturn
+        self.progress = progress
+        self.abortEvent = AbortEvent()
+        self.state = 'queued'
+        self.future = None
+
+    def getJobID(self):
+        """Return the jobID given to Executor.submit()"""
+        return self.__jobID
+
+    def cancel(self):
+        """Cancel the job. A queued job is removed from the queue and True
+        is returned. A running job can't be stopped, but its abort event is
+        set so a worker function that was given one can stop early, and
+        False is returned."""
+        return self.__executor.cancel(self)
+
+    def isCancelled(self):
+        return self.state == 'cancelled'
+
+    def isRunning(self):
+        return self.state == 'running'
+
+    def isDone(self):
+        return self.state in ('done', 'cancelled')
+
+    def sendProgress(self, chunk):
+        """Send a partial result to the job's progress consumer. This is
+        what the worker function is given as progress callable. The chunks
+        sent during one pass of the event loop are delivered together."""
+        self.__executor._addProgress(self, chunk)
+
+    def run(self):
+        """Call the worker function in the worker thread."""
+        return self.workerFn(*self.args, **self.kwargs)
+
+
+class Executor:
+    """
+    Run worker functions on a pool of threads, or of processes, and send
+    their results to consumers in the main thread like startWorker() does::
+
+        executor = Executor(maxWorkers=4)
+        job = executor.submit(consumer, workerFn, wargs=(path,), priority=1)
+        ...
+        executor.shutdown()
+
+    Jobs with a higher priority are started first, and jobs with the same
+    priority in the order they were submitted. A job can be cancelled until
+    it is started. Worker functions running in threads can also be given a
+    callable to send partial results with, and an AbortEvent that is set
+    when their job is cancelled.
+
+    With useProcesses=True the worker functions are run in a
+    concurrent.futures.ProcessPoolExecutor, which is better for CPU bound
+    work. The worker functions and their arguments and results must then be
+    picklable, and progress and abort events are not available.
+    """
+
+    def __init__(self, maxWorkers=None, useProcesses=False):
+        """The maxWorkers is the number of jobs that can run at the same
+        time. It defaults to the number of CPUs for processes, and to that
+        plus 4 (but at most 32) for threads."""
+        if futures is None:
+            raise RuntimeError('Executor requires the concurrent.futures module')
+        cpus = getattr(os, 'cpu_count', lambda: None)() or 1
+        if maxWorkers is None:
+            maxWorkers = cpus if useProcesses else min(32, cpus + 4)
+        self.__maxWorkers = maxWorkers
+        self.__useProcesses = useProcesses
+        if useProcesses:
+            self.__pool = futures.ProcessPoolExecutor(maxWorkers)
+        else:
+            self.__pool = futures.ThreadPoolExecutor(maxWorkers)
+        self.__lock = threading.Lock()
+        self.__queue = []
+        self.__count = 0
+        self.__running = 0
+        self.__jobs = set()
+        self.__progress = {}
+        self.__shutdown = False
+
+    def submit(self, consumer, workerFn,
+               cargs=(), ckwargs={},
+               wargs=(), wkwargs={},
+               jobID=None, priority=0, sendReturn=True,
+               progress=None, progressArg=None, abortArg=None):
+        """
+        Queue `workerFn(*wargs, **wkwargs)` to be run, and its result sent
+        to `consumer(delayedResult, *cargs, **ckwargs)` in the main thread,
+        as with startWorker(). Returns the Job.
+
+        If progressArg is given, it is the name of the keyword arg used to
+        pass the worker function a callable that sends partial results. They
+        are delivered as `progress(jobID, chunks)` calls in the main thread,
+        with all the chunks sent since the previous call in a list. If
+        abortArg is given, it is the name of the keyword arg used to pass the
+        job's AbortEvent.
+        """
+        if self.__useProcesses and (progressArg or abortArg):
+            raise ValueError('progressArg and abortArg can not be used with processes')
+        if isinstance(consumer, wx.EvtHandler):
+            eventClass = cargs[0]
+            sender = SenderWxEvent(consumer, eventClass, jobID=jobID, **ckwargs)
+        else:
+            sender = SenderCallAfter(consumer, jobID, args=cargs, kwargs=ckwargs)
+
+        wkwargs = dict(wkwargs)
+        job = Job(self, jobID, priority, workerFn, wargs, wkwargs,
+                  sender, sendReturn, progress)
+        if progressArg:
+            wkwargs[progressArg] = job.sendProgress
+        if abortArg:
+            wkwargs[abortArg] = job.abortEvent
+
+        with self.__lock:
+            if self.__shutdown:
+                raise RuntimeError('submit() called after shutdown()')
+            self.__count += 1
+            heapq.heappush(self.__queue, (-priority, self.__count, job))
+            self.__jobs.add(job)
+        self.__dispatch()
+        return job
+
+    def cancel(self, job):
+        """Cancel the job, see Job.cancel()."""
+        with self.__lock:
+            if job.state == 'queued':
+                job.state = 'cancelled'
+                self.__jobs.discard(job)
+                return True
+            if job.state == 'running':
+                job.abortEvent.set()
+        return False
+
+    def cancelAll(self):
+        """Cancel all of the jobs. Returns how many queued jobs were
+        cancelled."""
+        with self.__lock:
+            jobs = list(self.__jobs)
+        return len([job for job in jobs if self.cancel(job)])
+
+    def getPendingCount(self):
+        """How many jobs are queued or running"""
+        with self.__lock:
+            return len(self.__jobs)
+
+    def shutdown(self, wait=True, cancelPending=True):
+        """Stop accepting jobs and free the pool once the jobs are done. If
+        cancelPending is True the queued jobs are cancelled first, otherwise
+        they are still run, and the call waits for them when wait is True."""
+        if cancelPending:
+            self.cancelAll()
+        with self.__lock:
+            self.__shutdown = True
+            # the queued jobs still need the pool, so if there are any the
+            # last one to finish shuts it down
+            idle = not self.__jobs
+        if wait:
+            while self.getPendingCount():
+                with self.__lock:
+                    running = [job.future for job in self.__jobs
+                               if job.future is not None]
+                futures.wait(running, timeout=0.1)
+            self.__pool.shutdown(True)
+        elif idle:
+            self.__pool.shutdown(False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        self.shutdown()
+
+    def __dispatch(self):
+        """Start queued jobs while there are free workers."""
+        toStart = []
+        with self.__lock:
+            while self.__queue and self.__running < self.__maxWorkers:
+                job = heapq.heappop(self.__queue)[2]
+                if job.state != 'queued':
+                    continue
+                job.state = 'running'
+                self.__running += 1
+                toStart.append(job)
+
+        for job in toStart:
+            if self.__useProcesses:
+                job.future = self.__pool.submit(job.workerFn, *job.args, **job.kwargs)
+            else:
+                job.future = self.__pool.submit(job.run)
+            job.future.add_done_callback(lambda future, job=job: self.__onDone(job))
+
+    def __onDone(self, job):
+        """Send the result of a finished job, and start the next ones."""
+        with self.__lock:
+            self.__running -= 1
+            job.state = 'done'
+            self.__jobs.discard(job)
+
+        exc = job.future.exception()
+        if exc is None:
+            if job.sendReturn:
+                job.sender.sendResult(job.future.result())
+        elif not isinstance(exc, AbortedException):
+            originalTb = ''.join(traceback.format_exception(
+                type(exc), exc, getattr(exc, '__traceback__', None)))
+            job.sender.sendException(exc, None, originalTb)
+        self.__dispatch()
+        with self.__lock:
+            idle = self.__shutdown and not self.__jobs
+        if idle:
+            self.__pool.shutdown(False)
+
+    def _addProgress(self, job, chunk):
+        with self.__lock:
+            post = not self.__progress
+            self.__progress.setdefault(job, []).append(chunk)
+        if post:
+            wx.CallAfter(self.__sendProgress)
+
+    def __sendProgress(self):
+        with self.__lock:
+            progress = self.__progress
+            self.__progress = {}
+        for job, chunks in progress.items():
+            if job.progress is not None:
+                job.progress(job.getJobID(), chunks)
+
+
 class PreProcessChain:
     """
     Represent a 'delayed result pre-processing chain', a kind of Handler.
@@ -16,6 +16,12 @@ import os.path
 import shutil
 import wx
 import sys
+import mmap
+import pickle
+import tempfile
+import threading
+import zlib
+from collections import deque
 from functools import cmp_to_key
 _ = wx.GetTranslation
 
@@ -70,6 +76,256 @@ def PathOnly(path):
     return os.path.split(path)[0]
 
 
+def EstimateSize(obj):
+    """
+    Returns a rough estimate, in bytes, of the memory held by an object:
+    its own size plus the size of each of its attributes and, for container
+    attributes, of their immediate items.
+    """
+    size = sys.getsizeof(obj)
+    for value in getattr(obj, '__dict__', {}).values():
+        size += sys.getsizeof(value)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            size += sum(sys.getsizeof(item) for item in value)
+        elif isinstance(value, dict):
+            size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    return size
+
+
+def _SyncDirectory(dirname):
+    """
+    Flushes a directory entry to disk so that a rename done in it survives a
+    crash. This is only possible, and only needed, on POSIX systems.
+    """
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    try:
+        fd = os.open(dirname, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def AtomicSave(filename, saveFunc, mode='w'):
+    """
+    Calls ``saveFunc`` with a file object opened on a temporary file in the
+    same directory as ``filename``, flushes it to disk and then atomically
+    replaces ``filename`` with it. If ``saveFunc`` raises, the temporary file
+    is removed and the original file is left untouched. The permission bits
+    of an existing file are preserved, and if ``filename`` is a symbolic link
+    the file it points to is replaced.
+    """
+    filename = os.path.realpath(filename)
+    dirname, basename = os.path.split(filename)
+    fd, tempFilename = tempfile.mkstemp(prefix='.%s.' % basename, suffix='.tmp', dir=dirname)
+    try:
+        with os.fdopen(fd, mode) as fileObject:
+            saveFunc(fileObject)
+            fileObject.flush()
+            os.fsync(fileObject.fileno())
+        if os.path.exists(filename):
+            shutil.copymode(filename, tempFilename)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tempFilename, 0o666 & ~umask)
+        os.replace(tempFilename, filename)
+    except:
+        if os.path.exists(tempFilename):
+            os.remove(tempFilename)
+        raise
+    _SyncDirectory(dirname)
+
+
+class DocumentCancelled(Exception):
+    """
+    Raised by :class:`DocumentFile` when a load or save has been cancelled
+    with :meth:`Document.CancelSave`. The partially written file is discarded.
+    """
+    pass
+
+
+wxEVT_DOCUMENT_PROGRESS = wx.NewEventType()
+wxEVT_DOCUMENT_SAVED = wx.NewEventType()
+EVT_DOCUMENT_PROGRESS = wx.PyEventBinder(wxEVT_DOCUMENT_PROGRESS, 1)
+EVT_DOCUMENT_SAVED = wx.PyEventBinder(wxEVT_DOCUMENT_SAVED, 1)
+
+
+class DocumentEvent(wx.PyCommandEvent):
+    """
+    Event sent to the document window while a document is being loaded or
+    saved (``EVT_DOCUMENT_PROGRESS``), and when a background save has
+    finished (``EVT_DOCUMENT_SAVED``).
+    """
+
+    def __init__(self, evtType, document, filename, position=0, range=-1, cancelled=False, error=None):
+        wx.PyCommandEvent.__init__(self, evtType, wx.ID_ANY)
+        self._document = document
+        self._filename = filename
+        self._position = position
+        self._range = range
+        self._cancelled = cancelled
+        self._error = error
+
+
+    def GetDocument(self):
+        """
+        Returns the document being loaded or saved.
+        """
+        return self._document
+
+
+    def GetFilename(self):
+        """
+        Returns the name of the file being loaded or saved.
+        """
+        return self._filename
+
+
+    def GetPosition(self):
+        """
+        Returns the number of bytes (or characters, for text files) read or
+        written so far.
+        """
+        return self._position
+
+
+    def GetRange(self):
+        """
+        Returns the total size of the file, or -1 if it is not known in
+        advance, as is the case when saving.
+        """
+        return self._range
+
+
+    def IsCancelled(self):
+        """
+        Returns True if the background save was cancelled.
+        """
+        return self._cancelled
+
+
+    def GetError(self):
+        """
+        Returns the exception that made the background save fail, or None.
+        """
+        return self._error
+
+
+class DocumentFile(object):
+    """
+    Wraps the file object given to :meth:`Document.LoadObject` and
+    :meth:`Document.SaveObject`. It behaves like the underlying file, but
+    counts the data read or written, reports progress to the document and
+    raises :class:`DocumentCancelled` once the operation has been cancelled.
+    """
+
+    def __init__(self, fileObject, document, filename, range=-1, cancelEvent=None):
+        self._file = fileObject
+        self._document = document
+        self._filename = filename
+        self._range = range
+        self._cancelEvent = cancelEvent
+        self._position = 0
+        self._reported = 0
+        if range > 0:
+            self._step = max(range // 100, 1 << 16)
+        else:
+            self._step = 1 << 18
+
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    next = __next__
+
+
+    def _Advance(self, count):
+        if self._cancelEvent is not None and self._cancelEvent.is_set():
+            raise DocumentCancelled(self._filename)
+        self._position += count
+        if self._position - self._reported >= self._step:
+            self.ReportProgress()
+
+
+    def ReportProgress(self):
+        """
+        Sends an ``EVT_DOCUMENT_PROGRESS`` event with the current position.
+        """
+        self._reported = self._position
+        self._document.PostDocumentEvent(DocumentEvent(wxEVT_DOCUMENT_PROGRESS,
+                                                       self._document,
+                                                       self._filename,
+                                                       self._position,
+                                                       self._range))
+
+
+    def GetPosition(self):
+        """
+        Returns the amount of data read or written so far.
+        """
+        return self._position
+
+
+    def write(self, data):
+        self._Advance(0)
+        result = self._file.write(data)
+        self._Advance(len(data))
+        return result
+
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+
+    def read(self, size=-1):
+        self._Advance(0)
+        data = self._file.read(size)
+        self._Advance(len(data))
+        return data
+
+
+    def readline(self, size=-1):
+        self._Advance(0)
+        data = self._file.readline(size)
+        self._Advance(len(data))
+        return data
+
+
+    def readlines(self):
+        return list(self)
+
+
+    def ReadChunks(self, size=1 << 20):
+        """
+        Returns an iterator over the rest of the file in chunks of at most
+        ``size`` bytes (or characters, for text files), so that large files
+        can be loaded without reading them into memory all at once.
+        """
+        while True:
+            data = self.read(size)
+            if not data:
+                return
+            yield data
+
+
 #----------------------------------------------------------------------
 # Document/View Classes
 #----------------------------------------------------------------------
@@ -107,6 +363,12 @@ class Document(wx.EvtHandler):
         self._documentModificationDate = None
         self._documentViews = []
 
+        self._saveInBackground = False
+        self._memoryMappedLoad = False
+        self._saveThread = None
+        self._saveResult = None
+        self._cancelEvent = None
+
 
     def ProcessEvent(self, event):
         """
@@ -281,6 +543,7 @@ class Document(wx.EvtHandler):
         """
         Destructor. Removes itself from the document manager.
         """
+        self.WaitForSave()
         self.DeleteContents()
         self._documentModificationDate = None
         if self.GetDocumentManager():
@@ -308,7 +571,9 @@ class Document(wx.EvtHandler):
         The default implementation calls :meth:`DeleteContents` (an empty
         implementation) sets the modified flag to false. Override this to
         supply additional behaviour when the document is closed with Close.
+        Any background save still running is waited for first.
         """
+        self.WaitForSave()
         self.NotifyClosing()
         self.DeleteContents()
         self.Modify(False)
@@ -441,69 +706,181 @@ class Document(wx.EvtHandler):
         not be empty), and calls :meth:`SaveObject`. If :meth:`SaveObject`
         returns true, the document is set to unmodified; otherwise, an
         error message box is displayed.
+
+        The document is written to a temporary file in the same directory,
+        which then atomically replaces ``filename``, so the existing file is
+        never left half written. If :meth:`SetSaveInBackground` has been
+        turned on, :meth:`SaveObject` runs on a worker thread and this
+        method returns as soon as the save has started.
         """
         if not filename:
             return False
 
+        if self.IsSaving():
+            return False
+
         msgTitle = wx.GetApp().GetAppName()
         if not msgTitle:
             msgTitle = _("File Error")
 
-        backupFilename = None
-        fileObject = None
-        copied = False
+        # Check if read-only.
+        if os.path.exists(filename) and not os.access(filename, os.W_OK):
+            wx.MessageBox("Could not save '%s'.  No write permission to overwrite existing file." % FileNameFromPath(filename),
+                          msgTitle,
+                          wx.OK | wx.ICON_EXCLAMATION,
+                          self.GetDocumentWindow())
+            return False
+
+        self._cancelEvent = threading.Event()
+        if self._saveInBackground:
+            self._saveThread = threading.Thread(target=self._BackgroundSave,
+                                                args=(filename, self._cancelEvent))
+            self._saveThread.daemon = True
+            self._saveThread.start()
+            return True
+
         try:
-            # if current file exists, move it to a safe place temporarily
-            if os.path.exists(filename):
-
-                # Check if read-only.
-                if not os.access(filename, os.W_OK):
-                    wx.MessageBox("Could not save '%s'.  No write permission to overwrite existing file." % FileNameFromPath(filename),
-                                  msgTitle,
-                                  wx.OK | wx.ICON_EXCLAMATION,
-                                  self.GetDocumentWindow())
-                    return False
-
-                i = 1
-                backupFilename = "%s.bak%s" % (filename, i)
-                while os.path.exists(backupFilename):
-                    i += 1
-                    backupFilename = "%s.bak%s" % (filename, i)
-                shutil.copy(filename, backupFilename)
-                copied = True
-
-            fileObject = file(filename, 'w')
-            self.SaveObject(fileObject)
-            fileObject.close()
-            fileObject = None
-
-            if backupFilename:
-                os.remove(backupFilename)
+            self._WriteDocument(filename, self._cancelEvent)
+        except DocumentCancelled:
+            return False
         except:
             # for debugging purposes
             import traceback
             traceback.print_exc()
 
-            if fileObject:
-                fileObject.close()  # file is still open, close it, need to do this before removal
+            wx.MessageBox("Could not save '%s'.  %s" % (FileNameFromPath(filename), sys.exc_info()[1]),
+                          msgTitle,
+                          wx.OK | wx.ICON_EXCLAMATION,
+                          self.GetDocumentWindow())
+            return False
+
+        self._OnDocumentSaved(filename)
+        return True
+
+
+    def _WriteDocument(self, filename, cancelEvent):
+        def saveFunc(fileObject):
+            self.SaveObject(DocumentFile(fileObject, self, filename, cancelEvent=cancelEvent))
+        AtomicSave(filename, saveFunc)
+
 
-            # save failed, remove copied file
-            if backupFilename and copied:
-                os.remove(backupFilename)
+    def _BackgroundSave(self, filename, cancelEvent):
+        try:
+            self._WriteDocument(filename, cancelEvent)
+            self._saveResult = (filename, False, None)
+        except DocumentCancelled:
+            self._saveResult = (filename, True, None)
+        except Exception as error:
+            self._saveResult = (filename, False, error)
+        wx.CallAfter(self._FinishBackgroundSave)
+
+
+    def _FinishBackgroundSave(self):
+        if self._saveThread is None:
+            return
+        self._saveThread.join()
+        self._saveThread = None
+        filename, cancelled, error = self._saveResult
+        self._saveResult = None
 
-            wx.MessageBox("Could not save '%s'.  %s" % (FileNameFromPath(filename), sys.exc_value),
+        if error is not None:
+            msgTitle = wx.GetApp().GetAppName()
+            if not msgTitle:
+                msgTitle = _("File Error")
+            wx.MessageBox("Could not save '%s'.  %s" % (FileNameFromPath(filename), error),
                           msgTitle,
                           wx.OK | wx.ICON_EXCLAMATION,
                           self.GetDocumentWindow())
-            return False
+        elif not cancelled:
+            self._OnDocumentSaved(filename)
 
-        self.SetDocumentModificationDate()
+        self.PostDocumentEvent(DocumentEvent(wxEVT_DOCUMENT_SAVED, self, filename,
+                                             cancelled=cancelled, error=error))
+
+
+    def _OnDocumentSaved(self, filename):
         self.SetFilename(filename, True)
+        self.SetDocumentModificationDate()
         self.Modify(False)
         self.SetDocumentSaved(True)
         #if wx.Platform == '__WXMAC__':  # Not yet implemented in wxPython
         #    wx.FileName(file).MacSetDefaultTypeAndCreator()
-        return True
+
+
+    def GetSaveInBackground(self):
+        """
+        Returns True if :meth:`SaveObject` is run on a worker thread.
+        """
+        return self._saveInBackground
+
+
+    def SetSaveInBackground(self, background=True):
+        """
+        Sets whether :meth:`OnSaveDocument` runs :meth:`SaveObject` on a
+        worker thread, keeping the application responsive while large
+        documents are saved. The document is only marked as saved once the
+        write has completed, and an ``EVT_DOCUMENT_SAVED`` event is then sent
+        to the document window. :meth:`SaveObject` must not touch any GUI
+        object, and the document data should not be changed while the save
+        is in progress.
+        """
+        self._saveInBackground = background
+
+
+    def IsSaving(self):
+        """
+        Returns True while a background save is in progress.
+        """
+        return self._saveThread is not None
+
+
+    def CancelSave(self):
+        """
+        Cancels the save in progress. The next read or write done by
+        :meth:`SaveObject` raises :class:`DocumentCancelled`, the temporary
+        file is discarded and the existing file is left as it was.
+        """
+        if self._cancelEvent is not None:
+            self._cancelEvent.set()
+
+
+    def WaitForSave(self):
+        """
+        Blocks until the background save in progress, if any, has finished
+        and its result has been applied to the document.
+        """
+        self._FinishBackgroundSave()
+
+
+    def GetMemoryMappedLoad(self):
+        """
+        Returns True if :meth:`LoadObject` is given a memory-mapped file.
+        """
+        return self._memoryMappedLoad
+
+
+    def SetMemoryMappedLoad(self, memoryMapped=True):
+        """
+        Sets whether :meth:`OnOpenDocument` passes a read-only ``mmap.mmap``
+        of the file to :meth:`LoadObject` instead of a file object, so large
+        files can be accessed without reading them into memory. Empty files,
+        which cannot be mapped, are still passed as a file object.
+        """
+        self._memoryMappedLoad = memoryMapped
+
+
+    def PostDocumentEvent(self, event):
+        """
+        Sends a :class:`DocumentEvent` to the document window. It can be
+        called from any thread; events coming from a worker thread are
+        delivered on the GUI thread.
+        """
+        if not wx.IsMainThread():
+            wx.CallAfter(self.PostDocumentEvent, event)
+            return
+        window = self.GetDocumentWindow()
+        if window:
+            window.GetEventHandler().ProcessEvent(event)
 
 
     def OnOpenDocument(self, filename):
@@ -514,6 +891,9 @@ class Document(wx.EvtHandler):
         displayed. The document's views are notified that the filename has
         changed, to give windows an opportunity to update their titles. All of
         the document's views are then updated.
+
+        ``EVT_DOCUMENT_PROGRESS`` events are sent as the file is read; see
+        also :meth:`SetMemoryMappedLoad`.
         """
         if not self.OnSaveModified():
             return False
@@ -522,33 +902,44 @@ class Document(wx.EvtHandler):
         if not msgTitle:
             msgTitle = _("File Error")
 
-        fileObject = file(filename, 'r')
         try:
-            self.LoadObject(fileObject)
-            fileObject.close()
-            fileObject = None
+            self._ReadDocument(filename)
         except:
             # for debugging purposes
             import traceback
             traceback.print_exc()
 
-            if fileObject:
-                fileObject.close()  # file is still open, close it
-
-            wx.MessageBox("Could not open '%s'.  %s" % (FileNameFromPath(filename), sys.exc_value),
+            wx.MessageBox("Could not open '%s'.  %s" % (FileNameFromPath(filename), sys.exc_info()[1]),
                           msgTitle,
                           wx.OK | wx.ICON_EXCLAMATION,
                           self.GetDocumentWindow())
             return False
 
-        self.SetDocumentModificationDate()
         self.SetFilename(filename, True)
+        self.SetDocumentModificationDate()
         self.Modify(False)
         self.SetDocumentSaved(True)
         self.UpdateAllViews()
         return True
 
 
+    def _ReadDocument(self, filename):
+        size = os.path.getsize(filename)
+        if self._memoryMappedLoad and size:
+            with open(filename, 'rb') as fileObject:
+                mapping = mmap.mmap(fileObject.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    self.LoadObject(mapping)
+                finally:
+                    mapping.close()
+            return
+
+        with open(filename, 'r') as fileObject:
+            docFile = DocumentFile(fileObject, self, filename, size)
+            self.LoadObject(docFile)
+            docFile.ReportProgress()
+
+
     def LoadObject(self, file):
         """
         Override this function and call it from your own ``LoadObject`` before
@@ -556,7 +947,9 @@ class Document(wx.EvtHandler):
         automatically when the document contents need to be loaded.
 
         Note that the wxPython version simply sends you a Python file object,
-        so you can use pickle.
+        so you can use pickle.  Large files can be read piecewise with
+        :meth:`DocumentFile.ReadChunks`, or memory-mapped by calling
+        :meth:`SetMemoryMappedLoad`.
         """
         return True
 
@@ -568,7 +961,8 @@ class Document(wx.EvtHandler):
         automatically when the document contents need to be saved.
 
         Note that the wxPython version simply sends you a Python file object,
-        so you can use pickle.
+        so you can use pickle.  The file is a temporary one that replaces
+        the document's file only once this method has returned.
         """
         return True
 
@@ -3006,6 +3400,125 @@ class Command(wx.Object):
         return True
 
 
+    def MergeWith(self, command):
+        """
+        Called by the command processor after ``command`` has been done, when
+        this command is the most recent one in the history.  Override this
+        member function to coalesce ``command`` into this command (for
+        example successive keystrokes, or the steps of a mouse drag) so that
+        a single :meth:`Undo` reverts both.  Return ``True`` if the command
+        was merged, in which case ``command`` is not stored in the history,
+        ``False`` otherwise (the default.)
+        """
+        return False
+
+
+    def GetMemorySize(self):
+        """
+        Returns an estimate, in bytes, of the memory held by this command,
+        used by a :class:`CommandProcessor` with a memory budget.  Override
+        this member function if the command refers to large data that the
+        default estimate does not account for.
+        """
+        return EstimateSize(self)
+
+
+    def Serialize(self):
+        """
+        Called by a :class:`CommandProcessor` with a journal to move the data
+        of this command out of memory.  Override this member function, along
+        with :meth:`Restore`, to return a picklable copy of the data needed to
+        undo and redo the command and release it from the command.  The
+        command object itself stays in the history, with its references to
+        the document, so the data is restored into it and acts on the live
+        document.  Return ``None`` (the default) to keep the command in
+        memory.
+        """
+        return None
+
+
+    def Restore(self, state):
+        """
+        Called by a :class:`CommandProcessor` with the value returned by
+        :meth:`Serialize` before the command is undone or redone, to put its
+        data back in place.
+        """
+        pass
+
+
+class CommandJournal(object):
+    """
+    :class:`CommandJournal` is a compact on-disk store for the data of
+    commands, used by a :class:`CommandProcessor` to hold the parts of its
+    undo and redo histories that do not fit in its memory budget.  Entries
+    are pickled, compressed and appended to an anonymous temporary file,
+    which is removed when the journal is closed.
+    """
+
+    def __init__(self, dir=None):
+        """
+        Constructor.  ``dir`` is the directory in which to create the journal
+        file, by default the system's temporary directory.
+        """
+        self._file = tempfile.TemporaryFile(prefix='cmdjournal', dir=dir)
+        self._entries = set()
+        self._end = 0
+
+
+    def __len__(self):
+        return len(self._entries)
+
+
+    def Write(self, state):
+        """
+        Stores ``state``, which must be picklable, in the journal and returns
+        the key to read it back with.
+        """
+        data = zlib.compress(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+        key = (self._end, len(data))
+        self._file.seek(self._end)
+        self._file.write(data)
+        self._end += len(data)
+        self._entries.add(key)
+        return key
+
+
+    def Read(self, key):
+        """
+        Returns the state stored under ``key``.
+        """
+        offset, length = key
+        self._file.seek(offset)
+        return pickle.loads(zlib.decompress(self._file.read(length)))
+
+
+    def Discard(self, key):
+        """
+        Removes the state stored under ``key``.  The space used by the
+        entries is reclaimed when the journal becomes empty.
+        """
+        self._entries.discard(key)
+        if not self._entries:
+            self.Clear()
+
+
+    def Clear(self):
+        """
+        Removes all the entries from the journal.
+        """
+        self._entries = set()
+        self._end = 0
+        self._file.truncate(0)
+
+
+    def Close(self):
+        """
+        Closes and removes the journal file.
+        """
+        self._entries = set()
+        self._file.close()
+
+
 class CommandProcessor(wx.Object):
     """
     :class:`CommandProcessor` is a class that maintains a history of
@@ -3014,31 +3527,136 @@ class CommandProcessor(wx.Object):
     """
 
 
-    def __init__(self, maxCommands=-1):
+    def __init__(self, maxCommands=-1, maxMemory=-1, journal=False):
         """
         Constructor.  ``maxCommands`` may be set to a positive integer to limit
         the number of commands stored to it, otherwise (and by default) the
         list of commands can grow arbitrarily.
+
+        ``maxMemory`` may be set to a positive number of bytes to limit the
+        estimated memory (see :meth:`Command.GetMemorySize`) held by the undo
+        and redo histories.  The oldest commands are removed from memory
+        first; the current command is always kept.
+
+        If ``journal`` is ``True``, or the name of a directory, the commands
+        are kept instead, and the data of those beyond ``maxCommands`` or
+        ``maxMemory`` is spilled to a :class:`CommandJournal` on disk and
+        restored when they are undone or redone.  Only commands that
+        implement :meth:`Command.Serialize` and :meth:`Command.Restore` are
+        spilled; the others stay in memory.  The journal is created when it
+        is first needed, and closed when the commands are cleared or the
+        command processor is deleted.
         """
         self._maxCommands = maxCommands
+        self._maxMemory = maxMemory
         self._editMenu = None
         self._undoAccelerator = _("Ctrl+Z")
         self._redoAccelerator = _("Ctrl+Y")
+        self._useJournal = bool(journal)
+        self._journalDir = None
+        if journal is not True and journal:
+            self._journalDir = journal
+        self._journal = None
         self.ClearCommands()
 
 
+    def __del__(self):
+        if getattr(self, '_journal', None) is not None:
+            self._journal.Close()
+            self._journal = None
+
+
     def _GetCurrentCommand(self):
         if len(self._commands) == 0:
             return None
-        else:
-            return self._commands[-1]
+        return self._commands[-1]
 
 
     def _GetCurrentRedoCommand(self):
         if len(self._redoCommands) == 0:
             return None
-        else:
-            return self._redoCommands[-1]
+        return self._redoCommands[-1]
+
+
+    def _GetCommandSize(self, command):
+        if hasattr(command, 'GetMemorySize'):
+            return command.GetMemorySize()
+        return EstimateSize(command)
+
+
+    def _Store(self, command):
+        size = self._GetCommandSize(command)
+        self._commandSizes[id(command)] = size
+        self._memoryUsage += size
+        self._commands.append(command)
+
+
+    def _Discard(self, command):
+        self._memoryUsage -= self._commandSizes.pop(id(command), 0)
+        key = self._journaled.pop(id(command), None)
+        if key is not None:
+            self._journal.Discard(key)
+
+
+    def _Spill(self, command):
+        """
+        Moves the data of ``command`` to the journal, if the command supports
+        it and is not already spilled.
+        """
+        if id(command) in self._journaled or not hasattr(command, 'Serialize'):
+            return
+        state = command.Serialize()
+        if state is None:
+            return
+        if self._journal is None:
+            self._journal = CommandJournal(self._journalDir)
+        self._journaled[id(command)] = self._journal.Write(state)
+        self._memoryUsage -= self._commandSizes.pop(id(command), 0)
+
+
+    def _Load(self, command):
+        """
+        Restores the data of ``command`` from the journal, if it was spilled.
+        """
+        key = self._journaled.pop(id(command), None)
+        if key is None:
+            return
+        command.Restore(self._journal.Read(key))
+        self._journal.Discard(key)
+        size = self._GetCommandSize(command)
+        self._commandSizes[id(command)] = size
+        self._memoryUsage += size
+
+
+    def _TrimHistory(self):
+        """
+        Removes the oldest commands until the history fits in the command and
+        memory limits or, if there is a journal, spills their data to it.
+        Commands furthest in the redo history go first, then the oldest undo
+        commands; the current undo and redo commands are kept in memory.
+        """
+        if not self._useJournal:
+            if self._maxCommands > -1:
+                while len(self._commands) > self._maxCommands:
+                    self._Discard(self._commands.popleft())
+            if self._maxMemory > -1:
+                while self._memoryUsage > self._maxMemory and len(self._redoCommands) > 1:
+                    self._Discard(self._redoCommands.popleft())
+                while self._memoryUsage > self._maxMemory and len(self._commands) > 1:
+                    self._Discard(self._commands.popleft())
+            return
+
+        if self._maxCommands > -1:
+            loaded = [command for command in self._commands
+                      if id(command) not in self._journaled]
+            excess = len(loaded) - max(self._maxCommands, 1)
+            for command in loaded[:max(excess, 0)]:
+                self._Spill(command)
+        if self._maxMemory > -1:
+            for command in list(self._redoCommands)[:-1] + list(self._commands)[:-1]:
+                if self._memoryUsage <= self._maxMemory:
+                    break
+                self._Spill(command)
 
 
     def GetMaxCommands(self):
@@ -3050,11 +3668,36 @@ class CommandProcessor(wx.Object):
         return self._maxCommands
 
 
+    def GetMaxMemory(self):
+        """
+        Returns the memory budget, in bytes, of the command history, or -1 if
+        it is unlimited.
+        """
+        return self._maxMemory
+
+
+    def SetMaxMemory(self, maxMemory):
+        """
+        Sets the memory budget, in bytes, of the command history.  A value of
+        -1 removes the limit.
+        """
+        self._maxMemory = maxMemory
+        self._TrimHistory()
+
+
+    def GetMemoryUsage(self):
+        """
+        Returns the estimated memory, in bytes, held by the commands of the
+        undo and redo histories that are in memory.
+        """
+        return self._memoryUsage
+
+
     def GetCommands(self):
         """
-        Returns the list of commands.
+        Returns a list of the commands of the undo history, oldest first.
         """
-        return self._commands
+        return list(self._commands)
 
 
     def ClearCommands(self):
@@ -3062,8 +3705,20 @@ class CommandProcessor(wx.Object):
         Deletes all the commands in the list and sets the current command
         pointer to None.
         """
-        self._commands = []
-        self._redoCommands = []
+        self._commands = deque()
+        self._redoCommands = deque()
+        self._commandSizes = {}
+        self._memoryUsage = 0
+        self._journaled = {}
+        if self._journal is not None:
+            self._journal.Close()
+            self._journal = None
+
+
+    def _ClearRedoCommands(self):
+        for command in self._redoCommands:
+            self._Discard(command)
+        self._redoCommands.clear()
 
 
     def GetEditMenu(self):
@@ -3169,16 +3824,24 @@ class CommandProcessor(wx.Object):
         not be deleted directly by the application.
 
         ``storeIt`` indicates whether the successful command should be stored in
-        the history list.
+        the history list.  If the most recent command in the history accepts
+        it (see :meth:`Command.MergeWith`) the command is merged into that one
+        rather than stored separately.
         """
         done = command.Do()
         if done:
-            del self._redoCommands[:]
+            self._ClearRedoCommands()
             if storeIt:
-                self._commands.append(command)
-        if self._maxCommands > -1:
-            if len(self._commands) > self._maxCommands:
-                del self._commands[0]
+                if self._commands:
+                    self._Load(self._commands[-1])
+                if self._commands and hasattr(self._commands[-1], 'MergeWith') and self._commands[-1].MergeWith(command):
+                    current = self._commands[-1]
+                    size = self._GetCommandSize(current)
+                    self._memoryUsage += size - self._commandSizes.get(id(current), 0)
+                    self._commandSizes[id(current)] = size
+                else:
+                    self._Store(command)
+        self._TrimHistory()
         return done
 
 
@@ -3189,9 +3852,11 @@ class CommandProcessor(wx.Object):
         cmd = self._GetCurrentRedoCommand()
         if not cmd:
             return False
+        self._Load(cmd)
         done = cmd.Do()
         if done:
             self._commands.append(self._redoCommands.pop())
+            self._TrimHistory()
         return done
 
 
@@ -3202,9 +3867,11 @@ class CommandProcessor(wx.Object):
         cmd = self._GetCurrentCommand()
         if not cmd:
             return False
+        self._Load(cmd)
         done = cmd.Undo()
         if done:
             self._redoCommands.append(self._commands.pop())
+            self._TrimHistory()
         return done
 
 
@@ -34,9 +34,15 @@ programmer to declare or track control ids or parent containers::
 
     eventManager.Register(handleEvents, EVT_BUTTON, myButton)
 
+Events are dispatched straight from a table keyed by (event type, window
+id, id) to the registered listeners, and all of a window's registrations
+are dropped automatically when the window is destroyed.  :meth:`EventManager.GetStats`
+reports how often each of these topics was delivered and how long its
+listeners took, which helps finding the hot ones.
+
 """
+import  time
 import  wx
-from wx.lib.pubsub import pub # publish / subscribe library
 
 #---------------------------------------------------------------------------
 
@@ -93,10 +99,10 @@ class EventManager:
             # Some widgets do not function as their own windows.
             win = self._determineWindow(source)
 
-        topic = ".".join([str(event.typeId), str(win.GetId()), str(id)])
+        topic = (event.typeId, win.GetId(), id)
 
-        #  Create an adapter from the PS system back to wxEvents, and
-        #  possibly one from wxEvents:
+        #  Create an adapter for the listener, and possibly one from
+        #  wxEvents that dispatches to all the listeners of this topic:
         if not self.__haveMessageAdapter(listener, topic):
             messageAdapter = MessageAdapter(eventHandler=listener, topicPattern=topic)
             try:
@@ -107,6 +113,7 @@ class EventManager:
 
             if not topic in self.eventAdapterDict:
                 self.eventAdapterDict[topic] = EventAdapter(event, win, id)
+            self.eventAdapterDict[topic].addListener(listener)
         else:
             # Throwing away a duplicate request
             pass
@@ -117,6 +124,9 @@ class EventManager:
         except KeyError:
             self.windowTopicLookup[win] = []
             self.windowTopicLookup[win].append(topic)
+            # Forget about the window's topics in one go when it dies.
+            if isinstance(win, wx.Window):
+                win.Bind(wx.EVT_WINDOW_DESTROY, self.__onWindowDestroy)
 
         # For time efficiency when deregistering by listener:
         try:
@@ -155,6 +165,8 @@ class EventManager:
                 self.__deregisterTopic(aTopic)
 
             del self.windowTopicLookup[win]
+            if isinstance(win, wx.Window):
+                win.Unbind(wx.EVT_WINDOW_DESTROY, handler=self.__onWindowDestroy)
 
 
     def DeregisterListener(self, listener):
@@ -167,11 +179,12 @@ class EventManager:
             return
 
         for topic in topicList:
-            topicDict = self.messageAdapterDict[topic]
+            topicDict = self.messageAdapterDict.get(topic, self.EMPTY_LIST)
 
             if listener in topicDict:
                 topicDict[listener].Destroy()
                 del topicDict[listener]
+                self.eventAdapterDict[topic].removeListener(listener)
 
                 if len(topicDict) == 0:
                     self.eventAdapterDict[topic].Destroy()
@@ -183,16 +196,30 @@ class EventManager:
 
     def GetStats(self):
         """
-        Return a dictionary with data about my state.
+        Return a dictionary with data about my state.  The
+        'Topics: Deliveries' entry maps each (event type, window id,
+        id) topic to a (count, seconds) tuple giving how many events
+        were delivered for it and the total time its listeners took.
         """
         stats = {}
-        stats['Adapters: Message'] = reduce(lambda x,y: x+y, [0] + map(len, self.messageAdapterDict.values()))
+        stats['Adapters: Message'] = sum(map(len, self.messageAdapterDict.values()))
         stats['Adapters: Event']   = len(self.eventAdapterDict)
         stats['Topics: Total']     = len(self.__getTopics())
         stats['Topics: Dead']      = len(self.GetDeadTopics())
+        stats['Topics: Deliveries'] = dict((topic, (adapter.deliveries, adapter.deliveryTime))
+                                           for topic, adapter in self.eventAdapterDict.items())
         return stats
 
 
+    def ResetStats(self):
+        """
+        Reset the per-topic delivery counts and times.
+        """
+        for adapter in self.eventAdapterDict.values():
+            adapter.deliveries   = 0
+            adapter.deliveryTime = 0.0
+
+
     def DeregisterDeadTopics(self):
         """
         Deregister any entries relating to dead
@@ -211,7 +238,7 @@ class EventManager:
         Return a list of topics relating to dead wxPython
         objects.
         """
-        return filter(self.__isDeadTopic, self.__getTopics())
+        return list(filter(self.__isDeadTopic, self.__getTopics()))
 
 
     def __winString(self, aWin):
@@ -243,22 +270,41 @@ class EventManager:
             return 'Function ' + aListener.__name__
 
 
-    def __deregisterTopic(self, aTopic):
+    def __deregisterTopic(self, aTopic, disconnect=True):
         try:
-            messageAdapterList = self.messageAdapterDict[aTopic].values()
+            messageAdapterDict = self.messageAdapterDict[aTopic]
         except KeyError:
             # This topic isn't valid.  Probably because it was deleted
             # by listener.
             return
 
-        for messageAdapter in messageAdapterList:
+        for listener, messageAdapter in messageAdapterDict.items():
             messageAdapter.Destroy()
-
-        self.eventAdapterDict[aTopic].Destroy()
+            topicList = self.listenerTopicLookup.get(listener, self.EMPTY_LIST)
+            while aTopic in topicList:
+                topicList.remove(aTopic)
+            if not topicList and listener in self.listenerTopicLookup:
+                del self.listenerTopicLookup[listener]
+
+        if disconnect:
+            self.eventAdapterDict[aTopic].Destroy()
         del self.messageAdapterDict[aTopic]
         del self.eventAdapterDict[aTopic]
 
 
+    def __onWindowDestroy(self, event):
+        """
+        Drop all the topics of a window that is being destroyed.  Its
+        event bindings go away with it, so they are not disconnected.
+        """
+        event.Skip()
+        win = event.GetEventObject()
+        topics = self.windowTopicLookup.pop(win, None)
+        if topics:
+            for aTopic in topics:
+                self.__deregisterTopic(aTopic, disconnect=False)
+
+
     def __getTopics(self, win=None):
         if win is None:
             return list(self.messageAdapterDict)
@@ -271,11 +317,11 @@ class EventManager:
 
 
     def __isDeadWxObject(self, anObject):
-        return isinstance(anObject, wx._core._wxPyDeadObject)
+        return not anObject
 
 
     def __isDeadTopic(self, aTopic):
-        return self.__isDeadWxObject(aTopic[1])
+        return self.__isDeadWxObject(self.eventAdapterDict[aTopic].win)
 
 
     def __haveMessageAdapter(self, eventHandler, topicPattern):
@@ -387,23 +433,27 @@ class FakeWindow:
 
 class EventAdapter:
     """
-    A class that adapts incoming wxWindows events to
-    Publish/Subscribe messages.
+    A class that relays incoming wxWindows events to the
+    listeners registered for them.
 
     In other words, this is the object that's seen by the
     wxWindows system.  Only one of these registers for any
-    particular wxWindows event.  It then relays it into the
-    PS system, which lets many listeners respond.
+    particular wxWindows event.  It then calls each of its
+    listeners directly, which lets many listeners respond, and
+    keeps count of the deliveries and the time they took.
     """
     def __init__(self, func, win, id):
         """
-        Instantiate a new adapter. Pre-compute my Publish/Subscribe
-        topic, which is constant, and register with wxWindows.
+        Instantiate a new adapter. Pre-compute my topic, which is
+        constant, and register with wxWindows.
         """
-        self.topic     = ".".join([str(func.typeId), str(win.GetId()), str(id)])
+        self.topic     = (func.typeId, win.GetId(), id)
         self.id        = id
         self.win       = win
         self.eventType = _macroInfo.getEventTypes(func)[0]
+        self.listeners = ()
+        self.deliveries   = 0
+        self.deliveryTime = 0.0
 
         # Register myself with the wxWindows event system
         try:
@@ -421,11 +471,28 @@ class EventAdapter:
             return self.win.Disconnect(-1, -1, self.eventType)
 
 
+    def addListener(self, listener):
+        # The listeners are kept in a tuple that is replaced rather
+        # than modified, so that listeners can (de)register while an
+        # event is being delivered.
+        self.listeners = self.listeners + (listener,)
+
+
+    def removeListener(self, listener):
+        self.listeners = tuple(l for l in self.listeners if l != listener)
+
+
     def handleEvent(self, event):
         """
-        In response to a wxWindows event, send a PS message
+        In response to a wxWindows event, call each listener
         """
-        pub.sendMessage(self.topic, message=event)
+        start = time.perf_counter()
+        try:
+            for listener in self.listeners:
+                listener(event)
+        finally:
+            self.deliveries   += 1
+            self.deliveryTime += time.perf_counter() - start
 
 
     def Destroy(self):
@@ -440,18 +507,13 @@ class EventAdapter:
 
 class MessageAdapter:
     """
-    A class that adapts incoming Publish/Subscribe messages
-    to wxWindows event calls.
-
-    This class works opposite the EventAdapter, and
-    retrieves the information an EventAdapter has sent in a message.
-    Strictly speaking, this class is not required: Event listeners
-    could pull the original wxEvent object out of the PS Message
-    themselves.
-
-    However, by pairing an instance of this class with each wxEvent
-    handler, the handlers can use the standard API: they receive an
-    event as a parameter.
+    A record of one listener's registration for a topic.
+
+    Events used to be relayed from the EventAdapter to the
+    listeners through Publish/Subscribe messages, which this class
+    turned back into wxEvent handler calls.  The EventAdapter now
+    calls the listeners itself, so this class only remains to keep
+    track of the registrations, and for compatibility.
     """
     def __init__(self, eventHandler, topicPattern):
         """
@@ -460,14 +522,13 @@ class MessageAdapter:
         """
         self.eventHandler = eventHandler
         self.topicPattern = topicPattern
-        pub.subscribe(self.deliverEvent, topicPattern)
 
     def deliverEvent(self, message):
         # the message is the event object
         self.eventHandler(message)
 
     def Destroy(self):
-        pub.unsubscribe(self.deliverEvent, self.topicPattern)
+        pass
 
 
 #---------------------------------------------------------------------------
@@ -15,13 +15,17 @@ This is where FloatCanvas defines its drawings objects.
 """
 
 import sys
+import threading
+from collections import OrderedDict
 
 import wx
 import six
+from six.moves import queue
 
 import numpy as N
 
 from .Utilities import BBox
+from .Utilities import TilePyramid
 from wx.lib.floatcanvas.Utilities import Colors
 
 mac = sys.platform.startswith("darwin")
@@ -1211,6 +1215,546 @@ class SquarePoint(XYObjectMixin, ColorOnlyMixin, DrawObject):
                 HTdc.SetBrush(self.HitBrush)
                 HTdc.DrawRectangle(x, y, Size, Size)
 
+def _SegmentDistances(Start, End):
+    """
+    Returns the distances from the origin to the segments going from the
+    points in Start to the points in End, two NX2 arrays.
+    """
+    Delta = End - Start
+    Length2 = (Delta**2).sum(axis=1)
+    with N.errstate(divide='ignore', invalid='ignore'):
+        t = -(Start * Delta).sum(axis=1) / Length2
+    t = N.where(Length2 > 0, N.clip(t, 0, 1), 0)
+    Closest = Start + Delta * t[:, None]
+    return N.hypot(Closest[:, 0], Closest[:, 1])
+
+
+class FeatureSetMixin:
+    """
+    A mixin class for the objects that draw a whole layer of features, like
+    the polygons of a map, as one DrawObject.
+
+    The vertices of all the features are kept in a single NX2 array,
+    ``Points``, and ``Offsets`` holds the index of the first vertex of each
+    feature, followed by the number of vertices, so that feature i is
+    ``Points[Offsets[i]:Offsets[i+1]]``. Each feature is drawn with one of the
+    ``Styles`` of the set, chosen by ``StyleIndex``.
+
+    The whole layer is transformed to pixel coordinates at once, and the
+    visible features which share a style are drawn with one call to the
+    ``wx.DC.Draw*List`` methods.
+
+    The features are not drawn on the hit test bitmap: the canvas looks for
+    the feature under the mouse with :meth:`FindFeature`, which only checks
+    the features whose bounding box contains the point, and sets
+    ``HitFeature`` to its index before calling the callback.
+
+    """
+    _StyleKeys = ()
+
+    def SetFeatures(self, Points, Offsets=None, StyleIndex=None):
+        """
+        Sets the features of the set
+
+        :param `Points`: a sequence of features, each of them a sequence of
+         (x, y) coordinates, or if `Offsets` is given, a NX2
+         `NumPy <http://www.numpy.org/>`_ array of the vertices of all the
+         features
+        :param `Offsets`: the index in `Points` of the first vertex of each
+         feature, optionally followed by the number of points
+        :param `StyleIndex`: see :meth:`SetStyleIndex`
+
+        """
+        if Offsets is None:
+            Features = [N.asarray(Feature, N.float).reshape(-1, 2)
+                        for Feature in Points]
+            Offsets = N.cumsum([0] + [len(Feature) for Feature in Features])
+            if Features:
+                Points = N.concatenate(Features)
+            else:
+                Points = N.zeros((0, 2), N.float)
+        else:
+            Points = N.array(Points, N.float).reshape(-1, 2)
+            Offsets = N.asarray(Offsets, N.intp).reshape(-1)
+            if not len(Offsets) or Offsets[-1] != len(Points):
+                Offsets = N.append(Offsets, len(Points))
+        if Offsets[0] != 0 or N.any(N.diff(Offsets) <= 0):
+            raise ValueError("Every feature must have at least one point")
+
+        self.Points = Points
+        self.Offsets = Offsets
+        self.CalcBoundingBox()
+        self.SetStyleIndex(StyleIndex)
+
+    def SetStyles(self, Styles=None):
+        """
+        Sets the styles used to draw the features
+
+        :param `Styles`: a list of dictionaries, whose keys are the style
+         arguments of the constructor. The values which are not in a
+         dictionary are the ones of the set. If ``None``, all the features
+         are drawn with the style of the set.
+
+        """
+        if Styles is None:
+            Styles = [{}]
+        Styles = [dict(Style) for Style in Styles]
+        for Style in Styles:
+            for key in Style:
+                if key not in self._StyleKeys:
+                    raise ValueError("%r is not a style of %s" % (key, self.__class__.__name__))
+        self.Styles = Styles
+        if getattr(self, "StyleIndex", None) is not None and len(self.StyleIndex):
+            if self.StyleIndex.max() >= len(Styles):
+                raise ValueError("StyleIndex refers to a missing style")
+
+    def SetStyleIndex(self, StyleIndex=None):
+        """
+        Sets the style of each feature
+
+        :param `StyleIndex`: a sequence with the index in ``Styles`` of the
+         style of each feature, or ``None`` to use the first style for all
+
+        """
+        NumFeatures = len(self.Offsets) - 1
+        if StyleIndex is None:
+            StyleIndex = N.zeros(NumFeatures, N.intp)
+        else:
+            StyleIndex = N.array(StyleIndex, N.intp).reshape(-1)
+            if len(StyleIndex) != NumFeatures:
+                raise ValueError("StyleIndex must have one entry per feature")
+            if len(StyleIndex) and (StyleIndex.min() < 0 or
+                                    StyleIndex.max() >= len(self.Styles)):
+                raise ValueError("StyleIndex refers to a missing style")
+        self.StyleIndex = StyleIndex
+        # the features are drawn grouped by style, in the order of the styles
+        self._DrawOrder = N.argsort(StyleIndex, kind="mergesort")
+        self._SortedStyleIndex = StyleIndex[self._DrawOrder]
+        self._DrawRank = N.empty(NumFeatures, N.intp)
+        self._DrawRank[self._DrawOrder] = N.arange(NumFeatures)
+
+    def GetStyle(self, Index):
+        """
+        Returns a dictionary with all the values of a style
+
+        :param integer `Index`: the index of the style in ``Styles``
+
+        """
+        Style = dict((key, getattr(self, key)) for key in self._StyleKeys)
+        Style.update(self.Styles[Index])
+        return Style
+
+    def GetFeature(self, Index):
+        """
+        Returns the NX2 array of the points of a feature
+
+        :param integer `Index`: the index of the feature
+
+        """
+        return self.Points[self.Offsets[Index]:self.Offsets[Index + 1]]
+
+    def GetFeatureCount(self):
+        """Returns the number of features in the set."""
+        return len(self.Offsets) - 1
+
+    def Move(self, Delta):
+        """
+        Moves the object by delta, where delta is a (dx, dy) pair.
+
+        :param `Delta`: is a (dx, dy) pair ideally a `NumPy <http://www.numpy.org/>`_
+         array of shape (2, )
+
+        """
+        Delta = N.asarray(Delta, N.float)
+        Delta.shape = (2,)
+        self.Points += Delta
+        self.FeatureBoxes += Delta
+        self.BoundingBox += Delta
+        if self._Canvas:
+            self._Canvas.BoundingBoxDirty = True
+
+    def CalcBoundingBox(self):
+        """Calculate the bounding box of the set, and of each feature."""
+        Starts = self.Offsets[:-1]
+        self.FeatureBoxes = N.empty((len(Starts), 2, 2), N.float)
+        if len(Starts):
+            self.FeatureBoxes[:, 0] = N.minimum.reduceat(self.Points, Starts)
+            self.FeatureBoxes[:, 1] = N.maximum.reduceat(self.Points, Starts)
+            self.BoundingBox = BBox.asBBox((self.FeatureBoxes[:, 0].min(axis=0),
+                                            self.FeatureBoxes[:, 1].max(axis=0)))
+        else:
+            self.BoundingBox = BBox.NullBBox()
+        if self._Canvas:
+            self._Canvas.BoundingBoxDirty = True
+
+    def Bind(self, Event, CallBackFun):
+        """
+        Bind an event to the set, see :meth:`DrawObject.Bind`
+
+        The index of the feature which was hit is put in ``HitFeature``.
+
+        """
+        self.CallBackFuncs[Event] = CallBackFun
+        self.HitAble = True
+        if not self._Canvas.HitDict:
+            self._Canvas.MakeHitDict()
+        if self not in self._Canvas.HitFeatureSets:
+            self._Canvas.HitFeatureSets.append(self)
+
+    def UnBindAll(self):
+        """Unbind all events"""
+        if self._Canvas and self in self._Canvas.HitFeatureSets:
+            self._Canvas.HitFeatureSets.remove(self)
+        self.CallBackFuncs = {}
+        self.HitAble = False
+
+    def FindFeature(self, XY):
+        """
+        Returns the index of the topmost feature at the point XY, given in
+        World coordinates, or ``None`` if there is no feature there.
+
+        Only the features whose bounding box contains the point are checked,
+        so this is fast even for very large sets. The set must be on a canvas,
+        as the line widths and marker sizes are in pixels.
+
+        :param `XY`: the (x,y) coordinates of the point to look for, it takes a
+         2-tuple or (2,) numpy array in World coordinates
+
+        """
+        XY = N.asarray(XY, N.float)
+        Transform = self._Canvas.TransformVector
+        Radius = max([self._HitRadius(self.GetStyle(i)) for i in range(len(self.Styles))])
+        Margin = Radius / N.abs(Transform)
+        Boxes = self.FeatureBoxes
+        Candidates = N.nonzero(N.all((Boxes[:, 0] - Margin <= XY) &
+                                     (Boxes[:, 1] + Margin >= XY), axis=1))[0]
+        # the topmost feature is the one drawn last
+        for Feature in Candidates[N.argsort(-self._DrawRank[Candidates])]:
+            # the points relative to XY, in pixels
+            Points = (self.GetFeature(Feature) - XY) * Transform
+            if self._HitFeature(Points, self.GetStyle(self.StyleIndex[Feature])):
+                return int(Feature)
+        return None
+
+    def _HitRadius(self, Style):
+        """Returns the distance in pixels at which a feature is hit."""
+        return max(Style["LineWidth"], self.MinHitLineWidth) / 2.0
+
+    def _GetPen(self, LineColor, LineStyle, LineWidth):
+        if LineColor is None or LineStyle is None:
+            return wx.TRANSPARENT_PEN
+        Pen = self.PenList.get((LineColor, LineStyle, LineWidth))
+        if Pen is None:
+            Pen = wx.Pen(LineColor, LineWidth, self.LineStyleList[LineStyle])
+            self.PenList[(LineColor, LineStyle, LineWidth)] = Pen
+        return Pen
+
+    def _GetBrush(self, FillColor, FillStyle):
+        if FillColor is None or FillStyle is None:
+            return wx.TRANSPARENT_BRUSH
+        Brush = self.BrushList.get((FillColor, FillStyle))
+        if Brush is None:
+            Brush = wx.Brush(FillColor, self.FillStyleList[FillStyle])
+            self.BrushList[(FillColor, FillStyle)] = Brush
+        return Brush
+
+    def _VisibleFeatures(self, Margin):
+        """
+        Returns a boolean array telling which features are in the view port
+        of the canvas grown by Margin pixels, or None if it isn't known.
+        """
+        ViewPortBB = getattr(self._Canvas, "ViewPortBB", None)
+        if ViewPortBB is None:
+            return None
+        Margin = N.abs(self._Canvas.ScalePixelToWorld((Margin, Margin)))
+        Boxes = self.FeatureBoxes
+        return N.all((Boxes[:, 1] >= ViewPortBB[0] - Margin) &
+                     (Boxes[:, 0] <= ViewPortBB[1] + Margin), axis=1)
+
+    def _StyleGroups(self, Visible):
+        """
+        Yields each style, with the indexes of the visible features drawn
+        with it.
+        """
+        Bounds = N.searchsorted(self._SortedStyleIndex, N.arange(len(self.Styles) + 1))
+        for i in range(len(self.Styles)):
+            Features = self._DrawOrder[Bounds[i]:Bounds[i + 1]]
+            if Visible is not None:
+                Features = Features[Visible[Features]]
+            if len(Features):
+                yield self.GetStyle(i), Features
+
+    def _SplitFeatures(self, Points, Features):
+        """Returns the list of the vertices in Points of each feature."""
+        Starts = self.Offsets[Features].tolist()
+        Ends = self.Offsets[Features + 1].tolist()
+        return [Points[start:end] for start, end in zip(Starts, Ends)]
+
+
+class PolygonSet(FeatureSetMixin, LineAndFillMixin, DrawObject):
+    """
+    Draws a set of polygons, like the features of a map layer
+
+    It is much faster than using a Polygon object for each of them: all the
+    points are transformed at once, and all the visible polygons with the
+    same style are drawn with a single call to ``wx.DC.DrawPolygonList``.
+
+    The polygons with the same style are drawn together, in the order of
+    the styles, so the last style is drawn on top.
+
+    See :class:`FeatureSetMixin` for the way the points are stored, and for
+    hit-testing: ``HitFeature`` is set to the index of the polygon that
+    was hit.
+
+    """
+    _StyleKeys = ("LineColor", "LineStyle", "LineWidth", "FillColor", "FillStyle")
+
+    def __init__(self,
+                 Points,
+                 LineColor = "Black",
+                 LineStyle = "Solid",
+                 LineWidth    = 1,
+                 FillColor    = None,
+                 FillStyle    = "Solid",
+                 Offsets      = None,
+                 Styles       = None,
+                 StyleIndex   = None,
+                 InForeground = False):
+        """
+        Default class constructor.
+
+        :param `Points`: a sequence of polygons, or an NX2 array of all the
+         points, see :meth:`~lib.floatcanvas.FloatCanvas.FeatureSetMixin.SetFeatures`
+        :param `LineColor`: see :meth:`~lib.floatcanvas.FloatCanvas.DrawObject.SetColor`
+        :param `LineStyle`: see :meth:`~lib.floatcanvas.FloatCanvas.DrawObject.SetLineStyle`
+        :param `LineWidth`: see :meth:`~lib.floatcanvas.FloatCanvas.DrawObject.SetLineWidth`
+        :param `FillColor`: see :meth:`~lib.floatcanvas.FloatCanvas.DrawObject.SetColor`
+        :param `FillStyle`: see :meth:`~lib.floatcanvas.FloatCanvas.DrawObject.SetFillStyle`
+        :param `Offsets`: the index of the first point of each polygon when
+         `Points` is an array
+        :param `Styles`: see :meth:`~lib.floatcanvas.FloatCanvas.FeatureSetMixin.SetStyles`
+        :param `StyleIndex`: see :meth:`~lib.floatcanvas.FloatCanvas.FeatureSetMixin.SetStyleIndex`
+        :param boolean `InForeground`: should object be in foreground
+
+        """
+        DrawObject.__init__(self, InForeground)
+
+        self.LineColor = LineColor
+        self.LineStyle = LineStyle
+        self.LineWidth = LineWidth
+        self.FillColor = FillColor
+        self.FillStyle = FillStyle
+
+        self.SetStyles(Styles)
+        self.SetFeatures(Points, Offsets, StyleIndex)
+
+    def _HitFeature(self, Points, Style):
+        if self.HitFill:
+            # count the edges crossed by a ray going right from the point
+            x, y = Points[:, 0], Points[:, 1]
+            xj, yj = N.roll(x, 1), N.roll(y, 1)
+            with N.errstate(divide='ignore', invalid='ignore'):
+                Crossings = ((y > 0) != (yj > 0)) & (x - y * (xj - x) / (yj - y) > 0)
+            if N.count_nonzero(Crossings) % 2:
+                return True
+        if self.HitLine:
+            Distances = _SegmentDistances(Points, N.roll(Points, -1, axis=0))
+            return Distances.min() <= self._HitRadius(Style)
+        return False
+
+    def _Draw(self, dc , WorldToPixel, ScaleWorldToPixel = None, HTdc=None):
+        Points = WorldToPixel(self.Points)
+        LineWidth = max([self.GetStyle(i)["LineWidth"] for i in range(len(self.Styles))])
+        for Style, Features in self._StyleGroups(self._VisibleFeatures(LineWidth)):
+            dc.DrawPolygonList(self._SplitFeatures(Points, Features),
+                               self._GetPen(Style["LineColor"], Style["LineStyle"], Style["LineWidth"]),
+                               self._GetBrush(Style["FillColor"], Style["FillStyle"]))
+
+
+class LineSet(FeatureSetMixin, LineOnlyMixin, DrawObject):
+    """
+    Draws a set of polylines, like the roads or rivers of a map layer
+
+    It is much faster than using a Line object for each of them: all the
+    points are transformed at once, and the segments of all the visible
+    lines with the same style are drawn with a single call to
+    ``wx.DC.DrawLineList``.
+
+    See :class:`FeatureSetMixin` for the way the points are stored, and for
+    hit-testing: ``HitFeature`` is set to the index of the line that was
+    hit.
+
+    """
+    _StyleKeys = ("LineColor", "LineStyle", "LineWidth")
+
+    def __init__(self,
+                 Points,
+                 LineColor = "Black",
+                 LineStyle = "Solid",
+                 LineWidth    = 1,
+                 Offsets      = None,
+                 Styles       = None,
+                 StyleIndex   = None,
+                 InForeground = False):
+        """
+        Default class constructor.
+
+        :param `Points`: a sequence of lines, or an NX2 array of all the
+         points, see :meth:`~lib.floatcanvas.FloatCanvas.FeatureSetMixin.SetFeatures`
+        :param `LineColor`: see :meth:`~lib.floatcanvas.FloatCanvas.DrawObject.SetColor`
+        :param `LineStyle`: see :meth:`~lib.floatcanvas.FloatCanvas.DrawObject.SetLineStyle`
+        :param `LineWidth`: see :meth:`~lib.floatcanvas.FloatCanvas.DrawObject.SetLineWidth`
+        :param `Offsets`: the index of the first point of each line when
+         `Points` is an array
+        :param `Styles`: see :meth:`~lib.floatcanvas.FloatCanvas.FeatureSetMixin.SetStyles`
+        :param `StyleIndex`: see :meth:`~lib.floatcanvas.FloatCanvas.FeatureSetMixin.SetStyleIndex`
+        :param boolean `InForeground`: should object be in foreground
+
+        """
+        DrawObject.__init__(self, InForeground)
+
+        self.LineColor = LineColor
+        self.LineStyle = LineStyle
+        self.LineWidth = LineWidth
+
+        self.SetStyles(Styles)
+        self.SetFeatures(Points, Offsets, StyleIndex)
+
+    def SetFeatures(self, Points, Offsets=None, StyleIndex=None):
+        FeatureSetMixin.SetFeatures(self, Points, Offsets, StyleIndex)
+        # the segments join the points of the same line
+        VertexFeatures = N.repeat(N.arange(len(self.Offsets) - 1), N.diff(self.Offsets))
+        self._SegmentStarts = N.nonzero(VertexFeatures[:-1] == VertexFeatures[1:])[0]
+        self._SegmentFeatures = VertexFeatures[self._SegmentStarts]
+    SetFeatures.__doc__ = FeatureSetMixin.SetFeatures.__doc__
+
+    def _HitFeature(self, Points, Style):
+        if len(Points) == 1:
+            Distances = N.hypot(Points[:, 0], Points[:, 1])
+        else:
+            Distances = _SegmentDistances(Points[:-1], Points[1:])
+        return Distances.min() <= self._HitRadius(Style)
+
+    def _Draw(self, dc , WorldToPixel, ScaleWorldToPixel, HTdc=None):
+        Points = WorldToPixel(self.Points)
+        LineWidth = max([self.GetStyle(i)["LineWidth"] for i in range(len(self.Styles))])
+        Selected = N.zeros(len(self.StyleIndex), N.bool_)
+        for Style, Features in self._StyleGroups(self._VisibleFeatures(LineWidth)):
+            Selected[:] = False
+            Selected[Features] = True
+            Starts = self._SegmentStarts[Selected[self._SegmentFeatures]]
+            dc.DrawLineList(N.hstack((Points[Starts], Points[Starts + 1])),
+                            self._GetPen(Style["LineColor"], Style["LineStyle"], Style["LineWidth"]))
+
+
+class MarkerSet(FeatureSetMixin, ColorOnlyMixin, DrawObject):
+    """
+    Draws a set of markers, like the places of a map layer
+
+    Unlike :class:`PointSet`, each marker can have its own style, and the
+    marker which was hit is known: ``HitFeature`` is set to its index. The
+    visible markers with the same style are drawn with a single call to one
+    of the ``wx.DC.Draw*List`` methods.
+
+    The Diameter is in screen pixels, and the Shape is either "Circle" or
+    "Square".
+
+    """
+    _StyleKeys = ("Color", "Diameter", "Shape")
+
+    def __init__(self,
+                 Points,
+                 Color        = "Black",
+                 Diameter     = 4,
+                 Shape        = "Circle",
+                 Styles       = None,
+                 StyleIndex   = None,
+                 InForeground = False):
+        """
+        Default class constructor.
+
+        :param `Points`: a sequence of (x, y) coordinates, or a NX2
+         `NumPy <http://www.numpy.org/>`_ array
+        :param `Color`: see :meth:`~lib.floatcanvas.FloatCanvas.DrawObject.SetColor`
+        :param integer `Diameter`: the diameter of the markers in pixels
+        :param string `Shape`: "Circle" or "Square"
+        :param `Styles`: see :meth:`~lib.floatcanvas.FloatCanvas.FeatureSetMixin.SetStyles`
+        :param `StyleIndex`: see :meth:`~lib.floatcanvas.FloatCanvas.FeatureSetMixin.SetStyleIndex`
+        :param boolean `InForeground`: should object be in foreground
+
+        """
+        DrawObject.__init__(self, InForeground)
+
+        self.Diameter = Diameter
+        self.Shape = Shape
+        self.SetColor(Color)
+
+        self.SetStyles(Styles)
+        self.SetPoints(Points, StyleIndex)
+
+    def SetColor(self, Color):
+        """
+        Set the Color
+
+        :param `Color`: see :meth:`~lib.floatcanvas.FloatCanvas.DrawObject.SetColor`
+         for valid values
+
+        """
+        self.Color = Color
+        ColorOnlyMixin.SetColor(self, Color)
+
+    SetFillColor = SetColor
+
+    def SetDiameter(self, Diameter):
+        """
+        Sets the diameter
+
+        :param integer `Diameter`: the markers diameter
+
+        """
+        self.Diameter = Diameter
+
+    def SetPoints(self, Points, StyleIndex=None):
+        """
+        Sets the markers coordinates
+
+        :param `Points`: a sequence of (x, y) coordinates, or a NX2
+         `NumPy <http://www.numpy.org/>`_ array
+        :param `StyleIndex`: see :meth:`~lib.floatcanvas.FloatCanvas.FeatureSetMixin.SetStyleIndex`
+
+        """
+        Points = N.array(Points, N.float).reshape(-1, 2)
+        self.SetFeatures(Points, N.arange(len(Points) + 1), StyleIndex)
+
+    def _HitRadius(self, Style):
+        return max(Style["Diameter"], self.MinHitLineWidth) / 2.0
+
+    def _HitFeature(self, Points, Style):
+        if Style["Shape"] == "Square":
+            Distance = N.abs(Points).max()
+        else:
+            Distance = N.hypot(Points[0, 0], Points[0, 1])
+        return Distance <= self._HitRadius(Style)
+
+    def _Draw(self, dc , WorldToPixel, ScaleWorldToPixel, HTdc=None):
+        Points = WorldToPixel(self.Points)
+        Diameter = max([self.GetStyle(i)["Diameter"] for i in range(len(self.Styles))])
+        for Style, Features in self._StyleGroups(self._VisibleFeatures(Diameter)):
+            Pen = self._GetPen(Style["Color"], "Solid", 1)
+            Diameter = int(Style["Diameter"])
+            if Diameter <= 1:
+                dc.DrawPointList(Points[Features], Pen)
+                continue
+            Radius = int(round(Diameter / 2))
+            XY = Points[Features]
+            Rectangles = N.hstack((XY - Radius, N.full(XY.shape, Diameter, XY.dtype)))
+            Brush = self._GetBrush(Style["Color"], "Solid")
+            if Style["Shape"] == "Square":
+                dc.DrawRectangleList(Rectangles, Pen, Brush)
+            else:
+                dc.DrawEllipseList(Rectangles, Pen, Brush)
+
+
 class RectEllipse(XYObjectMixin, LineAndFillMixin, DrawObject):
     """A RectEllipse draw object."""
     def __init__(self, XY, WH,
@@ -2373,6 +2917,196 @@ class ScaledBitmap2(TextObjectMixin, DrawObject, ):
             #print("Not Drawing -- no part of image is showing")
             pass
 
+def _PrefetchTiles(Pyramid, Requests, Prefetched, Lock, MaxTiles):
+    """
+    Reads the tiles asked for in the Requests queue into the Prefetched
+    dictionary, in a background thread. Only the latest request is read, and
+    it is abandoned as soon as there is a newer one.
+    """
+    while True:
+        Keys = Requests.get()
+        try:
+            while True:
+                Keys = Requests.get_nowait()
+        except queue.Empty:
+            pass
+        if Keys is None:
+            return
+        for Key in Keys:
+            if not Requests.empty():
+                break
+            with Lock:
+                if Key in Prefetched:
+                    continue
+            Data = Pyramid.ReadTile(*Key)
+            with Lock:
+                Prefetched[Key] = Data
+                while len(Prefetched) > MaxTiles:
+                    Prefetched.popitem(last=False)
+
+
+class TiledRaster(TextObjectMixin, DrawObject):
+    """
+    Draws a huge raster image, like an orthophoto, from a pyramid of tiles
+
+    The pyramid is built once, and stored on disk, with
+    :func:`~lib.floatcanvas.Utilities.TilePyramid.BuildTilePyramid`. Only the
+    visible tiles are drawn, from the level of the pyramid closest to the
+    screen resolution, so drawing takes about the same time whatever the size
+    of the image and the zoom.
+
+    The last used tiles are kept in a cache, and the tiles around the visible
+    ones are read from the disk in a background thread, so that they are
+    ready when the image is panned. Call :meth:`Close` to stop the thread
+    when the object isn't used anymore.
+
+    """
+
+    def __init__(self,
+                 Pyramid,
+                 XY,
+                 Height,
+                 Width = None,
+                 Position = 'tl',
+                 CacheSize = 128,
+                 Prefetch = True,
+                 InForeground = False):
+        """
+        Default class constructor.
+
+        :param `Pyramid`: a :class:`~lib.floatcanvas.Utilities.TilePyramid.TilePyramid`,
+         or the directory it was built in
+        :param `XY`: the (x, y) coordinate of the corner of the image,
+         or a 2-tuple, or a (2,) `NumPy <http://www.numpy.org/>`_ array
+        :param `Height`: height of the image in world coordinates
+        :param `Width`: width of the image in world coordinates, if ``None``
+         it is calculated from the aspect ratio of the image
+        :param string `Position`: a two character string indicating where in
+         relation to the coordinates the image should be oriented, see
+         :class:`ScaledBitmap2`
+        :param integer `CacheSize`: the number of tiles kept in memory
+        :param boolean `Prefetch`: read the tiles around the visible ones
+         in a background thread
+        :param boolean `InForeground`: should object be in foreground
+
+        """
+        DrawObject.__init__(self, InForeground)
+
+        if not isinstance(Pyramid, TilePyramid.TilePyramid):
+            Pyramid = TilePyramid.TilePyramid(Pyramid)
+        self.Pyramid = Pyramid
+
+        self.XY = N.array(XY, N.float)
+        self.Height = Height
+        if Width is None:
+            Width = Height * float(Pyramid.Width) / Pyramid.Height
+        self.Width = Width
+        self.ShiftFun = self.ShiftFunDict[Position]
+        self.CalcBoundingBox()
+
+        self.CacheSize = CacheSize
+        self.Prefetch = Prefetch
+        self._TileCache = OrderedDict()
+        self._Prefetched = OrderedDict()
+        self._PrefetchLock = threading.Lock()
+        self._PrefetchQueue = None
+
+    def CalcBoundingBox(self):
+        """Calculate the bounding box."""
+        w, h = self.Width, self.Height
+        x, y = self.ShiftFun(self.XY[0], self.XY[1], w, h, world = 1)
+        self.BoundingBox = BBox.asBBox( ((x, y-h ), (x + w, y)) )
+
+    def Close(self):
+        """Stops the prefetching thread, and empties the tile cache."""
+        if self._PrefetchQueue is not None:
+            self._PrefetchQueue.put(None)
+            self._PrefetchQueue = None
+        self._TileCache.clear()
+        with self._PrefetchLock:
+            self._Prefetched.clear()
+
+    def _GetTileBitmap(self, Key):
+        """Returns the bitmap of a tile, from the cache if it is there."""
+        Bitmap = self._TileCache.pop(Key, None)
+        if Bitmap is None:
+            with self._PrefetchLock:
+                Data = self._Prefetched.pop(Key, None)
+            if Data is None:
+                Data = self.Pyramid.ReadTile(*Key)
+            TileSize = self.Pyramid.TileSize
+            Bitmap = wx.Bitmap.FromBuffer(TileSize, TileSize, Data)
+            while len(self._TileCache) >= self.CacheSize:
+                self._TileCache.popitem(last=False)
+        self._TileCache[Key] = Bitmap
+        return Bitmap
+
+    def _PrefetchTiles(self, Keys):
+        """Asks the prefetching thread to read the tiles which aren't cached."""
+        Keys = [Key for Key in Keys if Key not in self._TileCache]
+        if not Keys:
+            return
+        if self._PrefetchQueue is None:
+            self._PrefetchQueue = queue.Queue()
+            Thread = threading.Thread(target=_PrefetchTiles,
+                                      args=(self.Pyramid, self._PrefetchQueue, self._Prefetched,
+                                            self._PrefetchLock, self.CacheSize))
+            Thread.daemon = True
+            Thread.start()
+        self._PrefetchQueue.put(Keys)
+
+    def _Draw(self, dc , WorldToPixel, ScaleWorldToPixel, HTdc=None):
+        Pyramid = self.Pyramid
+        TileSize = Pyramid.TileSize
+        x0, y0 = self.ShiftFun(self.XY[0], self.XY[1], self.Width, self.Height, world = 1)
+        # the size of the full resolution pixels, in world coordinates
+        dx = float(self.Width) / Pyramid.Width
+        dy = float(self.Height) / Pyramid.Height
+
+        # use the coarsest level that still has a pixel per screen pixel
+        PixelSize = N.abs(self._Canvas.TransformVector) * (dx, dy)
+        Level = int(N.floor(-N.log2(PixelSize.max())))
+        Level = min(max(Level, 0), len(Pyramid.Levels) - 1)
+        Cols, Rows = Pyramid.GetTileCount(Level)
+        TileWorld = TileSize * 2**Level
+
+        # the range of visible tiles
+        ViewPortBB = self._Canvas.ViewPortBB
+        Col0 = max(int((ViewPortBB[0, 0] - x0) / dx // TileWorld), 0)
+        Col1 = min(int((ViewPortBB[1, 0] - x0) / dx // TileWorld), Cols - 1)
+        Row0 = max(int((y0 - ViewPortBB[1, 1]) / dy // TileWorld), 0)
+        Row1 = min(int((y0 - ViewPortBB[0, 1]) / dy // TileWorld), Rows - 1)
+        if Col0 > Col1 or Row0 > Row1:
+            return
+
+        # the pixel coordinates of the tile edges, shared by the neighbouring
+        # tiles so that there are no gaps between them
+        ColEdges = N.minimum(N.arange(Col0, Col1 + 2) * TileWorld, Pyramid.Width) * dx + x0
+        RowEdges = y0 - N.minimum(N.arange(Row0, Row1 + 2) * TileWorld, Pyramid.Height) * dy
+        X = WorldToPixel(N.column_stack((ColEdges, N.zeros_like(ColEdges))))[:, 0]
+        Y = WorldToPixel(N.column_stack((N.zeros_like(RowEdges), RowEdges)))[:, 1]
+
+        TileDC = wx.MemoryDC()
+        for Row in range(Row0, Row1 + 1):
+            for Col in range(Col0, Col1 + 1):
+                w, h = Pyramid.GetTileExtent(Level, Row, Col)
+                TileDC.SelectObject(self._GetTileBitmap((Level, Row, Col)))
+                i, j = Col - Col0, Row - Row0
+                dc.StretchBlit(X[i], Y[j], X[i + 1] - X[i], Y[j + 1] - Y[j],
+                               TileDC, 0, 0, w, h)
+        TileDC.SelectObject(wx.NullBitmap)
+
+        if self.Prefetch:
+            self._PrefetchTiles([(Level, Row, Col)
+                                 for Row in range(max(Row0 - 1, 0), min(Row1 + 2, Rows))
+                                 for Col in range(max(Col0 - 1, 0), min(Col1 + 2, Cols))])
+
+        if HTdc and self.HitAble:
+            HTdc.SetPen(self.HitPen)
+            HTdc.SetBrush(self.HitBrush)
+            HTdc.DrawRectangle(X[0], Y[0], X[-1] - X[0], Y[-1] - Y[0])
+
+
 class DotGrid:
     """
     An example of a Grid Object -- it is set on the FloatCanvas with one of::
@@ -197,9 +197,13 @@ class FloatCanvas(wx.Panel):
         self.UseHitTest = False
 
         self.NumBetweenBlits = 500
+        ## objects this many pixels away from the strips exposed by a pan
+        ## are drawn too, for the parts of them drawn in pixels, like text.
+        self.ScrollRedrawMargin = 50
 
         ## create the Hit Test Dicts:
         self.HitDict = None
+        self.HitFeatureSets = []
         self._HTdc = None
 
         self._DrawList = []
@@ -219,11 +223,13 @@ class FloatCanvas(wx.Panel):
 
         self.Scale = 1
         self.ObjectUnderMouse = None
+        self.FeatureUnderMouse = None
 
         self.GridUnder = None
         self.GridOver = None
 
         self._BackgroundDirty = True
+        self._ScrollDelta = N.array((0, 0))
 
     def SetProjectionFun(self, ProjectionFun):
         """
@@ -341,24 +347,64 @@ class FloatCanvas(wx.Panel):
     def UnBindAll(self):
         """Removes all bindings to Objects."""
         self.HitDict = None
+        self.HitFeatureSets = []
 
-    def _CallHitCallback(self, Object, xy, HitEvent):
+    def _CallHitCallback(self, Object, xy, HitEvent, Feature=None):
         """
         A little book keeping to be done when a callback is called.
         """
         Object.HitCoords = self.PixelToWorld( xy )
         Object.HitCoordsPixel = xy
+        if Feature is not None:
+            Object.HitFeature = Feature
         Object.CallBackFuncs[HitEvent](Object)
 
+    def _DrawOrder(self, Object):
+        """
+        Returns the position of Object in the drawing order, or -1 if it is
+        not drawn directly by the canvas, like the members of a Group.
+        """
+        try:
+            if Object.InForeground:
+                return len(self._DrawList) + self._ForeDrawList.index(Object)
+            return self._DrawList.index(Object)
+        except ValueError:
+            return -1
+
+    def _FindHitObject(self, xy, HitEvent):
+        """
+        Returns the topmost object bound to HitEvent at the pixel xy, and the
+        index of the feature that was hit, or None, for the feature sets.
+
+        The feature sets are not on the hit test bitmap, they are asked for
+        the feature at xy, unless an object above them was hit.
+        """
+        Object = None
+        if self.HitDict[HitEvent]:
+            color = self.GetHitTestColor( xy )
+            Object = self.HitDict[HitEvent].get(color)
+        FeatureSets = [FeatureSet for FeatureSet in self.HitFeatureSets
+                       if HitEvent in FeatureSet.CallBackFuncs and FeatureSet.Visible]
+        if FeatureSets:
+            XY = self.PixelToWorld(xy)
+            ObjectOrder = -1 if Object is None else self._DrawOrder(Object)
+            FeatureSets.sort(key=self._DrawOrder, reverse=True)
+            for FeatureSet in FeatureSets:
+                if Object is not None and self._DrawOrder(FeatureSet) < ObjectOrder:
+                    break
+                Feature = FeatureSet.FindFeature(XY)
+                if Feature is not None:
+                    return FeatureSet, Feature
+        return Object, None
+
     def HitTest(self, event, HitEvent):
         """Check if any objects in the dict for this event."""
         if self.HitDict:
             if HitEvent in self.HitDict:
                 xy = event.GetPosition()
-                color = self.GetHitTestColor( xy )
-                if color in self.HitDict[ HitEvent ]:
-                    Object = self.HitDict[ HitEvent ][color]
-                    self._CallHitCallback(Object, xy, HitEvent)
+                Object, Feature = self._FindHitObject(xy, HitEvent)
+                if Object is not None:
+                    self._CallHitCallback(Object, xy, HitEvent, Feature)
                     return True
             return False
 
@@ -368,50 +414,56 @@ class FloatCanvas(wx.Panel):
         ##fixme: Can this be cleaned up?
         if (self.HitDict and
             (self.HitDict[EVT_FC_ENTER_OBJECT ] or
-             self.HitDict[EVT_FC_LEAVE_OBJECT ]    )
+             self.HitDict[EVT_FC_LEAVE_OBJECT ] or
+             self.HitFeatureSets )
             ):
             xy = event.GetPosition()
-            color = self.GetHitTestColor( xy )
             OldObject = self.ObjectUnderMouse
+            OldFeature = self.FeatureUnderMouse
             ObjectCallbackCalled = False
-            if color in self.HitDict[ EVT_FC_ENTER_OBJECT ]:
-                Object = self.HitDict[ EVT_FC_ENTER_OBJECT][color]
+            Object, Feature = self._FindHitObject(xy, EVT_FC_ENTER_OBJECT)
+            if Object is not None:
                 if (OldObject is None):
                     try:
-                        self._CallHitCallback(Object, xy, EVT_FC_ENTER_OBJECT)
+                        self._CallHitCallback(Object, xy, EVT_FC_ENTER_OBJECT, Feature)
                         ObjectCallbackCalled =  True
                     except KeyError:
                         pass # this means the enter event isn't bound for that object
-                elif OldObject == Object: # the mouse is still on the same object
+                elif OldObject == Object and OldFeature == Feature:
+                    # the mouse is still on the same object
                     pass
                     ## Is the mouse on a different object as it was...
-                elif not (Object == OldObject):
+                else:
                     # call the leave object callback
                     try:
-                        self._CallHitCallback(OldObject, xy, EVT_FC_LEAVE_OBJECT)
+                        self._CallHitCallback(OldObject, xy, EVT_FC_LEAVE_OBJECT, OldFeature)
                         ObjectCallbackCalled =  True
                     except KeyError:
                         pass # this means the leave event isn't bound for that object
                     try:
-                        self._CallHitCallback(Object, xy, EVT_FC_ENTER_OBJECT)
+                        self._CallHitCallback(Object, xy, EVT_FC_ENTER_OBJECT, Feature)
                         ObjectCallbackCalled =  True
                     except KeyError:
                         pass # this means the enter event isn't bound for that object
                     ## set the new object under mouse
                 self.ObjectUnderMouse = Object
-            elif color in self.HitDict[ EVT_FC_LEAVE_OBJECT ]:
-                Object = self.HitDict[ EVT_FC_LEAVE_OBJECT][color]
-                self.ObjectUnderMouse = Object
+                self.FeatureUnderMouse = Feature
             else:
-                # no objects under mouse bound to mouse-over events
-                self.ObjectUnderMouse = None
-                if OldObject:
-                    try:
-                        ## Add the hit coords to the Object
-                        self._CallHitCallback(OldObject, xy, EVT_FC_LEAVE_OBJECT)
-                        ObjectCallbackCalled =  True
-                    except KeyError:
-                        pass # this means the leave event isn't bound for that object
+                Object, Feature = self._FindHitObject(xy, EVT_FC_LEAVE_OBJECT)
+                if Object is not None:
+                    self.ObjectUnderMouse = Object
+                    self.FeatureUnderMouse = Feature
+                else:
+                    # no objects under mouse bound to mouse-over events
+                    self.ObjectUnderMouse = None
+                    self.FeatureUnderMouse = None
+                    if OldObject:
+                        try:
+                            ## Add the hit coords to the Object
+                            self._CallHitCallback(OldObject, xy, EVT_FC_LEAVE_OBJECT, OldFeature)
+                            ObjectCallbackCalled =  True
+                        except KeyError:
+                            pass # this means the leave event isn't bound for that object
             return ObjectCallbackCalled
         return False
 
@@ -505,6 +557,9 @@ class FloatCanvas(wx.Panel):
         self._BackgroundDirty = True
         # Make new offscreen bitmap:
         self._Buffer = wx.Bitmap(*self.PanelSize)
+        # the bitmaps the background is shifted into when panning
+        self._ScrollBuffer = None
+        self._ScrollHTBitmap = None
         if self._ForeDrawList:
             self._ForegroundBuffer = wx.Bitmap(*self.PanelSize)
             if self.UseHitTest:
@@ -612,6 +667,10 @@ class FloatCanvas(wx.Panel):
         self.ViewPortBB = N.array( ( N.minimum.reduce(ViewPortWorld),
                               N.maximum.reduce(ViewPortWorld) ) )
 
+        if N.any(self._ScrollDelta) and not (self._BackgroundDirty or Force):
+            self._ScrollBackground(ScreenDC)
+        self._ScrollDelta = N.array((0, 0))
+
         dc = wx.MemoryDC()
         dc.SelectObject(self._Buffer)
         if self._BackgroundDirty or Force:
@@ -672,6 +731,79 @@ class FloatCanvas(wx.Panel):
         ## when zoomed in.
         DrawObject.FontList = {}
 
+    def _ShiftBitmap(self, Bitmap, Spare, dx, dy, depth=wx.BITMAP_SCREEN_DEPTH):
+        """
+        Copies Bitmap shifted by (dx, dy) into Spare, making it if needed,
+        and returns them swapped.
+        """
+        w, h = self.PanelSize
+        if Spare is None or tuple(Spare.GetSize()) != (w, h):
+            Spare = wx.Bitmap(w, h, depth=depth)
+        SourceDC = wx.MemoryDC()
+        SourceDC.SelectObject(Bitmap)
+        TargetDC = wx.MemoryDC()
+        TargetDC.SelectObject(Spare)
+        TargetDC.Blit(dx, dy, w, h, SourceDC, 0, 0)
+        TargetDC.SelectObject(wx.NullBitmap)
+        SourceDC.SelectObject(wx.NullBitmap)
+        return Spare, Bitmap
+
+    def _ScrollBackground(self, ScreenDC):
+        """
+        Shifts the background buffer and hit test bitmap by the pixels the
+        image was moved since the last draw, and only draws the strips that
+        were exposed, with the objects whose bounding box is in them.
+        """
+        dx, dy = [int(d) for d in self._ScrollDelta]
+        w, h = self.PanelSize
+        Strips = []
+        if dx > 0:
+            Strips.append((0, 0, dx, h))
+        elif dx < 0:
+            Strips.append((w + dx, 0, -dx, h))
+        if dy > 0:
+            Strips.append((0, 0, w, dy))
+        elif dy < 0:
+            Strips.append((0, h + dy, w, -dy))
+
+        self._Buffer, self._ScrollBuffer = self._ShiftBitmap(
+            self._Buffer, self._ScrollBuffer, dx, dy)
+        dc = wx.MemoryDC()
+        dc.SelectObject(self._Buffer)
+        if self._HTBitmap is not None:
+            self._HTBitmap, self._ScrollHTBitmap = self._ShiftBitmap(
+                self._HTBitmap, self._ScrollHTBitmap, dx, dy, self.HitTestBitmapDepth)
+            HTdc = wx.MemoryDC()
+            HTdc.SelectObject(self._HTBitmap)
+        else:
+            HTdc = None
+
+        Margin = self.ScrollRedrawMargin
+        for x, y, sw, sh in Strips:
+            StripWorld = self.PixelToWorld(((x - Margin, y - Margin),
+                                            (x + sw + Margin, y + sh + Margin)))
+            StripBB = N.array((N.minimum.reduce(StripWorld),
+                               N.maximum.reduce(StripWorld)))
+            dc.SetClippingRegion(x, y, sw, sh)
+            dc.SetPen(wx.TRANSPARENT_PEN)
+            dc.SetBrush(self.BackgroundBrush)
+            dc.DrawRectangle(x, y, sw, sh)
+            if HTdc is not None:
+                HTdc.SetClippingRegion(x, y, sw, sh)
+                HTdc.SetPen(wx.TRANSPARENT_PEN)
+                HTdc.SetBrush(HTdc.GetBackground())
+                HTdc.DrawRectangle(x, y, sw, sh)
+            if self.GridUnder is not None:
+                self.GridUnder._Draw(dc, self)
+            self._DrawObjects(dc, self._DrawList, ScreenDC, StripBB, HTdc)
+            dc.DestroyClippingRegion()
+            if HTdc is not None:
+                HTdc.DestroyClippingRegion()
+
+        dc.SelectObject(wx.NullBitmap)
+        if HTdc is not None:
+            HTdc.SelectObject(wx.NullBitmap)
+
     def _ShouldRedraw(DrawList, ViewPortBB):
         # lrk: Returns the objects that should be redrawn
         ## fixme: should this check be moved into the object?
@@ -702,6 +834,9 @@ class FloatCanvas(wx.Panel):
                         coordinates
          ============== ======================================================
 
+        When the image moves by a whole number of pixels, the background is
+        shifted rather than redrawn, and only the exposed strips are drawn.
+
         """
         shift = N.asarray(shift,N.float)
         if CoordType.lower() == 'panel':# convert from panel coordinates
@@ -713,10 +848,23 @@ class FloatCanvas(wx.Panel):
         else:
             raise FloatCanvasError('CoordType must be either "Panel", "Pixel", or "World"')
 
+        OldTransformVector = self.TransformVector
         self.ViewPortCenter = self.ViewPortCenter + shift
         self.MapProjectionVector = self.ProjectionFun(self.ViewPortCenter)
         self.TransformVector = N.array((self.Scale,-self.Scale),N.float) * self.MapProjectionVector
-        self._BackgroundDirty = True
+
+        # If the image moved by whole pixels, without changing scale, the
+        # background is shifted by the next Draw, which only draws the
+        # strips that get exposed.
+        PixelShift = -shift * self.TransformVector
+        ScrollDelta = self._ScrollDelta + N.round(PixelShift).astype(int)
+        if (not self._BackgroundDirty and
+            N.array_equal(OldTransformVector, self.TransformVector) and
+            N.allclose(PixelShift, N.round(PixelShift), atol=1e-3) and
+            N.all(N.abs(ScrollDelta) < self.PanelSize)):
+            self._ScrollDelta = ScrollDelta
+        else:
+            self._BackgroundDirty = True
         if ReDraw:
             self.Draw()
 
@@ -850,6 +998,8 @@ class FloatCanvas(wx.Panel):
         else:
             self._DrawList.remove(Object)
             self._BackgroundDirty = True
+        if Object in self.HitFeatureSets:
+            self.HitFeatureSets.remove(Object)
         if ResetBB:
             self.BoundingBoxDirty = True
 
@@ -871,6 +1021,7 @@ class FloatCanvas(wx.Panel):
             self._ResetBoundingBox()
         self.MakeNewBuffers()
         self.HitDict = None
+        self.HitFeatureSets = []
 
     def _ResetBoundingBox(self):
         SetToNull=False
@@ -1005,7 +1156,8 @@ class FloatCanvas(wx.Panel):
 def _makeFloatCanvasAddMethods(): ## lrk's code for doing this in module __init__
     classnames = ["Circle", "Ellipse", "Arc", "Rectangle", "ScaledText", "Polygon",
                   "Line", "Text", "PointSet","Point", "Arrow", "ArrowLine", "ScaledTextBox",
-                  "SquarePoint","Bitmap", "ScaledBitmap", "Spline", "Group"]
+                  "SquarePoint","Bitmap", "ScaledBitmap", "Spline", "Group",
+                  "PolygonSet", "LineSet", "MarkerSet", "TiledRaster"]
     for classname in classnames:
         klass = globals()[classname]
         def getaddshapemethod(klass=klass):
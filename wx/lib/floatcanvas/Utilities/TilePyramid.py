@@ -0,0 +1,194 @@
+#----------------------------------------------------------------------------
+# Name:         TilePyramid.py
+# Purpose:      An on-disk pyramid of image tiles, for drawing huge rasters
+#
+# Author:
+#
+# Created:
+# Version:
+# Date:
+# Licence:
+# Tags:
+#----------------------------------------------------------------------------
+"""
+An image pyramid of fixed size tiles, stored on disk.
+
+Level 0 is the full resolution image, and each level is half the size of the
+previous one, down to the level that fits in a single tile. Each level is a
+``.npy`` file holding a (rows, columns, TileSize, TileSize, 3) array of RGB
+bytes, which is memory-mapped when read, so only the tiles which are used
+are loaded from the disk.
+
+The pyramid is built once with :func:`BuildTilePyramid`, and used by the
+:class:`~lib.floatcanvas.FloatCanvas.TiledRaster` draw object.
+
+"""
+
+import os
+import json
+
+import numpy as N
+
+MetadataFile = "pyramid.json"
+
+
+def _SourceArray(Source):
+    """
+    Returns the HxWx3 array of bytes of Source, a wx.Image, a wx.Bitmap or
+    an array.
+    """
+    if hasattr(Source, "ConvertToImage"):
+        Source = Source.ConvertToImage()
+    if hasattr(Source, "GetData"):
+        Width, Height = Source.GetWidth(), Source.GetHeight()
+        return N.frombuffer(bytes(Source.GetData()), N.uint8).reshape(Height, Width, 3)
+    Source = N.asarray(Source)
+    if Source.ndim != 3 or Source.shape[2] < 3 or Source.dtype != N.uint8:
+        raise ValueError("Source must be a wx.Image, a wx.Bitmap or a HxWx3 array of uint8")
+    return Source[:, :, :3]
+
+
+def _FillEdges(Tile, Width, Height):
+    """
+    Copies the last valid column and row of Tile into the part of it which is
+    outside the image, so that they don't darken the edges of the next level.
+    """
+    if Width < Tile.shape[1]:
+        Tile[:Height, Width:] = Tile[:Height, Width - 1:Width]
+    if Height < Tile.shape[0]:
+        Tile[Height:] = Tile[Height - 1:Height]
+
+
+def BuildTilePyramid(Source, Directory, TileSize=256):
+    """
+    Builds the tile pyramid of an image in a directory, and returns the
+    :class:`TilePyramid`.
+
+    The image is only read one tile at a time, so a memory-mapped array can be
+    used for images too large to be loaded in memory.
+
+    :param `Source`: a :class:`wx.Image`, a :class:`wx.Bitmap` or a HxWx3
+     `NumPy <http://www.numpy.org/>`_ array of uint8 RGB values
+    :param string `Directory`: the directory to write the pyramid into, which
+     is created if needed
+    :param integer `TileSize`: the width and height of the tiles, which must
+     be even
+
+    """
+    if TileSize < 2 or TileSize % 2:
+        raise ValueError("TileSize must be an even number")
+    Source = _SourceArray(Source)
+    Height, Width = Source.shape[:2]
+    if not os.path.isdir(Directory):
+        os.makedirs(Directory)
+
+    Levels = [(Width, Height)]
+    while max(Levels[-1]) > TileSize:
+        w, h = Levels[-1]
+        Levels.append(((w + 1) // 2, (h + 1) // 2))
+
+    Previous = None
+    for Level, (w, h) in enumerate(Levels):
+        Rows, Cols = -(-h // TileSize), -(-w // TileSize)
+        Tiles = N.lib.format.open_memmap(os.path.join(Directory, "level%d.npy" % Level),
+                                         mode="w+", dtype=N.uint8,
+                                         shape=(Rows, Cols, TileSize, TileSize, 3))
+        for Row in range(Rows):
+            for Col in range(Cols):
+                Tile = Tiles[Row, Col]
+                if Previous is None:
+                    Data = Source[Row * TileSize:(Row + 1) * TileSize,
+                                  Col * TileSize:(Col + 1) * TileSize]
+                    Tile[:Data.shape[0], :Data.shape[1]] = Data
+                else:
+                    # average each 2x2 block of the 4 tiles of the previous level
+                    Block = N.zeros((2 * TileSize, 2 * TileSize, 3), N.uint16)
+                    for i in range(2):
+                        for j in range(2):
+                            if 2 * Row + i < Previous.shape[0] and 2 * Col + j < Previous.shape[1]:
+                                Block[i * TileSize:(i + 1) * TileSize,
+                                      j * TileSize:(j + 1) * TileSize] = Previous[2 * Row + i, 2 * Col + j]
+                    Block = Block.reshape(TileSize, 2, TileSize, 2, 3).sum(axis=(1, 3))
+                    Tile[:] = (Block + 2) // 4
+                _FillEdges(Tile, min(TileSize, w - Col * TileSize), min(TileSize, h - Row * TileSize))
+        Tiles.flush()
+        Previous = Tiles
+
+    with open(os.path.join(Directory, MetadataFile), "w") as f:
+        json.dump({"TileSize": TileSize, "Levels": Levels}, f)
+    del Previous, Tiles
+    return TilePyramid(Directory)
+
+
+class TilePyramid(object):
+    """
+    Reads the tiles of a pyramid built by :func:`BuildTilePyramid`.
+
+    The levels are memory-mapped, so opening a pyramid is cheap, and reading a
+    tile only reads that tile from the disk. The tiles can be read from any
+    thread.
+
+    """
+    def __init__(self, Directory):
+        """
+        Default class constructor.
+
+        :param string `Directory`: the directory the pyramid was built in
+
+        """
+        self.Directory = Directory
+        with open(os.path.join(Directory, MetadataFile)) as f:
+            Metadata = json.load(f)
+        self.TileSize = Metadata["TileSize"]
+        self.Levels = [tuple(Size) for Size in Metadata["Levels"]]
+        self.Width, self.Height = self.Levels[0]
+        self._Tiles = [None] * len(self.Levels)
+
+    def GetTiles(self, Level):
+        """
+        Returns the memory-mapped array of the tiles of a level.
+
+        :param integer `Level`: the level, 0 being the full resolution
+
+        """
+        if self._Tiles[Level] is None:
+            self._Tiles[Level] = N.load(os.path.join(self.Directory, "level%d.npy" % Level),
+                                        mmap_mode="r")
+        return self._Tiles[Level]
+
+    def GetTileCount(self, Level):
+        """
+        Returns the number of (columns, rows) of tiles of a level.
+
+        :param integer `Level`: the level, 0 being the full resolution
+
+        """
+        w, h = self.Levels[Level]
+        return -(-w // self.TileSize), -(-h // self.TileSize)
+
+    def GetTileExtent(self, Level, Row, Col):
+        """
+        Returns the (width, height) of the part of a tile inside the image,
+        which is less than the tile size for the tiles of the right and
+        bottom edges.
+
+        :param integer `Level`: the level, 0 being the full resolution
+        :param integer `Row`: the row of the tile
+        :param integer `Col`: the column of the tile
+
+        """
+        w, h = self.Levels[Level]
+        return (min(self.TileSize, w - Col * self.TileSize),
+                min(self.TileSize, h - Row * self.TileSize))
+
+    def ReadTile(self, Level, Row, Col):
+        """
+        Reads a tile from the disk, and returns it as a
+        (TileSize, TileSize, 3) array of uint8 RGB values.
+
+        :param integer `Level`: the level, 0 being the full resolution
+        :param integer `Row`: the row of the tile
+        :param integer `Col`: the column of the tile
+
+        """
+        return N.array(self.GetTiles(Level)[Row, Col])
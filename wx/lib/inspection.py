@@ -31,7 +31,15 @@ import wx.lib.agw.aui as aui
 import six
 import wx.lib.utils as utils
 import sys
+import os
 import inspect
+import collections
+import json
+import math
+try:
+    from time import perf_counter
+except ImportError:  # clock is removed in py3.8
+    from time import clock as perf_counter
 
 #----------------------------------------------------------------------------
 
@@ -217,6 +225,7 @@ class InspectionFrame(wx.Frame):
         evtWatcherBmp = EvtWatcher.GetBitmap()
 
         toggleFillingBmp = ShowFilling.GetBitmap()
+        perfMonitorBmp = PerfMonitor.GetBitmap()
 
         refreshTool = tbar.AddTool(-1, 'Refresh', refreshBmp,
                                    shortHelp = 'Refresh widget tree (F1)')
@@ -237,6 +246,9 @@ class InspectionFrame(wx.Frame):
         toggleFillingTool = tbar.AddTool(-1, 'Filling', toggleFillingBmp,
                                          shortHelp='Show PyCrust \'filling\' (F8)',
                                          kind=wx.ITEM_CHECK)
+        perfMonitorTool = tbar.AddTool(-1, 'Perf', perfMonitorBmp,
+                                       shortHelp='Show the event monitor (F9)',
+                                       kind=wx.ITEM_CHECK)
         tbar.Realize()
 
         self.Bind(wx.EVT_TOOL,      self.OnRefreshTree,     refreshTool)
@@ -247,9 +259,11 @@ class InspectionFrame(wx.Frame):
         self.Bind(wx.EVT_TOOL,      self.OnHighlightItem,   highlightItemTool)
         self.Bind(wx.EVT_TOOL,      self.OnWatchEvents,     evtWatcherTool)
         self.Bind(wx.EVT_TOOL,      self.OnToggleFilling,   toggleFillingTool)
+        self.Bind(wx.EVT_TOOL,      self.OnTogglePerfMonitor, perfMonitorTool)
         self.Bind(wx.EVT_UPDATE_UI, self.OnShowSizersUI,    showSizersTool)
         self.Bind(wx.EVT_UPDATE_UI, self.OnWatchEventsUI,   evtWatcherTool)
         self.Bind(wx.EVT_UPDATE_UI, self.OnToggleFillingUI, toggleFillingTool)
+        self.Bind(wx.EVT_UPDATE_UI, self.OnTogglePerfMonitorUI, perfMonitorTool)
 
         tbl = wx.AcceleratorTable(
             [(wx.ACCEL_NORMAL, wx.WXK_F1, refreshTool.GetId()),
@@ -260,6 +274,7 @@ class InspectionFrame(wx.Frame):
              (wx.ACCEL_NORMAL, wx.WXK_F6, highlightItemTool.GetId()),
              (wx.ACCEL_NORMAL, wx.WXK_F7, evtWatcherTool.GetId()),
              (wx.ACCEL_NORMAL, wx.WXK_F8, toggleFillingTool.GetId()),
+             (wx.ACCEL_NORMAL, wx.WXK_F9, perfMonitorTool.GetId()),
              ])
         self.SetAcceleratorTable(tbl)
 
@@ -276,6 +291,8 @@ class InspectionFrame(wx.Frame):
         if not self:
             return
         self.SaveSettings(self.config)
+        if hasattr(self, 'perf'):
+            self.perf.monitor.Stop()
         if hasattr(self, 'mgr'):
             self.mgr.UnInit()
             del self.mgr
@@ -382,6 +399,20 @@ class InspectionFrame(wx.Frame):
         self.crust.ToggleTools()
 
 
+    def OnTogglePerfMonitor(self, evt):
+        if not hasattr(self, 'perf'):
+            self.perf = EventMonitorPanel(self.mgr.GetManagedWindow())
+            self.mgr.AddPane(self.perf,
+                             aui.AuiPaneInfo().Name("perf").Caption("Event Monitor").
+                             CaptionVisible(True).Right().Dockable(True).Floatable(True).
+                             BestSize((420,300)).MaximizeButton(True)
+                             )
+        else:
+            pane = self.mgr.GetPane(self.perf)
+            pane.Show(not pane.IsShown())
+        self.mgr.Update()
+
+
     def OnShowSizersUI(self, evt):
         evt.Check(self.includeSizers)
 
@@ -391,6 +422,13 @@ class InspectionFrame(wx.Frame):
             evt.Check(self.crust.ToolsShown())
 
 
+    def OnTogglePerfMonitorUI(self, evt):
+        if hasattr(self, 'perf') and hasattr(self, 'mgr'):
+            evt.Check(self.mgr.GetPane(self.perf).IsShown())
+        else:
+            evt.Check(False)
+
+
     def LoadSettings(self, config):
         self.crust.LoadSettings(config)
         self.info.LoadSettings(config)
@@ -1072,6 +1110,354 @@ class _InspectionHighlighter(object):
                 self.cl.Restart()
 
 
+#---------------------------------------------------------------------------
+
+class EventMonitor(wx.EventFilter):
+    """
+    Collects timing information about the events processed by the
+    application, to help find what is making the UI stutter.
+
+    All events are counted with an event filter, the time taken by each
+    Python event handler is measured with
+    :meth:`wx.EvtHandler.SetHandlerMonitor`, and the latency of the event
+    loop is sampled by timing how long it takes for a :func:`wx.CallAfter`
+    call to be run.  Handler times include the time of any nested events
+    processed by the handler.
+
+    Nothing is collected until :meth:`Start` is called.  Only one monitor can
+    be running at a time.
+    """
+    def __init__(self, latencyInterval=100, maxSamples=1000, maxTrace=100000):
+        """
+        :param int `latencyInterval`: milliseconds between event loop
+            latency samples
+        :param int `maxSamples`: how many of the latest latency samples are
+            used for the percentiles
+        :param int `maxTrace`: how many of the latest handler calls are kept
+            for :meth:`ExportChromeTrace`
+        """
+        wx.EventFilter.__init__(self)
+        self.latencyInterval = latencyInterval
+        self.maxSamples = maxSamples
+        self.maxTrace = maxTrace
+        self.running = False
+        self._probe = None
+        self.Reset()
+
+
+    def Start(self):
+        """
+        Start collecting.  Raises a :exc:`RuntimeError` if another handler
+        monitor is installed.
+        """
+        if self.running:
+            return
+        if wx.EvtHandler.GetHandlerMonitor() is not None:
+            raise RuntimeError("Another event handler monitor is already running")
+        wx.EvtHandler.AddFilter(self)
+        wx.EvtHandler.SetHandlerMonitor(self._OnHandler)
+        self.running = True
+        self._probe = wx.CallLater(self.latencyInterval, self._PostProbe)
+
+
+    def Stop(self):
+        """
+        Stop collecting.  What was collected so far is kept.
+        """
+        if not self.running:
+            return
+        self.running = False
+        wx.EvtHandler.RemoveFilter(self)
+        wx.EvtHandler.SetHandlerMonitor(None)
+        self._probe.Stop()
+        self._probe = None
+
+
+    def IsRunning(self):
+        return self.running
+
+
+    def Reset(self):
+        """
+        Forget everything that has been collected.
+        """
+        self.startTime = perf_counter()
+        self.eventCounts = {}
+        self.typeStats = {}
+        self.windowStats = {}
+        self.latencies = collections.deque(maxlen=self.maxSamples)
+        self.trace = collections.deque(maxlen=self.maxTrace)
+
+
+    def FilterEvent(self, event):
+        typeId = event.GetEventType()
+        self.eventCounts[typeId] = self.eventCounts.get(typeId, 0) + 1
+        return self.Event_Skip
+
+
+    def _OnHandler(self, event, handler, duration):
+        end = perf_counter()
+        typeId = event.GetEventType()
+        window = _describeObject(event.GetEventObject())
+        _addStat(self.typeStats, typeId, duration)
+        _addStat(self.windowStats, window, duration)
+        name = getattr(handler, '__qualname__', None) or \
+               getattr(handler, '__name__', None) or repr(handler)
+        self.trace.append((end - duration, duration, typeId, name, window))
+
+
+    def _PostProbe(self):
+        wx.CallAfter(self._OnProbe, perf_counter())
+
+
+    def _OnProbe(self, posted):
+        now = perf_counter()
+        self.latencies.append(now - posted)
+        self.trace.append((posted, now - posted, None, None, None))
+        if self.running:
+            self._probe.Start(self.latencyInterval)
+
+
+    def GetEventTypeName(self, typeId):
+        """
+        Returns the name of the ``EVT_*`` binder for the event type.
+        """
+        import wx.lib.eventwatcher as ew
+        ew.buildWxEventMap()
+        return ew._eventIdMap.get(typeId, 'Event type %d' % typeId)
+
+
+    def GetEventCount(self, eventType):
+        """
+        Returns how many events of a type have been processed.
+
+        :param `eventType`: an event type ID or a ``wx.EVT_*`` binder.
+        """
+        typeId = getattr(eventType, 'typeId', eventType)
+        return self.eventCounts.get(typeId, 0)
+
+
+    def GetHandlerStats(self, eventType):
+        """
+        Returns the number of Python handler calls for an event type, and
+        the total and maximum time they took in seconds.
+
+        :param `eventType`: an event type ID or a ``wx.EVT_*`` binder.
+        """
+        typeId = getattr(eventType, 'typeId', eventType)
+        return tuple(self.typeStats.get(typeId, (0, 0.0, 0.0)))
+
+
+    def GetTypeStats(self):
+        """
+        Returns a list of ``(name, events, handlerCalls, totalTime, maxTime)``
+        tuples for each event type seen, with the most expensive first.
+        """
+        stats = []
+        for typeId in set(self.eventCounts) | set(self.typeStats):
+            calls, total, maximum = self.typeStats.get(typeId, (0, 0.0, 0.0))
+            stats.append((self.GetEventTypeName(typeId),
+                          self.eventCounts.get(typeId, 0),
+                          calls, total, maximum))
+        stats.sort(key=lambda item: (-item[3], -item[1]))
+        return stats
+
+
+    def GetWindowStats(self):
+        """
+        Returns a list of ``(window, handlerCalls, totalTime, maxTime)``
+        tuples for each event source whose events were handled, with the
+        most expensive first.
+        """
+        stats = [(window,) + tuple(value)
+                 for window, value in self.windowStats.items()]
+        stats.sort(key=lambda item: -item[2])
+        return stats
+
+
+    def GetLatencyPercentiles(self, percentiles=(50, 90, 99, 100)):
+        """
+        Returns a dictionary mapping each of the percentiles to the event
+        loop latency in seconds, based on the latest samples.  It is empty
+        when there are no samples yet.
+        """
+        samples = sorted(self.latencies)
+        result = {}
+        if samples:
+            for p in percentiles:
+                idx = int(math.ceil(p / 100.0 * len(samples))) - 1
+                result[p] = samples[max(0, min(idx, len(samples) - 1))]
+        return result
+
+
+    def ExportChromeTrace(self, fileObj):
+        """
+        Write the latest handler calls and latency samples as a trace in
+        the JSON format used by Chrome's ``about:tracing`` and Perfetto.
+
+        :param `fileObj`: a file name or a text file-like object
+        """
+        pid = os.getpid()
+        events = []
+        for start, duration, typeId, handler, window in self.trace:
+            event = dict(ph='X', pid=pid, tid=0,
+                         ts=(start - self.startTime) * 1e6,
+                         dur=duration * 1e6)
+            if typeId is None:
+                event.update(name='Event loop latency', cat='latency', tid=1)
+            else:
+                event.update(name=self.GetEventTypeName(typeId),
+                             cat='handler',
+                             args=dict(handler=handler, window=window))
+            events.append(event)
+        data = dict(traceEvents=events, displayTimeUnit='ms')
+        if isinstance(fileObj, six.string_types):
+            with open(fileObj, 'w') as f:
+                json.dump(data, f)
+        else:
+            json.dump(data, fileObj)
+
+
+def _addStat(stats, key, duration):
+    stat = stats.get(key)
+    if stat is None:
+        stats[key] = [1, duration, duration]
+    else:
+        stat[0] += 1
+        stat[1] += duration
+        if duration > stat[2]:
+            stat[2] = duration
+
+
+def _describeObject(obj):
+    if obj is None:
+        return 'None'
+    if isinstance(obj, wx.Window):
+        return '%s "%s"' % (obj.__class__.__name__, obj.GetName())
+    return obj.__class__.__name__
+
+
+
+class EventMonitorPanel(wx.Panel):
+    """
+    A panel showing the statistics collected by an :class:`EventMonitor`,
+    updated every second while it is running.
+    """
+    def __init__(self, *args, **kw):
+        wx.Panel.__init__(self, *args, **kw)
+        self.monitor = EventMonitor()
+
+        self.startBtn = wx.ToggleButton(self, label='Start')
+        resetBtn = wx.Button(self, label='Reset')
+        exportBtn = wx.Button(self, label='Export Trace...')
+        self.summary = wx.StaticText(self)
+
+        self.types = wx.ListCtrl(self, style=wx.LC_REPORT)
+        for col, label in enumerate(['Event', 'Count', 'Handled',
+                                     'Total ms', 'Max ms']):
+            self.types.InsertColumn(col, label,
+                                    wx.LIST_FORMAT_LEFT if col == 0 else wx.LIST_FORMAT_RIGHT)
+        self.types.SetColumnWidth(0, 200)
+
+        self.windows = wx.ListCtrl(self, style=wx.LC_REPORT)
+        for col, label in enumerate(['Window', 'Handled', 'Total ms', 'Max ms']):
+            self.windows.InsertColumn(col, label,
+                                      wx.LIST_FORMAT_LEFT if col == 0 else wx.LIST_FORMAT_RIGHT)
+        self.windows.SetColumnWidth(0, 200)
+
+        btns = wx.BoxSizer(wx.HORIZONTAL)
+        btns.Add(self.startBtn)
+        btns.Add(resetBtn, 0, wx.LEFT, 5)
+        btns.Add(exportBtn, 0, wx.LEFT, 5)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(btns, 0, wx.ALL, 5)
+        sizer.Add(self.summary, 0, wx.EXPAND|wx.LEFT|wx.RIGHT|wx.BOTTOM, 5)
+        sizer.Add(self.types, 2, wx.EXPAND)
+        sizer.Add(self.windows, 1, wx.EXPAND|wx.TOP, 5)
+        self.SetSizer(sizer)
+
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.OnTimer, self.timer)
+        self.Bind(wx.EVT_TOGGLEBUTTON, self.OnStart, self.startBtn)
+        self.Bind(wx.EVT_BUTTON, self.OnReset, resetBtn)
+        self.Bind(wx.EVT_BUTTON, self.OnExport, exportBtn)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.OnDestroy)
+        self.UpdateStats()
+
+
+    def OnStart(self, evt):
+        if self.startBtn.GetValue():
+            try:
+                self.monitor.Start()
+            except RuntimeError as exc:
+                self.startBtn.SetValue(False)
+                wx.MessageBox(str(exc), 'Event Monitor')
+                return
+            self.startBtn.SetLabel('Stop')
+            self.timer.Start(1000)
+        else:
+            self.monitor.Stop()
+            self.startBtn.SetLabel('Start')
+            self.timer.Stop()
+        self.UpdateStats()
+
+
+    def OnReset(self, evt):
+        self.monitor.Reset()
+        self.UpdateStats()
+
+
+    def OnExport(self, evt):
+        with wx.FileDialog(self, 'Export Chrome Trace',
+                           defaultFile='trace.json',
+                           wildcard='JSON files (*.json)|*.json',
+                           style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as dlg:
+            if dlg.ShowModal() == wx.ID_OK:
+                self.monitor.ExportChromeTrace(dlg.GetPath())
+
+
+    def OnTimer(self, evt):
+        self.UpdateStats()
+
+
+    def OnDestroy(self, evt):
+        evt.Skip()
+        if evt.GetEventObject() is self:
+            self.timer.Stop()
+            self.monitor.Stop()
+
+
+    def UpdateStats(self):
+        m = self.monitor
+        calls, total, maximum = m.GetHandlerStats(wx.EVT_PAINT)
+        text = 'Idle: %d   UpdateUI: %d   Paint: %d' % (
+            m.GetEventCount(wx.EVT_IDLE), m.GetEventCount(wx.EVT_UPDATE_UI),
+            m.GetEventCount(wx.EVT_PAINT))
+        if calls:
+            text += ' (avg %.1f ms, max %.1f ms)' % (total / calls * 1000, maximum * 1000)
+        latency = m.GetLatencyPercentiles()
+        if latency:
+            text += '\nLatency ms: p50 %.1f  p90 %.1f  p99 %.1f  max %.1f' % tuple(
+                latency[p] * 1000 for p in (50, 90, 99, 100))
+        self.summary.SetLabel(text)
+
+        self.types.DeleteAllItems()
+        for idx, (name, count, calls, total, maximum) in enumerate(m.GetTypeStats()):
+            self.types.InsertItem(idx, name)
+            self.types.SetItem(idx, 1, str(count))
+            self.types.SetItem(idx, 2, str(calls))
+            self.types.SetItem(idx, 3, '%.1f' % (total * 1000))
+            self.types.SetItem(idx, 4, '%.1f' % (maximum * 1000))
+
+        self.windows.DeleteAllItems()
+        for idx, (window, calls, total, maximum) in enumerate(m.GetWindowStats()):
+            self.windows.InsertItem(idx, window)
+            self.windows.SetItem(idx, 1, str(calls))
+            self.windows.SetItem(idx, 2, '%.1f' % (total * 1000))
+            self.windows.SetItem(idx, 3, '%.1f' % (maximum * 1000))
+        self.Layout()
+
+
 #---------------------------------------------------------------------------
 from wx.lib.embeddedimage import PyEmbeddedImage
 
@@ -1253,3 +1639,8 @@ EvtWatcher = PyEmbeddedImage(
     "XC4WiwuGYZyRUp63bfsm4O5oftL0dyAiGAxmDMM4UK1WJ4eGhj67vb09tFWtkk6lDN9xZHFz"
     "08pkMhJYKBQK7ySTyXylUrkClO51vmPD920V90GA/lgsFqrX6/26ro8oijJo23YC8E3TvGvb"
     "9m0hxHI4HC7XarXmJ8Th49UHgP8A40NGDcCfTKIAAAAASUVORK5CYII=")
+
+PerfMonitor = PyEmbeddedImage(
+    "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAAUklEQVR42mNgGDbAwcHh/8iz"
+    "oEdE5D8M08SCE0Ya/2F41AKGBXki/2GYJhbcWaXxH4ZHLaC9BXJRcv9hmCYW2PTY/IfhUQtG"
+    "LRhkFlATD5/GBADqcUUnOI2OhwAAAABJRU5ErkJggg==")
@@ -0,0 +1,99 @@
+#----------------------------------------------------------------------
+# Name:        wx.lib.lazyimport
+# Purpose:     Load the submodules of a package when their names are
+#              first used.
+#
+# Created:     19-Oct-2026
+# Licence:     wxWindows license
+#----------------------------------------------------------------------
+
+"""
+Helpers for packages which re-export the names of their submodules.
+
+A package ``__init__`` calls :func:`InstallLazyLoader` with a table telling
+which submodule provides each name, instead of importing every submodule
+up front. The submodule is imported the first time one of its names is
+looked up on the package, using a module level ``__getattr__`` (:pep:`562`).
+
+On Python versions older than 3.7, which don't support module ``__getattr__``,
+all the submodules are imported straight away.
+"""
+
+import sys
+import importlib
+
+
+def InstallLazyLoader(moduleGlobals, names, starImports=()):
+    """
+    Adds ``__getattr__`` and ``__dir__`` functions to a package so that the
+    names in `names` are imported from their submodules on first use.
+
+    :param `moduleGlobals`: the ``globals()`` of the package ``__init__``.
+    :param `names`: a dictionary mapping submodule names to the sequence of
+     names the package takes from them.
+    :param `starImports`: submodules which the package used to import with
+     ``from .submodule import *``, in that order. Any name not found in
+     `names` is looked up in all of them, to keep the same namespace.
+    """
+
+    packageName = moduleGlobals['__name__']
+    lookup = {}
+    for submodule, subnames in names.items():
+        for name in subnames:
+            lookup[name] = submodule
+
+    # Set while a submodule is imported, so that a "from package import *"
+    # inside it sees the names loaded so far, as it did before
+    state = {'loading': 0}
+
+    def importSubmodule(submodule):
+        state['loading'] += 1
+        try:
+            return importlib.import_module('.' + submodule, packageName)
+        finally:
+            state['loading'] -= 1
+
+    def loadAll():
+        for submodule in names:
+            importSubmodule(submodule)
+        for submodule in starImports:
+            module = importSubmodule(submodule)
+            for name, value in vars(module).items():
+                if not name.startswith('_'):
+                    moduleGlobals[name] = value
+        for name, submodule in lookup.items():
+            module = sys.modules[packageName + '.' + submodule]
+            # some names are only defined on some platforms
+            if name not in moduleGlobals and hasattr(module, name):
+                moduleGlobals[name] = getattr(module, name)
+
+    def __getattr__(name):
+        if name in lookup:
+            value = getattr(importSubmodule(lookup[name]), name)
+            moduleGlobals[name] = value
+            return value
+
+        if name in names or name in starImports:
+            return importSubmodule(name)
+
+        if name == '__all__':
+            if state['loading']:
+                raise AttributeError(name)
+            loadAll()
+            return sorted([n for n in moduleGlobals if not n.startswith('_')])
+
+        if starImports and not state['loading'] and not name.startswith('__'):
+            loadAll()
+            if name in moduleGlobals:
+                return moduleGlobals[name]
+
+        raise AttributeError("module %r has no attribute %r" % (packageName, name))
+
+    def __dir__():
+        return sorted(set(moduleGlobals) | set(lookup))
+
+    if sys.version_info < (3, 7):
+        loadAll()
+    else:
+        moduleGlobals['__getattr__'] = __getattr__
+        moduleGlobals['__dir__'] = __dir__
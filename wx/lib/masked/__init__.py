@@ -19,9 +19,17 @@ package providing "masked edit" controls, allowing characters within a data entr
 
 # import relevant external symbols into package namespace:
 from .maskededit import *
-from .textctrl   import BaseMaskedTextCtrl, PreMaskedTextCtrl, TextCtrl
-from .combobox   import BaseMaskedComboBox, PreMaskedComboBox, ComboBox, MaskedComboBoxSelectEvent
-from .numctrl    import NumCtrl, wxEVT_COMMAND_MASKED_NUMBER_UPDATED, EVT_NUM, NumberUpdatedEvent
-from .timectrl   import TimeCtrl, wxEVT_TIMEVAL_UPDATED, EVT_TIMEUPDATE, TimeUpdatedEvent
-from .ipaddrctrl import IpAddrCtrl
-from .ctrl       import Ctrl, controlTypes, TEXT, COMBO, IPADDR, TIME, NUMBER
+
+# the controls are imported when first used
+from wx.lib.lazyimport import InstallLazyLoader
+
+InstallLazyLoader(globals(), {
+    'textctrl':   ('BaseMaskedTextCtrl', 'PreMaskedTextCtrl', 'TextCtrl'),
+    'combobox':   ('BaseMaskedComboBox', 'PreMaskedComboBox', 'ComboBox', 'MaskedComboBoxSelectEvent'),
+    'numctrl':    ('NumCtrl', 'wxEVT_COMMAND_MASKED_NUMBER_UPDATED', 'EVT_NUM', 'NumberUpdatedEvent'),
+    'timectrl':   ('TimeCtrl', 'wxEVT_TIMEVAL_UPDATED', 'EVT_TIMEUPDATE', 'TimeUpdatedEvent'),
+    'ipaddrctrl': ('IpAddrCtrl', ),
+    'ctrl':       ('Ctrl', 'controlTypes', 'TEXT', 'COMBO', 'IPADDR', 'TIME', 'NUMBER'),
+    })
+
+del InstallLazyLoader
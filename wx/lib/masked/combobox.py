@@ -506,6 +506,16 @@ class BaseMaskedComboBox( wx.ComboBox, MaskedEditMixin ):
             self._ctrl_constraints._choices.append(choice)
             self._choices = self._ctrl_constraints._choices     # (for shorthand)
 
+            # the mask engine validates values for the control, so give it the
+            # choice too:
+            constraints = self._maskEngine._ctrl_constraints
+            if constraints._choices is not self._choices:
+                if not constraints._choices:
+                    constraints._compareChoices = []
+                    constraints._choices = []
+                constraints._compareChoices.append(compareChoice)
+                constraints._choices.append(choice)
+
             if( not self.IsValid(choice) and
                (not self._ctrl_constraints.IsEmpty(choice) or
                 (self._ctrl_constraints.IsEmpty(choice) and self._ctrl_constraints._validRequired) ) ):
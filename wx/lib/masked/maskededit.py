@@ -511,6 +511,11 @@ Control Class Functions
 .GetFieldParameter(field_index, parametername)
                     Allows the retrieval of field parameters after construction
 
+.GetMaskEngine()
+                    Returns the headless masked.MaskEngine the control uses
+                    to normalize and validate its values.  (See "Using Masks
+                    Without a Control" below.)
+
 
 The control detects certain common constructions. In order to use the signed feature
 (negative numbers and coloring), the mask has to be all numbers with optionally one
@@ -531,6 +536,26 @@ Take a look at the demo; the zip-code validation succeeds as long as the
 first five numerals are entered. the last four are optional, but if
 any are entered, there must be 4 to be valid.
 
+Using Masks Without a Control
+=============================
+masked.MaskEngine accepts the same mask, field and constraint parameters
+as masked.TextCtrl, but needs no window.  The mask is compiled once, when the
+engine is constructed, so it can be used to validate and format large
+amounts of data (eg. when importing records) far faster than by driving a
+hidden control::
+
+    engine = masked.MaskEngine(autoformat='USPHONEFULL')
+    engine.Normalize('5551234567')      # -> '(555) 123-4567'
+    engine.Validate('(555) 123-4567')   # -> True
+    engine.NormalizeMany(rows, invalid=None)
+    engine.ValidateMany(rows)
+
+Every masked control keeps an engine configured with its own mask, field
+and constraint parameters, and uses it to normalize the values set into the
+control and to validate its contents; .GetMaskEngine() returns it.  The engine
+works on the masked text, so values for controls such as NumCtrl or TimeCtrl
+must first be converted to the text that the control would display.
+
 masked.Ctrl Configuration
 =========================
 masked.Ctrl works by looking for a special *controlType*
@@ -1828,6 +1853,10 @@ class MaskedEditMixin:
 
         self._valid     = True
 
+        # The headless engine used to normalize and validate values, configured
+        # along with the control:
+        self._maskEngine = self._CreateMaskEngine()
+
         # Set defaults for each parameter for this instance, and fully
         # populate initial parameter list for configuration:
         for key, value in MaskedEditMixin.valid_ctrl_params.items():
@@ -1855,6 +1884,10 @@ class MaskedEditMixin:
 ####            dbg(key, '=', value)
 ####        dbg(indent=0)
 
+        # Keep the engine configured the same way as the control:
+        if self._maskEngine is not self:
+            self._maskEngine.SetCtrlParameters(**kwargs)
+
         # Validate keyword arguments:
         constraint_kwargs = {}
         ctrl_kwargs = {}
@@ -2096,6 +2129,24 @@ class MaskedEditMixin:
         return self.GetCtrlParameter(paramname)
 
 
+    def GetMaskEngine(self):
+        """
+        Returns the :class:`MaskEngine` this control uses to normalize and
+        validate its values, which can also be used to validate, normalize
+        and format values (singly or in bulk) without going through the
+        control itself.  The engine is reconfigured along with the control.
+        """
+        return self._maskEngine
+
+
+    def _CreateMaskEngine(self):
+        """
+        Creates the engine the control delegates normalization and validation
+        of values to; it is given the same parameters as the control.
+        """
+        return MaskEngine(self.name)
+
+
 ## This idea worked, but Boa was unable to use this solution...
 ##    def _attachMethod(self, func):
 ##        import new
@@ -2136,6 +2187,8 @@ class MaskedEditMixin:
             ie.index = field_index
             raise ie
         # set parameters as requested:
+        if self._maskEngine is not self:
+            self._maskEngine.SetFieldParameters(field_index, **kwargs)
         self._fields[field_index]._SetParameters(**kwargs)
 
         # Possibly reprogram control template due to resulting changes, and ensure
@@ -2715,6 +2768,10 @@ class MaskedEditMixin:
             raise AttributeError('groupChar (%s) and decimalChar (%s) must be distinct.' %
                                  (self._fields[0]._groupChar, self._decimalChar) )
 
+        # Now that the fields are settled, compile the per-position character
+        # filters used when validating input:
+        self._compileCharFilters()
+
 ####        dbg('fields:', indent=1)
 ##        for i in [-1] + self._field_indices:
 ####            dbg('field %d:' % i, self._fields[i].__dict__)
@@ -4631,6 +4688,16 @@ class MaskedEditMixin:
         """ Returns a string of all allowed user input characters for the provided
             mask character plus control options
         """
+        try:
+            return self._allowedChars[pos]
+        except (AttributeError, KeyError):
+            return self._calcAllowedChars(pos)
+
+
+    def _calcAllowedChars(self, pos):
+        """ Computes the string of allowed user input characters for the provided
+            position from the mask character and the constraints of its field.
+        """
         maskChar = self.maskdict[pos]
         okchars = self.maskchardict[maskChar]    ## entry, get mask approved characters
 
@@ -4724,18 +4791,10 @@ class MaskedEditMixin:
             return False
 
         if self._isMaskChar( pos ):
-            okChars  = self._getAllowedChars(pos)
-
-            if self._fields[0]._groupdigits and (self._isInt or (self._isFloat and pos < self._decimalpos)):
-                okChars += self._fields[0]._groupChar
-
-            if self._signOk:
-                if self._isInt or (self._isFloat and pos < self._decimalpos):
-                    okChars += '-'
-                    if self._useParens:
-                        okChars += '('
-                elif self._useParens and (self._isInt or (self._isFloat and pos > self._decimalpos)):
-                    okChars += ')'
+            try:
+                okChars = self._charFilters[pos]
+            except (AttributeError, KeyError):
+                okChars = self._calcCharFilter(pos)
 
 ####            dbg('%s in %s?' % (char, okChars), char in okChars)
             approved = (self.maskdict[pos] == '*' or char in okChars)
@@ -4771,6 +4830,41 @@ class MaskedEditMixin:
             return False
 
 
+    def _calcCharFilter(self, pos):
+        """ Returns the set of characters accepted at the provided (mask) position,
+            including any grouping and sign characters allowed there for numeric
+            controls.
+        """
+        okChars  = self._getAllowedChars(pos)
+
+        if self._fields[0]._groupdigits and (self._isInt or (self._isFloat and pos < self._decimalpos)):
+            okChars += self._fields[0]._groupChar
+
+        if self._signOk:
+            if self._isInt or (self._isFloat and pos < self._decimalpos):
+                okChars += '-'
+                if self._useParens:
+                    okChars += '('
+            elif self._useParens and (self._isInt or (self._isFloat and pos > self._decimalpos)):
+                okChars += ')'
+        return frozenset(okChars)
+
+
+    def _compileCharFilters(self):
+        """
+        Computes the allowed characters for every mask position once per
+        (re)configuration, so that character validation on each keystroke or
+        pasted character is a simple lookup rather than a rebuild of the
+        allowed set from the field constraints.
+        """
+        self._allowedChars = {}
+        self._charFilters = {}
+        for pos in range(self._masklength):
+            if self._isMaskChar(pos):
+                self._allowedChars[pos] = self._calcAllowedChars(pos)
+                self._charFilters[pos] = self._calcCharFilter(pos)
+
+
     def _applyFormatting(self):
         """ Apply formatting depending on the control's state.
             Need to find a way to call this whenever the value changes, in case the control's
@@ -5351,24 +5445,7 @@ class MaskedEditMixin:
         else: value = candidate
 ##        dbg('value: "%s"' % value)
         oldvalue = value
-        valid = True    # assume True
-
-        if not self.IsDefault(value) and self._isDate:                    ## Date type validation
-            valid = self._validateDate(value)
-##            dbg("valid date?", valid)
-
-        elif not self.IsDefault(value) and self._isTime:
-            valid = self._validateTime(value)
-##            dbg("valid time?", valid)
-
-        elif not self.IsDefault(value) and (self._isInt or self._isFloat):  ## Numeric type
-            valid = self._validateNumeric(value)
-##            dbg("valid Number?", valid)
-
-        if valid:   # and not self.IsDefault(value):    ## generic validation accounts for IsDefault()
-            ## valid so far; ensure also allowed by any list or regex provided:
-            valid = self._validateGeneric(value)
-##            dbg("valid value?", valid)
+        valid = self._maskEngine._validateValue(value)
 
 ##        dbg('valid?', valid)
 
@@ -6008,6 +6085,20 @@ class MaskedEditMixin:
             return self._GetValue(), sel_to
 ##        dbg(indent=0)
 
+    def _normalizeValue(self, value):
+        """
+        Used by the SetValue()/ChangeValue() implementations of derived
+        controls to turn an arbitrary string into the value the control would
+        hold if it had been typed in over the entire (selected) contents of the
+        control.  Returns the adjusted value and the position of the last
+        character replaced, and raises ValueError if the value cannot be
+        entered.  The work is done by the control's mask engine.
+        """
+        value, replace_to = self._maskEngine._normalizeValue(value)
+        self._isNeg = self._maskEngine._isNeg
+        return value, replace_to
+
+
     def _Undo(self, value=None, prev=None, just_return_results=False):
         """ Provides an Undo() method in base controls. """
 ##        dbg("MaskedEditMixin::_Undo", indent=1)
@@ -6409,6 +6500,341 @@ class MaskedEditAccessorsMixin:
 
 
 
+## ---------- ---------- ---------- ---------- ---------- ---------- ----------
+
+class MaskEngine(MaskedEditMixin):
+    """
+    A "headless" implementation of the masked edit logic.  It accepts the
+    same parameters as masked.TextCtrl, compiles the mask, fields, regular
+    expressions and choice lists once, and then validates, normalizes and
+    formats values held in an in-memory buffer rather than in a window.
+
+    Instances are either constructed directly, eg.::
+
+        engine = MaskEngine(mask='###-##-####', formatcodes='F')
+
+    or obtained from a control via its GetMaskEngine() method; every masked
+    control keeps an engine, configured along with the control, to which it
+    delegates normalizing and validating its values.  The in-memory buffer
+    stands in for the control, so values are entered into it exactly as
+    SetValue() enters them into a control.
+    """
+
+    # Parameters that only affect how a control looks; the engine ignores
+    # them, so that it needs no wx objects:
+    _displayParams = ('emptyBackgroundColour', 'invalidBackgroundColour',
+                      'validBackgroundColour', 'foregroundColour',
+                      'signedForegroundColour', 'useFixedWidthFont')
+
+    def __init__(self, name='MaskEngine', converter=None, **kwargs):
+        """
+        Default class constructor.
+
+        :param string `name`: name used in error messages;
+        :param `converter`: optional function used to convert each value
+         passed to the engine into its masked string form, before the value
+         is normalized;
+        :param `kwargs`: any of the masked edit control or field parameters.
+
+        """
+        self._converter = converter
+        self._resetBuffer()
+        MaskedEditMixin.__init__(self, name, **kwargs)
+
+
+    def _CreateMaskEngine(self):
+        # the engine does its own normalization and validation
+        return self
+
+
+    def _copyParameters(self, kwargs):
+        """
+        Returns the parameters without the display-only ones, and with copies
+        of any fields and lists, so that the engine shares no state with the
+        control it is configured along with.
+        """
+        params = {}
+        for key, value in kwargs.items():
+            if key.replace('Color', 'Colour') in self._displayParams:
+                continue
+            if key == 'fields' and isinstance(value, dict):
+                value = dict((index, copy.copy(field)) for index, field in value.items())
+            elif key == 'fields' and isinstance(value, (list, tuple)):
+                value = [copy.copy(field) for field in value]
+            elif isinstance(value, (list, dict)):
+                value = copy.copy(value)
+            params[key] = value
+        return params
+
+
+    def SetCtrlParameters(self, **kwargs):
+        """
+        Sets individual or multiple masked edit parameters, as for a masked
+        control.
+        """
+        # there is no window to reconfigure, only the buffer to reset
+        self.controlInitialized = False
+        try:
+            MaskedEditMixin.SetCtrlParameters(self, **self._copyParameters(kwargs))
+        finally:
+            self.controlInitialized = True
+        self._resetBuffer()
+
+
+    def SetFieldParameters(self, field_index, **kwargs):
+        """
+        Sets the parameters of the field at `field_index`, as for a masked
+        control.
+        """
+        self.controlInitialized = False
+        try:
+            MaskedEditMixin.SetFieldParameters(self, field_index, **self._copyParameters(kwargs))
+        finally:
+            self.controlInitialized = True
+        self._resetBuffer()
+
+
+    def _resetBuffer(self, value=None):
+        """ Resets the in-memory "control" to the given value (or the template) with
+            the entire contents selected, as SetValue() does with a real control.
+        """
+        if value is None:
+            value = getattr(self, '_template', '')
+        self._value = value
+        self._isNeg = False
+        self._insertionPoint = 0
+        self._selection = (0, len(value))
+
+
+    ## The following are the "base control" functions REQUIRED by MaskedEditMixin:
+
+    def _GetValue(self):
+        return self._value
+
+    def _SetValue(self, value):
+        self._value = value
+
+    def _ChangeValue(self, value):
+        self._value = value
+
+    def _GetSelection(self):
+        return self._selection
+
+    def _SetSelection(self, sel_start, sel_to):
+        self._selection = (sel_start, sel_to)
+
+    def _GetInsertionPoint(self):
+        return self._insertionPoint
+
+    def _SetInsertionPoint(self, pos):
+        self._insertionPoint = pos
+
+    def _IsEditable(self):
+        return True
+
+    def _Refresh(self):
+        pass
+
+    def Refresh(self):
+        pass
+
+    def SetForegroundColour(self, colour):
+        self._foregroundColour = colour
+
+    def SetBackgroundColour(self, colour):
+        self._validBackgroundColour = colour
+
+
+    def _normalizeValue(self, value):
+        """
+        Enters the string into the emptied buffer as though it had been typed
+        in over the entire contents of a control, and returns the adjusted
+        value and the position of the last character replaced; raises
+        ValueError if the value cannot be entered.
+        """
+        self._resetBuffer()
+        if self._signOk and self._useParens:
+            signpos = value.find('-')
+            if signpos != -1:
+                value = value[:signpos] + '(' + value[signpos+1:].strip() + ')'
+            elif value.find(')') == -1 and len(value) < self._masklength:
+                value += ' '    # add place holder for reserved space for right paren
+
+        if( len(value) < self._masklength                # value shorter than control
+            and (self._isFloat or self._isInt)            # and it's a numeric control
+            and self._ctrl_constraints._alignRight ):   # and it's a right-aligned control
+
+##            dbg('len(value)', len(value), ' < self._masklength', self._masklength)
+            # try to intelligently "pad out" the value to the right size:
+            value = self._template[0:self._masklength - len(value)] + value
+            if self._isFloat and value.find('.') == -1:
+                value = value[1:]
+##            dbg('padded value = "%s"' % value)
+
+        try:
+            value, replace_to = self._Paste(value, raise_on_invalid=True, just_return_value=True)
+            if self._isFloat:
+                self._isNeg = False     # (clear current assumptions)
+                value = self._adjustFloat(value)
+            elif self._isInt:
+                self._isNeg = False     # (clear current assumptions)
+                value = self._adjustInt(value)
+            elif self._isDate and not self.IsValid(value) and self._4digityear:
+                value = self._adjustDate(value, fixcentury=True)
+        except ValueError:
+            # If date, year might be 2 digits vs. 4; try adjusting it:
+            if self._isDate and self._4digityear:
+                dateparts = value.split(' ')
+                dateparts[0] = self._adjustDate(dateparts[0], fixcentury=True)
+                value = ' '.join(dateparts)
+##                dbg('adjusted value: "%s"' % value)
+                value, replace_to = self._Paste(value, raise_on_invalid=True, just_return_value=True)
+            else:
+##                dbg('exception thrown', indent=0)
+                raise
+        return value, replace_to
+
+
+    def _validateValue(self, value):
+        """
+        Returns True if the (already normalized) value is valid for the type
+        of the mask and satisfies the constraints of all of the fields.
+        """
+        valid = True    # assume True
+
+        if not self.IsDefault(value) and self._isDate:                    ## Date type validation
+            valid = self._validateDate(value)
+##            dbg("valid date?", valid)
+
+        elif not self.IsDefault(value) and self._isTime:
+            valid = self._validateTime(value)
+##            dbg("valid time?", valid)
+
+        elif not self.IsDefault(value) and (self._isInt or self._isFloat):  ## Numeric type
+            valid = self._validateNumeric(value)
+##            dbg("valid Number?", valid)
+
+        if valid:   # and not self.IsDefault(value):    ## generic validation accounts for IsDefault()
+            ## valid so far; ensure also allowed by any list or regex provided:
+            valid = self._validateGeneric(value)
+##            dbg("valid value?", valid)
+        return valid
+
+
+    def Normalize(self, value):
+        """
+        Returns the value as a masked control with this configuration would
+        hold it had the value been typed or set into it; (eg. numbers are
+        justified and grouped, 2-digit years are expanded, case is forced, etc.)
+        A ValueError is raised if the value cannot be entered with the mask.
+        """
+        if self._converter is not None:
+            value = self._converter(value)
+        if not isinstance(value, six.string_types):
+            raise ValueError('%s must be a string' % repr(value))
+        if not self._mask:
+            return value
+        text = self._normalizeValue(value)[0]
+        if text is None:
+            ve = ValueError('"%s" cannot be inserted into the control "%s"' % (value, self.name))
+            ve.value = value
+            raise ve
+        return text
+
+
+    def Validate(self, value):
+        """
+        Returns True if the value can be entered with the mask and the
+        resulting normalized value satisfies all of the validation
+        constraints (ranges, choices, regular expressions, etc.)
+        """
+        try:
+            value = self.Normalize(value)
+        except ValueError:
+            return False
+        return self.IsValid(value)
+
+
+    def IsValid(self, value):
+        """
+        Returns True if the (already normalized) value satisfies the
+        validation constraints of the mask.
+        """
+        self._resetBuffer(value)
+        return MaskedEditMixin.IsValid(self, value)
+
+
+    def IsEmpty(self, value=None):
+        """
+        Returns True if the (already normalized) value is equal to an empty
+        value for the mask.
+        """
+        return MaskedEditMixin.IsEmpty(self, value)
+
+
+    def GetPlainValue(self, value):
+        """
+        Returns the (already normalized) value stripped of the template text.
+        """
+        self._resetBuffer(value)
+        return MaskedEditMixin.GetPlainValue(self, value)
+
+
+    def Format(self, value):
+        """
+        Normalizes the value and returns the result if it is valid; raises
+        ValueError otherwise.
+        """
+        text = self.Normalize(value)
+        if not self.IsValid(text):
+            ve = ValueError('"%s" is not a valid value for "%s"' % (text, self.name))
+            ve.value = value
+            raise ve
+        return text
+
+
+    def NormalizeMany(self, values, invalid=None):
+        """
+        Normalizes each value of the iterable `values`, returning a list of the
+        results, with `invalid` substituted for any value that cannot be
+        entered with the mask.
+        """
+        normalize = self.Normalize
+        results = []
+        append = results.append
+        for value in values:
+            try:
+                append(normalize(value))
+            except ValueError:
+                append(invalid)
+        return results
+
+
+    def ValidateMany(self, values):
+        """
+        Returns a list of booleans indicating whether each value of the
+        iterable `values` is valid for the mask.  (See Validate().)
+        """
+        validate = self.Validate
+        return [validate(value) for value in values]
+
+
+    def FormatMany(self, values, invalid=None):
+        """
+        Formats each value of the iterable `values`, returning a list of the
+        results, with `invalid` substituted for any value that is not valid.
+        """
+        format = self.Format
+        results = []
+        append = results.append
+        for value in values:
+            try:
+                append(format(value))
+            except ValueError:
+                append(invalid)
+        return results
+
+
 ## ---------- ---------- ---------- ---------- ---------- ---------- ----------
 ## these are helper subroutines:
 
@@ -242,46 +242,10 @@ class BaseMaskedTextCtrl( wx.TextCtrl, MaskedEditMixin ):
         # empty previous contents, replacing entire value:
         self._SetInsertionPoint(0)
         self._SetSelection(0, self._masklength)
-        if self._signOk and self._useParens:
-            signpos = value.find('-')
-            if signpos != -1:
-                value = value[:signpos] + '(' + value[signpos+1:].strip() + ')'
-            elif value.find(')') == -1 and len(value) < self._masklength:
-                value += ' '    # add place holder for reserved space for right paren
-
-        if( len(value) < self._masklength                # value shorter than control
-            and (self._isFloat or self._isInt)            # and it's a numeric control
-            and self._ctrl_constraints._alignRight ):   # and it's a right-aligned control
-
-##            dbg('len(value)', len(value), ' < self._masklength', self._masklength)
-            # try to intelligently "pad out" the value to the right size:
-            value = self._template[0:self._masklength - len(value)] + value
-            if self._isFloat and value.find('.') == -1:
-                value = value[1:]
-##            dbg('padded value = "%s"' % value)
 
         # make Set/ChangeValue behave the same as if you had typed the value in:
-        try:
-            value, replace_to = self._Paste(value, raise_on_invalid=True, just_return_value=True)
-            if self._isFloat:
-                self._isNeg = False     # (clear current assumptions)
-                value = self._adjustFloat(value)
-            elif self._isInt:
-                self._isNeg = False     # (clear current assumptions)
-                value = self._adjustInt(value)
-            elif self._isDate and not self.IsValid(value) and self._4digityear:
-                value = self._adjustDate(value, fixcentury=True)
-        except ValueError:
-            # If date, year might be 2 digits vs. 4; try adjusting it:
-            if self._isDate and self._4digityear:
-                dateparts = value.split(' ')
-                dateparts[0] = self._adjustDate(dateparts[0], fixcentury=True)
-                value = ' '.join(dateparts)
-##                dbg('adjusted value: "%s"' % value)
-                value, replace_to = self._Paste(value, raise_on_invalid=True, just_return_value=True)
-            else:
-##                dbg('exception thrown', indent=0)
-                raise
+        value, replace_to = self._normalizeValue(value)
+
         if use_change_value:
             self._ChangeValue(value)
         else:
@@ -13,6 +13,7 @@ __docformat__ = "restructuredtext en"
 __all__ = [
     'PolyLine',
     'PolySpline',
+    'PolyStream',
     'PolyMarker',
     'PolyBars',
     'PolyHistogram',
@@ -21,6 +22,8 @@ __all__ = [
     'PlotGraphics',
     'PlotCanvas',
     'PlotPrintout',
+    'PlotRenderer',
+    'RenderBatch',
 ]
 
 # Expose items so that the old API can still be used.
@@ -31,6 +34,7 @@ from .plotcanvas import PlotCanvas
 from .polyobjects import PolyPoints
 from .polyobjects import PolyLine
 from .polyobjects import PolySpline
+from .polyobjects import PolyStream
 from .polyobjects import PolyMarker
 from .polyobjects import PolyBars
 from .polyobjects import PolyHistogram
@@ -38,6 +42,9 @@ from .polyobjects import PolyBoxPlot
 from .polyobjects import PlotGraphics
 from .polyobjects import PlotPrintout
 
+from .renderer import PlotRenderer
+from .renderer import RenderBatch
+
 from .utils import TempStyle
 from .utils import pendingDeprecation
 from .utils import PlotPendingDeprecation
@@ -30,103 +30,35 @@ from .utils import TempStyle
 from .utils import scale_and_shift_point
 
 
-class PlotCanvas(wx.Panel):
+class PlotDrawer(object):
     """
-    Creates a PlotCanvas object.
-
-    Subclass of a wx.Panel which holds two scrollbars and the actual
-    plotting canvas (self.canvas). It allows for simple general plotting
-    of data with zoom, labels, and automatic axis scaling.
+    The layout and drawing code of a plot, without the window.
 
-    This is the main window that you will want to import into your
-    application.
+    This holds the plot options and draws a :class:`PlotGraphics` on a
+    :class:`wx.DC`. It is shared by :class:`PlotCanvas`, which adds the
+    scrollbars, mouse handling and printing, and by
+    :class:`~wx.lib.plot.renderer.PlotRenderer`, which draws without a
+    window.
 
-    Parameters for ``__init__`` are the same as any :class:`wx.Panel`.
+    Subclasses must create the offscreen bitmap, ``self._Buffer``, that the
+    plot is drawn into when no DC is given, and provide the ``GetFont``,
+    ``GetForegroundColour`` and ``GetBackgroundColour`` methods of a window.
     """
 
-    def __init__(self, parent, id=wx.ID_ANY, pos=wx.DefaultPosition,
-                 size=wx.DefaultSize, style=0, name="plotCanvas"):
-        wx.Panel.__init__(self, parent, id, pos, size, style, name)
-
-        sizer = wx.FlexGridSizer(2, 2, 0, 0)
-        self.canvas = wx.Window(self, -1)
-        self.sb_vert = wx.ScrollBar(self, -1, style=wx.SB_VERTICAL)
-        self.sb_vert.SetScrollbar(0, 1000, 1000, 1000)
-        self.sb_hor = wx.ScrollBar(self, -1, style=wx.SB_HORIZONTAL)
-        self.sb_hor.SetScrollbar(0, 1000, 1000, 1000)
-
-        sizer.Add(self.canvas, 1, wx.EXPAND)
-        sizer.Add(self.sb_vert, 0, wx.EXPAND)
-        sizer.Add(self.sb_hor, 0, wx.EXPAND)
-        sizer.Add((0, 0))
-
-        self.sb_vert.Show(False)
-        self.sb_hor.Show(False)
-
-        self.SetSizer(sizer)
-        sizer.AddGrowableRow(0, 1)
-        sizer.AddGrowableCol(0, 1)
-        self.Fit()
-
-        self.border = (1, 1)
-
-        self.SetBackgroundColour("white")
-
-        # Create some mouse events for zooming
-        self.canvas.Bind(wx.EVT_LEFT_DOWN, self.OnMouseLeftDown)
-        self.canvas.Bind(wx.EVT_LEFT_UP, self.OnMouseLeftUp)
-        self.canvas.Bind(wx.EVT_MOTION, self.OnMotion)
-        self.canvas.Bind(wx.EVT_LEFT_DCLICK, self.OnMouseDoubleClick)
-        self.canvas.Bind(wx.EVT_RIGHT_DOWN, self.OnMouseRightDown)
-
-        # scrollbar events
-        self.Bind(wx.EVT_SCROLL_THUMBTRACK, self.OnScroll)
-        self.Bind(wx.EVT_SCROLL_PAGEUP, self.OnScroll)
-        self.Bind(wx.EVT_SCROLL_PAGEDOWN, self.OnScroll)
-        self.Bind(wx.EVT_SCROLL_LINEUP, self.OnScroll)
-        self.Bind(wx.EVT_SCROLL_LINEDOWN, self.OnScroll)
-
-        # set curser as cross-hairs
-        self.defaultCursor = wx.Cursor(wx.CURSOR_ARROW)
-        self.HandCursor = wx.Cursor(wx.CURSOR_SIZING)
-        self.GrabHandCursor = wx.Cursor(wx.CURSOR_SIZING)
-        self.MagCursor = wx.Cursor(wx.CURSOR_MAGNIFIER)
-        self.canvas.SetCursor(self.defaultCursor)
-
+    def __init__(self):
         # Things for printing
-        self._print_data = None
-        self._pageSetupData = None
         self.printerScale = 1
-        self.parent = parent
-
-        # scrollbar variables
-        self._sb_ignore = False
-        self._sb_show = False
-        self._adjustingSB = False
-        self._sb_xfullrange = 0
-        self._sb_yfullrange = 0
-        self._sb_xunit = 0
-        self._sb_yunit = 0
-
-        self._screenCoordinates = np.array([0.0, 0.0])
-
-        # Zooming variables
-        self._zoomInFactor = 0.5
-        self._zoomOutFactor = 2
-        self._zoomCorner1 = np.array([0.0, 0.0])  # left mouse down corner
-        self._zoomCorner2 = np.array([0.0, 0.0])   # left mouse up corner
-        self._zoomEnabled = False
-        self._hasDragged = False
 
         # Drawing Variables
         self.last_draw = None
         self._pointScale = 1
         self._pointShift = 0
+        # plot area rect, scale and shift of the last draw to the screen
+        self._plotArea = None
         self._xSpec = 'auto'
         self._ySpec = 'auto'
 
         # Initial Plot Options
-        self._dragEnabled = False
         self._logscale = (False, False)
         self._absScale = (False, False)
         self._gridEnabled = (True, True)
@@ -147,17 +79,6 @@ class PlotCanvas(wx.Panel):
         self._fontSizeTitle = 15
         self._fontSizeLegend = 7
 
-        # pointLabels
-        self._pointLabelEnabled = False
-        self.last_PointLabel = None
-        self._pointLabelFunc = None
-        self.canvas.Bind(wx.EVT_LEAVE_WINDOW, self.OnLeave)
-        if sys.platform != "darwin":
-            self._logicalFunction = wx.EQUIV  # (NOT src) XOR dst
-        else:
-            # wx.EQUIV not supported on Mac OS X
-            self._logicalFunction = wx.COPY
-
         self._useScientificNotation = False
 
         self._antiAliasingEnabled = False
@@ -165,13 +86,6 @@ class PlotCanvas(wx.Panel):
         self._pointSize = (1.0, 1.0)
         self._fontScale = 1.0
 
-        self.canvas.Bind(wx.EVT_PAINT, self.OnPaint)
-        self.canvas.Bind(wx.EVT_SIZE, self.OnSize)
-        # OnSize called to make sure the buffer is initialized.
-        # This might result in OnSize getting called twice on some
-        # platforms at initialization, but little harm done.
-        self.OnSize(None)  # sets the initial size based on client size
-
         # Default Pens
         self._gridPen = wx.Pen(wx.Colour(180, 180, 180, 255),
                                self._pointSize[0],
@@ -194,9 +108,6 @@ class PlotCanvas(wx.Panel):
                                    self._pointSize[0],
                                    wx.PENSTYLE_DOT_DASH)
 
-    def SetCursor(self, cursor):
-        self.canvas.SetCursor(cursor)
-
     ### Pen Properties
     @property
     def gridPen(self):
@@ -320,141 +231,6 @@ class PlotCanvas(wx.Panel):
         return (3 * self.printerScale * self._tickLength[0],
                 3 * self.printerScale * self._tickLength[1])
 
-    # SaveFile
-    def SaveFile(self, fileName=''):
-        """
-        Saves the file to the type specified in the extension. If no file
-        name is specified a dialog box is provided.  Returns True if
-        sucessful, otherwise False.
-
-        .bmp  Save a Windows bitmap file.
-        .xbm  Save an X bitmap file.
-        .xpm  Save an XPM bitmap file.
-        .png  Save a Portable Network Graphics file.
-        .jpg  Save a Joint Photographic Experts Group file.
-
-        """
-        extensions = {
-            "bmp": wx.BITMAP_TYPE_BMP,       # Save a Windows bitmap file.
-            "xbm": wx.BITMAP_TYPE_XBM,       # Save an X bitmap file.
-            "xpm": wx.BITMAP_TYPE_XPM,       # Save an XPM bitmap file.
-            "jpg": wx.BITMAP_TYPE_JPEG,      # Save a JPG file.
-            "png": wx.BITMAP_TYPE_PNG,       # Save a PNG file.
-        }
-
-        fType = fileName[-3:].lower()
-        dlg1 = None
-        while fType not in extensions:
-
-            msg_txt = ('File name extension\n'  # implicit str concat
-                       'must be one of\nbmp, xbm, xpm, png, or jpg')
-
-            if dlg1:               # FileDialog exists: Check for extension
-                dlg2 = wx.MessageDialog(self, msg_txt, 'File Name Error',
-                                        wx.OK | wx.ICON_ERROR)
-                try:
-                    dlg2.ShowModal()
-                finally:
-                    dlg2.Destroy()
-            # FileDialog doesn't exist: just check one
-            else:
-                msg_txt = ("Choose a file with extension bmp, "
-                           "gif, xbm, xpm, png, or jpg")
-                wildcard_str = ("BMP files (*.bmp)|*.bmp|XBM files (*.xbm)|"
-                                "*.xbm|XPM file (*.xpm)|*.xpm|"
-                                "PNG files (*.png)|*.png|"
-                                "JPG files (*.jpg)|*.jpg")
-                dlg1 = wx.FileDialog(self,
-                                     msg_txt,
-                                     ".",
-                                     "",
-                                     wildcard_str,
-                                     wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
-                                     )
-
-            if dlg1.ShowModal() == wx.ID_OK:
-                fileName = dlg1.GetPath()
-                fType = fileName[-3:].lower()
-            else:                      # exit without saving
-                dlg1.Destroy()
-                return False
-
-        if dlg1:
-            dlg1.Destroy()
-
-        # Save Bitmap
-        res = self._Buffer.SaveFile(fileName, extensions[fType])
-        return res
-
-    @property
-    def print_data(self):
-        if not self._print_data:
-            self._print_data = wx.PrintData()
-            self._print_data.SetPaperId(wx.PAPER_LETTER)
-            self._print_data.SetOrientation(wx.LANDSCAPE)
-        return self._print_data
-
-    @property
-    def pageSetupData(self):
-        if not self._pageSetupData:
-            self._pageSetupData = wx.PageSetupDialogData()
-            self._pageSetupData.SetMarginBottomRight((25, 25))
-            self._pageSetupData.SetMarginTopLeft((25, 25))
-            self._pageSetupData.SetPrintData(self.print_data)
-        return self._pageSetupData
-
-    def PageSetup(self):
-        """Brings up the page setup dialog"""
-        data = self.pageSetupData
-        data.SetPrintData(self.print_data)
-        dlg = wx.PageSetupDialog(self.parent, data)
-        try:
-            if dlg.ShowModal() == wx.ID_OK:
-                data = dlg.GetPageSetupData()
-                # updates page parameters from dialog
-                self.pageSetupData.SetMarginBottomRight(
-                    data.GetMarginBottomRight())
-                self.pageSetupData.SetMarginTopLeft(data.GetMarginTopLeft())
-                self.pageSetupData.SetPrintData(data.GetPrintData())
-                self._print_data = wx.PrintData(
-                    data.GetPrintData())  # updates print_data
-        finally:
-            dlg.Destroy()
-
-    def Printout(self, paper=None):
-        """Print current plot."""
-        if paper is not None:
-            self.print_data.SetPaperId(paper)
-        pdd = wx.PrintDialogData(self.print_data)
-        printer = wx.Printer(pdd)
-        out = PlotPrintout(self)
-        print_ok = printer.Print(self.parent, out)
-        if print_ok:
-            self._print_data = wx.PrintData(
-                printer.GetPrintDialogData().GetPrintData())
-        out.Destroy()
-
-    def PrintPreview(self):
-        """Print-preview current plot."""
-        printout = PlotPrintout(self)
-        printout2 = PlotPrintout(self)
-        self.preview = wx.PrintPreview(printout, printout2, self.print_data)
-        if not self.preview.IsOk():
-            wx.MessageDialog(self, "Print Preview failed.\n"
-                             "Check that default printer is configured\n",
-                             "Print error", wx.OK | wx.CENTRE).ShowModal()
-        self.preview.SetZoom(40)
-        # search up tree to find frame instance
-        frameInst = self
-        while not isinstance(frameInst, wx.Frame):
-            frameInst = frameInst.GetParent()
-        frame = wx.PreviewFrame(self.preview, frameInst, "Preview")
-        frame.Initialize()
-        frame.SetPosition(self.GetPosition())
-        frame.SetSize((600, 550))
-        frame.Centre(wx.BOTH)
-        frame.Show(True)
-
     def setLogScale(self, logscale):
         """
         Set the log scale boolean value.
@@ -657,79 +433,27 @@ class PlotCanvas(wx.Panel):
     def fontSizeLegend(self, point):
         self._fontSizeLegend = point
 
-    def SetShowScrollbars(self, value):
+    def SetUseScientificNotation(self, useScientificNotation):
         """
-        Set the showScrollbars value.
+        Set the useScientificNotation value.
 
         .. deprecated:: Feb 27, 2016
 
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.showScrollbars`
+           Use the
+           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.useScientificNotation`
            property instead.
         """
-        pendingDeprecation("self.showScrollbars property")
-        self.showScrollbars = value
+        pendingDeprecation("self.useScientificNotation property")
+        self.useScientificNotation = useScientificNotation
 
-    def GetShowScrollbars(self):
+    def GetUseScientificNotation(self):
         """
-        Get the showScrollbars value.
+        Get the useScientificNotation value.
 
         .. deprecated:: Feb 27, 2016
 
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.showScrollbars`
-           property instead.
-        """
-        pendingDeprecation("self.showScrollbars property")
-        return self.showScrollbars
-
-    @property
-    def showScrollbars(self):
-        """
-        The current showScrollbars value.
-
-        :getter: Returns the value of showScrollbars.
-        :setter: Sets the value of showScrollbars.
-        :type:   bool
-        :raises: `TypeError` if setting a non-boolean value.
-        """
-        return self._sb_show
-
-    @showScrollbars.setter
-    def showScrollbars(self, value):
-        if not isinstance(value, bool):
-            raise TypeError("Value should be True or False")
-        if value == self._sb_show:
-            # no change, so don't do anything
-            return
-        self._sb_show = value
-        self.sb_vert.Show(value)
-        self.sb_hor.Show(value)
-
-        def _do_update():
-            self.Layout()
-            self._adjustScrollbars()
-        wx.CallAfter(_do_update)
-
-    def SetUseScientificNotation(self, useScientificNotation):
-        """
-        Set the useScientificNotation value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the
-           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.useScientificNotation`
-           property instead.
-        """
-        pendingDeprecation("self.useScientificNotation property")
-        self.useScientificNotation = useScientificNotation
-
-    def GetUseScientificNotation(self):
-        """
-        Get the useScientificNotation value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the
-           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.useScientificNotation`
+           Use the
+           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.useScientificNotation`
            property instead.
         """
         pendingDeprecation("self.useScientificNotation property")
@@ -841,118 +565,6 @@ class PlotCanvas(wx.Panel):
         self._hiResEnabled = value
         self.Redraw()
 
-    def SetEnableDrag(self, value):
-        """
-        Set the enableDrag value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableDrag`
-           property instead.
-        """
-        pendingDeprecation("self.enableDrag property")
-        self.enableDrag = value
-
-    def GetEnableDrag(self):
-        """
-        Get the enableDrag value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableDrag`
-           property instead.
-        """
-        pendingDeprecation("self.enableDrag property")
-        return self.enableDrag
-
-    @property
-    def enableDrag(self):
-        """
-        The current enableDrag value.
-
-        :getter: Returns the value of enableDrag.
-        :setter: Sets the value of enableDrag.
-        :type:   bool
-        :raises: `TypeError` if setting a non-boolean value.
-
-        .. note::
-           This is mutually exclusive with
-           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableZoom`. Setting
-           one will disable the other.
-
-        .. seealso::
-           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableZoom`
-        """
-        return self._dragEnabled
-
-    @enableDrag.setter
-    def enableDrag(self, value):
-        if not isinstance(value, bool):
-            raise TypeError("Value must be a bool.")
-        if value:
-            if self.enableZoom:
-                self.enableZoom = False
-            self.SetCursor(self.HandCursor)
-        else:
-            self.SetCursor(self.defaultCursor)
-        self._dragEnabled = value
-
-    def SetEnableZoom(self, value):
-        """
-        Set the enableZoom value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableZoom`
-           property instead.
-        """
-        pendingDeprecation("self.enableZoom property")
-        self.enableZoom = value
-
-    def GetEnableZoom(self):
-        """
-        Get the enableZoom value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableZoom`
-           property instead.
-        """
-        pendingDeprecation("self.enableZoom property")
-        return self.enableZoom
-
-    @property
-    def enableZoom(self):
-        """
-        The current enableZoom value.
-
-        :getter: Returns the value of enableZoom.
-        :setter: Sets the value of enableZoom.
-        :type:   bool
-        :raises: `TypeError` if setting a non-boolean value.
-
-        .. note::
-           This is mutually exclusive with
-           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableDrag`. Setting
-           one will disable the other.
-
-        .. seealso::
-           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableDrag`
-        """
-        return self._zoomEnabled
-
-    @enableZoom.setter
-    def enableZoom(self, value):
-        if not isinstance(value, bool):
-            raise TypeError("Value must be a bool.")
-        if value:
-            if self.enableDrag:
-                self.enableDrag = False
-            self.SetCursor(self.MagCursor)
-        else:
-            self.SetCursor(self.defaultCursor)
-        self._zoomEnabled = value
-
     def SetEnableGrid(self, value):
         """
         Set the enableGrid value.
@@ -1199,50 +811,6 @@ class PlotCanvas(wx.Panel):
         self._titleEnabled = value
         self.Redraw()
 
-    def SetEnablePointLabel(self, value):
-        """
-        Set the enablePointLabel value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enablePointLabel`
-           property instead.
-        """
-        pendingDeprecation("self.enablePointLabel property")
-        self.enablePointLabel = value
-
-    def GetEnablePointLabel(self):
-        """
-        Set the enablePointLabel value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enablePointLabel`
-           property instead.
-        """
-        pendingDeprecation("self.enablePointLabel property")
-        return self.enablePointLabel
-
-    @property
-    def enablePointLabel(self):
-        """
-        The current enablePointLabel value.
-
-        :getter: Returns the value of enablePointLabel.
-        :setter: Sets the value of enablePointLabel.
-        :type:   bool
-        :raises: `TypeError` if setting a non-boolean value.
-        """
-        return self._pointLabelEnabled
-
-    @enablePointLabel.setter
-    def enablePointLabel(self, value):
-        if not isinstance(value, bool):
-            raise TypeError("Value must be a bool.")
-        self._pointLabelEnabled = value
-        self.Redraw()  # will erase existing pointLabel if present
-        self.last_PointLabel = None
-
     @property
     def enableAxes(self):
         """
@@ -1398,131 +966,53 @@ class PlotCanvas(wx.Panel):
         self._axesLabelsEnabled = value
         self.Redraw()
 
-    def SetPointLabelFunc(self, func):
+    def PositionUserToScreen(self, pntXY):
+        """Converts User position to Screen Coordinates"""
+        userPos = np.array(pntXY)
+        x, y = userPos * self._pointScale + self._pointShift
+        return x, y
+
+    def PositionScreenToUser(self, pntXY):
+        """Converts Screen position to User Coordinates"""
+        screenPos = np.array(pntXY)
+        x, y = (screenPos - self._pointShift) / self._pointScale
+        return x, y
+
+    def SetXSpec(self, spectype='auto'):
         """
-        Set the enablePointLabel value.
+        Set the xSpec value.
 
         .. deprecated:: Feb 27, 2016
 
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enablePointLabel`
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.xSpec`
            property instead.
         """
-        pendingDeprecation("self.pointLabelFunc property")
-        self.pointLabelFunc = func
+        pendingDeprecation("self.xSpec property")
+        self.xSpec = spectype
 
-    def GetPointLabelFunc(self):
+    def SetYSpec(self, spectype='auto'):
         """
-        Get the enablePointLabel value.
+        Set the ySpec value.
 
         .. deprecated:: Feb 27, 2016
 
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enablePointLabel`
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.ySpec`
            property instead.
         """
-        pendingDeprecation("self.pointLabelFunc property")
-        return self.pointLabelFunc
+        pendingDeprecation("self.ySpec property")
+        self.ySpec = spectype
 
-    @property
-    def pointLabelFunc(self):
+    def GetXSpec(self):
         """
-        The current pointLabelFunc value.
+        Get the xSpec value.
 
-        :getter: Returns the value of pointLabelFunc.
-        :setter: Sets the value of pointLabelFunc.
-        :type:   function
+        .. deprecated:: Feb 27, 2016
 
-        TODO: More information is needed.
-        Sets the function with custom code for pointLabel drawing
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.xSpec`
+           property instead.
         """
-        return self._pointLabelFunc
-
-    @pointLabelFunc.setter
-    def pointLabelFunc(self, func):
-        self._pointLabelFunc = func
-
-    def Reset(self):
-        """Unzoom the plot."""
-        self.last_PointLabel = None  # reset pointLabel
-        if self.last_draw is not None:
-            self._Draw(self.last_draw[0])
-
-    def ScrollRight(self, units):
-        """Move view right number of axis units."""
-        self.last_PointLabel = None  # reset pointLabel
-        if self.last_draw is not None:
-            graphics, xAxis, yAxis = self.last_draw
-            xAxis = (xAxis[0] + units, xAxis[1] + units)
-            self._Draw(graphics, xAxis, yAxis)
-
-    def ScrollUp(self, units):
-        """Move view up number of axis units."""
-        self.last_PointLabel = None  # reset pointLabel
-        if self.last_draw is not None:
-            graphics, xAxis, yAxis = self.last_draw
-            yAxis = (yAxis[0] + units, yAxis[1] + units)
-            self._Draw(graphics, xAxis, yAxis)
-
-    def GetXY(self, event):
-        """Wrapper around _getXY, which handles log scales"""
-        x, y = self._getXY(event)
-        if self.logScale[0]:
-            x = np.power(10, x)
-        if self.logScale[1]:
-            y = np.power(10, y)
-        return x, y
-
-    def _getXY(self, event):
-        """Takes a mouse event and returns the XY user axis values."""
-        x, y = self.PositionScreenToUser(event.GetPosition())
-        return x, y
-
-    def PositionUserToScreen(self, pntXY):
-        """Converts User position to Screen Coordinates"""
-        userPos = np.array(pntXY)
-        x, y = userPos * self._pointScale + self._pointShift
-        return x, y
-
-    def PositionScreenToUser(self, pntXY):
-        """Converts Screen position to User Coordinates"""
-        screenPos = np.array(pntXY)
-        x, y = (screenPos - self._pointShift) / self._pointScale
-        return x, y
-
-    def SetXSpec(self, spectype='auto'):
-        """
-        Set the xSpec value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.xSpec`
-           property instead.
-        """
-        pendingDeprecation("self.xSpec property")
-        self.xSpec = spectype
-
-    def SetYSpec(self, spectype='auto'):
-        """
-        Set the ySpec value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.ySpec`
-           property instead.
-        """
-        pendingDeprecation("self.ySpec property")
-        self.ySpec = spectype
-
-    def GetXSpec(self):
-        """
-        Get the xSpec value.
-
-        .. deprecated:: Feb 27, 2016
-
-           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.xSpec`
-           property instead.
-        """
-        pendingDeprecation("self.xSpec property")
-        return self.xSpec
+        pendingDeprecation("self.xSpec property")
+        return self.xSpec
 
     def GetYSpec(self):
         """
@@ -1769,7 +1259,7 @@ class PlotCanvas(wx.Panel):
                 yAxis = np.log10(yAxis)
         self._Draw(graphics, xAxis, yAxis, dc)
 
-    def _Draw(self, graphics, xAxis=None, yAxis=None, dc=None):
+    def _Draw(self, graphics, xAxis=None, yAxis=None, dc=None, scroll=False):
         """\
         Draw objects in graphics with specified x and y axis.
         graphics- instance of PlotGraphics with list of PolyXXX objects
@@ -1777,11 +1267,19 @@ class PlotCanvas(wx.Panel):
         yAxis - same as xAxis
         dc - drawing context - doesn't have to be specified.
         If it's not, the offscreen buffer is used
+        scroll - True if the plot area may just have been scrolled
+        horizontally, in which case the previous contents are reused
         """
+        toScreen = dc is None
+        oldPlotArea = oldPlot = None
+        if toScreen and scroll and self._plotArea is not None:
+            oldPlotArea = self._plotArea
+            oldPlot = self._Buffer.GetSubBitmap(oldPlotArea[0])
+        self._plotArea = None
 
         if dc is None:
             # sets new dc and clears it
-            dc = wx.BufferedDC(wx.ClientDC(self.canvas), self._Buffer)
+            dc = self._getBufferDC()
             bbr = wx.Brush(self.GetBackgroundColour(), wx.BRUSHSTYLE_SOLID)
             dc.SetBackground(bbr)
             dc.SetBackgroundMode(wx.SOLID)
@@ -1924,60 +1422,82 @@ class PlotCanvas(wx.Panel):
 
         # set clipping area so drawing does not occur outside axis box
         ptx, pty, rectWidth, rectHeight = self._point2ClientCoord(p1, p2)
-        # allow graph to overlap axis lines by adding units to w and h
-        dc.SetClippingRegion(ptx * self._pointSize[0],
-                             pty * self._pointSize[1],
-                             rectWidth * self._pointSize[0] + 2,
-                             rectHeight * self._pointSize[1] + 1)
-        # Draw the lines and markers
-#        start = _time.perf_counter()
-        graphics.draw(dc)
-#        time_str = "entire graphics drawing took: {} seconds"
-#        print(time_str.format(_time.perf_counter() - start))
-        # remove the clipping region
-        dc.DestroyClippingRegion()
+        if toScreen and self._pointSize == (1.0, 1.0):
+            rect = wx.Rect(int(ptx), int(pty), int(rectWidth), int(rectHeight) + 1)
+            self._plotArea = (rect, scale, shift)
+        if oldPlot is not None and self._canScrollPlotArea(oldPlotArea):
+            self._scrollPlotArea(dc, graphics, oldPlot, oldPlotArea)
+        else:
+            # allow graph to overlap axis lines by adding units to w and h
+            dc.SetClippingRegion(ptx * self._pointSize[0],
+                                 pty * self._pointSize[1],
+                                 rectWidth * self._pointSize[0] + 2,
+                                 rectHeight * self._pointSize[1] + 1)
+            # Draw the lines and markers
+#            start = _time.perf_counter()
+            graphics.draw(dc)
+#            time_str = "entire graphics drawing took: {} seconds"
+#            print(time_str.format(_time.perf_counter() - start))
+            # remove the clipping region
+            dc.DestroyClippingRegion()
 
         self._adjustScrollbars()
 
+    def _getBufferDC(self):
+        """Returns a DC that draws into the offscreen buffer."""
+        return wx.MemoryDC(self._Buffer)
+
+    def _adjustScrollbars(self):
+        """Updates the scrollbars after a draw, if there are any."""
+        pass
+
+    def _scrollMargin(self):
+        """Width of the plot area edges that hold the y axis and ticks."""
+        return int(np.ceil(np.max(np.abs(self.tickLengthPrinterScale)))) + 2
+
+    def _canScrollPlotArea(self, oldPlotArea):
+        """
+        True if the plot area only moved left by a whole number of pixels
+        since oldPlotArea was drawn, so its contents can be reused.
+        """
+        if self._plotArea is None:
+            return False
+        if self._centerLinesEnabled or self._diagonalsEnabled:
+            # these stay in place when the data scrolls
+            return False
+        rect, scale, shift = self._plotArea
+        oldRect, oldScale, oldShift = oldPlotArea
+        dx = oldShift[0] - shift[0]
+        return (rect == oldRect
+                and np.allclose(scale, oldScale)
+                and abs(shift[1] - oldShift[1]) < 1e-6
+                and abs(dx - round(dx)) < 1e-6
+                and 0 < round(dx) < rect.width - 2 * self._scrollMargin())
+
+    def _scrollPlotArea(self, dc, graphics, oldPlot, oldPlotArea):
+        """
+        Draws the previous plot area moved left, then draws the graphics
+        only in the newly exposed strip on the right and along the left
+        edge, which holds the y axis and ticks that must not move.
+        """
+        rect, scale, shift = self._plotArea
+        dx = int(round(oldPlotArea[2][0] - shift[0]))
+        margin = self._scrollMargin()
+        width = rect.width - 2 * margin - dx
+        dc.DrawBitmap(oldPlot.GetSubBitmap((margin + dx, 0, width, rect.height)),
+                      rect.x + margin, rect.y)
+        for left, right in ((rect.x, rect.x + margin),
+                            (rect.x + margin + width, rect.x + rect.width + 2)):
+            dc.SetClippingRegion(left, rect.y, right - left, rect.height)
+            graphics.draw(dc, span=(left, right))
+            dc.DestroyClippingRegion()
+
     def Redraw(self, dc=None):
         """Redraw the existing plot."""
         if self.last_draw is not None:
             graphics, xAxis, yAxis = self.last_draw
             self._Draw(graphics, xAxis, yAxis, dc)
 
-    def Clear(self):
-        """Erase the window."""
-        self.last_PointLabel = None  # reset pointLabel
-        dc = wx.BufferedDC(wx.ClientDC(self.canvas), self._Buffer)
-        bbr = wx.Brush(self.GetBackgroundColour(), wx.SOLID)
-        dc.SetBackground(bbr)
-        dc.SetBackgroundMode(wx.SOLID)
-        dc.Clear()
-        if self._antiAliasingEnabled:
-            try:
-                dc = wx.GCDC(dc)
-            except Exception:
-                pass
-        dc.SetTextForeground(self.GetForegroundColour())
-        dc.SetTextBackground(self.GetBackgroundColour())
-        self.last_draw = None
-
-    def Zoom(self, Center, Ratio):
-        """
-        Zoom on the plot
-        Centers on the X,Y coords given in Center
-        Zooms by the Ratio = (Xratio, Yratio) given
-        """
-        self.last_PointLabel = None  # reset maker
-        x, y = Center
-        if self.last_draw is not None:
-            (graphics, xAxis, yAxis) = self.last_draw
-            w = (xAxis[1] - xAxis[0]) * Ratio[0]
-            h = (yAxis[1] - yAxis[0]) * Ratio[1]
-            xAxis = (x - w / 2, x + w / 2)
-            yAxis = (y - h / 2, y + h / 2)
-            self._Draw(graphics, xAxis, yAxis)
-
     def GetClosestPoints(self, pntXY, pointScaled=True):
         """
         Returns list with
@@ -1996,8 +1516,8 @@ class PlotCanvas(wx.Panel):
         graphics, xAxis, yAxis = self.last_draw
         l = []
         for curveNum, obj in enumerate(graphics):
-            # check there are points in the curve
-            if len(obj.points) == 0:
+            # check there are points in the curve, without copying them
+            if len(obj.getPointIndex()) == 0:
                 continue  # go to next obj
             #[curveNum, legend, closest pt index, pointXY, scaledXY, dist]
             cn = ([curveNum] +
@@ -2027,237 +1547,41 @@ class PlotCanvas(wx.Panel):
         i = dists.index(mdist)  # index for min dist
         return closestPts[i]  # this is the closest point on closest curve
 
-    def UpdatePointLabel(self, mDataDict):
-        """
-        Updates the pointLabel point on screen with data contained in
-        mDataDict.
-
-        mDataDict will be passed to your function set by
-        SetPointLabelFunc.  It can contain anything you
-        want to display on the screen at the scaledXY point
-        you specify.
-
-        This function can be called from parent window with onClick,
-        onMotion events etc.
-        """
-        if self.last_PointLabel is not None:
-            # compare pointXY
-            if np.sometrue(
-                    mDataDict["pointXY"] != self.last_PointLabel["pointXY"]):
-                # closest changed
-                self._drawPointLabel(self.last_PointLabel)  # erase old
-                self._drawPointLabel(mDataDict)  # plot new
+    # Private Methods **************************************************
+    def _setSize(self, width=None, height=None):
+        """DC width and height."""
+        if width is None:
+            # the buffer has the size of the window, or of the rendered image
+            (self.width, self.height) = self._Buffer.GetSize()
         else:
-            # just plot new with no erase
-            self._drawPointLabel(mDataDict)  # plot new
-        # save for next erase
-        self.last_PointLabel = mDataDict
-
-    # event handlers **********************************
-    # TODO: some of these event handlers can be modified
-    #       Meaning: only bind the event if the item is enabled. Disable
-    #       the event when the item is disabled.
-    #
-    #       Example::
-    #
-    #           if self._zoomEnabled:
-    #               self.Bind(stuff)
-    #           else:
-    #               self.UnBind(stuff)   # or equivalent
-    #
-    #           def OnZoom(self, event):
-    #               # process zoom event.
-    #
-    #       What this change would do is remove most of the if statements
-    #       within these event handlers.
-    def OnMotion(self, event):
-        if self._zoomEnabled and event.LeftIsDown():
-            if self._hasDragged:
-                self._drawRubberBand(
-                    self._zoomCorner1, self._zoomCorner2)  # remove old
-            else:
-                self._hasDragged = True
-            self._zoomCorner2[0], self._zoomCorner2[1] = self._getXY(event)
-            self._drawRubberBand(
-                self._zoomCorner1, self._zoomCorner2)  # add new
-        elif self._dragEnabled and event.LeftIsDown():
-            coordinates = event.GetPosition()
-            newpos, oldpos = map(
-                np.array,
-                map(self.PositionScreenToUser,
-                    [coordinates, self._screenCoordinates]
-                    )
-            )
-            dist = newpos - oldpos
-            self._screenCoordinates = coordinates
+            self.width, self.height = width, height
+        self.width *= self._pointSize[0]  # high precision
+        self.height *= self._pointSize[1]  # high precision
+        self.plotbox_size = 0.97 * np.array([self.width, self.height])
+        xo = 0.5 * (self.width - self.plotbox_size[0])
+        yo = self.height - 0.5 * (self.height - self.plotbox_size[1])
+        self.plotbox_origin = np.array([xo, yo])
 
-            if self.last_draw is not None:
-                graphics, xAxis, yAxis = self.last_draw
-                yAxis -= dist[1]
-                xAxis -= dist[0]
-                self._Draw(graphics, xAxis, yAxis)
+    def _setPrinterScale(self, scale):
+        """Used to thicken lines and increase marker size for print out."""
+        # line thickness on printer is very thin at 600 dot/in. Markers small
+        self.printerScale = scale
 
-    def OnMouseLeftDown(self, event):
-        self._zoomCorner1[0], self._zoomCorner1[1] = self._getXY(event)
-        self._screenCoordinates = np.array(event.GetPosition())
-        if self._dragEnabled:
-            self.SetCursor(self.GrabHandCursor)
-            self.canvas.CaptureMouse()
+    def _drawLegend(self, dc, graphics, rhsW, topH, legendBoxWH,
+                    legendSymExt, legendTextExt):
+        """Draws legend symbols and text"""
+        # top right hand corner of graph box is ref corner
+        trhc = (self.plotbox_origin +
+                (self.plotbox_size - [rhsW, topH]) * [1, -1])
+        # border space between legend sym and graph box
+        legendLHS = .091 * legendBoxWH[0]
+        # 1.1 used as space between lines
+        lineHeight = max(legendSymExt[1], legendTextExt[1]) * 1.1
+        dc.SetFont(self._getFont(self._fontSizeLegend))
 
-    def OnMouseLeftUp(self, event):
-        if self._zoomEnabled:
-            if self._hasDragged is True:
-                self._drawRubberBand(
-                    self._zoomCorner1, self._zoomCorner2)  # remove old
-                self._zoomCorner2[0], self._zoomCorner2[1] = self._getXY(event)
-                self._hasDragged = False  # reset flag
-                minX, minY = np.minimum(self._zoomCorner1, self._zoomCorner2)
-                maxX, maxY = np.maximum(self._zoomCorner1, self._zoomCorner2)
-                self.last_PointLabel = None  # reset pointLabel
-                if self.last_draw is not None:
-                    self._Draw(self.last_draw[0],
-                               xAxis=(minX, maxX),
-                               yAxis=(minY, maxY),
-                               dc=None)
-            # else: # A box has not been drawn, zoom in on a point
-            # this interfered with the double click, so I've disables it.
-            #    X,Y = self._getXY(event)
-            #    self.Zoom( (X,Y), (self._zoomInFactor,self._zoomInFactor) )
-        if self._dragEnabled:
-            self.SetCursor(self.HandCursor)
-            if self.canvas.HasCapture():
-                self.canvas.ReleaseMouse()
-
-    def OnMouseDoubleClick(self, event):
-        if self._zoomEnabled:
-            # Give a little time for the click to be totally finished
-            # before (possibly) removing the scrollbars and trigering
-            # size events, etc.
-            wx.CallLater(200, self.Reset)
-
-    def OnMouseRightDown(self, event):
-        if self._zoomEnabled:
-            X, Y = self._getXY(event)
-            self.Zoom((X, Y), (self._zoomOutFactor, self._zoomOutFactor))
-
-    def OnPaint(self, event):
-        # All that is needed here is to draw the buffer to screen
-        if self.last_PointLabel is not None:
-            self._drawPointLabel(self.last_PointLabel)  # erase old
-            self.last_PointLabel = None
-        dc = wx.BufferedPaintDC(self.canvas, self._Buffer)
-        if self._antiAliasingEnabled:
-            try:
-                dc = wx.GCDC(dc)
-            except Exception:
-                pass
-
-    def OnSize(self, event):
-        # The Buffer init is done here, to make sure the buffer is always
-        # the same size as the Window
-        Size = self.canvas.GetClientSize()
-        Size.width = max(1, Size.width)
-        Size.height = max(1, Size.height)
-
-        # Make new offscreen bitmap: this bitmap will always have the
-        # current drawing in it, so it can be used to save the image to
-        # a file, or whatever.
-        self._Buffer = wx.Bitmap(Size.width, Size.height)
-        self._setSize()
-
-        self.last_PointLabel = None  # reset pointLabel
-
-        if self.last_draw is None:
-            self.Clear()
-        else:
-            graphics, xSpec, ySpec = self.last_draw
-            self._Draw(graphics, xSpec, ySpec)
-
-    def OnLeave(self, event):
-        """Used to erase pointLabel when mouse outside window"""
-        if self.last_PointLabel is not None:
-            self._drawPointLabel(self.last_PointLabel)  # erase old
-            self.last_PointLabel = None
-
-    def OnScroll(self, evt):
-        if not self._adjustingSB:
-            self._sb_ignore = True
-            sbpos = evt.GetPosition()
-
-            if evt.GetOrientation() == wx.VERTICAL:
-                fullrange = self.sb_vert.GetRange()
-                pagesize = self.sb_vert.GetPageSize()
-                sbpos = fullrange - pagesize - sbpos
-                dist = (sbpos * self._sb_yunit -
-                        (self._getYCurrentRange()[0] - self._sb_yfullrange[0]))
-                self.ScrollUp(dist)
-
-            if evt.GetOrientation() == wx.HORIZONTAL:
-                dist = (sbpos * self._sb_xunit -
-                        (self._getXCurrentRange()[0] - self._sb_xfullrange[0]))
-                self.ScrollRight(dist)
-
-    # Private Methods **************************************************
-    def _setSize(self, width=None, height=None):
-        """DC width and height."""
-        if width is None:
-            (self.width, self.height) = self.canvas.GetClientSize()
-        else:
-            self.width, self.height = width, height
-        self.width *= self._pointSize[0]  # high precision
-        self.height *= self._pointSize[1]  # high precision
-        self.plotbox_size = 0.97 * np.array([self.width, self.height])
-        xo = 0.5 * (self.width - self.plotbox_size[0])
-        yo = self.height - 0.5 * (self.height - self.plotbox_size[1])
-        self.plotbox_origin = np.array([xo, yo])
-
-    def _setPrinterScale(self, scale):
-        """Used to thicken lines and increase marker size for print out."""
-        # line thickness on printer is very thin at 600 dot/in. Markers small
-        self.printerScale = scale
-
-    def _printDraw(self, printDC):
-        """Used for printing."""
-        if self.last_draw is not None:
-            graphics, xSpec, ySpec = self.last_draw
-            self._Draw(graphics, xSpec, ySpec, printDC)
-
-    def _drawPointLabel(self, mDataDict):
-        """Draws and erases pointLabels"""
-        width = self._Buffer.GetWidth()
-        height = self._Buffer.GetHeight()
-        if sys.platform != "darwin":
-            tmp_Buffer = wx.Bitmap(width, height)
-            dcs = wx.MemoryDC()
-            dcs.SelectObject(tmp_Buffer)
-            dcs.Clear()
-        else:
-            tmp_Buffer = self._Buffer.GetSubBitmap((0, 0, width, height))
-            dcs = wx.MemoryDC(self._Buffer)
-        self._pointLabelFunc(dcs, mDataDict)  # custom user pointLabel func
-
-        dc = wx.ClientDC(self.canvas)
-        dc = wx.BufferedDC(dc, self._Buffer)
-        # this will erase if called twice
-        dc.Blit(0, 0, width, height, dcs, 0, 0, self._logicalFunction)
-        if sys.platform == "darwin":
-            self._Buffer = tmp_Buffer
-
-    def _drawLegend(self, dc, graphics, rhsW, topH, legendBoxWH,
-                    legendSymExt, legendTextExt):
-        """Draws legend symbols and text"""
-        # top right hand corner of graph box is ref corner
-        trhc = (self.plotbox_origin +
-                (self.plotbox_size - [rhsW, topH]) * [1, -1])
-        # border space between legend sym and graph box
-        legendLHS = .091 * legendBoxWH[0]
-        # 1.1 used as space between lines
-        lineHeight = max(legendSymExt[1], legendTextExt[1]) * 1.1
-        dc.SetFont(self._getFont(self._fontSizeLegend))
-
-        from .polyobjects import PolyLine
-        from .polyobjects import PolyMarker
-        from .polyobjects import PolyBoxPlot
+        from .polyobjects import PolyLine
+        from .polyobjects import PolyMarker
+        from .polyobjects import PolyBoxPlot
 
         for i in range(len(graphics)):
             o = graphics[i]
@@ -2320,18 +1644,6 @@ class PlotCanvas(wx.Panel):
             legendBoxWH = (maxW, maxH)
         return (legendBoxWH, symExt, txtExt)
 
-    def _drawRubberBand(self, corner1, corner2):
-        """Draws/erases rect box from corner1 to corner2"""
-        ptx, pty, rectWidth, rectHeight = self._point2ClientCoord(
-            corner1, corner2)
-        # draw rectangle
-        dc = wx.ClientDC(self.canvas)
-        dc.SetPen(wx.Pen(wx.BLACK))
-        dc.SetBrush(wx.Brush(wx.WHITE, wx.BRUSHSTYLE_TRANSPARENT))
-        dc.SetLogicalFunction(wx.INVERT)
-        dc.DrawRectangle(ptx, pty, rectWidth, rectHeight)
-        dc.SetLogicalFunction(wx.COPY)
-
     def _getFont(self, size):
         """Take font size, adjusts if printing and returns wx.Font"""
         s = size * self.printerScale * self._fontScale
@@ -2915,61 +2227,938 @@ class PlotCanvas(wx.Panel):
     _multiples = [(2., np.log10(2.)), (5., np.log10(5.))]
 
 
-    def _adjustScrollbars(self):
-        if self._sb_ignore:
-            self._sb_ignore = False
-            return
+class PlotCanvas(PlotDrawer, wx.Panel):
+    """
+    Creates a PlotCanvas object.
 
-        if not self.showScrollbars:
-            return
+    Subclass of a wx.Panel which holds two scrollbars and the actual
+    plotting canvas (self.canvas). It allows for simple general plotting
+    of data with zoom, labels, and automatic axis scaling.
 
-        self._adjustingSB = True
-        needScrollbars = False
+    This is the main window that you will want to import into your
+    application.
 
-        # horizontal scrollbar
-        r_current = self._getXCurrentRange()
-        r_max = list(self._getXMaxRange())
-        sbfullrange = float(self.sb_hor.GetRange())
+    Parameters for ``__init__`` are the same as any :class:`wx.Panel`.
+    """
 
-        r_max[0] = min(r_max[0], r_current[0])
-        r_max[1] = max(r_max[1], r_current[1])
+    def __init__(self, parent, id=wx.ID_ANY, pos=wx.DefaultPosition,
+                 size=wx.DefaultSize, style=0, name="plotCanvas"):
+        wx.Panel.__init__(self, parent, id, pos, size, style, name)
+        PlotDrawer.__init__(self)
 
-        self._sb_xfullrange = r_max
+        sizer = wx.FlexGridSizer(2, 2, 0, 0)
+        self.canvas = wx.Window(self, -1)
+        self.sb_vert = wx.ScrollBar(self, -1, style=wx.SB_VERTICAL)
+        self.sb_vert.SetScrollbar(0, 1000, 1000, 1000)
+        self.sb_hor = wx.ScrollBar(self, -1, style=wx.SB_HORIZONTAL)
+        self.sb_hor.SetScrollbar(0, 1000, 1000, 1000)
 
-        unit = (r_max[1] - r_max[0]) / float(self.sb_hor.GetRange())
-        pos = int((r_current[0] - r_max[0]) / unit)
+        sizer.Add(self.canvas, 1, wx.EXPAND)
+        sizer.Add(self.sb_vert, 0, wx.EXPAND)
+        sizer.Add(self.sb_hor, 0, wx.EXPAND)
+        sizer.Add((0, 0))
 
-        if pos >= 0:
-            pagesize = int((r_current[1] - r_current[0]) / unit)
+        self.sb_vert.Show(False)
+        self.sb_hor.Show(False)
 
-            self.sb_hor.SetScrollbar(pos, pagesize, sbfullrange, pagesize)
-            self._sb_xunit = unit
-            needScrollbars = needScrollbars or (pagesize != sbfullrange)
-        else:
-            self.sb_hor.SetScrollbar(0, 1000, 1000, 1000)
+        self.SetSizer(sizer)
+        sizer.AddGrowableRow(0, 1)
+        sizer.AddGrowableCol(0, 1)
+        self.Fit()
 
-        # vertical scrollbar
-        r_current = self._getYCurrentRange()
-        r_max = list(self._getYMaxRange())
-        sbfullrange = float(self.sb_vert.GetRange())
+        self.border = (1, 1)
 
-        r_max[0] = min(r_max[0], r_current[0])
-        r_max[1] = max(r_max[1], r_current[1])
+        self.SetBackgroundColour("white")
 
-        self._sb_yfullrange = r_max
+        # Create some mouse events for zooming
+        self.canvas.Bind(wx.EVT_LEFT_DOWN, self.OnMouseLeftDown)
+        self.canvas.Bind(wx.EVT_LEFT_UP, self.OnMouseLeftUp)
+        self.canvas.Bind(wx.EVT_MOTION, self.OnMotion)
+        self.canvas.Bind(wx.EVT_LEFT_DCLICK, self.OnMouseDoubleClick)
+        self.canvas.Bind(wx.EVT_RIGHT_DOWN, self.OnMouseRightDown)
 
-        unit = (r_max[1] - r_max[0]) / sbfullrange
-        pos = int((r_current[0] - r_max[0]) / unit)
+        # scrollbar events
+        self.Bind(wx.EVT_SCROLL_THUMBTRACK, self.OnScroll)
+        self.Bind(wx.EVT_SCROLL_PAGEUP, self.OnScroll)
+        self.Bind(wx.EVT_SCROLL_PAGEDOWN, self.OnScroll)
+        self.Bind(wx.EVT_SCROLL_LINEUP, self.OnScroll)
+        self.Bind(wx.EVT_SCROLL_LINEDOWN, self.OnScroll)
 
-        if pos >= 0:
-            pagesize = int((r_current[1] - r_current[0]) / unit)
-            pos = (sbfullrange - 1 - pos - pagesize)
-            self.sb_vert.SetScrollbar(pos, pagesize, sbfullrange, pagesize)
-            self._sb_yunit = unit
-            needScrollbars = needScrollbars or (pagesize != sbfullrange)
-        else:
-            self.sb_vert.SetScrollbar(0, 1000, 1000, 1000)
+        # set curser as cross-hairs
+        self.defaultCursor = wx.Cursor(wx.CURSOR_ARROW)
+        self.HandCursor = wx.Cursor(wx.CURSOR_SIZING)
+        self.GrabHandCursor = wx.Cursor(wx.CURSOR_SIZING)
+        self.MagCursor = wx.Cursor(wx.CURSOR_MAGNIFIER)
+        self.canvas.SetCursor(self.defaultCursor)
 
-        self.sb_hor.Show(needScrollbars)
-        self.sb_vert.Show(needScrollbars)
+        # Things for printing
+        self._print_data = None
+        self._pageSetupData = None
+        self.parent = parent
+
+        # scrollbar variables
+        self._sb_ignore = False
+        self._sb_show = False
         self._adjustingSB = False
+        self._sb_xfullrange = 0
+        self._sb_yfullrange = 0
+        self._sb_xunit = 0
+        self._sb_yunit = 0
+
+        self._screenCoordinates = np.array([0.0, 0.0])
+
+        # Zooming variables
+        self._zoomInFactor = 0.5
+        self._zoomOutFactor = 2
+        self._zoomCorner1 = np.array([0.0, 0.0])  # left mouse down corner
+        self._zoomCorner2 = np.array([0.0, 0.0])   # left mouse up corner
+        self._zoomEnabled = False
+        self._hasDragged = False
+        self._dragEnabled = False
+        self._followWidth = None
+
+        # pointLabels
+        self._pointLabelEnabled = False
+        self.last_PointLabel = None
+        self._pointLabelFunc = None
+        self.canvas.Bind(wx.EVT_LEAVE_WINDOW, self.OnLeave)
+        if sys.platform != "darwin":
+            self._logicalFunction = wx.EQUIV  # (NOT src) XOR dst
+        else:
+            # wx.EQUIV not supported on Mac OS X
+            self._logicalFunction = wx.COPY
+
+        self.canvas.Bind(wx.EVT_PAINT, self.OnPaint)
+        self.canvas.Bind(wx.EVT_SIZE, self.OnSize)
+        # OnSize called to make sure the buffer is initialized.
+        # This might result in OnSize getting called twice on some
+        # platforms at initialization, but little harm done.
+        self.OnSize(None)  # sets the initial size based on client size
+
+    def SetCursor(self, cursor):
+        self.canvas.SetCursor(cursor)
+
+    # SaveFile
+    def SaveFile(self, fileName=''):
+        """
+        Saves the file to the type specified in the extension. If no file
+        name is specified a dialog box is provided.  Returns True if
+        sucessful, otherwise False.
+
+        .bmp  Save a Windows bitmap file.
+        .xbm  Save an X bitmap file.
+        .xpm  Save an XPM bitmap file.
+        .png  Save a Portable Network Graphics file.
+        .jpg  Save a Joint Photographic Experts Group file.
+
+        """
+        extensions = {
+            "bmp": wx.BITMAP_TYPE_BMP,       # Save a Windows bitmap file.
+            "xbm": wx.BITMAP_TYPE_XBM,       # Save an X bitmap file.
+            "xpm": wx.BITMAP_TYPE_XPM,       # Save an XPM bitmap file.
+            "jpg": wx.BITMAP_TYPE_JPEG,      # Save a JPG file.
+            "png": wx.BITMAP_TYPE_PNG,       # Save a PNG file.
+        }
+
+        fType = fileName[-3:].lower()
+        dlg1 = None
+        while fType not in extensions:
+
+            msg_txt = ('File name extension\n'  # implicit str concat
+                       'must be one of\nbmp, xbm, xpm, png, or jpg')
+
+            if dlg1:               # FileDialog exists: Check for extension
+                dlg2 = wx.MessageDialog(self, msg_txt, 'File Name Error',
+                                        wx.OK | wx.ICON_ERROR)
+                try:
+                    dlg2.ShowModal()
+                finally:
+                    dlg2.Destroy()
+            # FileDialog doesn't exist: just check one
+            else:
+                msg_txt = ("Choose a file with extension bmp, "
+                           "gif, xbm, xpm, png, or jpg")
+                wildcard_str = ("BMP files (*.bmp)|*.bmp|XBM files (*.xbm)|"
+                                "*.xbm|XPM file (*.xpm)|*.xpm|"
+                                "PNG files (*.png)|*.png|"
+                                "JPG files (*.jpg)|*.jpg")
+                dlg1 = wx.FileDialog(self,
+                                     msg_txt,
+                                     ".",
+                                     "",
+                                     wildcard_str,
+                                     wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
+                                     )
+
+            if dlg1.ShowModal() == wx.ID_OK:
+                fileName = dlg1.GetPath()
+                fType = fileName[-3:].lower()
+            else:                      # exit without saving
+                dlg1.Destroy()
+                return False
+
+        if dlg1:
+            dlg1.Destroy()
+
+        # Save Bitmap
+        res = self._Buffer.SaveFile(fileName, extensions[fType])
+        return res
+
+    @property
+    def print_data(self):
+        if not self._print_data:
+            self._print_data = wx.PrintData()
+            self._print_data.SetPaperId(wx.PAPER_LETTER)
+            self._print_data.SetOrientation(wx.LANDSCAPE)
+        return self._print_data
+
+    @property
+    def pageSetupData(self):
+        if not self._pageSetupData:
+            self._pageSetupData = wx.PageSetupDialogData()
+            self._pageSetupData.SetMarginBottomRight((25, 25))
+            self._pageSetupData.SetMarginTopLeft((25, 25))
+            self._pageSetupData.SetPrintData(self.print_data)
+        return self._pageSetupData
+
+    def PageSetup(self):
+        """Brings up the page setup dialog"""
+        data = self.pageSetupData
+        data.SetPrintData(self.print_data)
+        dlg = wx.PageSetupDialog(self.parent, data)
+        try:
+            if dlg.ShowModal() == wx.ID_OK:
+                data = dlg.GetPageSetupData()
+                # updates page parameters from dialog
+                self.pageSetupData.SetMarginBottomRight(
+                    data.GetMarginBottomRight())
+                self.pageSetupData.SetMarginTopLeft(data.GetMarginTopLeft())
+                self.pageSetupData.SetPrintData(data.GetPrintData())
+                self._print_data = wx.PrintData(
+                    data.GetPrintData())  # updates print_data
+        finally:
+            dlg.Destroy()
+
+    def Printout(self, paper=None):
+        """Print current plot."""
+        if paper is not None:
+            self.print_data.SetPaperId(paper)
+        pdd = wx.PrintDialogData(self.print_data)
+        printer = wx.Printer(pdd)
+        out = PlotPrintout(self)
+        print_ok = printer.Print(self.parent, out)
+        if print_ok:
+            self._print_data = wx.PrintData(
+                printer.GetPrintDialogData().GetPrintData())
+        out.Destroy()
+
+    def PrintPreview(self):
+        """Print-preview current plot."""
+        printout = PlotPrintout(self)
+        printout2 = PlotPrintout(self)
+        self.preview = wx.PrintPreview(printout, printout2, self.print_data)
+        if not self.preview.IsOk():
+            wx.MessageDialog(self, "Print Preview failed.\n"
+                             "Check that default printer is configured\n",
+                             "Print error", wx.OK | wx.CENTRE).ShowModal()
+        self.preview.SetZoom(40)
+        # search up tree to find frame instance
+        frameInst = self
+        while not isinstance(frameInst, wx.Frame):
+            frameInst = frameInst.GetParent()
+        frame = wx.PreviewFrame(self.preview, frameInst, "Preview")
+        frame.Initialize()
+        frame.SetPosition(self.GetPosition())
+        frame.SetSize((600, 550))
+        frame.Centre(wx.BOTH)
+        frame.Show(True)
+
+    def SetShowScrollbars(self, value):
+        """
+        Set the showScrollbars value.
+
+        .. deprecated:: Feb 27, 2016
+
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.showScrollbars`
+           property instead.
+        """
+        pendingDeprecation("self.showScrollbars property")
+        self.showScrollbars = value
+
+    def GetShowScrollbars(self):
+        """
+        Get the showScrollbars value.
+
+        .. deprecated:: Feb 27, 2016
+
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.showScrollbars`
+           property instead.
+        """
+        pendingDeprecation("self.showScrollbars property")
+        return self.showScrollbars
+
+    @property
+    def showScrollbars(self):
+        """
+        The current showScrollbars value.
+
+        :getter: Returns the value of showScrollbars.
+        :setter: Sets the value of showScrollbars.
+        :type:   bool
+        :raises: `TypeError` if setting a non-boolean value.
+        """
+        return self._sb_show
+
+    @showScrollbars.setter
+    def showScrollbars(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("Value should be True or False")
+        if value == self._sb_show:
+            # no change, so don't do anything
+            return
+        self._sb_show = value
+        self.sb_vert.Show(value)
+        self.sb_hor.Show(value)
+
+        def _do_update():
+            self.Layout()
+            self._adjustScrollbars()
+        wx.CallAfter(_do_update)
+
+    def SetEnableDrag(self, value):
+        """
+        Set the enableDrag value.
+
+        .. deprecated:: Feb 27, 2016
+
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableDrag`
+           property instead.
+        """
+        pendingDeprecation("self.enableDrag property")
+        self.enableDrag = value
+
+    def GetEnableDrag(self):
+        """
+        Get the enableDrag value.
+
+        .. deprecated:: Feb 27, 2016
+
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableDrag`
+           property instead.
+        """
+        pendingDeprecation("self.enableDrag property")
+        return self.enableDrag
+
+    @property
+    def enableDrag(self):
+        """
+        The current enableDrag value.
+
+        :getter: Returns the value of enableDrag.
+        :setter: Sets the value of enableDrag.
+        :type:   bool
+        :raises: `TypeError` if setting a non-boolean value.
+
+        .. note::
+           This is mutually exclusive with
+           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableZoom`. Setting
+           one will disable the other.
+
+        .. seealso::
+           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableZoom`
+        """
+        return self._dragEnabled
+
+    @enableDrag.setter
+    def enableDrag(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("Value must be a bool.")
+        if value:
+            if self.enableZoom:
+                self.enableZoom = False
+            self.SetCursor(self.HandCursor)
+        else:
+            self.SetCursor(self.defaultCursor)
+        self._dragEnabled = value
+
+    def SetEnableZoom(self, value):
+        """
+        Set the enableZoom value.
+
+        .. deprecated:: Feb 27, 2016
+
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableZoom`
+           property instead.
+        """
+        pendingDeprecation("self.enableZoom property")
+        self.enableZoom = value
+
+    def GetEnableZoom(self):
+        """
+        Get the enableZoom value.
+
+        .. deprecated:: Feb 27, 2016
+
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableZoom`
+           property instead.
+        """
+        pendingDeprecation("self.enableZoom property")
+        return self.enableZoom
+
+    @property
+    def enableZoom(self):
+        """
+        The current enableZoom value.
+
+        :getter: Returns the value of enableZoom.
+        :setter: Sets the value of enableZoom.
+        :type:   bool
+        :raises: `TypeError` if setting a non-boolean value.
+
+        .. note::
+           This is mutually exclusive with
+           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableDrag`. Setting
+           one will disable the other.
+
+        .. seealso::
+           :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enableDrag`
+        """
+        return self._zoomEnabled
+
+    @enableZoom.setter
+    def enableZoom(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("Value must be a bool.")
+        if value:
+            if self.enableDrag:
+                self.enableDrag = False
+            self.SetCursor(self.MagCursor)
+        else:
+            self.SetCursor(self.defaultCursor)
+        self._zoomEnabled = value
+
+    def SetEnablePointLabel(self, value):
+        """
+        Set the enablePointLabel value.
+
+        .. deprecated:: Feb 27, 2016
+
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enablePointLabel`
+           property instead.
+        """
+        pendingDeprecation("self.enablePointLabel property")
+        self.enablePointLabel = value
+
+    def GetEnablePointLabel(self):
+        """
+        Set the enablePointLabel value.
+
+        .. deprecated:: Feb 27, 2016
+
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enablePointLabel`
+           property instead.
+        """
+        pendingDeprecation("self.enablePointLabel property")
+        return self.enablePointLabel
+
+    @property
+    def enablePointLabel(self):
+        """
+        The current enablePointLabel value.
+
+        :getter: Returns the value of enablePointLabel.
+        :setter: Sets the value of enablePointLabel.
+        :type:   bool
+        :raises: `TypeError` if setting a non-boolean value.
+        """
+        return self._pointLabelEnabled
+
+    @enablePointLabel.setter
+    def enablePointLabel(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("Value must be a bool.")
+        self._pointLabelEnabled = value
+        self.Redraw()  # will erase existing pointLabel if present
+        self.last_PointLabel = None
+
+    def SetPointLabelFunc(self, func):
+        """
+        Set the enablePointLabel value.
+
+        .. deprecated:: Feb 27, 2016
+
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enablePointLabel`
+           property instead.
+        """
+        pendingDeprecation("self.pointLabelFunc property")
+        self.pointLabelFunc = func
+
+    def GetPointLabelFunc(self):
+        """
+        Get the enablePointLabel value.
+
+        .. deprecated:: Feb 27, 2016
+
+           Use the :attr:`~wx.lib.plot.plotcanvas.PlotCanvas.enablePointLabel`
+           property instead.
+        """
+        pendingDeprecation("self.pointLabelFunc property")
+        return self.pointLabelFunc
+
+    @property
+    def pointLabelFunc(self):
+        """
+        The current pointLabelFunc value.
+
+        :getter: Returns the value of pointLabelFunc.
+        :setter: Sets the value of pointLabelFunc.
+        :type:   function
+
+        TODO: More information is needed.
+        Sets the function with custom code for pointLabel drawing
+        """
+        return self._pointLabelFunc
+
+    @pointLabelFunc.setter
+    def pointLabelFunc(self, func):
+        self._pointLabelFunc = func
+
+    @property
+    def followWidth(self):
+        """
+        The width of the X axis range, in user units, that :meth:`Append`
+        keeps showing as it scrolls to follow the newest data, or ``None``
+        to not follow the data.
+
+        :getter: Returns the value of followWidth.
+        :setter: Sets the value of followWidth.
+        :type:   float or None
+        :raises: `ValueError` if setting a width that is not positive.
+        """
+        return self._followWidth
+
+    @followWidth.setter
+    def followWidth(self, width):
+        if width is not None and width <= 0:
+            raise ValueError("`width` must be positive or None")
+        self._followWidth = width
+
+    def Reset(self):
+        """Unzoom the plot."""
+        self.last_PointLabel = None  # reset pointLabel
+        if self.last_draw is not None:
+            self._Draw(self.last_draw[0])
+
+    def ScrollRight(self, units):
+        """Move view right number of axis units."""
+        self.last_PointLabel = None  # reset pointLabel
+        if self.last_draw is not None:
+            graphics, xAxis, yAxis = self.last_draw
+            xAxis = (xAxis[0] + units, xAxis[1] + units)
+            self._Draw(graphics, xAxis, yAxis)
+
+    def ScrollUp(self, units):
+        """Move view up number of axis units."""
+        self.last_PointLabel = None  # reset pointLabel
+        if self.last_draw is not None:
+            graphics, xAxis, yAxis = self.last_draw
+            yAxis = (yAxis[0] + units, yAxis[1] + units)
+            self._Draw(graphics, xAxis, yAxis)
+
+    def GetXY(self, event):
+        """Wrapper around _getXY, which handles log scales"""
+        x, y = self._getXY(event)
+        if self.logScale[0]:
+            x = np.power(10, x)
+        if self.logScale[1]:
+            y = np.power(10, y)
+        return x, y
+
+    def _getXY(self, event):
+        """Takes a mouse event and returns the XY user axis values."""
+        x, y = self.PositionScreenToUser(event.GetPosition())
+        return x, y
+
+    def _drawStreamTail(self, graphics, series, count):
+        """
+        Draws just the last count points of series, and the segment that
+        joins them to the rest, when the axes have not changed.
+        """
+        rect, scale, shift = self._plotArea
+        series.scaleAndShift(scale, shift)
+        left = series.scaled[-count - 1][0]
+        dc = wx.BufferedDC(wx.ClientDC(self.canvas), self._Buffer)
+        if self._antiAliasingEnabled:
+            try:
+                dc = wx.GCDC(dc)
+            except Exception:
+                pass
+        dc.SetClippingRegion(rect.x, rect.y, rect.width + 2, rect.height)
+        series._pointSize = graphics._pointSize
+        series.draw(dc, graphics.printerScale,
+                    span=(np.nextafter(left, np.inf), rect.x + rect.width + 2))
+        dc.DestroyClippingRegion()
+
+    def Append(self, series, xs, ys):
+        """
+        Append points to a :class:`~wx.lib.plot.PolyStream` and update the
+        plot.
+
+        If the series is part of the graphics currently drawn, only the new
+        points are drawn as long as they fall within the current axes. When
+        :attr:`followWidth` is set, the X axis scrolls to keep the newest
+        points in view; the existing plot area is then moved instead of
+        being redrawn, and only the exposed strip is drawn. Otherwise the
+        axes are recalculated, as :meth:`Draw` would, once points fall
+        outside of them.
+
+        :param series: The series to append to.
+        :type series: :class:`~wx.lib.plot.PolyStream`
+        :param xs: The X values of the new points.
+        :type xs: sequence or :class:`np.array` of floats
+        :param ys: The Y values of the new points.
+        :type ys: sequence or :class:`np.array` of floats
+        """
+        count = len(np.atleast_1d(xs))
+        series.append(xs, ys)
+        if self.last_draw is None or count == 0:
+            return
+        graphics, xAxis, yAxis = self.last_draw
+        if series not in graphics.objects:
+            return
+        self.last_PointLabel = None  # reset pointLabel
+
+        p1, p2 = graphics.boundingBox()
+        newXAxis, newYAxis = xAxis, yAxis
+        scroll = False
+        if (self._followWidth is not None and not self.logScale[0]
+                and self._plotArea is not None):
+            width = xAxis[1] - xAxis[0]
+            if not np.isclose(width, self._followWidth):
+                newXAxis = np.array((p2[0] - self._followWidth, p2[0]))
+            elif p2[0] > xAxis[1]:
+                # move by whole pixels so the plot area can be reused
+                pixelsPerUnit = self._plotArea[1][0]
+                dx = np.ceil((p2[0] - xAxis[1]) * pixelsPerUnit) / pixelsPerUnit
+                newXAxis = xAxis + dx
+                scroll = True
+        elif p1[0] < xAxis[0] or p2[0] > xAxis[1]:
+            newXAxis = np.array(self._axisInterval(self._xSpec, p1[0], p2[0]))
+        if p1[1] < yAxis[0] or p2[1] > yAxis[1]:
+            newYAxis = np.array(self._axisInterval(self._ySpec, p1[1], p2[1]))
+            scroll = False
+
+        if (newXAxis is xAxis and newYAxis is yAxis
+                and self._plotArea is not None and count < len(series)
+                and not series._transformed()):
+            self._drawStreamTail(graphics, series, min(count, len(series) - 1))
+        else:
+            self._Draw(graphics, tuple(newXAxis), tuple(newYAxis), scroll=scroll)
+
+    def Clear(self):
+        """Erase the window."""
+        self.last_PointLabel = None  # reset pointLabel
+        dc = wx.BufferedDC(wx.ClientDC(self.canvas), self._Buffer)
+        bbr = wx.Brush(self.GetBackgroundColour(), wx.SOLID)
+        dc.SetBackground(bbr)
+        dc.SetBackgroundMode(wx.SOLID)
+        dc.Clear()
+        if self._antiAliasingEnabled:
+            try:
+                dc = wx.GCDC(dc)
+            except Exception:
+                pass
+        dc.SetTextForeground(self.GetForegroundColour())
+        dc.SetTextBackground(self.GetBackgroundColour())
+        self.last_draw = None
+        self._plotArea = None
+
+    def Zoom(self, Center, Ratio):
+        """
+        Zoom on the plot
+        Centers on the X,Y coords given in Center
+        Zooms by the Ratio = (Xratio, Yratio) given
+        """
+        self.last_PointLabel = None  # reset maker
+        x, y = Center
+        if self.last_draw is not None:
+            (graphics, xAxis, yAxis) = self.last_draw
+            w = (xAxis[1] - xAxis[0]) * Ratio[0]
+            h = (yAxis[1] - yAxis[0]) * Ratio[1]
+            xAxis = (x - w / 2, x + w / 2)
+            yAxis = (y - h / 2, y + h / 2)
+            self._Draw(graphics, xAxis, yAxis)
+
+    def UpdatePointLabel(self, mDataDict):
+        """
+        Updates the pointLabel point on screen with data contained in
+        mDataDict.
+
+        mDataDict will be passed to your function set by
+        SetPointLabelFunc.  It can contain anything you
+        want to display on the screen at the scaledXY point
+        you specify.
+
+        This function can be called from parent window with onClick,
+        onMotion events etc.
+        """
+        if self.last_PointLabel is not None:
+            # compare pointXY
+            if np.sometrue(
+                    mDataDict["pointXY"] != self.last_PointLabel["pointXY"]):
+                # closest changed
+                self._drawPointLabel(self.last_PointLabel)  # erase old
+                self._drawPointLabel(mDataDict)  # plot new
+        else:
+            # just plot new with no erase
+            self._drawPointLabel(mDataDict)  # plot new
+        # save for next erase
+        self.last_PointLabel = mDataDict
+
+    # event handlers **********************************
+    # TODO: some of these event handlers can be modified
+    #       Meaning: only bind the event if the item is enabled. Disable
+    #       the event when the item is disabled.
+    #
+    #       Example::
+    #
+    #           if self._zoomEnabled:
+    #               self.Bind(stuff)
+    #           else:
+    #               self.UnBind(stuff)   # or equivalent
+    #
+    #           def OnZoom(self, event):
+    #               # process zoom event.
+    #
+    #       What this change would do is remove most of the if statements
+    #       within these event handlers.
+    def OnMotion(self, event):
+        if self._zoomEnabled and event.LeftIsDown():
+            if self._hasDragged:
+                self._drawRubberBand(
+                    self._zoomCorner1, self._zoomCorner2)  # remove old
+            else:
+                self._hasDragged = True
+            self._zoomCorner2[0], self._zoomCorner2[1] = self._getXY(event)
+            self._drawRubberBand(
+                self._zoomCorner1, self._zoomCorner2)  # add new
+        elif self._dragEnabled and event.LeftIsDown():
+            coordinates = event.GetPosition()
+            newpos, oldpos = map(
+                np.array,
+                map(self.PositionScreenToUser,
+                    [coordinates, self._screenCoordinates]
+                    )
+            )
+            dist = newpos - oldpos
+            self._screenCoordinates = coordinates
+
+            if self.last_draw is not None:
+                graphics, xAxis, yAxis = self.last_draw
+                yAxis -= dist[1]
+                xAxis -= dist[0]
+                self._Draw(graphics, xAxis, yAxis)
+
+    def OnMouseLeftDown(self, event):
+        self._zoomCorner1[0], self._zoomCorner1[1] = self._getXY(event)
+        self._screenCoordinates = np.array(event.GetPosition())
+        if self._dragEnabled:
+            self.SetCursor(self.GrabHandCursor)
+            self.canvas.CaptureMouse()
+
+    def OnMouseLeftUp(self, event):
+        if self._zoomEnabled:
+            if self._hasDragged is True:
+                self._drawRubberBand(
+                    self._zoomCorner1, self._zoomCorner2)  # remove old
+                self._zoomCorner2[0], self._zoomCorner2[1] = self._getXY(event)
+                self._hasDragged = False  # reset flag
+                minX, minY = np.minimum(self._zoomCorner1, self._zoomCorner2)
+                maxX, maxY = np.maximum(self._zoomCorner1, self._zoomCorner2)
+                self.last_PointLabel = None  # reset pointLabel
+                if self.last_draw is not None:
+                    self._Draw(self.last_draw[0],
+                               xAxis=(minX, maxX),
+                               yAxis=(minY, maxY),
+                               dc=None)
+            # else: # A box has not been drawn, zoom in on a point
+            # this interfered with the double click, so I've disables it.
+            #    X,Y = self._getXY(event)
+            #    self.Zoom( (X,Y), (self._zoomInFactor,self._zoomInFactor) )
+        if self._dragEnabled:
+            self.SetCursor(self.HandCursor)
+            if self.canvas.HasCapture():
+                self.canvas.ReleaseMouse()
+
+    def OnMouseDoubleClick(self, event):
+        if self._zoomEnabled:
+            # Give a little time for the click to be totally finished
+            # before (possibly) removing the scrollbars and trigering
+            # size events, etc.
+            wx.CallLater(200, self.Reset)
+
+    def OnMouseRightDown(self, event):
+        if self._zoomEnabled:
+            X, Y = self._getXY(event)
+            self.Zoom((X, Y), (self._zoomOutFactor, self._zoomOutFactor))
+
+    def OnPaint(self, event):
+        # All that is needed here is to draw the buffer to screen
+        if self.last_PointLabel is not None:
+            self._drawPointLabel(self.last_PointLabel)  # erase old
+            self.last_PointLabel = None
+        dc = wx.BufferedPaintDC(self.canvas, self._Buffer)
+        if self._antiAliasingEnabled:
+            try:
+                dc = wx.GCDC(dc)
+            except Exception:
+                pass
+
+    def OnSize(self, event):
+        # The Buffer init is done here, to make sure the buffer is always
+        # the same size as the Window
+        Size = self.canvas.GetClientSize()
+        Size.width = max(1, Size.width)
+        Size.height = max(1, Size.height)
+
+        # Make new offscreen bitmap: this bitmap will always have the
+        # current drawing in it, so it can be used to save the image to
+        # a file, or whatever.
+        self._Buffer = wx.Bitmap(Size.width, Size.height)
+        self._setSize()
+
+        self.last_PointLabel = None  # reset pointLabel
+
+        if self.last_draw is None:
+            self.Clear()
+        else:
+            graphics, xSpec, ySpec = self.last_draw
+            self._Draw(graphics, xSpec, ySpec)
+
+    def OnLeave(self, event):
+        """Used to erase pointLabel when mouse outside window"""
+        if self.last_PointLabel is not None:
+            self._drawPointLabel(self.last_PointLabel)  # erase old
+            self.last_PointLabel = None
+
+    def OnScroll(self, evt):
+        if not self._adjustingSB:
+            self._sb_ignore = True
+            sbpos = evt.GetPosition()
+
+            if evt.GetOrientation() == wx.VERTICAL:
+                fullrange = self.sb_vert.GetRange()
+                pagesize = self.sb_vert.GetPageSize()
+                sbpos = fullrange - pagesize - sbpos
+                dist = (sbpos * self._sb_yunit -
+                        (self._getYCurrentRange()[0] - self._sb_yfullrange[0]))
+                self.ScrollUp(dist)
+
+            if evt.GetOrientation() == wx.HORIZONTAL:
+                dist = (sbpos * self._sb_xunit -
+                        (self._getXCurrentRange()[0] - self._sb_xfullrange[0]))
+                self.ScrollRight(dist)
+
+    # Private Methods **************************************************
+    def _getBufferDC(self):
+        """Returns a DC that draws into the buffer and on the window."""
+        return wx.BufferedDC(wx.ClientDC(self.canvas), self._Buffer)
+
+    def _printDraw(self, printDC):
+        """Used for printing."""
+        if self.last_draw is not None:
+            graphics, xSpec, ySpec = self.last_draw
+            self._Draw(graphics, xSpec, ySpec, printDC)
+
+    def _drawPointLabel(self, mDataDict):
+        """Draws and erases pointLabels"""
+        width = self._Buffer.GetWidth()
+        height = self._Buffer.GetHeight()
+        if sys.platform != "darwin":
+            tmp_Buffer = wx.Bitmap(width, height)
+            dcs = wx.MemoryDC()
+            dcs.SelectObject(tmp_Buffer)
+            dcs.Clear()
+        else:
+            tmp_Buffer = self._Buffer.GetSubBitmap((0, 0, width, height))
+            dcs = wx.MemoryDC(self._Buffer)
+        self._pointLabelFunc(dcs, mDataDict)  # custom user pointLabel func
+
+        dc = wx.ClientDC(self.canvas)
+        dc = wx.BufferedDC(dc, self._Buffer)
+        # this will erase if called twice
+        dc.Blit(0, 0, width, height, dcs, 0, 0, self._logicalFunction)
+        if sys.platform == "darwin":
+            self._Buffer = tmp_Buffer
+
+    def _drawRubberBand(self, corner1, corner2):
+        """Draws/erases rect box from corner1 to corner2"""
+        ptx, pty, rectWidth, rectHeight = self._point2ClientCoord(
+            corner1, corner2)
+        # draw rectangle
+        dc = wx.ClientDC(self.canvas)
+        dc.SetPen(wx.Pen(wx.BLACK))
+        dc.SetBrush(wx.Brush(wx.WHITE, wx.BRUSHSTYLE_TRANSPARENT))
+        dc.SetLogicalFunction(wx.INVERT)
+        dc.DrawRectangle(ptx, pty, rectWidth, rectHeight)
+        dc.SetLogicalFunction(wx.COPY)
+
+    def _adjustScrollbars(self):
+        if self._sb_ignore:
+            self._sb_ignore = False
+            return
+
+        if not self.showScrollbars:
+            return
+
+        self._adjustingSB = True
+        needScrollbars = False
+
+        # horizontal scrollbar
+        r_current = self._getXCurrentRange()
+        r_max = list(self._getXMaxRange())
+        sbfullrange = float(self.sb_hor.GetRange())
+
+        r_max[0] = min(r_max[0], r_current[0])
+        r_max[1] = max(r_max[1], r_current[1])
+
+        self._sb_xfullrange = r_max
+
+        unit = (r_max[1] - r_max[0]) / float(self.sb_hor.GetRange())
+        pos = int((r_current[0] - r_max[0]) / unit)
+
+        if pos >= 0:
+            pagesize = int((r_current[1] - r_current[0]) / unit)
+
+            self.sb_hor.SetScrollbar(pos, pagesize, sbfullrange, pagesize)
+            self._sb_xunit = unit
+            needScrollbars = needScrollbars or (pagesize != sbfullrange)
+        else:
+            self.sb_hor.SetScrollbar(0, 1000, 1000, 1000)
+
+        # vertical scrollbar
+        r_current = self._getYCurrentRange()
+        r_max = list(self._getYMaxRange())
+        sbfullrange = float(self.sb_vert.GetRange())
+
+        r_max[0] = min(r_max[0], r_current[0])
+        r_max[1] = max(r_max[1], r_current[1])
+
+        self._sb_yfullrange = r_max
+
+        unit = (r_max[1] - r_max[0]) / sbfullrange
+        pos = int((r_current[0] - r_max[0]) / unit)
+
+        if pos >= 0:
+            pagesize = int((r_current[1] - r_current[0]) / unit)
+            pos = (sbfullrange - 1 - pos - pagesize)
+            self.sb_vert.SetScrollbar(pos, pagesize, sbfullrange, pagesize)
+            self._sb_yunit = unit
+            needScrollbars = needScrollbars or (pagesize != sbfullrange)
+        else:
+            self.sb_vert.SetScrollbar(0, 1000, 1000, 1000)
+
+        self.sb_hor.Show(needScrollbars)
+        self.sb_vert.Show(needScrollbars)
+        self._adjustingSB = False
+
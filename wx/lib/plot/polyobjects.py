@@ -16,6 +16,7 @@ __docformat__ = "restructuredtext en"
 import time as _time
 import wx
 import warnings
+from collections import deque
 from collections import namedtuple
 
 # Third-Party
@@ -34,6 +35,7 @@ except:
 from .utils import pendingDeprecation
 from .utils import TempStyle
 from .utils import pairwise
+from .utils import NearestPointIndex
 
 
 class PolyPoints(object):
@@ -50,6 +52,7 @@ class PolyPoints(object):
     """
 
     def __init__(self, points, attr):
+        self._index = None
         self._points = np.array(points).astype(np.float64)
         self._logscale = (False, False)
         self._absScale = (False, False)
@@ -84,6 +87,7 @@ class PolyPoints(object):
         if not isinstance(logscale, tuple) or len(logscale) != 2:
             raise ValueError("`logscale` must be a 2-tuple of bools")
         self._logscale = logscale
+        self._index = None
 
     def setLogScale(self, logscale):
         """
@@ -98,6 +102,7 @@ class PolyPoints(object):
         """
         pendingDeprecation("self.logScale property")
         self._logscale = logscale
+        self._index = None
 
     @property
     def symLogScale(self):
@@ -210,6 +215,7 @@ class PolyPoints(object):
         if not isinstance(absscale, tuple) and len(absscale) == 2:
             raise ValueError("`absscale` must be a 2-tuple of bools")
         self._absScale = absscale
+        self._index = None
 
     @property
     def points(self):
@@ -258,6 +264,7 @@ class PolyPoints(object):
     @points.setter
     def points(self, points):
         self._points = points
+        self._index = None
 
     def _log10(self, data, index):
         """ Take the Log10 of the data, dropping any negative values """
@@ -321,6 +328,19 @@ class PolyPoints(object):
     def getLegend(self):
         return self.attributes['legend']
 
+    def getPointIndex(self):
+        """
+        Returns the :class:`~wx.lib.plot.utils.NearestPointIndex` of the
+        points, as returned by :attr:`points`.
+
+        The index is built on the first call, and kept until the points or
+        the log and abs scale options are changed. Points modified in place
+        are not noticed: set :attr:`points` again after changing them.
+        """
+        if self._index is None:
+            self._index = NearestPointIndex(self.points)
+        return self._index
+
     def getClosestPoint(self, pntXY, pointScaled=True):
         """
         Returns the index of closest point on the curve, pointXY,
@@ -328,21 +348,21 @@ class PolyPoints(object):
 
         if pointScaled == True, then based on screen coords
         if pointScaled == False, then based on user coords
+
+        The search uses the index from :meth:`getPointIndex`, so it does not
+        measure the distance to every point.
         """
+        index = self.getPointIndex()
         if pointScaled:
-            # Using screen coords
-            p = self.scaled
-            pxy = self.currentScale * np.array(pntXY) + self.currentShift
+            # Using screen coords: the distances are the user distances
+            # multiplied by the scale of each axis
+            weights = self.currentScale
         else:
             # Using user coords
-            p = self.points
-            pxy = np.array(pntXY)
-        # determine distance for each point
-        d = np.sqrt(np.add.reduce((p - pxy) ** 2, 1))  # sqrt(dx^2+dy^2)
-        pntIndex = np.argmin(d)
-        dist = d[pntIndex]
+            weights = (1, 1)
+        pntIndex, dist = index.nearest(pntXY, weights)
         return [pntIndex,
-                self.points[pntIndex],
+                index.points[pntIndex],
                 self.scaled[pntIndex] / self._pointSize,
                 dist]
 
@@ -421,12 +441,18 @@ class PolyLine(PolyPoints):
         pen.SetCap(wx.CAP_BUTT)
         dc.SetPen(pen)
         if coord is None:
-            if len(self.scaled):  # bugfix for Mac OS X
-                for c1, c2 in zip(self.scaled, self.scaled[1:]):
-                    self._path(dc, c1, c2, drawstyle)
+            self._drawPath(dc, self.scaled, drawstyle)
         else:
             dc.DrawLines(coord)  # draw legend line
 
+    def _drawPath(self, dc, scaled, drawstyle):
+        """
+        Draws the connectors between the given scaled points.
+        """
+        if len(scaled):  # bugfix for Mac OS X
+            for c1, c2 in zip(scaled, scaled[1:]):
+                self._path(dc, c1, c2, drawstyle)
+
     def getSymExtent(self, printerScale):
         """
         Get the Width and Height of the symbol.
@@ -528,6 +554,233 @@ class PolySpline(PolyLine):
             dc.DrawLines(coord)  # draw legend line
 
 
+class PolyStream(PolyLine):
+    """
+    Creates a PolyStream object: a line whose points are kept in a
+    fixed-capacity ring buffer, for plotting live data.
+
+    New samples are added with :meth:`append`; once ``capacity`` points are
+    held, the oldest ones are dropped. Appending does not reallocate the
+    point data, the bounding box is maintained incrementally and only the
+    new points are scaled on the next draw when the axes have not changed.
+
+    The X values are expected to increase monotonically, as they do for
+    time series; this lets the canvas redraw just part of the series when
+    it scrolls. See :meth:`~wx.lib.plot.PlotCanvas.Append`.
+
+    :param capacity: The maximum number of points held
+    :type capacity: int
+    :param points: The initial points, if any
+    :type points: list of ``[x, y]`` values
+    :param **attr: keyword attributes, as for :class:`PolyLine`
+
+    .. warning::
+
+       All methods except ``__init__`` and ``append`` are private.
+    """
+
+    def __init__(self, capacity, points=(), **attr):
+        if capacity < 1:
+            raise ValueError("`capacity` must be at least 1")
+        self._capacity = int(capacity)
+        # The buffer holds twice the capacity, so that the current points
+        # are always a contiguous slice of it and the old ones only have to
+        # be moved back to the start once every ``capacity`` samples.
+        self._buffer = np.empty((2 * self._capacity, 2), dtype=np.float64)
+        self._scaledBuffer = np.empty_like(self._buffer)
+        # Bounds are kept per chunk of samples as
+        # [first sample, end sample, minXY, maxXY], sample numbers counting
+        # every point ever appended.
+        self._chunkSize = max(1, self._capacity // 64)
+        self._span = None
+        PolyLine.__init__(self, points, **attr)
+
+    @property
+    def _points(self):
+        return self._buffer[self._start:self._end]
+
+    @_points.setter
+    def _points(self, points):
+        self._index = None
+        self._start = self._end = 0
+        self._total = 0
+        self._scaledFrom = 0
+        self._chunks = deque()
+        self.currentScale = (1, 1)
+        self.currentShift = (0, 0)
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self.append(points[:, 0], points[:, 1])
+
+    @property
+    def points(self):
+        """
+        Get or set the plotted points. Setting them discards the buffered
+        points.
+
+        :getter: Returns the current points, adjusting for the various scale
+                 options. The array is a view of the buffer when no scale
+                 option is active, and must then not be modified.
+        :setter: Sets the value of points.
+        :type: list of `(x, y)` pairs
+        """
+        if self._transformed():
+            return PolyLine.points.fget(self)
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+
+    @property
+    def capacity(self):
+        """
+        The maximum number of points held.
+
+        :type: int
+        """
+        return self._capacity
+
+    def __len__(self):
+        return self._end - self._start
+
+    def _transformed(self):
+        return any(self.logScale) or any(self.absScale)
+
+    def append(self, xs, ys):
+        """
+        Append samples to the series, dropping the oldest ones if the
+        capacity is exceeded.
+
+        :param xs: The X values of the new points
+        :type xs: sequence or :class:`np.array` of floats
+        :param ys: The Y values of the new points
+        :type ys: sequence or :class:`np.array` of floats
+        """
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        ys = np.asarray(ys, dtype=np.float64).ravel()
+        if len(xs) != len(ys):
+            raise ValueError("`xs` and `ys` must have the same length")
+        n = len(xs)
+        if n == 0:
+            return
+        total = self._total + n
+        if n > self._capacity:
+            xs, ys = xs[-self._capacity:], ys[-self._capacity:]
+            n = self._capacity
+
+        keep = min(self._end - self._start, self._capacity - n)
+        if self._end + n > len(self._buffer):
+            # move the points that are kept back to the start of the buffer
+            offset = self._end - keep
+            self._buffer[:keep] = self._buffer[offset:self._end]
+            self._scaledBuffer[:keep] = self._scaledBuffer[offset:self._end]
+            self._scaledFrom = max(0, self._scaledFrom - offset)
+            self._end = keep
+        new = self._buffer[self._end:self._end + n]
+        new[:, 0] = xs
+        new[:, 1] = ys
+        self._end += n
+        self._start = self._end - keep - n
+        self._total = total
+        self._index = None
+
+        # update the bounds of the chunks
+        minXY = new.min(axis=0)
+        maxXY = new.max(axis=0)
+        last = self._chunks[-1] if self._chunks else None
+        if (last is not None and last[1] == total - n
+                and last[1] - last[0] < self._chunkSize):
+            last[1] = total
+            last[2] = np.minimum(last[2], minXY)
+            last[3] = np.maximum(last[3], maxXY)
+        else:
+            self._chunks.append([total - n, total, minXY, maxXY])
+
+        first = total - len(self)
+        while self._chunks[0][1] <= first:
+            self._chunks.popleft()
+        head = self._chunks[0]
+        if head[0] < first:
+            data = self._buffer[self._start:self._start + head[1] - first]
+            head[0] = first
+            head[2] = data.min(axis=0)
+            head[3] = data.max(axis=0)
+
+        self._scaledFrom = min(self._scaledFrom, self._end - n)
+
+    def boundingBox(self):
+        """
+        Returns the bouding box for the entire dataset as a tuple with this
+        format::
+
+            ((minX, minY), (maxX, maxY))
+
+        :returns: boundingbox
+        :rtype: numpy array of ``[[minX, minY], [maxX, maxY]]``
+        """
+        if len(self) == 0 or self._transformed():
+            return PolyLine.boundingBox(self)
+        minXY = np.minimum.reduce([chunk[2] for chunk in self._chunks])
+        maxXY = np.maximum.reduce([chunk[3] for chunk in self._chunks])
+        return minXY, maxXY
+
+    def scaleAndShift(self, scale=(1, 1), shift=(0, 0)):
+        """
+        Scales and shifts the data for plotting. Only the points appended
+        since the last call are scaled if ``scale`` and ``shift`` have not
+        changed.
+
+        :param scale: The values to scale the data by.
+        :type scale: list of floats: ``[x_scale, y_scale]``
+        :param shift: The value to shift the data by. This should be in scaled
+                      units
+        :type shift: list of floats: ``[x_shift, y_shift]``
+        :returns: None
+        """
+        if self._transformed():
+            # the points do not map 1:1 to the buffer
+            self.currentScale = (1, 1)
+            self.currentShift = (0, 0)
+            PolyLine.scaleAndShift(self, scale, shift)
+            self._scaledFrom = self._start
+            return
+
+        if (list(scale) != list(self.currentScale)
+                or list(shift) != list(self.currentShift)):
+            self._scaledFrom = self._start
+            self.currentScale = scale
+            self.currentShift = shift
+        lower = max(self._scaledFrom, self._start)
+        scaled = self._scaledBuffer[lower:self._end]
+        np.multiply(self._buffer[lower:self._end], scale, out=scaled)
+        np.add(scaled, shift, out=scaled)
+        self._scaledFrom = self._end
+        self.scaled = self._scaledBuffer[self._start:self._end]
+
+    def draw(self, dc, printerScale, coord=None, span=None):
+        """
+        Draw the line, or only the part of it that lies within ``span``, a
+        ``(left, right)`` range of DC X coordinates.
+        """
+        self._span = span
+        try:
+            PolyLine.draw(self, dc, printerScale, coord)
+        finally:
+            self._span = None
+
+    def _drawPath(self, dc, scaled, drawstyle):
+        if self._span is not None and len(scaled):
+            x = scaled[:, 0]
+            lower = max(0, np.searchsorted(x, self._span[0]) - 1)
+            upper = np.searchsorted(x, self._span[1]) + 1
+            scaled = scaled[lower:upper]
+        if drawstyle == 'line':
+            if len(scaled) >= 2:
+                dc.DrawLines(scaled)
+        else:
+            PolyLine._drawPath(self, dc, scaled, drawstyle)
+
+
 class PolyMarker(PolyPoints):
     """
     Creates a PolyMarker object.
@@ -1399,11 +1652,14 @@ class PlotGraphics(object):
     def title(self, text):
         self._title = text
 
-    def draw(self, dc):
+    def draw(self, dc, span=None):
         for o in self.objects:
 #            t=_time.perf_counter()          # profile info
             o._pointSize = self._pointSize
-            o.draw(dc, self._printerScale)
+            if span is not None and isinstance(o, PolyStream):
+                o.draw(dc, self._printerScale, span=span)
+            else:
+                o.draw(dc, self._printerScale)
 #            print(o, "time=", _time.perf_counter()-t)
 
     def getSymExtent(self, printerScale):
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=E1101, C0330, C0103
+#   E1101: Module X has no Y member
+#   C0330: Wrong continued indentation
+#   C0103: Invalid attribute/variable/method name
+"""
+renderer.py
+===========
+
+This draws plots without a window, to save them to image files or to draw
+them on any :class:`wx.DC`, and renders batches of plots in a pool of
+processes.
+
+"""
+__docformat__ = "restructuredtext en"
+
+# Standard Library
+import os
+import multiprocessing
+
+# Third-Party
+import wx
+
+# Package
+from .plotcanvas import PlotDrawer
+
+
+class PlotRenderer(PlotDrawer):
+    """
+    Draws plots without a window.
+
+    A PlotRenderer has the same plot options and ``Draw`` method as
+    :class:`~wx.lib.plot.PlotCanvas`, but it draws into a bitmap of a fixed
+    size. It needs a :class:`wx.App`, but no frame, and it does not have to
+    be used from the main thread of a process that has no windows.
+
+    :param size: The size of the image, in pixels
+    :type size: ``(width, height)`` tuple of int
+    :param dpi: The resolution that the text, lines and markers are sized
+                for, or ``None`` to draw them at the screen resolution.
+    :type dpi: float
+    :param **settings: The initial values of plot options, such as
+                       ``enableLegend=True`` or ``fontSizeTitle=12``
+    :raises AttributeError: if a setting is not a plot option
+
+    ::
+
+        renderer = PlotRenderer((800, 600), dpi=150, enableLegend=True)
+        renderer.Draw(graphics)
+        renderer.SaveFile("chart.png")
+
+    Giving a DC to ``Draw`` draws the plot on it instead of the bitmap, for
+    example on a :class:`wx.GCDC` of a Cairo :class:`wx.GraphicsContext`. The
+    DC should be at least as large as ``size``.
+    """
+
+    _fileTypes = {
+        "bmp": wx.BITMAP_TYPE_BMP,
+        "jpg": wx.BITMAP_TYPE_JPEG,
+        "jpeg": wx.BITMAP_TYPE_JPEG,
+        "png": wx.BITMAP_TYPE_PNG,
+        "tif": wx.BITMAP_TYPE_TIFF,
+        "tiff": wx.BITMAP_TYPE_TIFF,
+    }
+
+    def __init__(self, size=(640, 480), dpi=None, **settings):
+        PlotDrawer.__init__(self)
+        self._foregroundColour = wx.Colour(wx.BLACK)
+        self._backgroundColour = wx.Colour(wx.WHITE)
+        self._font = wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT)
+        self._Buffer = None
+        self._dpi = None
+        self.size = size
+        self.dpi = dpi
+        for name, value in settings.items():
+            if not isinstance(getattr(type(self), name, None), property):
+                err_txt = "`{}` is not a plot option"
+                raise AttributeError(err_txt.format(name))
+            setattr(self, name, value)
+
+    @property
+    def size(self):
+        """
+        The size of the image, in pixels. Changing it redraws the plot.
+
+        :type: ``(width, height)`` tuple of int
+        """
+        return tuple(self._Buffer.GetSize())
+
+    @size.setter
+    def size(self, size):
+        width, height = size
+        self._Buffer = wx.Bitmap(max(1, int(width)), max(1, int(height)))
+        self._setSize()
+        self.Redraw()
+
+    @property
+    def dpi(self):
+        """
+        The resolution that the text, lines and markers are sized for, or
+        ``None`` to draw them at the screen resolution. It is also written
+        in the image files that can hold it.
+
+        :type: float or None
+        """
+        return self._dpi
+
+    @dpi.setter
+    def dpi(self, dpi):
+        if dpi is not None and dpi <= 0:
+            raise ValueError("`dpi` must be positive")
+        self._dpi = dpi
+        if dpi is None:
+            self._setPrinterScale(1)
+        else:
+            screenDpi = wx.ScreenDC().GetPPI()[0] or 96
+            self._setPrinterScale(float(dpi) / screenDpi)
+        self._fontCache = {}
+        self.Redraw()
+
+    def GetForegroundColour(self):
+        """Returns the colour of the text."""
+        return self._foregroundColour
+
+    def SetForegroundColour(self, colour):
+        """Sets the colour of the text."""
+        self._foregroundColour = wx.Colour(colour)
+
+    def GetBackgroundColour(self):
+        """Returns the colour of the background."""
+        return self._backgroundColour
+
+    def SetBackgroundColour(self, colour):
+        """Sets the colour of the background."""
+        self._backgroundColour = wx.Colour(colour)
+
+    def GetFont(self):
+        """Returns the font that the family, style and weight of the text
+        are taken from."""
+        return self._font
+
+    def SetFont(self, font):
+        """Sets the font that the family, style and weight of the text are
+        taken from."""
+        self._font = font
+        self._fontCache = {}
+
+    def GetBitmap(self):
+        """Returns a copy of the bitmap that the plot was drawn into."""
+        width, height = self.size
+        return self._Buffer.GetSubBitmap((0, 0, width, height))
+
+    def SaveFile(self, fileName):
+        """
+        Saves the last plot drawn to a file, of the type given by the
+        extension of ``fileName``: bmp, jpg, png, tif or svg. Returns True if
+        successful, otherwise False.
+
+        The svg files are drawn again with :class:`wx.SVGFileDC`, the other
+        types are saved from the bitmap.
+
+        :raises ValueError: if the extension is not one of the above
+        """
+        fType = os.path.splitext(fileName)[1][1:].lower()
+        if fType == "svg":
+            if self.last_draw is None:
+                return False
+            width, height = self.size
+            dc = wx.SVGFileDC(fileName, width, height,
+                              int(round(self._dpi or 72)))
+            dc.SetBackground(wx.Brush(self.GetBackgroundColour()))
+            dc.Clear()
+            self.Redraw(dc)
+            res = dc.IsOk()
+            # the file is completed when the DC is destroyed
+            del dc
+            return res
+
+        if fType not in self._fileTypes:
+            err_txt = "File name extension must be one of {}"
+            raise ValueError(err_txt.format(
+                ", ".join(sorted(self._fileTypes) + ["svg"])))
+        image = self._Buffer.ConvertToImage()
+        if self._dpi is not None:
+            image.SetOption(wx.IMAGE_OPTION_RESOLUTIONUNIT,
+                            wx.IMAGE_RESOLUTION_INCHES)
+            image.SetOption(wx.IMAGE_OPTION_RESOLUTIONX, int(round(self._dpi)))
+            image.SetOption(wx.IMAGE_OPTION_RESOLUTIONY, int(round(self._dpi)))
+        return image.SaveFile(fileName, self._fileTypes[fType])
+
+
+# The wx.App of a worker process of RenderBatch
+_workerApp = None
+
+
+def _initWorker():
+    global _workerApp
+    _workerApp = wx.App(False)
+
+
+def _renderJob(job):
+    graphics, fileName = job[:2]
+    settings = dict(job[2]) if len(job) > 2 else {}
+    xAxis = settings.pop("xAxis", None)
+    yAxis = settings.pop("yAxis", None)
+    renderer = PlotRenderer(**settings)
+    renderer.Draw(graphics, xAxis, yAxis)
+    return renderer.SaveFile(fileName)
+
+
+def RenderBatch(jobs, processes=None, chunksize=1):
+    """
+    Renders plots to files in a pool of processes, and returns the list of
+    the results of :meth:`PlotRenderer.SaveFile` for the jobs.
+
+    Each job is a ``(graphics, fileName)`` or a
+    ``(graphics, fileName, settings)`` tuple, where ``settings`` is a dict of
+    :class:`PlotRenderer` arguments, such as ``size``, ``dpi`` or plot
+    options, and of the ``xAxis`` and ``yAxis`` passed to ``Draw``.
+
+    The jobs are pickled to be sent to the processes, so the attributes of
+    the graphics must be picklable: give colours by name or as
+    :class:`wx.Colour`, not as :class:`wx.Pen` or :class:`wx.Brush`. The
+    processes are started with the "spawn" method, as forking a process that
+    uses wx is not safe, and each creates its own :class:`wx.App`.
+
+    :param jobs: The plots to render
+    :type jobs: iterable of tuples
+    :param processes: The number of processes, by default the number of
+                      CPUs. With 0, the plots are rendered in this process,
+                      which must have a :class:`wx.App`.
+    :type processes: int
+    :param chunksize: The number of jobs sent to a process at a time
+    :type chunksize: int
+    :returns: list of bool
+    """
+    jobs = list(jobs)
+    if processes == 0:
+        return [_renderJob(job) for job in jobs]
+    context = multiprocessing.get_context("spawn")
+    pool = context.Pool(processes, initializer=_initWorker)
+    try:
+        return pool.map(_renderJob, jobs, chunksize)
+    finally:
+        pool.close()
+        pool.join()
@@ -323,5 +323,175 @@ def pairwise(iterable):
     next(b, None)
     return zip(a, b)
 
+
+class NearestPointIndex(object):
+    """
+    A spatial index of a set of points, for finding the point nearest to a
+    given position without measuring the distance to every point.
+
+    If the X values are sorted, which is the case for most line plots, the
+    index is the points themselves: the search starts at the bisection of the
+    X values and works outwards until the X distance alone is greater than the
+    closest distance found. Other points are put in a 2-d tree.
+
+    The distances can be weighted per axis, which gives the distances on
+    screen when the weights are the absolute values of the axis scales.
+
+    :param points: The points to index. The array must not be modified while
+                   the index is in use.
+    :type points: :class:`np.array` of ``[x, y]`` values
+    :param leafsize: The maximum number of points in a leaf of the tree.
+    :type leafsize: int
+    """
+
+    def __init__(self, points, leafsize=64):
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self.leafsize = max(1, int(leafsize))
+        x = self.points[:, 0]
+        diff = np.diff(x)
+        if np.all(diff >= 0):
+            self._order = None
+            self._x = x
+        elif np.all(diff <= 0):
+            # search the reversed points, and map the indices back
+            self._order = np.arange(len(x) - 1, -1, -1)
+            self._x = x[::-1]
+        else:
+            self._x = None
+            self._buildTree()
+
+    @property
+    def sorted(self):
+        """
+        ``True`` if the X values are sorted and no tree was built.
+
+        :type: bool
+        """
+        return self._x is not None
+
+    def __len__(self):
+        return len(self.points)
+
+    def _buildTree(self):
+        # The nodes are stored in lists, the points of a node being the slice
+        # [start:end] of the reordered X and Y values, which are partitioned
+        # in place.
+        self._order = np.arange(len(self.points))
+        self._treeX = self.points[:, 0].copy()
+        self._treeY = self.points[:, 1].copy()
+        self._start = []
+        self._end = []
+        self._lower = []
+        self._upper = []
+        self._children = []
+        self._buildNode(0, len(self.points))
+        self._lower = np.array(self._lower).reshape(-1, 2)
+        self._upper = np.array(self._upper).reshape(-1, 2)
+
+    def _buildNode(self, start, end):
+        node = len(self._start)
+        x = self._treeX[start:end]
+        y = self._treeY[start:end]
+        if len(x):
+            lower = (x.min(), y.min())
+            upper = (x.max(), y.max())
+        else:
+            lower = upper = (0, 0)
+        self._start.append(start)
+        self._end.append(end)
+        self._lower.append(lower)
+        self._upper.append(upper)
+        self._children.append(None)
+        if end - start > self.leafsize:
+            # split at the median of the widest axis
+            values = x if upper[0] - lower[0] >= upper[1] - lower[1] else y
+            middle = (end - start) // 2
+            part = np.argpartition(values, middle)
+            x[:] = x[part]
+            y[:] = y[part]
+            self._order[start:end] = self._order[start:end][part]
+            self._children[node] = (self._buildNode(start, start + middle),
+                                    self._buildNode(start + middle, end))
+        return node
+
+    def _boxDistance(self, node, xy, weights):
+        delta = np.maximum(self._lower[node] - xy, 0)
+        delta = np.maximum(delta, xy - self._upper[node])
+        return np.hypot(*(delta * weights))
+
+    def nearest(self, xy, weights=(1, 1)):
+        """
+        Returns the ``(index, distance)`` of the point nearest to ``xy``.
+
+        :param xy: The position to search from
+        :type xy: ``(x, y)`` pair of floats
+        :param weights: The factors the X and Y differences are multiplied
+                        by before measuring the distance.
+        :type weights: ``(x_weight, y_weight)`` pair of floats
+        :raises ValueError: if there are no points
+        """
+        if len(self.points) == 0:
+            raise ValueError("no points to search")
+        xy = np.asarray(xy, dtype=np.float64)
+        weights = np.abs(np.asarray(weights, dtype=np.float64))
+        if self.sorted:
+            index, dist = self._nearestSorted(xy, weights)
+        else:
+            index, dist = self._nearestTree(xy, weights)
+        if self._order is not None:
+            index = self._order[index]
+        return int(index), dist
+
+    def _nearestSorted(self, xy, weights):
+        x = self._x
+        pts = self.points if self._order is None else self.points[::-1]
+        n = len(x)
+        lower = upper = int(np.searchsorted(x, xy[0]))
+        bestIndex, best = -1, np.inf
+        step = 8
+        while True:
+            ranges = []
+            if upper < n and (x[upper] - xy[0]) * weights[0] <= best:
+                ranges.append((upper, min(n, upper + step)))
+                upper = ranges[-1][1]
+            if lower > 0 and (xy[0] - x[lower - 1]) * weights[0] <= best:
+                ranges.append((max(0, lower - step), lower))
+                lower = ranges[-1][0]
+            if not ranges:
+                break
+            for start, end in ranges:
+                d = np.hypot(*((pts[start:end] - xy) * weights).T)
+                i = np.argmin(d)
+                if d[i] < best:
+                    bestIndex, best = start + i, d[i]
+            # widen the search when the points are spread vertically
+            step *= 2
+        return bestIndex, best
+
+    def _nearestTree(self, xy, weights):
+        bestIndex, best = -1, np.inf
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._boxDistance(node, xy, weights) > best:
+                continue
+            children = self._children[node]
+            if children is None:
+                start, end = self._start[node], self._end[node]
+                d = np.hypot((self._treeX[start:end] - xy[0]) * weights[0],
+                             (self._treeY[start:end] - xy[1]) * weights[1])
+                i = np.argmin(d)
+                if d[i] < best:
+                    bestIndex, best = start + i, d[i]
+            else:
+                # visit the nearest child first
+                near, far = children
+                if (self._boxDistance(near, xy, weights)
+                        > self._boxDistance(far, xy, weights)):
+                    near, far = far, near
+                stack.append(far)
+                stack.append(near)
+        return bestIndex, best
+
 if __name__ == "__main__":
     raise RuntimeError("This module is not intended to be run by itself.")
@@ -149,6 +149,28 @@ class Interpreter(InteractiveInterpreter):
         sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
         return l
 
+    def getAutoCompleteListAsync(self, command, callback, *args, **kwds):
+        """Call callback with the list of auto-completion options for a
+        command, possibly later if looking them up takes a while.
+
+        The list of options will be based on the locals namespace."""
+        method = type(self).getAutoCompleteList
+        if getattr(method, '__func__', method) is not \
+           getattr(Interpreter.getAutoCompleteList, '__func__',
+                   Interpreter.getAutoCompleteList):
+            # Respect a derived class's own way of finding the options.
+            callback(self.getAutoCompleteList(command, *args, **kwds))
+            return True
+        stdin, stdout, stderr = sys.stdin, sys.stdout, sys.stderr
+        sys.stdin, sys.stdout, sys.stderr = \
+                   self.stdin, self.stdout, self.stderr
+        try:
+            return introspect.getAutoCompleteListAsync(command, callback,
+                                                       self.locals,
+                                                       *args, **kwds)
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+
     def getCallTip(self, command='', *args, **kwds):
         """Return call tip text for a command.
 
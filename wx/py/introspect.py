@@ -7,14 +7,20 @@ import sys
 import inspect
 import tokenize
 import types
+import bisect
+import threading
+import weakref
+from collections import OrderedDict
 import wx
 from six import BytesIO, PY3, string_types
 
 def getAutoCompleteList(command='', locals=None, includeMagic=1,
-                        includeSingle=1, includeDouble=1):
+                        includeSingle=1, includeDouble=1, prefix=''):
     """Return list of auto-completion options for command.
 
-    The list of options will be based on the locals namespace."""
+    The list of options will be based on the locals namespace.  If prefix
+    is given only the options starting with it, ignoring case, are
+    returned."""
     attributes = []
     # Get the proper chunk of code from the command.
     root = getRoot(command, terminator='.')
@@ -27,12 +33,142 @@ def getAutoCompleteList(command='', locals=None, includeMagic=1,
         pass
     else:
         attributes = getAttributeNames(obj, includeMagic,
-                                       includeSingle, includeDouble)
+                                       includeSingle, includeDouble, prefix)
     return attributes
 
+def getAutoCompleteListAsync(command, callback, locals=None, includeMagic=1,
+                             includeSingle=1, includeDouble=1, prefix=''):
+    """Call callback with the list of auto-completion options for command.
+
+    Looking up the attributes of a module that are not cached yet is done
+    in a background thread, and callback is then called later in the GUI
+    thread.  Otherwise it is called right away.  Other kinds of objects
+    are always looked up in the calling thread, since getting their
+    attributes may not be safe in another one.  Returns True if callback
+    has been called."""
+    root = getRoot(command, terminator='.')
+    try:
+        if locals is not None:
+            obj = eval(root, locals)
+        else:
+            obj = eval(root)
+    except:
+        callback([])
+        return True
+    args = (includeMagic, includeSingle, includeDouble, prefix)
+    if not isinstance(obj, types.ModuleType) or \
+       _attributeNamesCache.get(obj, includeMagic) is not None:
+        callback(getAttributeNames(obj, *args))
+        return True
+
+    def lookup():
+        try:
+            attributes = getAttributeNames(obj, *args)
+        except Exception:
+            attributes = []
+        wx.CallAfter(callback, attributes)
+    thread = threading.Thread(target=lookup)
+    thread.daemon = True
+    thread.start()
+    return False
+
+
+class _ObjectCache(object):
+    """A small LRU cache of values computed for objects.
+
+    Entries are keyed on the id and type of the object.  They are dropped
+    when the object has gone away, or when attributes have been added to or
+    removed from the object or its classes.  Objects that can't be weakly
+    referenced are not cached."""
+
+    def __init__(self, size=64):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, obj, extra=None):
+        key = (id(obj), type(obj), extra)
+        with self.lock:
+            entry = self.entries.pop(key, None)
+        if entry is None:
+            return None
+        ref, token, value = entry
+        if ref() is not obj or token != _namespaceToken(obj):
+            return None
+        with self.lock:
+            self.entries[key] = entry
+        return value
+
+    def set(self, obj, value, extra=None):
+        try:
+            ref = weakref.ref(obj)
+        except TypeError:
+            return
+        key = (id(obj), type(obj), extra)
+        entry = (ref, _namespaceToken(obj), value)
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = entry
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+def _namespaceToken(obj):
+    """Return a cheap value that changes when attributes are added to or
+    removed from obj or its classes."""
+    token = []
+    try:
+        token.append(len(obj.__dict__))
+    except Exception:
+        token.append(None)
+    klass = obj if isinstance(obj, type) else type(obj)
+    for base in getattr(klass, '__mro__', ()):
+        token.append(len(base.__dict__))
+    return tuple(token)
+
+_attributeNamesCache = _ObjectCache()
+_callTipCache = _ObjectCache()
+
+def clearCaches():
+    """Forget the attribute names and call tips found so far."""
+    _attributeNamesCache.clear()
+    _callTipCache.clear()
+
 def getAttributeNames(obj, includeMagic=1, includeSingle=1,
-                      includeDouble=1):
-    """Return list of unique attributes, including inherited, for obj."""
+                      includeDouble=1, prefix=''):
+    """Return list of unique attributes, including inherited, for obj.
+
+    If prefix is given only the attributes starting with it, ignoring case,
+    are returned.  The names found are cached until attributes are added to
+    or removed from obj or its classes."""
+    cached = _attributeNamesCache.get(obj, includeMagic)
+    if cached is None:
+        attributes = _getAttributeNames(obj, includeMagic)
+        keys = [attribute.upper() for attribute in attributes]
+        if not hasattrAlwaysReturnsTrue(obj):
+            _attributeNamesCache.set(obj, (attributes, keys), includeMagic)
+    else:
+        attributes, keys = cached
+    if prefix:
+        # The names are sorted ignoring case, so the matches are together
+        prefix = prefix.upper()
+        start = end = bisect.bisect_left(keys, prefix)
+        while end < len(keys) and keys[end].startswith(prefix):
+            end += 1
+        attributes = attributes[start:end]
+    if not includeSingle:
+        attributes = [item for item in attributes
+                      if item[0]!='_' or item[1:2]=='_']
+    if not includeDouble:
+        attributes = [item for item in attributes if item[:2]!='__']
+    return list(attributes)
+
+def _getAttributeNames(obj, includeMagic):
+    """Return the sorted list of unique attributes for obj."""
     attributes = []
     dict = {}
     if not hasattrAlwaysReturnsTrue(obj):
@@ -81,11 +217,6 @@ def getAttributeNames(obj, includeMagic=1, includeSingle=1,
     attributes = [attribute for attribute in attributes
                   if type(attribute) == str]
     attributes.sort(key=lambda x: x.upper())
-    if not includeSingle:
-        attributes = filter(lambda item: item[0]!='_' \
-                            or item[1:2]=='_', attributes)
-    if not includeDouble:
-        attributes = filter(lambda item: item[:2]!='__', attributes)
     return attributes
 
 def hasattrAlwaysReturnsTrue(obj):
@@ -162,8 +293,16 @@ def getCallTip(command='', locals=None):
             obj = eval(root)
     except:
         return calltip
-    name = ''
     obj, dropSelf = getBaseObject(obj)
+    calltip = _callTipCache.get(obj, dropSelf)
+    if calltip is None:
+        calltip = _getCallTip(obj, dropSelf)
+        _callTipCache.set(obj, calltip, dropSelf)
+    return calltip
+
+def _getCallTip(obj, dropSelf):
+    """Return the call tip tuple for a base object."""
+    name = ''
     try:
         name = obj.__name__
     except AttributeError:
@@ -1171,18 +1171,29 @@ class Shell(editwindow.EditWindow):
                 else:
                     self.run(command, prompt=False, verbose=True)
 
-    def autoCompleteShow(self, command, offset = 0):
-        """Display auto-completion popup list."""
+    def autoCompleteShow(self, command, offset = 0, prefix = ''):
+        """Display auto-completion popup list.
+
+        The names of a module are looked up in the background the first
+        time, so typing isn't blocked, and the list is shown when they are
+        ready if the cursor hasn't moved meanwhile."""
         self.AutoCompSetAutoHide(self.autoCompleteAutoHide)
         self.AutoCompSetIgnoreCase(self.autoCompleteCaseInsensitive)
-        list = self.interp.getAutoCompleteList(command,
+        pos = self.GetCurrentPos()
+
+        def show(list):
+            if not self or self.GetCurrentPos() != pos:
+                return
+            if list:
+                options = ' '.join(list)
+                #offset = 0
+                self.AutoCompShow(offset, options)
+
+        self.interp.getAutoCompleteListAsync(command, show,
                     includeMagic=self.autoCompleteIncludeMagic,
                     includeSingle=self.autoCompleteIncludeSingle,
-                    includeDouble=self.autoCompleteIncludeDouble)
-        if list:
-            options = ' '.join(list)
-            #offset = 0
-            self.AutoCompShow(offset, options)
+                    includeDouble=self.autoCompleteIncludeDouble,
+                    prefix=prefix)
 
     def autoCallTipShow(self, command, insertcalltip = True, forceCallTip = False):
         """Display argument spec and docstring in a popup window."""
@@ -1232,7 +1243,7 @@ class Shell(editwindow.EditWindow):
                 #call AutoComplete
                 stoppos = self.promptPosEnd
                 textbefore = self.GetTextRange(stoppos, pointavailpos)
-                self.autoCompleteShow(textbefore, len (textbehind))
+                self.autoCompleteShow(textbefore, len (textbehind), textbehind)
             else:
                 #call CallTips
                 cpos = pointavailpos
@@ -21,10 +21,12 @@ pywxrc -- Python XML resource compiler
           (see http://wiki.wxpython.org/index.cgi/pywxrc for more info)
 
 Usage: python pywxrc.py -h
-       python pywxrc.py [-p] [-g] [-e] [-v] [-o filename] xrc input files...
+       python pywxrc.py [-p] [-c] [-g] [-e] [-v] [-o filename] xrc input files...
 
   -h, --help     show help message
   -p, --python   generate python module
+  -c, --compile  generate python module creating the windows with Python
+                 code instead of loading the XRC resources at runtime
   -g, --gettext  output list of translatable strings (may be combined with -p)
   -e, --embed    embed XRC resources in the output file
   -v, --novar    suppress default assignment of variables
@@ -248,6 +250,104 @@ def __gettext_strings():
 %s
 """
 
+    COMPILED_FILE_HEADER = """\
+# This file was automatically generated by pywxrc.
+# -*- coding: UTF-8 -*-
+
+%(imports)s
+import wx
+import wx.xrc as xrc
+
+__bitmaps = {}
+
+def get_bitmap(filename):
+    \"\"\" Returns a bitmap used by this module, loading it the first time it is needed.\"\"\"
+    bmp = __bitmaps.get(filename)
+    if bmp is None:
+        bmp = __bitmaps[filename] = __load_bitmap(filename)
+    return bmp
+
+"""
+
+    GET_RESOURCES = """\
+__res = None
+
+def get_resources():
+    \"\"\" This function provides access to the XML resources in this module.\"\"\"
+    global __res
+    if __res is None:
+        __init_resources()
+    return __res
+
+"""
+
+    COMPILED_CLASS_HEADER = """\
+class xrc%(windowName)s(wx.%(windowClass)s):
+#!XRCED:begin-block:xrc%(windowName)s.PreCreate
+    def PreCreate(self):
+        \"\"\" This function is called during the class's initialization.
+
+        Override it for custom setup before the window is created usually to
+        set additional window styles using SetWindowStyle() and SetExtraStyle().
+        \"\"\"
+        pass
+
+#!XRCED:end-block:xrc%(windowName)s.PreCreate
+
+    def __init__(self, parent):
+        wx.%(windowClass)s.__init__(self)
+        self.PreCreate()
+        self.Create(%(createArgs)s)
+
+        # Create the controls, bind event handlers
+"""
+
+    COMPILED_MENU_CLASS_HEADER = """\
+class xrc%(windowName)s(wx.%(windowClass)s):
+    def __init__(self):
+        wx.%(windowClass)s.__init__(self)
+
+        # Create the menu items
+"""
+
+    COMPILED_TOOLBAR_CLASS_HEADER = """\
+class xrc%(windowName)s(wx.%(windowClass)s):
+    def __init__(self, parent):
+        wx.%(windowClass)s.__init__(self, %(createArgs)s)
+
+        # Create the toolbar items
+"""
+
+    LOAD_BITMAP_FILE = """\
+# ------------------------ Bitmap data ------------------------
+
+def __load_bitmap(filename):
+    return wx.Bitmap(os.path.join(os.path.dirname(os.path.abspath(__file__)), filename))
+"""
+
+    LOAD_BITMAP_EMBEDDED = """\
+# ------------------------ Bitmap data ------------------------
+
+def __load_bitmap(filename):
+    return wx.Bitmap(wx.Image(io.BytesIO(__bitmap_data[filename])))
+
+__bitmap_data = {}
+"""
+
+    BITMAP_AS_STRING = """\
+__bitmap_data['%(filename)s'] = b'''\\
+%(fileData)s'''
+"""
+
+#----------------------------------------------------------------------
+
+class CompileError(Exception):
+    """
+    Raised when an XRC object can't be translated to Python code by
+    :meth:`XmlResourceCompiler.GenerateCompiledClasses`.
+    """
+    pass
+
 #----------------------------------------------------------------------
 
 class XmlResourceCompiler:
@@ -258,12 +358,15 @@ class XmlResourceCompiler:
 
     def MakePythonModule(self, inputFiles, outputFilename,
                          embedResources=False, generateGetText=False,
-                         assignVariables=True):
+                         assignVariables=True, compileResources=False):
 
         self.blocks = {}
         self.outputFilename = outputFilename
         outputFile = self._OpenOutputFile(outputFilename)
         self.assignVariables = assignVariables
+        self.embedResources = embedResources
+        self.bitmaps = {}
+        self.imports = set()
 
         classes = []
         subclasses = []
@@ -274,19 +377,31 @@ class XmlResourceCompiler:
         for inFile in inputFiles:
             resourceDocument = minidom.parse(inFile)
             subclasses.append(self.GenerateSubclasses(resourceDocument))
-            classes.append(self.GenerateClasses(resourceDocument))
-
-            if embedResources:
-                res = self.GenerateInitResourcesEmbedded(inFile, resourceDocument)
+            if compileResources:
+                classes.append(self.GenerateCompiledClasses(inFile, resourceDocument))
             else:
-                res = self.GenerateInitResourcesFile(inFile, resourceDocument)
-            resources.append(res)
+                classes.append(self.GenerateClasses(resourceDocument))
+
+            # compiled classes only need the XRC for the objects they can't create
+            if not compileResources or self.resourcesNeeded:
+                if embedResources:
+                    res = self.GenerateInitResourcesEmbedded(inFile, resourceDocument)
+                else:
+                    res = self.GenerateInitResourcesFile(inFile, resourceDocument)
+                resources.append(res)
 
             if generateGetText:
                 gettextStrings += self.FindStringsInNode(resourceDocument.firstChild)
 
         # now write it all out
-        print_(self.templates.FILE_HEADER, file=outputFile)
+        if compileResources:
+            imports = embedResources and "import io" or "import os"
+            imports = "\n".join(sorted(self.imports | set([imports])))
+            print_(self.templates.COMPILED_FILE_HEADER % locals(), file=outputFile)
+            if resources:
+                print_(self.templates.GET_RESOURCES, file=outputFile)
+        else:
+            print_(self.templates.FILE_HEADER, file=outputFile)
 
         # Note: Technically it is not legal to have anything other
         # than ascii for class and variable names, but since the user
@@ -300,11 +415,15 @@ class XmlResourceCompiler:
             classes = self.ReplaceBlocks(u"\n".join(classes))
             print_(classes, file=outputFile)
 
-        print_(self.templates.INIT_RESOURE_HEADER, file=outputFile)
-        if embedResources:
-            print_(self.templates.PREPARE_MEMFS, file=outputFile)
-        resources = u"\n".join(resources)
-        print_(resources, file=outputFile)
+        if compileResources:
+            print_(self.GenerateBitmaps(), file=outputFile)
+
+        if resources or not compileResources:
+            print_(self.templates.INIT_RESOURE_HEADER, file=outputFile)
+            if embedResources:
+                print_(self.templates.PREPARE_MEMFS, file=outputFile)
+            resources = u"\n".join(resources)
+            print_(resources, file=outputFile)
 
         if generateGetText:
             # gettextStrings is a list of unicode strings as returned by ConvertText
@@ -580,6 +699,825 @@ class XmlResourceCompiler:
 
     #-------------------------------------------------------------------
 
+    # The window classes GenerateCompiledClasses knows how to create. For each
+    # one: the constructor keyword arguments, and the setters called after the
+    # window is created, as (argument, property, kind) and (template,
+    # property, kind) tuples. The kind selects the Compile* method converting
+    # the property value.
+    compiledWindows = {
+        "wxPanel":          ([], []),
+        "wxScrolledWindow": ([], [("%(var)s.SetScrollRate(%(value)s)", "scrollrate", "pair")]),
+        "wxButton":         ([("label", "label", "text")],
+                             [("%(var)s.SetDefault()", "default", "flag")]),
+        "wxBitmapButton":   ([("bitmap", "bitmap", "bitmap")],
+                             [("%(var)s.SetDefault()", "default", "flag"),
+                              ("%(var)s.SetBitmapPressed(%(value)s)", "selected", "bitmap"),
+                              ("%(var)s.SetBitmapPressed(%(value)s)", "pressed", "bitmap"),
+                              ("%(var)s.SetBitmapFocus(%(value)s)", "focus", "bitmap"),
+                              ("%(var)s.SetBitmapDisabled(%(value)s)", "disabled", "bitmap"),
+                              ("%(var)s.SetBitmapCurrent(%(value)s)", "hover", "bitmap")]),
+        "wxStaticText":     ([("label", "label", "text")],
+                             [("%(var)s.Wrap(%(value)s)", "wrap", "int")]),
+        "wxTextCtrl":       ([("value", "value", "text")],
+                             [("%(var)s.SetMaxLength(%(value)s)", "maxlength", "int"),
+                              ("%(var)s.SetHint(%(value)s)", "hint", "text")]),
+        "wxCheckBox":       ([("label", "label", "text")],
+                             [("%(var)s.SetValue(True)", "checked", "flag")]),
+        "wxRadioButton":    ([("label", "label", "text")],
+                             [("%(var)s.SetValue(True)", "value", "flag")]),
+        "wxStaticBox":      ([("label", "label", "text")], []),
+        "wxStaticLine":     ([], []),
+        "wxStaticBitmap":   ([("bitmap", "bitmap", "bitmap")], []),
+        "wxChoice":         ([("choices", "content", "choices")],
+                             [("%(var)s.SetSelection(%(value)s)", "selection", "int")]),
+        "wxComboBox":       ([("value", "value", "text"), ("choices", "content", "choices")],
+                             [("%(var)s.SetSelection(%(value)s)", "selection", "int"),
+                              ("%(var)s.SetHint(%(value)s)", "hint", "text")]),
+        "wxListBox":        ([("choices", "content", "choices")],
+                             [("%(var)s.SetSelection(%(value)s)", "selection", "int")]),
+        "wxCheckListBox":   ([("choices", "content", "choices")],
+                             [("%(var)s.SetCheckedItems(%(value)s)", "content", "checked")]),
+        "wxRadioBox":       ([("label", "label", "text"), ("choices", "content", "choices"),
+                              ("majorDimension", "dimension", "int")],
+                             [("%(var)s.SetSelection(%(value)s)", "selection", "int")]),
+        "wxGauge":          ([("range", "range", "int")],
+                             [("%(var)s.SetValue(%(value)s)", "value", "int")]),
+        "wxSlider":         ([("value", "value", "int"), ("minValue", "min", "int"),
+                              ("maxValue", "max", "int")],
+                             [("%(var)s.SetTickFreq(%(value)s)", "tickfreq", "int"),
+                              ("%(var)s.SetPageSize(%(value)s)", "pagesize", "int"),
+                              ("%(var)s.SetLineSize(%(value)s)", "linesize", "int"),
+                              ("%(var)s.SetThumbLength(%(value)s)", "thumb", "int"),
+                              ("%(var)s.SetTick(%(value)s)", "tick", "int")]),
+        "wxSpinCtrl":       ([("initial", "value", "int"), ("min", "min", "int"),
+                              ("max", "max", "int")], []),
+        "wxListCtrl":       ([], []),
+        "wxTreeCtrl":       ([], []),
+        "wxNotebook":       ([], []),
+        "wxSplitterWindow": ([], [("%(var)s.SetMinimumPaneSize(%(value)s)", "minsize", "int"),
+                                  ("%(var)s.SetSashGravity(%(value)s)", "gravity", "float")]),
+        "wxToolBar":        ([], [("%(var)s.SetToolBitmapSize(%(value)s)", "bitmapsize", "size"),
+                                  ("%(var)s.SetMargins(%(value)s)", "margins", "size"),
+                                  ("%(var)s.SetToolPacking(%(value)s)", "packing", "int"),
+                                  ("%(var)s.SetToolSeparation(%(value)s)", "separation", "int")]),
+        "wxStatusBar":      ([], []),
+        }
+
+    # Top level windows, created with the properties as keyword arguments
+    compiledTopWindows = {
+        "wxFrame":  [("title", "title", "text")],
+        "wxDialog": [("title", "title", "text")],
+        }
+
+    compiledSizers = ["wxBoxSizer", "wxStaticBoxSizer", "wxGridSizer", "wxFlexGridSizer",
+                      "wxGridBagSizer", "wxWrapSizer", "wxStdDialogButtonSizer"]
+
+    fontFamilies = {"default": "wx.FONTFAMILY_DEFAULT", "decorative": "wx.FONTFAMILY_DECORATIVE",
+                    "roman": "wx.FONTFAMILY_ROMAN", "script": "wx.FONTFAMILY_SCRIPT",
+                    "swiss": "wx.FONTFAMILY_SWISS", "modern": "wx.FONTFAMILY_MODERN",
+                    "teletype": "wx.FONTFAMILY_TELETYPE"}
+    fontStyles = {"normal": "wx.FONTSTYLE_NORMAL", "italic": "wx.FONTSTYLE_ITALIC",
+                  "slant": "wx.FONTSTYLE_SLANT"}
+    fontWeights = {"normal": "wx.FONTWEIGHT_NORMAL", "bold": "wx.FONTWEIGHT_BOLD",
+                   "light": "wx.FONTWEIGHT_LIGHT"}
+
+
+    def GenerateCompiledClasses(self, resourceFilename, resourceDocument):
+        """
+        Generates classes which create the top level windows, menus and
+        toolbars of the resource with Python code, instead of loading them
+        from the XRC file at runtime.
+
+        Objects using XRC features which can't be translated fall back to the
+        classes made by :meth:`GenerateClasses`. Sets ``self.resourcesNeeded``
+        when that happens, so that the XML resources are added to the module.
+        """
+        outputList = []
+        self.resourcesNeeded = False
+        self.resourcePath = os.path.split(resourceFilename)[0]
+
+        resource = resourceDocument.firstChild
+        topWindows = [e for e in resource.childNodes
+                      if e.nodeType == e.ELEMENT_NODE and e.tagName == "object" \
+                      and not e.getAttribute('subclass')]
+
+        for topWindow in topWindows:
+            windowClass = topWindow.getAttribute("class")
+            windowClass = re.sub("^wx", "", windowClass)
+            windowName = topWindow.getAttribute("name")
+            if not windowName: continue
+
+            vars = []
+            try:
+                classCode = self.GenerateCompiledClass(windowClass, windowName, topWindow, vars)
+            except CompileError as exc:
+                print_("pywxrc: warning: %s: %s, it will be loaded from the XRC resources"
+                       % (windowName, exc), file=sys.stderr)
+                self.resourcesNeeded = True
+                if windowClass in ["MenuBar"]:
+                    genfunc = self.GenerateMenuBarClass
+                elif windowClass in ["Menu"]:
+                    genfunc = self.GenerateMenuClass
+                elif windowClass in ["ToolBar"]:
+                    genfunc = self.GenerateToolBarClass
+                else:
+                    genfunc = self.GenerateWidgetClass
+                vars = []
+                classCode = genfunc(windowClass, windowName, topWindow, vars)
+
+            outputList += classCode
+            outputList.append('\n')
+
+            outputList += self.GenerateEventHandlers(windowClass, windowName, topWindow, vars)
+
+        return "".join(outputList)
+
+
+    def GenerateCompiledClass(self, windowClass, windowName, topWindow, vars):
+        self.vars = vars
+        self.lines = []
+        self.localCount = 0
+
+        klass = topWindow.getAttribute("class")
+        if klass == "wxMenuBar":
+            header = self.templates.COMPILED_MENU_CLASS_HEADER
+            self.CompileMenuBar(topWindow, "self")
+        elif klass == "wxMenu":
+            header = self.templates.COMPILED_MENU_CLASS_HEADER
+            self.CompileMenu(topWindow, "self")
+        elif klass == "wxToolBar":
+            header = self.templates.COMPILED_TOOLBAR_CLASS_HEADER
+            createArgs = ", ".join(self.CompileWindowArgs(topWindow, "parent", "wxToolBar"))
+            self.CompileWindowSetup(topWindow, "self", "wxToolBar")
+            self.CompileToolBarItems(topWindow, "self")
+        elif klass in self.compiledTopWindows or klass in self.compiledWindows:
+            header = self.templates.COMPILED_CLASS_HEADER
+            createArgs = ", ".join(self.CompileWindowArgs(topWindow, "parent", klass))
+            self.CompileWindowSetup(topWindow, "self", klass)
+            self.CompileWindowChildren(topWindow, "self", klass)
+            if self.GetBool(topWindow, "centered"):
+                self.lines.append("self.Centre()")
+        else:
+            raise CompileError("%s can't be compiled" % klass)
+
+        outputList = [header % locals()]
+        outputList += ["        %s\n" % line for line in self.lines]
+        return outputList
+
+    #-------------------------------------------------------------------
+
+    def CompileObject(self, node, parent):
+        """
+        Adds the code creating the window `node` as a child of `parent` and
+        returns the expression referring to it.
+        """
+        klass = node.getAttribute("class")
+        if node.getAttribute("platform"):
+            raise CompileError("objects with a platform attribute can't be compiled")
+        if klass in self.compiledSizers:
+            return self.CompileSizer(node, parent)
+        if klass not in self.compiledWindows:
+            raise CompileError("%s can't be compiled" % (klass or "an object without class"))
+
+        var = self.GetVariable(node)
+        args = self.CompileWindowArgs(node, parent, klass)
+        subclass = node.getAttribute("subclass")
+        if subclass:
+            self.lines.append("%s = %s()" % (var, self.GetSubclassName(subclass)))
+            self.lines.append("%s.Create(%s)" % (var, ", ".join(args)))
+        else:
+            self.lines.append("%s = wx.%s(%s)" % (var, klass[2:], ", ".join(args)))
+
+        self.CompileWindowSetup(node, var, klass)
+        self.CompileWindowChildren(node, var, klass)
+
+        if klass == "wxToolBar":
+            frame = parent if parent == "self" and self.IsFrameChild(node) else None
+            if frame and not self.GetBool(node, "dontattachtoframe"):
+                self.lines.append("%s.SetToolBar(%s)" % (frame, var))
+        elif klass == "wxStatusBar" and parent == "self" and self.IsFrameChild(node):
+            self.lines.append("%s.SetStatusBar(%s)" % (parent, var))
+        return var
+
+
+    def CompileWindowArgs(self, node, parent, klass):
+        """ Returns the arguments creating the window `node`. """
+        args = [parent, self.GetId(node)]
+        if klass in self.compiledTopWindows:
+            ctorArgs = self.compiledTopWindows[klass]
+        else:
+            ctorArgs = self.compiledWindows[klass][0]
+        for argName, param, kind in ctorArgs:
+            value = self.CompileValue(node, param, kind, parent)
+            if value is not None:
+                args.append("%s=%s" % (argName, value))
+
+        # XRC sets the size and position of top level windows after creating them
+        if klass not in self.compiledTopWindows:
+            for argName, kind in [("pos", "pos"), ("size", "size")]:
+                value = self.CompileValue(node, argName, kind, parent)
+                if value is not None:
+                    args.append("%s=%s" % (argName, value))
+
+        style = self.CompileValue(node, "style", "style")
+        if style is None and klass == "wxToolBar":
+            style = "wx.TB_HORIZONTAL | wx.NO_BORDER"
+        if style is not None:
+            args.append("style=%s" % style)
+
+        name = node.getAttribute("name")
+        if name:
+            args.append("name=%s" % self.PyString(name))
+        return args
+
+
+    def CompileWindowSetup(self, node, var, klass):
+        """ Adds the code setting the common window properties, as XRC does. """
+        lines = self.lines
+
+        if klass in self.compiledTopWindows:
+            size = self.CompileValue(node, "size", "size", var)
+            if size is not None:
+                lines.append("%s.SetClientSize(%s)" % (var, size))
+            pos = self.CompileValue(node, "pos", "pos", var)
+            if pos is not None:
+                lines.append("%s.Move(%s)" % (var, pos))
+            icon = self.CompileValue(node, "icon", "bitmap", clientId="wx.ART_FRAME_ICON")
+            if icon is not None:
+                lines.append("icon = wx.Icon()")
+                lines.append("icon.CopyFromBitmap(%s)" % icon)
+                lines.append("%s.SetIcon(icon)" % var)
+        else:
+            for template, param, kind in self.compiledWindows[klass][1]:
+                value = self.CompileValue(node, param, kind, var)
+                if value is not None and value != "False":
+                    lines.append(template % locals())
+
+        exstyle = self.CompileValue(node, "exstyle", "style")
+        if exstyle is not None:
+            lines.append("%s.SetExtraStyle(%s.GetExtraStyle() | %s)" % (var, var, exstyle))
+        for param, method in [("bg", "SetBackgroundColour"), ("ownbg", "SetOwnBackgroundColour"),
+                              ("fg", "SetForegroundColour"), ("ownfg", "SetOwnForegroundColour")]:
+            colour = self.CompileValue(node, param, "colour")
+            if colour is not None:
+                lines.append("%s.%s(%s)" % (var, method, colour))
+        if not self.GetBool(node, "enabled", True):
+            lines.append("%s.Enable(False)" % var)
+        if self.GetBool(node, "focused"):
+            lines.append("%s.SetFocus()" % var)
+        if self.GetBool(node, "hidden"):
+            lines.append("%s.Show(False)" % var)
+        tooltip = self.CompileValue(node, "tooltip", "text")
+        if tooltip is not None:
+            lines.append("%s.SetToolTip(%s)" % (var, tooltip))
+        for param, method in [("font", "SetFont"), ("ownfont", "SetOwnFont")]:
+            if self.GetParam(node, param) is not None:
+                self.CompileFont(self.GetParam(node, param))
+                lines.append("%s.%s(font)" % (var, method))
+        helpText = self.CompileValue(node, "help", "text")
+        if helpText is not None:
+            lines.append("%s.SetHelpText(%s)" % (var, helpText))
+
+
+    def CompileWindowChildren(self, node, var, klass):
+        """ Adds the code creating the children of the window `node`. """
+        children = self.GetObjects(node)
+
+        if klass == "wxToolBar":
+            self.CompileToolBarItems(node, var)
+            return
+
+        if klass == "wxStatusBar":
+            fields = self.GetInt(node, "fields", 1)
+            widths = self.GetParamText(node, "widths")
+            if widths:
+                widths = "[%s]" % ", ".join([str(int(w)) for w in widths.split(",")])
+                self.lines.append("%s.SetFieldsCount(%d, %s)" % (var, fields, widths))
+            else:
+                self.lines.append("%s.SetFieldsCount(%d)" % (var, fields))
+            styles = self.GetParamText(node, "styles")
+            if styles:
+                styles = ", ".join([self.ConvertStyle(st) for st in styles.split(",")])
+                self.lines.append("%s.SetStatusStyles([%s])" % (var, styles))
+            return
+
+        if klass == "wxNotebook":
+            for page in children:
+                if page.getAttribute("class") != "notebookpage":
+                    raise CompileError("unexpected %s in a wxNotebook" % page.getAttribute("class"))
+                if self.GetParam(page, "bitmap") is not None or self.GetParam(page, "image") is not None:
+                    raise CompileError("notebook pages with images can't be compiled")
+                window = self.GetObjects(page)
+                if len(window) != 1:
+                    raise CompileError("a notebookpage must contain one window")
+                pageVar = self.CompileObject(window[0], var)
+                label = self.CompileValue(page, "label", "text") or "u''"
+                selected = self.GetBool(page, "selected")
+                self.lines.append("%s.AddPage(%s, %s, %s)" % (var, pageVar, label, selected))
+            return
+
+        if klass == "wxSplitterWindow":
+            windows = [self.CompileObject(child, var) for child in children]
+            if len(windows) == 1:
+                self.lines.append("%s.Initialize(%s)" % (var, windows[0]))
+            elif len(windows) == 2:
+                orientation = self.GetParamText(node, "orientation", "horizontal")
+                method = orientation == "vertical" and "SplitVertically" or "SplitHorizontally"
+                sashpos = self.GetInt(node, "sashpos", 0)
+                self.lines.append("%s.%s(%s, %s, %d)" % (var, method, windows[0], windows[1], sashpos))
+            elif windows:
+                raise CompileError("a wxSplitterWindow can't have more than two windows")
+            return
+
+        for child in children:
+            childClass = child.getAttribute("class")
+            if klass == "wxFrame" and childClass == "wxMenuBar":
+                menuBar = self.GetVariable(child)
+                self.lines.append("%s = wx.MenuBar(%s)" % (menuBar, self.CompileValue(child, "style", "style") or ""))
+                self.CompileMenuBar(child, menuBar)
+                self.lines.append("%s.SetMenuBar(%s)" % (var, menuBar))
+            elif childClass in self.compiledSizers:
+                sizer = self.CompileSizer(child, var)
+                self.lines.append("%s.SetSizer(%s)" % (var, sizer))
+                if self.GetParam(node, "size") is None:
+                    if klass == "wxScrolledWindow":
+                        self.lines.append("%s.FitInside(%s)" % (sizer, var))
+                    else:
+                        self.lines.append("%s.Fit(%s)" % (sizer, var))
+                if klass in self.compiledTopWindows:
+                    self.lines.append("%s.SetSizeHints(%s)" % (sizer, var))
+            else:
+                self.CompileObject(child, var)
+
+
+    def IsFrameChild(self, node):
+        return node.parentNode.getAttribute("class") == "wxFrame"
+
+    #-------------------------------------------------------------------
+
+    def CompileSizer(self, node, parent):
+        """
+        Adds the code creating the sizer `node`, whose windows are children of
+        `parent`, and returns the variable holding it.
+        """
+        klass = node.getAttribute("class")
+        if node.getAttribute("platform"):
+            raise CompileError("objects with a platform attribute can't be compiled")
+
+        var = self.GetVariable(node, "sizer")
+        orient = self.CompileValue(node, "orient", "style") or "wx.HORIZONTAL"
+        vgap = self.GetInt(node, "vgap", 0)
+        hgap = self.GetInt(node, "hgap", 0)
+        rows = self.GetInt(node, "rows", 0)
+        cols = self.GetInt(node, "cols", 0)
+        if not rows and not cols:
+            cols = 1
+
+        if klass == "wxBoxSizer":
+            self.lines.append("%s = wx.BoxSizer(%s)" % (var, orient))
+        elif klass == "wxStaticBoxSizer":
+            label = self.CompileValue(node, "label", "text") or "u''"
+            self.lines.append("%s = wx.StaticBoxSizer(%s, %s, %s)" % (var, orient, parent, label))
+            # the windows in the sizer are children of the static box
+            parent = "%s.GetStaticBox()" % var
+        elif klass == "wxGridSizer":
+            self.lines.append("%s = wx.GridSizer(%d, %d, %d, %d)" % (var, rows, cols, vgap, hgap))
+        elif klass == "wxFlexGridSizer":
+            self.lines.append("%s = wx.FlexGridSizer(%d, %d, %d, %d)" % (var, rows, cols, vgap, hgap))
+        elif klass == "wxGridBagSizer":
+            self.lines.append("%s = wx.GridBagSizer(%d, %d)" % (var, vgap, hgap))
+        elif klass == "wxWrapSizer":
+            flag = self.CompileValue(node, "flag", "style") or "wx.WRAPSIZER_DEFAULT_FLAGS"
+            self.lines.append("%s = wx.WrapSizer(%s, %s)" % (var, orient, flag))
+        elif klass == "wxStdDialogButtonSizer":
+            self.lines.append("%s = wx.StdDialogButtonSizer()" % var)
+            for child in self.GetObjects(node):
+                buttons = self.GetObjects(child)
+                if child.getAttribute("class") != "button" or len(buttons) != 1:
+                    raise CompileError("unexpected %s in a wxStdDialogButtonSizer" % child.getAttribute("class"))
+                button = self.CompileObject(buttons[0], parent)
+                self.lines.append("%s.AddButton(%s)" % (var, button))
+            self.lines.append("%s.Realize()" % var)
+            return var
+
+        if klass in ["wxFlexGridSizer", "wxGridBagSizer"]:
+            for param, method in [("growablerows", "AddGrowableRow"), ("growablecols", "AddGrowableCol")]:
+                for item in (self.GetParamText(node, param) or "").split(","):
+                    if item.strip():
+                        args = ", ".join([str(int(n)) for n in item.split(":")])
+                        self.lines.append("%s.%s(%s)" % (var, method, args))
+            for param, method in [("flexibledirection", "SetFlexibleDirection"),
+                                  ("nonflexiblegrowmode", "SetNonFlexibleGrowMode")]:
+                value = self.CompileValue(node, param, "style")
+                if value is not None:
+                    self.lines.append("%s.%s(%s)" % (var, method, value))
+
+        minsize = self.CompileValue(node, "minsize", "size", parent)
+        if minsize is not None:
+            self.lines.append("%s.SetMinSize(%s)" % (var, minsize))
+
+        for child in self.GetObjects(node):
+            childClass = child.getAttribute("class")
+            if childClass == "sizeritem":
+                items = self.GetObjects(child)
+                if len(items) != 1:
+                    raise CompileError("a sizeritem must contain one object")
+                item = self.CompileObject(items[0], parent)
+            elif childClass == "spacer":
+                size = self.GetParamText(child, "size", "0,0")
+                item = ", ".join(self.ParsePair(size))
+            else:
+                raise CompileError("unexpected %s in a sizer" % childClass)
+
+            flag = self.CompileValue(child, "flag", "style") or "0"
+            border = self.GetInt(child, "border", 0)
+            if klass == "wxGridBagSizer":
+                cellpos = ", ".join(self.ParsePair(self.GetParamText(child, "cellpos", "-1,-1")))
+                cellspan = ", ".join(self.ParsePair(self.GetParamText(child, "cellspan", "1,1")))
+                add = "%s.Add(%s, wx.GBPosition(%s), wx.GBSpan(%s), %s, %d)" % (var, item, cellpos, cellspan, flag, border)
+            else:
+                proportion = self.GetInt(child, "option", self.GetInt(child, "proportion", 0))
+                add = "%s.Add(%s, %d, %s, %d)" % (var, item, proportion, flag, border)
+
+            minsize = self.CompileValue(child, "minsize", "size", parent)
+            if minsize is not None:
+                add += ".SetMinSize(%s)" % minsize
+            self.lines.append(add)
+
+        return var
+
+    #-------------------------------------------------------------------
+
+    def CompileMenuBar(self, node, var):
+        for menu in self.GetObjects(node):
+            if menu.getAttribute("class") != "wxMenu":
+                raise CompileError("unexpected %s in a wxMenuBar" % menu.getAttribute("class"))
+            menuVar = self.GetVariable(menu, "menu")
+            self.lines.append("%s = wx.Menu()" % menuVar)
+            self.CompileMenu(menu, menuVar)
+            label = self.CompileValue(menu, "label", "text") or "u''"
+            self.lines.append("%s.Append(%s, %s)" % (var, menuVar, label))
+            if not self.GetBool(menu, "enabled", True):
+                self.lines.append("%s.EnableTop(%s.GetMenuCount() - 1, False)" % (var, var))
+
+
+    def CompileMenu(self, node, var):
+        for child in self.GetObjects(node):
+            childClass = child.getAttribute("class")
+            if childClass == "separator":
+                self.lines.append("%s.AppendSeparator()" % var)
+            elif childClass == "break":
+                self.lines.append("%s.Break()" % var)
+            elif childClass == "wxMenu":
+                menuVar = self.GetVariable(child, "menu")
+                self.lines.append("%s = wx.Menu()" % menuVar)
+                self.CompileMenu(child, menuVar)
+                label = self.CompileValue(child, "label", "text") or "u''"
+                helpText = self.CompileValue(child, "help", "text") or "u''"
+                item = "%s.Append(%s, %s, %s, %s)" % (var, self.GetId(child), label, menuVar, helpText)
+                if not self.GetBool(child, "enabled", True):
+                    item += ".Enable(False)"
+                self.lines.append(item)
+            elif childClass == "wxMenuItem":
+                itemVar = self.GetVariable(child, "item")
+                label = self.CompileValue(child, "label", "text") or "u''"
+                accel = self.CompileValue(child, "accel", "string")
+                if accel is not None:
+                    label = "%s + u'\\t' + %s" % (label, accel)
+                helpText = self.CompileValue(child, "help", "text") or "u''"
+                if self.GetBool(child, "radio"):
+                    kind = "wx.ITEM_RADIO"
+                elif self.GetBool(child, "checkable"):
+                    kind = "wx.ITEM_CHECK"
+                else:
+                    kind = "wx.ITEM_NORMAL"
+                self.lines.append("%s = wx.MenuItem(%s, %s, %s, %s, %s)"
+                                  % (itemVar, var, self.GetId(child), label, helpText, kind))
+                bitmap = self.CompileValue(child, "bitmap", "bitmap", clientId="wx.ART_MENU")
+                if bitmap is not None:
+                    self.lines.append("%s.SetBitmap(%s)" % (itemVar, bitmap))
+                self.lines.append("%s.Append(%s)" % (var, itemVar))
+                if not self.GetBool(child, "enabled", True):
+                    self.lines.append("%s.Enable(False)" % itemVar)
+                if self.GetBool(child, "checked"):
+                    self.lines.append("%s.Check(True)" % itemVar)
+            else:
+                raise CompileError("unexpected %s in a wxMenu" % childClass)
+
+
+    def CompileToolBarItems(self, node, var):
+        for child in self.GetObjects(node):
+            childClass = child.getAttribute("class")
+            if childClass == "tool":
+                if self.GetObjects(child):
+                    raise CompileError("tools with a drop down menu can't be compiled")
+                toolVar = self.GetVariable(child, "tool")
+                label = self.CompileValue(child, "label", "text") or "u''"
+                bitmap = self.CompileValue(child, "bitmap", "bitmap", clientId="wx.ART_TOOLBAR") or "wx.NullBitmap"
+                bitmap2 = self.CompileValue(child, "bitmap2", "bitmap", clientId="wx.ART_TOOLBAR") or "wx.NullBitmap"
+                if self.GetBool(child, "radio"):
+                    kind = "wx.ITEM_RADIO"
+                elif self.GetBool(child, "toggle"):
+                    kind = "wx.ITEM_CHECK"
+                elif self.GetBool(child, "dropdown"):
+                    kind = "wx.ITEM_DROPDOWN"
+                else:
+                    kind = "wx.ITEM_NORMAL"
+                tooltip = self.CompileValue(child, "tooltip", "text") or "u''"
+                longhelp = self.CompileValue(child, "longhelp", "text") or "u''"
+                self.lines.append("%s = %s.AddTool(%s, %s, %s, %s, %s, %s, %s)"
+                                  % (toolVar, var, self.GetId(child), label, bitmap, bitmap2,
+                                     kind, tooltip, longhelp))
+                if self.GetBool(child, "disabled"):
+                    self.lines.append("%s.EnableTool(%s.GetId(), False)" % (var, toolVar))
+                if self.GetBool(child, "checked"):
+                    self.lines.append("%s.ToggleTool(%s.GetId(), True)" % (var, toolVar))
+            elif childClass == "separator":
+                self.lines.append("%s.AddSeparator()" % var)
+            elif childClass == "space":
+                self.lines.append("%s.AddStretchableSpace()" % var)
+            else:
+                control = self.CompileObject(child, var)
+                self.lines.append("%s.AddControl(%s)" % (var, control))
+        self.lines.append("%s.Realize()" % var)
+
+    #-------------------------------------------------------------------
+
+    def CompileFont(self, node):
+        """ Adds the code creating the font described by `node` in a ``font`` variable. """
+        sysfont = self.GetParamText(node, "sysfont")
+        size = self.GetParamText(node, "size")
+        family = self.GetParamText(node, "family", "default")
+        style = self.GetParamText(node, "style", "normal")
+        weight = self.GetParamText(node, "weight", "normal")
+        try:
+            family = self.fontFamilies[family]
+            style = self.fontStyles[style]
+            weight = self.fontWeights[weight]
+        except KeyError as exc:
+            raise CompileError("unknown font property %s" % exc)
+        underlined = self.GetBool(node, "underlined")
+        faces = [self.PyString(f.strip()) for f in (self.GetParamText(node, "face") or "").split(",") if f.strip()]
+
+        if sysfont:
+            self.lines.append("font = wx.SystemSettings.GetFont(%s)" % self.ConvertStyle(sysfont))
+            if size:
+                self.lines.append("font.SetPointSize(%d)" % int(float(size)))
+            for param, method, value in [("family", "SetFamily", family), ("style", "SetStyle", style),
+                                         ("weight", "SetWeight", weight)]:
+                if self.GetParam(node, param) is not None:
+                    self.lines.append("font.%s(%s)" % (method, value))
+            if underlined:
+                self.lines.append("font.SetUnderlined(True)")
+        else:
+            size = size and "%d" % int(float(size)) or "wx.NORMAL_FONT.GetPointSize()"
+            self.lines.append("font = wx.Font(%s, %s, %s, %s, %s)" % (size, family, style, weight, underlined))
+
+        if len(faces) == 1:
+            self.lines.append("font.SetFaceName(%s)" % faces[0])
+        elif faces:
+            # use the first one available, as XRC does
+            self.lines.append("for face in (%s):" % ", ".join(faces))
+            self.lines.append("    if wx.FontEnumerator.IsValidFacename(face):")
+            self.lines.append("        font.SetFaceName(face)")
+            self.lines.append("        break")
+
+        relativesize = self.GetParamText(node, "relativesize")
+        if relativesize:
+            self.lines.append("font.SetPointSize(int(font.GetPointSize() * %s))" % float(relativesize))
+
+    #-------------------------------------------------------------------
+
+    def CompileValue(self, node, param, kind, parent=None, clientId="wx.ART_OTHER"):
+        """
+        Returns the Python expression for the property `param` of the object
+        `node`, or ``None`` if it isn't set.
+
+        :param `kind`: how to convert the value, one of ``"text"``, ``"string"``,
+         ``"int"``, ``"float"``, ``"flag"``, ``"style"``, ``"colour"``,
+         ``"pos"``, ``"size"``, ``"pair"``, ``"bitmap"``, ``"choices"`` or
+         ``"checked"``.
+        :param `parent`: the window to use for sizes in dialog units.
+        :param `clientId`: the art provider client for stock bitmaps.
+        """
+        elem = self.GetParam(node, param)
+        if elem is None:
+            return None
+        text = self.GetText(elem)
+
+        try:
+            if kind == "text":
+                text = self.ConvertXrcText(text)
+                if text and elem.getAttribute("translate") != "0":
+                    return "wx.GetTranslation(%s)" % self.PyString(text)
+                return self.PyString(text)
+            if kind == "string":
+                return self.PyString(self.ConvertXrcText(text))
+            if kind == "int":
+                return "%d" % int(text.strip())
+            if kind == "float":
+                return repr(float(text.strip()))
+            if kind == "flag":
+                return repr(text.strip() == "1")
+            if kind == "style":
+                return " | ".join([self.ConvertStyle(st) for st in text.split("|")])
+            if kind == "colour":
+                text = text.strip()
+                if text.startswith("wxSYS_COLOUR_"):
+                    return "wx.SystemSettings.GetColour(%s)" % self.ConvertStyle(text)
+                return "wx.Colour(%s)" % self.PyString(text)
+            if kind == "pair":
+                return ", ".join(self.ParsePair(text))
+            if kind in ["pos", "size"]:
+                text = text.strip()
+                klass = kind == "pos" and "wx.Point" or "wx.Size"
+                if text.endswith("d"):
+                    if parent is None or parent == "parent":
+                        raise CompileError("dialog units can't be compiled here")
+                    return "wx.DLG_UNIT(%s, %s(%s))" % (parent, klass, ", ".join(self.ParsePair(text[:-1])))
+                return "%s(%s)" % (klass, ", ".join(self.ParsePair(text)))
+            if kind == "bitmap":
+                return self.CompileBitmap(elem, clientId)
+            if kind in ["choices", "checked"]:
+                items = [e for e in elem.childNodes if e.nodeType == e.ELEMENT_NODE and e.tagName == "item"]
+                if kind == "checked":
+                    checked = [str(i) for i, e in enumerate(items) if e.getAttribute("checked") == "1"]
+                    return checked and "[%s]" % ", ".join(checked) or None
+                choices = []
+                for item in items:
+                    value = self.ConvertXrcText(self.GetText(item))
+                    if value and item.getAttribute("translate") != "0":
+                        choices.append("wx.GetTranslation(%s)" % self.PyString(value))
+                    else:
+                        choices.append(self.PyString(value))
+                return "[%s]" % ", ".join(choices)
+        except ValueError:
+            raise CompileError("invalid value %r for %s" % (text, param))
+
+        raise CompileError("unknown kind of property %s" % kind)
+
+
+    def CompileBitmap(self, elem, clientId):
+        """
+        Returns the expression loading the bitmap in the property `elem`. The
+        bitmap files are listed in ``self.bitmaps``, mapping the name used by
+        ``get_bitmap`` to the file path.
+        """
+        stockId = elem.getAttribute("stock_id")
+        if stockId:
+            stockClient = elem.getAttribute("stock_client")
+            if stockClient:
+                clientId = self.ConvertStyle(stockClient)
+            return "wx.ArtProvider.GetBitmap(%s, %s)" % (self.ConvertStyle(stockId), clientId)
+
+        filename = os.path.join(self.resourcePath, self.GetText(elem).strip())
+        if self.outputFilename == "-":
+            outputPath = os.getcwd()
+        else:
+            outputPath = os.path.dirname(os.path.abspath(self.outputFilename))
+        name = os.path.relpath(os.path.abspath(filename), outputPath).replace(os.sep, "/")
+        if self.embedResources:
+            name = self.GetMemoryFilename(name)
+        self.bitmaps[name] = filename
+        return "get_bitmap(%s)" % self.PyString(name)
+
+
+    def GenerateBitmaps(self):
+        """ Returns the code loading the bitmaps used by the compiled classes. """
+        if not self.embedResources:
+            return self.templates.LOAD_BITMAP_FILE
+
+        outputList = [self.templates.LOAD_BITMAP_EMBEDDED]
+        for filename in sorted(self.bitmaps):
+            fileData = self.FileToString(self.bitmaps[filename])
+            outputList.append(self.templates.BITMAP_AS_STRING % locals())
+        return "".join(outputList)
+
+    #-------------------------------------------------------------------
+
+    def GetObjects(self, node):
+        return [e for e in node.childNodes
+                if e.nodeType == e.ELEMENT_NODE and e.tagName == "object"]
+
+
+    def GetParam(self, node, param):
+        for e in node.childNodes:
+            if e.nodeType == e.ELEMENT_NODE and e.tagName == param:
+                return e
+        return None
+
+
+    def GetText(self, elem):
+        return "".join([n.nodeValue for n in elem.childNodes
+                        if n.nodeType in (n.TEXT_NODE, n.CDATA_SECTION_NODE)])
+
+
+    def GetParamText(self, node, param, default=None):
+        elem = self.GetParam(node, param)
+        if elem is None:
+            return default
+        return self.GetText(elem).strip()
+
+
+    def GetInt(self, node, param, default):
+        value = self.GetParamText(node, param)
+        if not value:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise CompileError("invalid value %r for %s" % (value, param))
+
+
+    def GetBool(self, node, param, default=False):
+        value = self.GetParamText(node, param)
+        if not value:
+            return default
+        return value == "1"
+
+
+    def GetId(self, node):
+        name = node.getAttribute("name")
+        if re.match(r"^wxID_[A-Z0-9_]+$", name):
+            return "wx.%s" % name[2:]
+        if name:
+            return "xrc.XRCID(%s)" % self.PyString(name)
+        return "wx.ID_ANY"
+
+
+    def GetVariable(self, node, prefix="ctrl"):
+        """
+        Returns the variable for the object `node`: an attribute of the class
+        for the named objects, or else a local variable.
+        """
+        name = node.getAttribute("name")
+        if name and self.CheckAssignVar(node) and re.match(r"^[A-Za-z_]\w*$", name):
+            self.vars.append(name)
+            return "self.%s" % name
+        self.localCount += 1
+        return "%s%d" % (prefix, self.localCount)
+
+
+    def GetSubclassName(self, subclass):
+        module, _, klass = subclass.rpartition(".")
+        if not module or module == os.path.splitext(os.path.basename(self.outputFilename))[0]:
+            return klass
+        self.imports.add("import %s" % module)
+        return subclass
+
+
+    def ConvertStyle(self, st):
+        st = st.strip()
+        if st.startswith("wx"):
+            return "wx.%s" % st[2:]
+        try:
+            return "%d" % int(st)
+        except ValueError:
+            raise CompileError("unknown style %s" % st)
+
+
+    def ParsePair(self, text):
+        values = text.split(",")
+        if len(values) != 2:
+            raise CompileError("invalid pair of values %r" % text)
+        try:
+            return ["%d" % int(v) for v in values]
+        except ValueError:
+            raise CompileError("invalid pair of values %r" % text)
+
+
+    def ConvertXrcText(self, text):
+        """
+        Translates the XRC text conventions: ``_`` marks the accelerator
+        (``__`` is a literal underscore) and backslash escapes.
+        """
+        output = []
+        i = 0
+        while i < len(text):
+            c = text[i]
+            if c == "_":
+                if i + 1 == len(text) or text[i+1] == "_":
+                    output.append("_")
+                    i += 1
+                else:
+                    output.append("&")
+            elif c == "\\" and i + 1 < len(text):
+                i += 1
+                output.append({"n": "\n", "t": "\t", "r": "\r", "\\": "\\"}.get(text[i], "\\" + text[i]))
+            else:
+                output.append(c)
+            i += 1
+        return "".join(output)
+
+
+    def PyString(self, text):
+        literal = repr(text)
+        if not literal.startswith("u"):
+            literal = "u" + literal
+        return literal
+
+    #-------------------------------------------------------------------
+
     def GenerateInitResourcesEmbedded(self, resourceFilename, resourceDocument):
         outputList = []
         files = []
@@ -874,11 +1812,12 @@ def main(args=None):
     generateGetText = False
     assignVariables = True
     generatePython = False
+    compileResources = False
 
     try:
         opts, args = getopt.gnu_getopt(args,
-                                       "hpgevo:",
-                                       "help python gettext embed novar output=".split())
+                                       "hpcgevo:",
+                                       "help python compile gettext embed novar output=".split())
     except getopt.GetoptError as exc:
         print("\nError : %s\n" % str(exc))
         print(__doc__)
@@ -899,6 +1838,10 @@ def main(args=None):
         if opt in ["-p", "--python"]:
             generatePython = True
 
+        if opt in ["-c", "--compile"]:
+            generatePython = True
+            compileResources = True
+
         if opt in ["-o", "--output"]:
             outputFilename = val
 
@@ -926,7 +1869,7 @@ def main(args=None):
                 outputFilename = os.path.splitext(args[0])[0] + "_xrc.py"
             comp.MakePythonModule(inputFiles, outputFilename,
                                   embedResources, generateGetText,
-                                  assignVariables)
+                                  assignVariables, compileResources)
 
         elif generateGetText:
             if not outputFilename: